@@ -0,0 +1,136 @@
+import asyncio
+import json
+import uuid
+from concurrent import futures
+from typing import Any, Generator, List
+
+import grpc
+import pytest
+from grpc_health.v1.health_pb2_grpc import add_HealthServicer_to_server
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC, MockHealthServicer
+from weaviate.collections.batch.rest import _BatchRESTAsync
+from weaviate.collections.classes.batch import _BatchReference
+from weaviate.connect.base import ConnectionParams, ProtocolParams
+from weaviate.exceptions import WeaviateClosedClientError, WeaviateConnectionError
+from weaviate.proto.v1 import search_get_pb2, weaviate_pb2_grpc
+
+UUIDS = [uuid.uuid4() for _ in range(3)]
+
+
+class MockWeaviateServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.requests: List[search_get_pb2.SearchRequest] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.requests.append(request)
+        reply = search_get_pb2.SearchReply()
+        for i, uid in enumerate(UUIDS[: request.limit or len(UUIDS)]):
+            result = reply.results.add()
+            result.properties.target_collection = request.collection
+            result.properties.non_ref_props.fields["name"].string_value = f"name{i}"
+            result.metadata.id_as_bytes = uid.bytes
+            result.metadata.creation_time_unix = 1
+            result.metadata.creation_time_unix_present = True
+            result.metadata.last_update_time_unix = 1
+            result.metadata.last_update_time_unix_present = True
+        return reply
+
+
+@pytest.fixture(scope="module")
+def weaviate_servicer() -> Generator[MockWeaviateServicer, None, None]:
+    servicer = MockWeaviateServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_HealthServicer_to_server(MockHealthServicer(), server)
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    server.add_insecure_port(f"[::]:{MOCK_PORT_GRPC}")
+    server.start()
+    yield servicer
+    server.stop(0)
+
+
+def _async_client() -> weaviate.WeaviateAsyncClient:
+    return weaviate.WeaviateAsyncClient(
+        ConnectionParams(
+            http=ProtocolParams(host=MOCK_IP, port=MOCK_PORT, secure=False),
+            grpc=ProtocolParams(host=MOCK_IP, port=MOCK_PORT_GRPC, secure=False),
+        ),
+        skip_init_checks=True,
+    )
+
+
+def test_async_queries(weaviate_mock: HTTPServer, weaviate_servicer: MockWeaviateServicer) -> None:
+    async def run() -> Any:
+        async with _async_client() as client:
+            collection = client.collections.get("Test")
+            return await asyncio.gather(
+                collection.query.fetch_objects(limit=2),
+                collection.query.near_vector([1.0, 2.0]),
+                collection.query.fetch_object_by_id(UUIDS[0]),
+                collection.generate.bm25("query", single_prompt="prompt"),
+            )
+
+    fetched, near, single, generated = asyncio.run(run())
+
+    assert [obj.uuid for obj in fetched.objects] == UUIDS[:2]
+    assert [obj.properties["name"] for obj in near.objects] == ["name0", "name1", "name2"]
+    assert single is not None and single.uuid == UUIDS[0]
+    assert len(generated.objects) == 3
+    assert len(weaviate_servicer.requests) == 4
+    assert {req.collection for req in weaviate_servicer.requests} == {"Test"}
+
+
+def test_async_data(weaviate_mock: HTTPServer, weaviate_servicer: MockWeaviateServicer) -> None:
+    uid = uuid.uuid4()
+    inserted: List[Any] = []
+
+    def handle_insert(request: Request) -> Response:
+        inserted.append(request.json)
+        return Response(json.dumps({}), status=200)
+
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_handler(handle_insert)
+    weaviate_mock.expect_request(f"/v1/objects/Test/{uid}", method="HEAD").respond_with_response(
+        Response(status=204)
+    )
+    weaviate_mock.expect_request(f"/v1/objects/Test/{uid}", method="DELETE").respond_with_response(
+        Response(status=404)
+    )
+
+    async def run() -> Any:
+        async with _async_client() as client:
+            collection = client.collections.get("Test").with_tenant("tenant")
+            return (
+                await collection.data.insert({"name": "test"}, uuid=uid),
+                await collection.data.exists(uid),
+                await collection.data.delete_by_id(uid),
+            )
+
+    assert asyncio.run(run()) == (uid, True, False)
+    assert inserted == [
+        {"class": "Test", "properties": {"name": "test"}, "id": str(uid), "tenant": "tenant"}
+    ]
+
+
+def test_batch_references_raise_weaviate_errors(weaviate_mock: HTTPServer) -> None:
+    # the batch sends its references with `apost`, which raises the same errors as the sync `post`
+    refs = [_BatchReference(from_="from", to="to", tenant=None, from_uuid=str(UUIDS[0]))]
+
+    async def run() -> None:
+        client = _async_client()
+        await client.connect()
+        try:
+            weaviate_mock.stop()
+            with pytest.raises(WeaviateConnectionError):
+                await _BatchRESTAsync(client._connection, None).references(refs)
+        finally:
+            weaviate_mock.start()
+            await client.close()
+        with pytest.raises(WeaviateClosedClientError):
+            await _BatchRESTAsync(client._connection, None).references(refs)
+
+    asyncio.run(run())
@@ -0,0 +1,346 @@
+import json
+import os
+import struct
+import threading
+import time
+import uuid
+from concurrent import futures
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Set
+
+import grpc
+import pytest
+from grpc_health.v1.health_pb2_grpc import add_HealthServicer_to_server
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC, MockHealthServicer
+from weaviate.collections.batch import grpc_batch_objects
+from weaviate.collections.batch.base import ReferencesBatchRequest
+from weaviate.collections.batch.spill import _SpillLog
+from weaviate.collections.classes.batch import _BatchObject, _BatchReference
+from weaviate.collections.classes.internal import ReferenceToMulti
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import batch_pb2, weaviate_pb2_grpc
+
+
+class MockBatchServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.objects: List[batch_pb2.BatchObject] = []
+        self.requests: List[batch_pb2.BatchObjectsRequest] = []
+        # requests are answered once this is set, clear it to keep objects in flight
+        self.answer = threading.Event()
+        self.answer.set()
+        self.received = threading.Event()
+        # uuids of the objects that are rejected, and of those that are rate limited the first time they are sent
+        self.failing: Set[str] = set()
+        self.rate_limited: Set[str] = set()
+
+    def BatchObjects(
+        self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+    ) -> batch_pb2.BatchObjectsReply:
+        self.received.set()
+        self.answer.wait()
+        self.requests.append(request)
+        self.objects.extend(request.objects)
+        errors = []
+        for idx, obj in enumerate(request.objects):
+            if obj.uuid in self.failing:
+                errors.append(batch_pb2.BatchObjectsReply.BatchError(index=idx, error="rejected"))
+            elif obj.uuid in self.rate_limited:
+                self.rate_limited.remove(obj.uuid)
+                errors.append(
+                    batch_pb2.BatchObjectsReply.BatchError(
+                        index=idx, error="failed with status: 503 error"
+                    )
+                )
+        return batch_pb2.BatchObjectsReply(errors=errors)
+
+
+@pytest.fixture(scope="function")
+def batch_servicer() -> Generator[MockBatchServicer, None, None]:
+    servicer = MockBatchServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_HealthServicer_to_server(MockHealthServicer(), server)
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    server.add_insecure_port(f"[::]:{MOCK_PORT_GRPC}")
+    server.start()
+    yield servicer
+    server.stop(0)
+
+
+@pytest.fixture(scope="function")
+def batch_client(
+    weaviate_mock: HTTPServer, batch_servicer: MockBatchServicer
+) -> Generator[weaviate.WeaviateClient, None, None]:
+    weaviate_mock.expect_request("/v1/schema").respond_with_json({"classes": []})
+    client = weaviate.connect_to_local(port=MOCK_PORT, host=MOCK_IP, grpc_port=MOCK_PORT_GRPC)
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize("skip_validation", [False, True])
+def test_add_object(
+    batch_client: weaviate.WeaviateClient, batch_servicer: MockBatchServicer, skip_validation: bool
+) -> None:
+    uid = uuid.uuid4()
+    with batch_client.batch.fixed_size(batch_size=3, skip_validation=skip_validation) as batch:
+        returned = [
+            batch.add_object("test", {"name": f"name{i}"}, uuid=uid if i == 0 else None)
+            for i in range(10)
+        ]
+        batch.add_object("test", vector={"a": [1.0, 2.0]})
+
+    assert returned[0] == str(uid)
+    assert all(isinstance(ret, uuid.UUID) for ret in returned[1:])
+    assert len(batch_client.batch.failed_objects) == 0
+    assert len(batch_servicer.objects) == 11
+    assert {obj.collection for obj in batch_servicer.objects} == {"Test"}
+    by_uuid = {obj.uuid: obj for obj in batch_servicer.objects}
+    assert all(str(ret) in by_uuid for ret in returned)
+    (named,) = [obj for obj in batch_servicer.objects if len(obj.vectors) > 0]
+    assert named.vectors[0].vector_bytes == struct.pack("2f", 1.0, 2.0)
+
+
+def test_add_columns(
+    batch_client: weaviate.WeaviateClient, batch_servicer: MockBatchServicer
+) -> None:
+    with batch_client.batch.fixed_size(batch_size=4) as batch:
+        uuids = batch.add_columns("test", {"name": [f"name{i}" for i in range(10)]})
+
+    assert len(batch_servicer.objects) == 10
+    assert sorted(obj.uuid for obj in batch_servicer.objects) == sorted(uuids)
+
+
+def test_dynamic_batching_and_flush(
+    batch_client: weaviate.WeaviateClient, batch_servicer: MockBatchServicer
+) -> None:
+    with batch_client.batch.dynamic() as batch:
+        for i in range(2000):
+            batch.add_object("test", {"name": f"name{i}"})
+        batch.flush()
+        assert len(batch_servicer.objects) == 2000
+        batch.add_object("test", {"name": "last"})
+
+    assert len(batch_servicer.objects) == 2001
+    assert len(batch_client.batch.failed_objects) == 0
+
+
+def test_references_are_attached_to_queued_objects(
+    batch_client: weaviate.WeaviateClient,
+    batch_servicer: MockBatchServicer,
+    weaviate_mock: HTTPServer,
+) -> None:
+    rest_refs: List[dict] = []
+
+    def handle_references(request: Request) -> Response:
+        rest_refs.extend(request.json)
+        return Response(json.dumps([]), status=200)
+
+    weaviate_mock.expect_request("/v1/batch/references", method="POST").respond_with_handler(
+        handle_references
+    )
+    source, target, other = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    with batch_client.batch.fixed_size(batch_size=100) as batch:
+        batch.add_object("test", uuid=source)
+        batch.add_reference(source, "test", "link", target)
+        batch.add_reference(source, "test", "link", [other])
+        batch.add_reference(
+            source, "test", "multi", ReferenceToMulti(target_collection="other", uuids=target)
+        )
+        batch.add_reference(other, "test", "link", target)
+
+    (obj,) = batch_servicer.objects
+    (single,) = obj.properties.single_target_ref_props
+    assert single.prop_name == "link" and list(single.uuids) == [str(target), str(other)]
+    (multi,) = obj.properties.multi_target_ref_props
+    assert multi.target_collection == "Other" and list(multi.uuids) == [str(target)]
+
+    assert [ref["from"] for ref in rest_refs] == [f"weaviate://localhost/Test/{other}/link"]
+    assert len(batch_client.batch.failed_references) == 0
+
+
+def test_attached_references_fail_with_their_object(
+    batch_client: weaviate.WeaviateClient, batch_servicer: MockBatchServicer
+) -> None:
+    failing, other, target = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    batch_servicer.failing.add(str(failing))
+
+    with batch_client.batch.fixed_size(batch_size=100) as batch:
+        batch.add_object("test", uuid=failing)
+        batch.add_object("test", uuid=other)
+        batch.add_reference(failing, "test", "link", [target, other])
+        batch.add_reference(
+            failing, "test", "multi", ReferenceToMulti(target_collection="other", uuids=target)
+        )
+        batch.add_reference(other, "test", "link", target)
+
+    assert len(batch_servicer.objects) == 2
+    (failed_object,) = batch_client.batch.failed_objects
+    assert failed_object.object_.uuid == str(failing)
+    failed = batch_client.batch.failed_references
+    assert [(ref.reference.from_, ref.reference.to) for ref in failed] == [
+        (f"weaviate://localhost/Test/{failing}/link", f"weaviate://localhost/{target}"),
+        (f"weaviate://localhost/Test/{failing}/link", f"weaviate://localhost/{other}"),
+        (f"weaviate://localhost/Test/{failing}/multi", f"weaviate://localhost/Other/{target}"),
+    ]
+    assert all("rejected" in ref.message for ref in failed)
+    assert batch_client.batch.results.refs.has_errors
+    assert len(batch_client.batch.results.refs.errors) == 3
+
+
+def test_only_retried_objects_keep_their_encoding(
+    batch_client: weaviate.WeaviateClient,
+    batch_servicer: MockBatchServicer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    failing, retried = str(uuid.uuid4()), str(uuid.uuid4())
+    batch_servicer.failing.add(failing)
+    batch_servicer.rate_limited.add(retried)
+    translated: List[Dict[str, Any]] = []
+    translate = grpc_batch_objects._translate_properties_from_python_to_grpc
+
+    def counting_translate(data: Dict[str, Any], *args: Any) -> batch_pb2.BatchObject.Properties:
+        translated.append(data)
+        return translate(data, *args)
+
+    monkeypatch.setattr(
+        grpc_batch_objects, "_translate_properties_from_python_to_grpc", counting_translate
+    )
+
+    with batch_client.batch.fixed_size(batch_size=100) as batch:
+        batch.add_object("test", properties={"name": "failing"}, uuid=failing)
+        batch.add_object("test", properties={"name": "retried"}, uuid=retried)
+
+    # the retry sends the message of the first attempt without translating the properties again
+    assert [obj.uuid for obj in batch_servicer.objects] == [failing, retried, retried]
+    assert batch_servicer.objects[1] == batch_servicer.objects[2]
+    assert len(translated) == 2
+    (failed_object,) = batch_client.batch.failed_objects
+    assert failed_object.object_.uuid == failing
+    assert failed_object.object_.serialized is None
+    assert failed_object.object_.sent_message is None
+
+
+def test_references_to_objects_in_flight_do_not_spin(
+    batch_client: weaviate.WeaviateClient,
+    batch_servicer: MockBatchServicer,
+    weaviate_mock: HTTPServer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rest_refs: List[dict] = []
+
+    def handle_references(request: Request) -> Response:
+        rest_refs.extend(request.json)
+        return Response(json.dumps([]), status=200)
+
+    weaviate_mock.expect_request("/v1/batch/references", method="POST").respond_with_handler(
+        handle_references
+    )
+    pops = 0
+    pop_items = ReferencesBatchRequest.pop_items
+
+    def counting_pop_items(
+        self: ReferencesBatchRequest, pop_amount: int, uuid_lookup: Set[str]
+    ) -> List[_BatchReference]:
+        nonlocal pops
+        pops += 1
+        return pop_items(self, pop_amount, uuid_lookup)
+
+    monkeypatch.setattr(ReferencesBatchRequest, "pop_items", counting_pop_items)
+    batch_servicer.answer.clear()
+    source = uuid.uuid4()
+
+    with batch_client.batch.fixed_size(batch_size=1) as batch:
+        try:
+            batch.add_object("test", uuid=source)
+            assert batch_servicer.received.wait(5)
+            # more references than fit into a request, but none can be sent while their object is in flight
+            for _ in range(60):
+                batch.add_reference(source, "test", "link", uuid.uuid4())
+            time.sleep(0.1)
+            before = pops
+            time.sleep(0.5)
+            assert pops - before <= 1
+        finally:
+            batch_servicer.answer.set()
+
+    assert len(rest_refs) == 60
+    assert len(batch_client.batch.failed_references) == 0
+
+
+def test_shard_routing(
+    batch_client: weaviate.WeaviateClient,
+    batch_servicer: MockBatchServicer,
+    weaviate_mock: HTTPServer,
+) -> None:
+    weaviate_mock.clear_all_handlers()  # the default nodes status has no shards
+    weaviate_mock.expect_request("/v1/schema").respond_with_json({"classes": []})
+    weaviate_mock.expect_request("/v1/nodes").respond_with_json(
+        {
+            "nodes": [
+                {"name": "node1", "shards": [{"class": "Test", "name": "a"}]},
+                {"name": "node2", "shards": [{"class": "Test", "name": "b"}]},
+            ]
+        }
+    )
+
+    with batch_client.batch.fixed_size(batch_size=20, shard_routing=True) as batch:
+        for i in range(30):
+            batch.add_object("test", {"name": f"name{i}"}, tenant="ab"[i % 2])
+
+    assert len(batch_servicer.objects) == 30
+    assert all(len({obj.tenant for obj in req.objects}) == 1 for req in batch_servicer.requests)
+    assert len(batch_client.batch.failed_objects) == 0
+
+
+def test_max_tenants_per_request(
+    batch_client: weaviate.WeaviateClient, batch_servicer: MockBatchServicer
+) -> None:
+    with pytest.raises(WeaviateInvalidInputError):
+        batch_client.batch.dynamic(max_tenants_per_request=0)
+
+    with batch_client.batch.fixed_size(batch_size=10, max_tenants_per_request=2) as batch:
+        for i in range(50):
+            batch.add_object("test", {"name": f"name{i}"}, tenant=f"tenant{i % 5}")
+
+    assert len(batch_servicer.objects) == 50
+    assert all(len({obj.tenant for obj in req.objects}) <= 2 for req in batch_servicer.requests)
+    assert len(batch_client.batch.failed_objects) == 0
+
+
+def test_spill_directory(
+    batch_client: weaviate.WeaviateClient, batch_servicer: MockBatchServicer, tmp_path: Path
+) -> None:
+    # the objects that an interrupted import left behind are sent first
+    log = _SpillLog(str(tmp_path))
+    left = _BatchObject("Test", None, str(uuid.uuid4()), {"name": "left"}, None, None)
+    log.append(log.encode(left))
+    log.close()
+
+    with batch_client.batch.fixed_size(batch_size=10, spill_directory=str(tmp_path)) as batch:
+        for i in range(50):
+            batch.add_object("test", {"name": f"name{i}"}, vector=[1.0, 2.0])
+        batch.add_object("test", {"id": "invalid"})
+
+    assert len(batch_servicer.objects) == 51
+    by_uuid = {obj.uuid: obj for obj in batch_servicer.objects}
+    assert by_uuid.pop(left.uuid).properties.non_ref_properties["name"] == "left"
+    assert all(obj.vector_bytes == struct.pack("2f", 1.0, 2.0) for obj in by_uuid.values())
+    (failed,) = batch_client.batch.failed_objects
+    assert failed.object_.properties == {"id": "invalid"}
+    assert os.listdir(tmp_path) == []
+
+
+def test_parallel(batch_client: weaviate.WeaviateClient, batch_servicer: MockBatchServicer) -> None:
+    with batch_client.batch.parallel(workers=2) as batch:
+        uuids = [batch.add_object("test", {"name": f"name{i}"}) for i in range(500)]
+
+    assert len(batch_client.batch.failed_objects) == 0
+    assert len(batch_client.batch.results.objs.uuids) == 500
+    assert sorted(obj.uuid for obj in batch_servicer.objects) == sorted(str(uid) for uid in uuids)
+
+    with pytest.raises(WeaviateInvalidInputError):
+        batch_client.batch.parallel(workers=0)
@@ -339,3 +339,90 @@ def test_integration_config(
 
     client.collections.list_all()  # return is irrelevant
     weaviate_no_auth_mock.check_assertions()
+
+
+def test_schema_cache(weaviate_mock: HTTPServer, start_grpc_server: grpc.Server) -> None:
+    schema: Dict[str, Any] = {"class": "Test", "vectorizer": "none", "properties": []}
+    requests = {"Test": 0, "Missing": 0}
+
+    def handle_get(request: Request) -> Response:
+        name = request.path.split("/")[-1]
+        requests[name] += 1
+        if name == "Missing":
+            return Response(status=404)
+        return Response(json.dumps(schema), status=200, content_type="application/json")
+
+    def handle_update(request: Request) -> Response:
+        schema.update(request.json)
+        return Response(json.dumps(schema), status=200, content_type="application/json")
+
+    weaviate_mock.expect_request("/v1/schema/Test", method="GET").respond_with_handler(handle_get)
+    weaviate_mock.expect_request("/v1/schema/Missing", method="GET").respond_with_handler(
+        handle_get
+    )
+    weaviate_mock.expect_request("/v1/schema/Test", method="PUT").respond_with_handler(
+        handle_update
+    )
+
+    def handle_insert(request: Request) -> Response:
+        # auto-schema adds the properties of inserted objects to the collection
+        schema["properties"] = [
+            {
+                "name": name,
+                "dataType": ["text"],
+                "indexFilterable": True,
+                "indexSearchable": True,
+                "tokenization": "word",
+            }
+            for name in request.json["properties"]
+        ]
+        return Response(json.dumps(request.json), status=200, content_type="application/json")
+
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_handler(handle_insert)
+
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        skip_init_checks=True,
+        additional_config=wvc.init.AdditionalConfig(
+            connection=weaviate.config.ConnectionConfig(schema_cache=True)
+        ),
+    )
+    collection = client.collections.get("Test")
+    assert client.collections.exists("Test")
+    assert collection.config.get(simple=True).description is None
+    assert requests["Test"] == 1
+
+    # changes made through the client invalidate the cache
+    collection.config.update(description="updated")
+    assert requests["Test"] == 2
+    assert collection.config.get(simple=True).description == "updated"
+    assert collection.config.get(simple=True).description == "updated"
+    assert requests["Test"] == 3
+
+    assert not client.collections.exists("Missing")
+    assert not client.collections.exists("Missing")
+    assert requests["Missing"] == 1
+
+    # only writes of properties that the collection does not have yet drop its configuration
+    collection.data.insert({"name": "auto"})
+    assert [prop.name for prop in collection.config.get(simple=True).properties] == ["name"]
+    assert requests["Test"] == 4
+    collection.data.insert({"Name": "known"})
+    collection.config.get(simple=True)
+    assert requests["Test"] == 4
+    assert not client.collections.exists("Missing")
+    assert requests["Missing"] == 1
+    client.close()
+
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT, host=MOCK_IP, grpc_port=MOCK_PORT_GRPC, skip_init_checks=True
+    )
+    client.collections.get("Test").config.get(simple=True)
+    client.collections.get("Test").config.get(simple=True)
+    assert requests["Test"] == 6
+    client.close()
+
+    with pytest.raises(ValueError):
+        weaviate.config.ConnectionConfig(schema_cache=True, schema_cache_ttl=0)
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from concurrent import futures
+from typing import Any, Generator
+
+import grpc
+import pytest
+from grpc_health.v1.health_pb2_grpc import add_HealthServicer_to_server
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC, MockHealthServicer
+from mock_tests.test_async_client import UUIDS, MockWeaviateServicer, _async_client
+from weaviate.classes.query import BatchQuery
+from weaviate.exceptions import WeaviateInvalidInputError, WeaviateQueryError
+from weaviate.proto.v1 import search_get_pb2, weaviate_pb2_grpc
+
+FAILING_LIMIT = 13
+
+
+class FailingWeaviateServicer(MockWeaviateServicer):
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        if request.limit == FAILING_LIMIT:
+            context.abort(grpc.StatusCode.INTERNAL, "search failed")
+        return super().Search(request, context)
+
+
+@pytest.fixture(scope="module")
+def weaviate_servicer() -> Generator[FailingWeaviateServicer, None, None]:
+    servicer = FailingWeaviateServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_HealthServicer_to_server(MockHealthServicer(), server)
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    server.add_insecure_port(f"[::]:{MOCK_PORT_GRPC}")
+    server.start()
+    yield servicer
+    server.stop(0)
+
+
+QUERIES = [
+    BatchQuery.near_vector([1.0, 2.0], limit=1),
+    BatchQuery.fetch_objects(limit=FAILING_LIMIT),
+    BatchQuery.bm25("query", limit=2),
+    BatchQuery.fetch_object_by_id(UUIDS[1]),
+    BatchQuery.near_text("text", limit="not a number"),
+]
+
+
+def _assert_results(results: Any) -> None:
+    near, failed, bm25, single, invalid = results
+    assert [obj.uuid for obj in near.objects] == UUIDS[:1]
+    assert isinstance(failed, WeaviateQueryError)
+    assert [obj.uuid for obj in bm25.objects] == UUIDS[:2]
+    assert single.uuid == UUIDS[0]
+    assert isinstance(invalid, WeaviateInvalidInputError)
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_query_batch(
+    weaviate_mock: HTTPServer, weaviate_servicer: FailingWeaviateServicer, concurrency: int
+) -> None:
+    client = weaviate.WeaviateClient(
+        connection_params=weaviate.connect.ConnectionParams.from_params(
+            http_host=MOCK_IP,
+            http_port=MOCK_PORT,
+            http_secure=False,
+            grpc_host=MOCK_IP,
+            grpc_port=MOCK_PORT_GRPC,
+            grpc_secure=False,
+        ),
+        skip_init_checks=True,
+    )
+    client.connect()
+    try:
+        collection = client.collections.get("Test")
+        _assert_results(collection.query.batch(QUERIES, concurrency=concurrency))
+        threads = set(threading.enumerate())
+        _assert_results(collection.query.batch(QUERIES, concurrency=concurrency))
+        assert set(threading.enumerate()) <= threads  # the threads of the first call are reused
+        assert collection.query.batch([]) == []
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.query.batch(QUERIES, concurrency=0)
+    finally:
+        client.close()
+
+
+def test_query_batch_async(
+    weaviate_mock: HTTPServer, weaviate_servicer: FailingWeaviateServicer
+) -> None:
+    async def run() -> Any:
+        async with _async_client() as client:
+            return await client.collections.get("Test").query.batch(QUERIES, concurrency=2)
+
+    _assert_results(asyncio.run(run()))
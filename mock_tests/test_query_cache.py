@@ -0,0 +1,133 @@
+import asyncio
+import time
+from concurrent import futures
+from typing import Generator
+
+import grpc
+import pytest
+from grpc_health.v1.health_pb2_grpc import add_HealthServicer_to_server
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC, MockHealthServicer
+from mock_tests.test_async_client import UUIDS, MockWeaviateServicer, _async_client
+from weaviate.collections.query_cache import QueryCacheStats
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import weaviate_pb2_grpc
+
+
+@pytest.fixture(scope="module")
+def weaviate_servicer() -> Generator[MockWeaviateServicer, None, None]:
+    servicer = MockWeaviateServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_HealthServicer_to_server(MockHealthServicer(), server)
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    server.add_insecure_port(f"[::]:{MOCK_PORT_GRPC}")
+    server.start()
+    yield servicer
+    server.stop(0)
+
+
+@pytest.fixture(scope="function")
+def client(
+    weaviate_mock: HTTPServer, weaviate_servicer: MockWeaviateServicer
+) -> Generator[weaviate.WeaviateClient, None, None]:
+    client = weaviate.WeaviateClient(
+        connection_params=weaviate.connect.ConnectionParams.from_params(
+            http_host=MOCK_IP,
+            http_port=MOCK_PORT,
+            http_secure=False,
+            grpc_host=MOCK_IP,
+            grpc_port=MOCK_PORT_GRPC,
+            grpc_secure=False,
+        ),
+        skip_init_checks=True,
+    )
+    client.connect()
+    yield client
+    client.close()
+
+
+def test_query_cache(
+    client: weaviate.WeaviateClient,
+    weaviate_servicer: MockWeaviateServicer,
+    weaviate_mock: HTTPServer,
+) -> None:
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_json({})
+    collection = client.collections.get("Test").with_query_cache()
+    sent = len(weaviate_servicer.requests)
+
+    first = collection.query.fetch_objects(limit=2)
+    second = collection.query.fetch_objects(limit=2)
+    assert [obj.uuid for obj in second.objects] == [obj.uuid for obj in first.objects] == UUIDS[:2]
+    assert len(weaviate_servicer.requests) == sent + 1
+
+    # other arguments and tenants miss, while derived collections share the cache
+    collection.query.fetch_objects(limit=3)
+    collection.with_tenant("tenant").query.fetch_objects(limit=2)
+    assert len(weaviate_servicer.requests) == sent + 3
+    collection.with_tenant("tenant").query.fetch_objects(limit=2)
+    assert len(weaviate_servicer.requests) == sent + 3
+
+    # writes through any collection object of the client invalidate the cache
+    client.collections.get("Test").data.insert({"name": "new"})
+    collection.query.fetch_objects(limit=2)
+    assert len(weaviate_servicer.requests) == sent + 4
+
+    assert collection.query_cache is not None
+    stats = collection.query_cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (2, 4, 0, 3)
+
+    # the cache of other collections and of collections without a cache are not affected
+    client.collections.get("Test").query.fetch_objects(limit=2)
+    assert len(weaviate_servicer.requests) == sent + 5
+
+
+def test_query_cache_async(
+    weaviate_mock: HTTPServer, weaviate_servicer: MockWeaviateServicer
+) -> None:
+    weaviate_mock.expect_request(
+        "/v1/objects/Test/" + str(UUIDS[0]), method="DELETE"
+    ).respond_with_data(status=204)
+
+    async def run() -> None:
+        async with _async_client() as client:
+            collection = client.collections.get("Test").with_query_cache()
+            sent = len(weaviate_servicer.requests)
+            await collection.query.fetch_objects(limit=2)
+            await collection.query.fetch_objects(limit=2)
+            assert len(weaviate_servicer.requests) == sent + 1
+
+            assert await collection.data.delete_by_id(UUIDS[0])
+            await collection.query.fetch_objects(limit=2)
+            assert len(weaviate_servicer.requests) == sent + 2
+
+    asyncio.run(run())
+
+
+def test_eviction_and_expiry(client: weaviate.WeaviateClient) -> None:
+    with pytest.raises(WeaviateInvalidInputError):
+        client.collections.get("Test").with_query_cache(max_bytes=0)
+    with pytest.raises(WeaviateInvalidInputError):
+        client.collections.get("Test").with_query_cache(ttl=0)
+
+    collection = client.collections.get("Test").with_query_cache(max_bytes=300, ttl=0.2)
+    assert collection.query_cache is not None
+    for limit in range(1, 4):
+        collection.query.fetch_objects(limit=limit)
+    stats = collection.query_cache.stats()
+    assert stats.evictions > 0
+    assert stats.size_bytes <= 300
+
+    # the most recently used reply is kept
+    collection.query.fetch_objects(limit=3)
+    assert collection.query_cache.stats().hits == 1
+
+    time.sleep(0.3)
+    collection.query.fetch_objects(limit=3)
+    assert collection.query_cache.stats().hits == 1
+
+    collection.query_cache.clear()
+    assert collection.query_cache.stats() == QueryCacheStats(
+        hits=1, misses=stats.misses + 1, evictions=stats.evictions, entries=0, size_bytes=0
+    )
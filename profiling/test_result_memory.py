@@ -0,0 +1,78 @@
+# run:
+# - pytest -m profiling profiling/test_result_memory.py -s
+
+import datetime
+import tracemalloc
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from weaviate.collections.classes.internal import MetadataReturn, Object
+
+NUM_OBJECTS = 100_000
+
+
+# the result classes as they were before they were slotted
+@dataclass
+class DictMetadataReturn:
+    creation_time: Optional[datetime.datetime] = None
+    last_update_time: Optional[datetime.datetime] = None
+    distance: Optional[float] = None
+    certainty: Optional[float] = None
+    score: Optional[float] = None
+    explain_score: Optional[str] = None
+    is_consistent: Optional[bool] = None
+    rerank_score: Optional[float] = None
+
+
+@dataclass
+class DictObject:
+    uuid: uuid.UUID
+    metadata: DictMetadataReturn
+    properties: Dict[str, Any]
+    references: Any
+    vector: Dict[str, List[float]]
+    collection: str
+
+
+def bytes_per_object(create: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [create() for _ in range(NUM_OBJECTS)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(objects) == NUM_OBJECTS
+    return (after - before) / NUM_OBJECTS
+
+
+@pytest.mark.profiling
+def test_result_memory() -> None:
+    # the values are shared by all objects so that only the overhead of the result classes is measured
+    uid = uuid.uuid4()
+    properties = {"name": "name"}
+    vector = {"default": [1.0, 2.0]}
+
+    before = bytes_per_object(
+        lambda: DictObject(
+            uuid=uid,
+            metadata=DictMetadataReturn(score=1.0),
+            properties=properties,
+            references=None,
+            vector=vector,
+            collection="Test",
+        )
+    )
+    after = bytes_per_object(
+        lambda: Object(
+            uuid=uid,
+            metadata=MetadataReturn(score=1.0),
+            properties=properties,
+            references=None,
+            vector=vector,
+            collection="Test",
+        )
+    )
+    print(f"bytes per object: {before:.0f} with __dict__, {after:.0f} with __slots__")
+    assert after < before
@@ -0,0 +1,53 @@
+from typing import Any, List
+
+from weaviate.collections.batch.controller import _DynamicBatchingController
+
+
+def _nodes(*stats: Any) -> List[Any]:
+    return [{"batchStats": {"queueLength": queue, "ratePerSecond": rate}} for queue, rate in stats]
+
+
+def _controller() -> _DynamicBatchingController:
+    return _DynamicBatchingController(
+        max_batch_size=1000, max_concurrent_requests=10, latency_target=10
+    )
+
+
+def test_aggregates_all_nodes() -> None:
+    controller = _controller()
+    # the second node is the bottleneck with 4s of queued work, although the cluster as a whole keeps up
+    stats = controller.update(_nodes((100, 1000), (400, 100)), 500, 2, 0, None)
+    assert (stats.queue_length, stats.rate_per_second, stats.backlog_seconds) == (500, 1100, 4.0)
+    assert stats.decision == "decrease"
+    assert stats.batch_size == 275  # half of the cluster's rate per worker
+
+    stats = controller.update(_nodes((10, 1000), (10, 100)), 500, 2, 0, None)
+    assert stats.decision == "increase"
+    assert stats.batch_size == 750
+
+
+def test_increase_hold_and_pause() -> None:
+    controller = _controller()
+    stats = controller.update(_nodes((0, 0), (0, 0)), 1000, 2, 5000, None)
+    assert (stats.decision, stats.batch_size, stats.concurrent_requests) == ("increase", 1000, 3)
+
+    stats = controller.update(_nodes((200, 100)), 300, 2, 0, None)
+    assert (stats.decision, stats.batch_size) == ("hold", 50)
+
+    stats = controller.update(_nodes((100, 0), (0, 100)), 300, 4, 0, None)
+    assert (stats.decision, stats.batch_size, stats.concurrent_requests) == ("pause", 0, 2)
+
+    # recovers from a pause
+    stats = controller.update(_nodes((100, 100)), 0, 2, 0, None)
+    assert (stats.decision, stats.batch_size) == ("increase", 50)
+
+
+def test_slow_requests_decrease() -> None:
+    stats = _controller().update(_nodes((0, 100)), 800, 4, 0, 12.0)
+    assert (stats.decision, stats.batch_size, stats.concurrent_requests) == ("decrease", 400, 3)
+    assert stats.latency_seconds == 12.0
+
+
+def test_fixed_without_batch_stats() -> None:
+    stats = _controller().update([{"batchStats": {"ratePerSecond": 0}}, {}], 10, 2, 0, None)  # type: ignore[list-item]
+    assert (stats.decision, stats.batch_size, stats.concurrent_requests) == ("fixed", 1000, 10)
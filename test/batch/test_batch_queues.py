@@ -0,0 +1,156 @@
+from typing import Optional
+from unittest.mock import Mock
+
+from weaviate.collections.batch.base import (
+    ObjectsBatchRequest,
+    ReferencesBatchRequest,
+    _PartitionedObjectsBatchRequest,
+)
+from weaviate.collections.batch.routing import _ShardRouter
+from weaviate.collections.classes.batch import _BatchObject, _BatchReference
+
+
+def _obj(i: int) -> _BatchObject:
+    return _BatchObject("Test", None, str(i), None, None, None)
+
+
+def _ref(from_uuid: str, to: str) -> _BatchReference:
+    return _BatchReference(from_="", to=to, tenant=None, from_uuid=from_uuid)
+
+
+def test_objects_batch_request() -> None:
+    queue = ObjectsBatchRequest()
+    for i in range(5):
+        queue.add(_obj(i))
+    queue.extend([_obj(5), _obj(6)])
+    assert len(queue) == 7
+
+    popped = queue.pop_items(3)
+    assert [obj.uuid for obj in popped] == ["0", "1", "2"]
+    queue.prepend(popped[1:])
+    assert [obj.uuid for obj in queue.pop_items(100)] == ["1", "2", "3", "4", "5", "6"]
+    assert len(queue) == 0
+    assert queue.pop_items(1) == []
+
+
+def test_references_batch_request_skips_objects_in_flight() -> None:
+    queue = ReferencesBatchRequest()
+    queue.add(_ref("a", "1"))
+    queue.extend([_ref("b", "1"), _ref("a", "2"), _ref("c", "1")])
+    assert len(queue) == 4
+
+    popped = queue.pop_items(10, uuid_lookup={"a"})
+    assert [(ref.from_uuid, ref.to) for ref in popped] == [("b", "1"), ("c", "1")]
+    assert len(queue) == 2
+
+    queue.prepend(popped[1:])
+    assert [(ref.from_uuid, ref.to) for ref in queue.pop_items(2, uuid_lookup=set())] == [
+        ("c", "1"),
+        ("a", "1"),
+    ]
+    assert [(ref.from_uuid, ref.to) for ref in queue.pop_items(2, uuid_lookup=set())] == [
+        ("a", "2")
+    ]
+    assert len(queue) == 0
+
+
+def test_objects_batch_request_grouped() -> None:
+    queue = ObjectsBatchRequest()
+    queue.extend([_obj(i) for i in range(7)])
+
+    def group(obj: _BatchObject) -> Optional[str]:
+        return None if obj.uuid == "6" else str(int(obj.uuid) % 2)
+
+    queue.group_by(group)
+    assert len(queue) == 7
+    popped = queue.pop_items(2)
+    assert [obj.uuid for obj in popped] == ["0", "2"]
+    assert [obj.uuid for obj in queue.pop_items(10)] == ["1", "3", "5"]
+    queue.prepend(popped)  # retried objects are popped first
+    queue.add(_obj(8))
+    assert [obj.uuid for obj in queue.pop_items(10)] == ["0", "2", "4", "8"]
+    assert [obj.uuid for obj in queue.pop_items(10)] == ["6"]
+    assert len(queue) == 0
+    assert queue.pop_items(1) == []
+
+    queue.extend([_obj(i) for i in range(4)])
+    queue.group_by(None)  # the queued objects are regrouped
+    assert [obj.uuid for obj in queue.pop_items(10)] == ["0", "2", "1", "3"]
+
+
+def test_shard_router() -> None:
+    cluster = Mock()
+    cluster.get_nodes_status.return_value = [
+        {
+            "name": "node1",
+            "shards": [
+                {"class": "Tenants", "name": "a"},
+                {"class": "Single", "name": "xyz"},
+                {"class": "Multi", "name": "m1"},
+            ],
+        },
+        {
+            "name": "node2",
+            "shards": [
+                {"class": "Tenants", "name": "b"},
+                {"class": "Single", "name": "xyz"},
+                {"class": "Multi", "name": "m2"},
+            ],
+        },
+        {"name": "node3", "shards": None},
+    ]
+    router = _ShardRouter(cluster)
+    assert router.refresh()
+    assert not router.refresh()  # the placement is only fetched again after a while
+    cluster.get_nodes_status.assert_called_once_with(output="verbose")
+
+    def obj(collection: str, tenant: Optional[str]) -> _BatchObject:
+        return _BatchObject(collection, None, "", None, tenant, None)
+
+    assert router.nodes(obj("Tenants", "a")) == ("node1",)
+    assert router.nodes(obj("Tenants", "b")) == ("node2",)
+    assert router.nodes(obj("Tenants", "c")) is None
+    assert router.nodes(obj("Single", None)) == ("node1", "node2")
+    assert router.nodes(obj("Multi", None)) is None
+    assert router.nodes(obj("Unknown", None)) is None
+
+
+def test_partitioned_objects_batch_request() -> None:
+    def obj(i: int, tenant: str) -> _BatchObject:
+        return _BatchObject("Test", None, str(i), None, tenant, None)
+
+    queue = _PartitionedObjectsBatchRequest(max_partitions=2, max_age=60)
+    queue.extend([obj(i, "abc"[i % 3]) for i in range(9)])
+    assert len(queue) == 9
+    assert queue.time_to_ready() > 0
+
+    # only full partitions can be popped before they are old
+    assert not queue.ready(5)
+    assert queue.pop_items(5) == []
+    assert queue.ready(3)
+    assert [(o.tenant, o.uuid) for o in queue.pop_items(3)] == [("a", "0"), ("a", "3"), ("a", "6")]
+
+    # retried objects are sent right away, together with their partition
+    queue.prepend([obj(9, "c")])
+    assert [o.uuid for o in queue.pop_items(100)] == ["9", "2", "5", "8"]
+
+    # flushing releases all partitions, which are popped oldest first and at most two per request
+    queue.extend([obj(10, "d"), obj(11, "e")])
+    queue.release()
+    assert [o.uuid for o in queue.pop_items(100)] == ["1", "4", "7", "10"]
+    assert [o.uuid for o in queue.pop_items(100)] == ["11"]
+    assert len(queue) == 0 and not queue.ready(1)
+
+
+def test_attached_references_drop_the_encoding_of_retried_objects() -> None:
+    queue = ObjectsBatchRequest()
+    retried = _obj(0)
+    retried.serialized = b"encoded"
+    spilled = _BatchObject("Test", None, "1", None, None, None, serialized=b"", spill_offset=1)
+    queue.prepend([retried, spilled])
+
+    assert queue.attach_reference("0", "Test", None, "link", "2", [_ref("0", "2")])
+    assert retried.serialized is None and retried.references == {"link": "2"}
+    assert retried.attached_references == [_ref("0", "2")]
+    # objects read back from a spill file cannot be encoded again
+    assert not queue.attach_reference("1", "Test", None, "link", "2", [_ref("1", "2")])
@@ -0,0 +1,71 @@
+import os
+from pathlib import Path
+from typing import List
+
+from weaviate.collections.batch.spill import _SpillLog
+from weaviate.collections.classes.batch import _BatchObject
+
+
+def _append(log: _SpillLog, uuids: range) -> None:
+    for i in uuids:
+        obj = _BatchObject("Test", [1.0, 2.0], str(i), {"name": f"name{i}"}, "tenant", None)
+        log.append(log.encode(obj))
+
+
+def _uuids(objects: List[_BatchObject]) -> List[str]:
+    return [obj.uuid for obj in objects]
+
+
+def test_spill_log_resumes_after_sent_records(tmp_path: Path) -> None:
+    log = _SpillLog(str(tmp_path), segment_bytes=200)
+    _append(log, range(10))
+    assert log.unread() == 10
+
+    first, second = log.read(3), log.read(3)
+    assert _uuids(first) == ["0", "1", "2"] and _uuids(second) == ["3", "4", "5"]
+    assert (first[0].collection, first[0].tenant, first[0].properties) == ("Test", "tenant", None)
+    assert first[0].serialized is not None
+
+    # the checkpoint only moves past records once all records before them were sent
+    log.sent(second)
+    log.sent(first[:2])
+    segments = sorted(name for name in os.listdir(tmp_path) if name.endswith(".log"))
+    assert len(segments) > 2
+    log.close()
+
+    log = _SpillLog(str(tmp_path), segment_bytes=200)
+    assert log.unread() == 8
+    resumed = log.read(100)
+    assert _uuids(resumed) == ["2", "3", "4", "5", "6", "7", "8", "9"]
+
+    _append(log, range(10, 12))
+    rest = log.read(100)
+    assert _uuids(rest) == ["10", "11"]
+    log.sent(rest)
+    # records 2 to 9 were not sent yet, so their segments are kept
+    assert set(segments) < set(os.listdir(tmp_path))
+
+    # segments are deleted once all their records were sent
+    log.sent(resumed)
+    assert len(os.listdir(tmp_path)) == 2
+    log.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_spill_log_cuts_off_torn_records(tmp_path: Path) -> None:
+    log = _SpillLog(str(tmp_path))
+    _append(log, range(3))
+    log.close()
+    (segment,) = [name for name in os.listdir(tmp_path) if name.endswith(".log")]
+    with open(tmp_path / segment, "r+b") as f:
+        f.truncate(os.path.getsize(tmp_path / segment) - 1)
+
+    log = _SpillLog(str(tmp_path))
+    assert log.unread() == 2
+    _append(log, range(3, 4))
+    objects = log.read(100)
+    assert _uuids(objects) == ["0", "1", "3"]
+
+    log.sent(objects)
+    log.close()
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,75 @@
+import uuid
+
+import pytest
+
+from weaviate.collections.batch import grpc_batch_objects
+from weaviate.collections.batch.grpc_batch_objects import (
+    _BatchGRPC,
+    _translate_properties_from_python_to_grpc,
+)
+from weaviate.collections.classes.batch import _BatchObject
+
+
+def _grpc_objects(vector: object) -> list:
+    batch = _BatchGRPC(connection=None, consistency_level=None)  # type: ignore
+    obj = _BatchObject("Test", vector, "", None, None, None)  # type: ignore
+    return batch._BatchGRPC__grpc_objects([obj])  # type: ignore
+
+
+def test_numpy_vectors_are_packed() -> None:
+    np = pytest.importorskip("numpy")
+
+    packed = b"\x00\x00\x80?\x00\x00\x00@"
+    (single,) = _grpc_objects(np.array([1.0, 2.0], dtype=np.float32))
+    assert single.vector_bytes == packed
+
+    (named,) = _grpc_objects({"a": np.array([1, 2]), "b": [1.0, 2.0]})
+    assert {vec.name: vec.vector_bytes for vec in named.vectors} == {"a": packed, "b": packed}
+    assert named.vector_bytes == b""
+
+
+def test_property_plans_are_reused_per_shape() -> None:
+    plans: dict = {}
+    first = _translate_properties_from_python_to_grpc(
+        {"name": "a", "tags": ["x"], "nested": {"count": 1}}, {}, plans
+    )
+    second = _translate_properties_from_python_to_grpc(
+        {"name": "b", "tags": ["y", "z"], "nested": {"count": 2}}, {}, plans
+    )
+    assert len(plans) == 2  # the object and its nested object
+
+    # the same property with a different type is a different shape
+    third = _translate_properties_from_python_to_grpc(
+        {"name": "c", "tags": [], "nested": {}}, {}, plans
+    )
+    assert len(plans) == 4
+
+    assert first.non_ref_properties["name"] == "a" and second.non_ref_properties["name"] == "b"
+    assert list(second.text_array_properties[0].values) == ["y", "z"]
+    assert second.object_properties[0].value.non_ref_properties["count"] == 2
+    assert list(third.empty_list_props) == ["tags"] and len(third.text_array_properties) == 0
+
+
+def test_failed_objects_keep_their_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    batch = _BatchGRPC(connection=None, consistency_level=None)  # type: ignore
+    objs = [
+        _BatchObject("Test", None, str(uuid.uuid4()), {"name": "a"}, None, None) for _ in range(2)
+    ]
+    messages = batch._BatchGRPC__grpc_objects(objs)  # type: ignore
+    batch._BatchGRPC__batch_return(objs, messages, {1: "rate limit"}, 0.0, False)  # type: ignore
+    assert objs[1].sent_message is None
+
+    batch._BatchGRPC__batch_return(objs, messages, {1: "rate limit"}, 0.0, True)  # type: ignore
+    assert objs[0].sent_message is None
+    assert objs[1].sent_message is messages[1] and objs[1].serialized is None
+    assert "sent_message" not in repr(objs[1])
+
+    # a retry sends the encoded message without translating the properties again
+    objs[1].serialized = messages[1].SerializeToString()
+
+    def fail(*args: object) -> None:
+        raise AssertionError("encoded again")
+
+    monkeypatch.setattr(grpc_batch_objects, "_translate_properties_from_python_to_grpc", fail)
+    (retried,) = batch._BatchGRPC__grpc_objects([objs[1]])  # type: ignore
+    assert retried == messages[1]
@@ -1,3 +1,5 @@
+import pytest
+
 from weaviate.collections.queries.byteops import _ByteOps
 
 
@@ -22,3 +24,33 @@ def test_decode_int64s():
     assert _ByteOps.decode_int64s(
         b"\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00"
     ) == [1, 2]
+
+
+def test_decode_float32s_numpy():
+    np = pytest.importorskip("numpy")
+
+    byte_vector = b"\x00\x00\x80?\x00\x00\x00@\x00\x00\x00\x00"
+    decoded = _ByteOps.decode_float32s_numpy(byte_vector)
+    assert isinstance(decoded, np.ndarray)
+    assert decoded.dtype == np.float32
+    assert decoded.tolist() == [1.0, 2.0, 0.0]
+    assert not decoded.flags.writeable
+    assert _ByteOps.decode_float32s_numpy(b"").tolist() == []
+
+
+def test_encode_float32s():
+    packed = b"\x00\x00\x80?\x00\x00\x00@\x00\x00\x00\x00"
+    assert _ByteOps.encode_float32s([1.0, 2.0, 0.0]) == packed
+
+
+def test_encode_float32s_numpy():
+    np = pytest.importorskip("numpy")
+
+    packed = b"\x00\x00\x80?\x00\x00\x00@\x00\x00\x00\x00"
+    assert _ByteOps.encode_float32s(np.array([1.0, 2.0, 0.0], dtype=np.float32)) == packed
+    assert _ByteOps.encode_float32s(np.array([1.0, 2.0, 0.0], dtype=np.float64)) == packed
+    assert _ByteOps.encode_float32s(np.array([[1, 2, 0]])) == packed
+    assert _ByteOps.encode_float32s(np.array([1.0, 5.0, 2.0, 5.0, 0.0])[::2]) == packed
+    assert _ByteOps.is_float_array(np.zeros((1, 3)))
+    assert not _ByteOps.is_float_array(np.zeros((2, 3)))
+    assert not _ByteOps.is_float_array(np.array(["a", "b"]))
@@ -1,3 +1,7 @@
+import dataclasses
+import pickle
+import uuid
+
 import pytest
 from pydantic import ValidationError
 
@@ -8,7 +12,16 @@ from weaviate.collections.classes.grpc import (
     Sort,
 )
 
+from weaviate.collections.classes.batch import BatchObject, _batch_objects_from_columns
 from weaviate.collections.classes.filters import Filter
+from weaviate.collections.classes.internal import (
+    GenerativeObject,
+    GroupByMetadataReturn,
+    GroupByObject,
+    MetadataReturn,
+    Object,
+)
+from weaviate.exceptions import WeaviateInvalidInputError
 
 
 def test_link_to_errors_on_extra_variable() -> None:
@@ -34,3 +47,78 @@ def test_direct_init_filter() -> None:
 def test_direct_init_sort() -> None:
     with pytest.raises(TypeError):
         Sort()
+
+
+def test_batch_object_keeps_float_arrays() -> None:
+    np = pytest.importorskip("numpy")
+
+    vector = np.array([1.0, 2.0], dtype=np.float32)
+    named = {"first": vector, "second": [3, 4]}
+    obj = BatchObject(collection="test", vector=named)._to_internal()
+    assert isinstance(obj.vector, dict)
+    assert obj.vector["first"] is vector
+    assert obj.vector["second"] == [3.0, 4.0]
+    assert set(named.keys()) == {"first", "second"} and named["first"] is vector
+
+    assert BatchObject(collection="Test", vector=vector)._to_internal().vector is vector
+    with pytest.raises(ValidationError):
+        BatchObject(collection="Test", vector=np.array(["a", "b"]))
+
+
+def test_batch_objects_from_columns() -> None:
+    np = pytest.importorskip("numpy")
+
+    uuids = [str(uuid.uuid4()) for _ in range(3)]
+    matrix = np.arange(6, dtype=np.float64).reshape(3, 2)
+    objects = _batch_objects_from_columns(
+        "Test",
+        "tenant",
+        {"name": ["a", "b", "c"], "count": np.array([1, 2, 3])},
+        matrix,
+        uuids,
+    )
+    assert [obj.uuid for obj in objects] == uuids
+    assert [obj.properties for obj in objects] == [
+        {"name": "a", "count": 1},
+        {"name": "b", "count": 2},
+        {"name": "c", "count": 3},
+    ]
+    assert all(obj.collection == "Test" and obj.tenant == "tenant" for obj in objects)
+    assert objects[2].vector.dtype == np.float32 and objects[2].vector.tolist() == [4.0, 5.0]
+
+    named = _batch_objects_from_columns("Test", None, None, {"a": matrix, "b": [[1.0]] * 3}, None)
+    assert len(named) == 3 and named[1].vector["b"] == [1.0]
+    assert len({obj.uuid for obj in named}) == 3
+
+    assert _batch_objects_from_columns("Test", None, None, None, None) == []
+    with pytest.raises(WeaviateInvalidInputError):
+        _batch_objects_from_columns("Test", None, {"name": ["a"]}, matrix, None)
+
+
+def test_result_objects_are_slotted() -> None:
+    uid = uuid.uuid4()
+    obj = GenerativeObject(
+        uuid=uid,
+        metadata=MetadataReturn(score=1.0),
+        properties={"name": "name"},
+        references=None,
+        vector={},
+        collection="Test",
+        generated="generated",
+    )
+    group_by = GroupByObject(
+        uuid=uid,
+        metadata=GroupByMetadataReturn(),
+        properties={},
+        references=None,
+        vector={},
+        collection="Test",
+        belongs_to_group="group",
+    )
+    for result in (obj, obj.metadata, group_by, group_by.metadata):
+        assert not hasattr(result, "__dict__")
+
+    assert isinstance(obj, Object)
+    assert (obj.uuid, obj.metadata.score, obj.generated) == (uid, 1.0, "generated")
+    assert obj == pickle.loads(pickle.dumps(obj))
+    assert dataclasses.replace(obj, generated=None).generated is None
@@ -0,0 +1,105 @@
+import json
+import uuid
+from typing import Any, List, Optional
+
+import pytest
+
+from weaviate.collections.classes.internal import MetadataReturn, Object, QueryReturn
+from weaviate.collections.export import _CollectionExport, _uuid_ranges
+from weaviate.exceptions import WeaviateInvalidInputError
+
+
+class _FakeCollection:
+    """Mimics the cursor semantics of `fetch_objects(after=...)` over an in-memory collection."""
+
+    def __init__(self, count: int) -> None:
+        self.uuids = sorted(uuid.uuid4() for _ in range(count))
+        self.calls = 0
+
+    def fetch_objects(
+        self, *, limit: int, after: Optional[uuid.UUID], **kwargs: Any
+    ) -> QueryReturn:
+        self.calls += 1
+        uuids = [uid for uid in self.uuids if after is None or uid > after][:limit]
+        return QueryReturn(
+            objects=[
+                Object(
+                    uuid=uid,
+                    metadata=MetadataReturn(),
+                    properties={"name": str(uid)},
+                    references=None,
+                    vector={},
+                    collection="Test",
+                )
+                for uid in uuids
+            ]
+        )
+
+
+def test_uuid_ranges_cover_the_uuid_space() -> None:
+    ranges = _uuid_ranges(4)
+    assert ranges[0][0] is None
+    assert ranges[-1][1] is None
+    for (_, upper), (after, _) in zip(ranges, ranges[1:]):
+        assert upper is not None and after is not None
+        assert upper.int == after.int + 1
+
+
+@pytest.mark.parametrize("shards,concurrency,page_size", [(1, 1, 100), (8, 3, 7), (16, 4, 1)])
+def test_export_to_callback(shards: int, concurrency: int, page_size: int) -> None:
+    collection = _FakeCollection(250)
+    pages: List[List[Object]] = []
+
+    count = _CollectionExport(collection.fetch_objects).to_callback(
+        pages.append, shards=shards, concurrency=concurrency, page_size=page_size
+    )
+
+    assert count == 250
+    assert all(len(page) <= page_size for page in pages)
+    assert sorted(obj.uuid for page in pages for obj in page) == collection.uuids
+
+
+def test_export_resumes_from_checkpoint(tmp_path: Any) -> None:
+    collection = _FakeCollection(100)
+    checkpoint = str(tmp_path / "checkpoint.json")
+    exported: List[uuid.UUID] = []
+    pages: List[int] = []
+
+    def failing_callback(objects: List[Object]) -> None:
+        if len(pages) == 3:
+            raise RuntimeError("interrupted")
+        pages.append(len(objects))
+        exported.extend(obj.uuid for obj in objects)
+
+    export = _CollectionExport(collection.fetch_objects)
+    with pytest.raises(RuntimeError):
+        export.to_callback(
+            failing_callback, shards=4, concurrency=1, page_size=10, checkpoint=checkpoint
+        )
+    assert len(exported) == sum(pages)
+
+    count = export.to_callback(
+        lambda objects: exported.extend(obj.uuid for obj in objects),
+        shards=4,
+        concurrency=1,
+        page_size=10,
+        checkpoint=checkpoint,
+    )
+    assert count == 100 - sum(pages)
+    assert sorted(exported) == collection.uuids
+    with open(checkpoint) as f:
+        assert all(cursor["done"] for cursor in json.load(f)["cursors"])
+
+    with pytest.raises(WeaviateInvalidInputError):
+        export.to_callback(lambda _: None, shards=2, checkpoint=checkpoint)
+
+
+def test_export_to_jsonl(tmp_path: Any) -> None:
+    collection = _FakeCollection(20)
+    path = str(tmp_path / "export.jsonl")
+
+    assert _CollectionExport(collection.fetch_objects).to_jsonl(path, shards=2) == 20
+    with open(path) as f:
+        rows = [json.loads(line) for line in f]
+    assert sorted(row["uuid"] for row in rows) == [str(uid) for uid in collection.uuids]
+    assert all(row["properties"]["name"] == row["uuid"] for row in rows)
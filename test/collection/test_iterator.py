@@ -0,0 +1,63 @@
+import uuid
+from typing import List, Optional
+
+import pytest
+
+from weaviate.collections.classes.internal import MetadataReturn, Object
+from weaviate.collections.iterator import _ObjectIterator
+
+
+def _make_query(uuids: List[uuid.UUID], calls: List[Optional[uuid.UUID]]):
+    def query(limit: int, after: Optional[uuid.UUID]) -> List[Object]:
+        calls.append(after)
+        start = 0 if after is None else uuids.index(after) + 1
+        return [
+            Object(
+                uuid=uid,
+                metadata=MetadataReturn(),
+                properties={},
+                references=None,
+                vector={},
+                collection="Test",
+            )
+            for uid in uuids[start : start + limit]
+        ]
+
+    return query
+
+
+@pytest.mark.parametrize("page_size,prefetch", [(100, 0), (7, 0), (7, 1), (3, 4), (1000, 2)])
+def test_iterator(page_size: int, prefetch: int) -> None:
+    uuids = sorted(uuid.uuid4() for _ in range(50))
+    calls: List[Optional[uuid.UUID]] = []
+    iterator = _ObjectIterator(_make_query(uuids, calls), None, page_size, prefetch)
+
+    assert [obj.uuid for obj in iterator] == uuids
+    assert calls[0] is None
+    assert len(calls) >= len(uuids) // page_size + 1
+
+    # iterating again restarts from the initial cursor
+    assert [obj.uuid for obj in iterator] == uuids
+
+
+def test_iterator_with_initial_cursor() -> None:
+    uuids = sorted(uuid.uuid4() for _ in range(10))
+    iterator = _ObjectIterator(_make_query(uuids, []), uuids[4], 3, 1)
+    assert [obj.uuid for obj in iterator] == uuids[5:]
+
+
+def test_iterator_stops_prefetching() -> None:
+    uuids = sorted(uuid.uuid4() for _ in range(10))
+    iterator = _ObjectIterator(_make_query(uuids, []), None, 3, 2)
+
+    assert [obj.uuid for obj in iterator] == uuids
+    assert iterator._ObjectIterator__executor is None  # type: ignore
+
+    for _ in iterator:
+        break
+    executor = iterator._ObjectIterator__executor  # type: ignore
+    assert executor is not None
+    # restarting shuts the executor of the previous loop down and drops its pages
+    assert next(iter(iterator)).uuid == uuids[0]
+    assert executor._shutdown
+    assert [obj.uuid for obj in iterator] == uuids
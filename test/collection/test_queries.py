@@ -1,8 +1,20 @@
-import pytest
+import datetime
+import struct
+import uuid
 from typing import Callable
+
+import numpy as np
+import pytest
+
+from weaviate.collections.classes.grpc import GroupBy, QueryReference
+from weaviate.collections.classes.internal import ColumnarReturn, Object, _QueryOptions
+from weaviate.collections.classes.types import GeoCoordinate
 from weaviate.connect import ConnectionV4
 from weaviate.collections.query import _QueryCollection
 from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
+from weaviate.types import VECTOR_FORMAT
+from weaviate.util import _ServerVersion
 
 # TODO: re-enable tests once string syntax is re-enabled in the API
 
@@ -127,3 +139,201 @@ def test_bad_query_inputs(connection: ConnectionV4) -> None:
 
     # near image
     _test_query(lambda: query.near_image(42))
+
+    # vector format
+    _test_query(lambda: query.fetch_objects(include_vector=True, vector_format="tuple"))
+    _test_query(lambda: query.near_vector([1.0, 2.0], vector_format=None))
+
+
+def test_columnar_query_with_group_by(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    _test_query(
+        lambda: query.near_vector(
+            [1.0, 2.0],
+            group_by=GroupBy(prop="name", number_of_groups=2, objects_per_group=2),
+            return_format="columnar",
+        )
+    )
+
+
+def test_columnar_query_with_references(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    _test_query(
+        lambda: query.fetch_objects(
+            return_references=QueryReference(link_on="ref"), return_format="columnar"
+        )
+    )
+
+
+def test_result_to_columnar_return(connection: ConnectionV4) -> None:
+    connection._weaviate_version = _ServerVersion(1, 25, 0)
+    query = _QueryCollection(connection, "Dummy", None, None, None, None, True)
+
+    reply = search_get_pb2.SearchReply()
+    uuids = [uuid.uuid4() for _ in range(3)]
+    for i, uid in enumerate(uuids):
+        result = reply.results.add()
+        result.properties.target_collection = "Dummy"
+        result.properties.non_ref_props.fields["name"].text_value = f"name{i}"
+        if i != 1:
+            result.properties.non_ref_props.fields["age"].int_value = i
+        result.metadata.id_as_bytes = uid.bytes
+        result.metadata.distance = 0.5 * i
+        result.metadata.distance_present = True
+        result.metadata.vector_bytes = struct.pack("2f", i, i + 1)
+
+    columns = query._result_to_columnar_return(
+        reply, _QueryOptions(True, True, False, True, False, return_format="columnar")
+    )
+    assert len(columns) == 3
+    assert columns.collection == "Dummy"
+    assert columns.uuids == uuids
+    assert columns.properties == {"name": ["name0", "name1", "name2"], "age": [0, None, 2]}
+    assert columns.metadata == {"distance": [0.0, 0.5, 1.0]}
+    assert columns.vectors["default"].shape == (3, 2)
+    assert columns.vectors["default"].tolist() == [[0.0, 1.0], [1.0, 2.0], [2.0, 3.0]]
+
+    df = columns.to_pandas()
+    assert set(df.columns) == {"uuid", "name", "age", "distance", "vector"}
+    assert len(df) == 3
+    assert [list(vector) for vector in df["vector"]] == [[0.0, 1.0], [1.0, 2.0], [2.0, 3.0]]
+
+
+def test_columnar_return_to_arrow() -> None:
+    pytest.importorskip("pyarrow")
+    uuids = [uuid.uuid4() for _ in range(2)]
+    vectors = np.array([[0.0, 1.0], [1.0, 2.0]], dtype=np.float32)
+    columns = ColumnarReturn(
+        "Dummy",
+        uuids,
+        {"name": ["a", "b"]},
+        {},
+        {"default": vectors},
+        b"".join(u.bytes for u in uuids),
+    )
+
+    table = columns.to_arrow()
+    assert table.column("uuid").to_pylist() == [uid.bytes for uid in uuids]
+    assert table.column("name").to_pylist() == ["a", "b"]
+    assert table.column("vector").type.list_size == 2
+    assert table.column("vector").to_pylist() == [[0.0, 1.0], [1.0, 2.0]]
+    # without the bytes of the UUIDs, they are converted from `uuids`
+    assert ColumnarReturn("Dummy", uuids, {}, {}, {}).to_arrow().equals(table.select(["uuid"]))
+
+
+def test_deserialize_property_kinds(connection: ConnectionV4) -> None:
+    connection._weaviate_version = _ServerVersion(1, 25, 0)
+    query = _QueryCollection(connection, "Dummy", None, None, None, None, True)
+    uid = uuid.uuid4()
+
+    reply = search_get_pb2.SearchReply()
+    fields = reply.results.add().properties.non_ref_props.fields
+    fields["text"].text_value = "text"
+    fields["int"].int_value = 1
+    fields["number"].number_value = 1.5
+    fields["bool"].bool_value = True
+    fields["uuid"].uuid_value = str(uid)
+    fields["date"].date_value = "2024-01-01T00:00:00Z"
+    fields["geo"].geo_value.latitude = 1.0
+    fields["null"].null_value = 0
+    fields["ints"].list_value.int_values.values = struct.pack("<2q", 1, 2)
+    fields["texts"].list_value.text_values.values.extend(["a", "b"])
+    fields["object"].object_value.fields["nested"].int_value = 2
+    fields["objects"].list_value.object_values.values.add().fields["nested"].bool_value = False
+    fields["unset"].CopyFrom(properties_pb2.Value())
+
+    with pytest.warns(UserWarning, match="Unknown return type None"):
+        columns = query._result_to_columnar_return(
+            reply, _QueryOptions(False, True, False, False, False, return_format="columnar")
+        )
+    props = {name: column[0] for name, column in columns.properties.items()}
+    assert props == {
+        "text": "text",
+        "int": 1,
+        "number": 1.5,
+        "bool": True,
+        "uuid": uid,
+        "date": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        "geo": GeoCoordinate(latitude=1.0, longitude=0.0),
+        "null": None,
+        "ints": [1, 2],
+        "texts": ["a", "b"],
+        "object": {"nested": 2},
+        "objects": [{"nested": False}],
+        "unset": None,
+    }
+
+
+def test_lazy_objects(connection: ConnectionV4) -> None:
+    connection._weaviate_version = _ServerVersion(1, 25, 0)
+    query = _QueryCollection(connection, "Dummy", None, None, None, None, True)
+
+    reply = search_get_pb2.SearchReply()
+    for i in range(2):
+        result = reply.results.add()
+        result.properties.target_collection = "Dummy"
+        result.properties.non_ref_props.fields["name"].text_value = f"name{i}"
+        result.metadata.id_as_bytes = uuid.uuid4().bytes
+        result.metadata.score = 0.5 * i
+        result.metadata.score_present = True
+        result.metadata.vector_bytes = struct.pack("2f", i, i + 1)
+
+    options = _QueryOptions(True, True, False, True, False)
+    eager = query._result_to_query_return(reply, options, None, None).objects
+    lazy = query._result_to_query_return(
+        reply, _QueryOptions(True, True, False, True, False, return_format="lazy"), None, None
+    ).objects
+
+    assert lazy[0].metadata.score == 0.0
+    assert "metadata" in vars(lazy[0]) and "properties" not in vars(lazy[0])
+    assert lazy[0].metadata is lazy[0].metadata
+    for obj, expected in zip(lazy, eager):
+        assert isinstance(obj, Object)
+        assert (obj.uuid, obj.collection, obj.properties, obj.metadata, obj.vector) == (
+            expected.uuid,
+            expected.collection,
+            expected.properties,
+            expected.metadata,
+            expected.vector,
+        )
+        assert obj.references is None
+
+    _test_query(
+        lambda: query.near_vector(
+            [1.0, 2.0],
+            group_by=GroupBy(prop="name", number_of_groups=2, objects_per_group=2),
+            return_format="lazy",
+        )
+    )
+
+
+@pytest.mark.parametrize("vector_format,vector_type", [("list", list), ("numpy", np.ndarray)])
+def test_query_vector_format(
+    connection: ConnectionV4,
+    monkeypatch: pytest.MonkeyPatch,
+    vector_format: VECTOR_FORMAT,
+    vector_type: type,
+) -> None:
+    connection._weaviate_version = _ServerVersion(1, 25, 0)
+    query = _QueryCollection(connection, "Dummy", None, None, None, None, True)
+
+    reply = search_get_pb2.SearchReply()
+    result = reply.results.add()
+    result.metadata.id_as_bytes = uuid.uuid4().bytes
+    result.metadata.vector_bytes = struct.pack("2f", 1.0, 2.0)
+    requests = []
+
+    def call(request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        requests.append(request)
+        return reply
+
+    monkeypatch.setattr(query._query, "call", call)
+
+    for objects in (
+        query.fetch_objects(include_vector=True, vector_format=vector_format).objects,
+        query.near_vector([1.0, 2.0], include_vector=True, vector_format=vector_format).objects,
+    ):
+        vector = objects[0].vector["default"]
+        assert isinstance(vector, vector_type)
+        assert list(vector) == [1.0, 2.0]
+    assert len(requests) == 2
@@ -1,3 +1,6 @@
+import base64
+import io
+import os
 import unittest
 import uuid as uuid_lib
 from copy import deepcopy
@@ -10,6 +13,7 @@ from weaviate.util import (
     generate_uuid5,
     image_decoder_b64,
     image_encoder_b64,
+    file_encoder_b64,
     generate_local_beacon,
     is_object_url,
     is_weaviate_object_url,
@@ -575,3 +579,20 @@ def test_is_weaviate_too_old(version: str, too_old: bool):
 )
 def test_is_weaviate_client_too_old(current_version: str, latest_version: str, too_old: bool):
     assert is_weaviate_client_too_old(current_version, latest_version) is too_old
+
+
+@pytest.mark.parametrize("size", [0, 1, 65535, 65536, 1_000_003])
+def test_file_encoder_b64_large_files(tmp_path, size: int):
+    content = os.urandom(size)
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+    expected = base64.b64encode(content).decode("utf-8")
+
+    assert file_encoder_b64(str(path)) == expected
+    assert file_encoder_b64(path) == expected
+    with open(path, "rb") as file:
+        file.read(min(size, 10))
+        assert file_encoder_b64(file) == base64.b64encode(content[10:]).decode("utf-8")
+        assert file.read() == b""
+    # readers that are not backed by a file on disk
+    assert file_encoder_b64(io.BufferedReader(io.BytesIO(content))) == expected
@@ -11,7 +11,7 @@ try:
 except PackageNotFoundError:
     __version__ = "unknown version"
 
-from .client import Client, WeaviateClient
+from .client import Client, WeaviateAsyncClient, WeaviateClient
 from .connect.helpers import (
     connect_to_custom,
     connect_to_embedded,
@@ -47,6 +47,7 @@ from .warnings import _Warnings
 
 __all__ = [
     "Client",
+    "WeaviateAsyncClient",
     "WeaviateClient",
     "connect_to_custom",
     "connect_to_embedded",
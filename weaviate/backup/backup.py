@@ -344,7 +344,11 @@ class _Backup:
         typed_response = _decode_json_response_dict(response, "Backup restore status check")
         if typed_response is None:
             raise EmptyResponseException()
-        return BackupStatusReturn(**typed_response)
+        status = BackupStatusReturn(**typed_response)
+        if status.status == BackupStatus.SUCCESS:
+            # the restored collections were (re)created
+            self._connection._schema_cache.invalidate()
+        return status
 
 
 class Backup:
@@ -1,6 +1,7 @@
 from weaviate.collections.classes.filters import Filter
 from weaviate.collections.classes.aggregate import Metrics
 from weaviate.collections.classes.grpc import (
+    BatchQuery,
     HybridFusion,
     GroupBy,
     HybridVector,
@@ -16,6 +17,7 @@ from weaviate.collections.classes.types import GeoCoordinate
 
 
 __all__ = [
+    "BatchQuery",
     "Filter",
     "GeoCoordinate",
     "GroupBy",
@@ -2,6 +2,7 @@
 Client class definition.
 """
 
+import asyncio
 from typing import Generic, Optional, Tuple, TypeVar, Union, Dict, Any
 
 from httpx import HTTPError as HttpxError
@@ -17,7 +18,7 @@ from .backup import Backup
 from .batch import Batch
 from .classification import Classification
 from .cluster import Cluster
-from .collections.collections import _Collections
+from .collections.collections import _Collections, _CollectionsAsync
 from .collections.batch.client import _BatchClientWrapper
 from .collections.cluster import _Cluster
 from .config import AdditionalConfig, Config
@@ -48,6 +49,39 @@ TIMEOUT_TYPE = Union[Tuple[NUMBER, NUMBER], NUMBER]
 C = TypeVar("C", Connection, ConnectionV4)
 
 
+def _parse_connection_params_and_embedded_db(
+    connection_params: Optional[ConnectionParams],
+    embedded_options: Optional[EmbeddedOptions],
+) -> Tuple[ConnectionParams, Optional[EmbeddedV4]]:
+    if connection_params is None and embedded_options is None:
+        raise TypeError("Either connection_params or embedded_options must be present.")
+    elif connection_params is not None and embedded_options is not None:
+        raise TypeError(
+            f"connection_params is not expected to be set when using embedded_options but connection_params was {connection_params}"
+        )
+
+    if embedded_options is not None:
+        _validate_input(_ValidateArgument([EmbeddedOptions], "embedded_options", embedded_options))
+
+        embedded_db = EmbeddedV4(options=embedded_options)
+        return (
+            ConnectionParams(
+                http=ProtocolParams(host="localhost", port=embedded_db.options.port, secure=False),
+                grpc=ProtocolParams(
+                    host="localhost", port=embedded_options.grpc_port, secure=False
+                ),
+            ),
+            embedded_db,
+        )
+
+    if not isinstance(connection_params, ConnectionParams):
+        raise TypeError(
+            f"connection_params is expected to be a ConnectionParams object but is {type(connection_params)}"
+        )
+
+    return connection_params, None
+
+
 class _ClientBase(Generic[C]):
     _connection: C
 
@@ -185,7 +219,7 @@ class WeaviateClient(_ClientBase[ConnectionV4]):
             - `skip_init_checks`: `bool`, optional
                 - If set to `True` then the client will not perform any checks including ensuring that weaviate has started. This is useful for air-gapped environments and high-performance setups.
         """
-        connection_params, embedded_db = self.__parse_connection_params_and_embedded_db(
+        connection_params, embedded_db = _parse_connection_params_and_embedded_db(
             connection_params, embedded_options
         )
         config = additional_config or AdditionalConfig()
@@ -217,43 +251,6 @@ class WeaviateClient(_ClientBase[ConnectionV4]):
 
         self.integrations = _Integrations(self._connection)
 
-    def __parse_connection_params_and_embedded_db(
-        self,
-        connection_params: Optional[ConnectionParams],
-        embedded_options: Optional[EmbeddedOptions],
-    ) -> Tuple[ConnectionParams, Optional[EmbeddedV4]]:
-        if connection_params is None and embedded_options is None:
-            raise TypeError("Either connection_params or embedded_options must be present.")
-        elif connection_params is not None and embedded_options is not None:
-            raise TypeError(
-                f"connection_params is not expected to be set when using embedded_options but connection_params was {connection_params}"
-            )
-
-        if embedded_options is not None:
-            _validate_input(
-                _ValidateArgument([EmbeddedOptions], "embedded_options", embedded_options)
-            )
-
-            embedded_db = EmbeddedV4(options=embedded_options)
-            return (
-                ConnectionParams(
-                    http=ProtocolParams(
-                        host="localhost", port=embedded_db.options.port, secure=False
-                    ),
-                    grpc=ProtocolParams(
-                        host="localhost", port=embedded_options.grpc_port, secure=False
-                    ),
-                ),
-                embedded_db,
-            )
-
-        if not isinstance(connection_params, ConnectionParams):
-            raise TypeError(
-                f"connection_params is expected to be a ConnectionParams object but is {type(connection_params)}"
-            )
-
-        return connection_params, None
-
     def __enter__(self) -> "WeaviateClient":
         self.connect()
         return self
@@ -350,6 +347,137 @@ class WeaviateClient(_ClientBase[ConnectionV4]):
         return _RawGQLReturn(aggregate={}, explore={}, get={}, errors=errors)
 
 
+class WeaviateAsyncClient:
+    """
+    The v4 Python-native Weaviate Client class for use with `asyncio`.
+
+    WARNING: This client is only compatible with Weaviate v1.23.6 and higher!
+
+    It sends all requests over asynchronous HTTP and gRPC connections so that a single event loop can have many requests
+    in flight at once. The requests and the parsing of the responses are shared with `WeaviateClient`, so the results
+    are identical.
+
+    Only a part of the API of `WeaviateClient` is available asynchronously:
+    - `collections.get`, `collections.delete` and `collections.exists`.
+    - The `data`, `query` and `generate` namespaces of the returned `CollectionAsync`.
+
+    Managing collections, i.e. `collections.create`, `list_all` and the `config` namespace, as well as the `tenants`,
+    `aggregate` and `batch` namespaces and the cluster, backup and schema APIs are out of scope of this client. Use a
+    `WeaviateClient` for them.
+
+    Use it as an async context manager or call `connect` and `close` yourself:
+
+    ```python
+    async with weaviate.WeaviateAsyncClient(connection_params) as client:
+        collection = client.collections.get("Article")
+        res = await collection.query.near_vector([0.1, 0.2], limit=5)
+    ```
+
+    Attributes:
+        `collections`
+            A `_CollectionsAsync` object instance connected to the same Weaviate instance as the Client.
+    """
+
+    def __init__(
+        self,
+        connection_params: Optional[ConnectionParams] = None,
+        embedded_options: Optional[EmbeddedOptions] = None,
+        auth_client_secret: Optional[AuthCredentials] = None,
+        additional_headers: Optional[dict] = None,
+        additional_config: Optional[AdditionalConfig] = None,
+        skip_init_checks: bool = False,
+    ) -> None:
+        """Initialise a WeaviateAsyncClient class instance to use when interacting with Weaviate from async code.
+
+        The arguments are the same as those of `WeaviateClient`.
+        """
+        connection_params, embedded_db = _parse_connection_params_and_embedded_db(
+            connection_params, embedded_options
+        )
+        config = additional_config or AdditionalConfig()
+
+        self.__skip_init_checks = skip_init_checks
+
+        self._connection = ConnectionV4(
+            connection_params=connection_params,
+            auth_client_secret=auth_client_secret,
+            timeout_config=config.timeout,
+            additional_headers=additional_headers,
+            embedded_db=embedded_db,
+            connection_config=config.connection,
+            proxies=config.proxies,
+            trust_env=config.trust_env,
+        )
+
+        self.collections = _CollectionsAsync(self._connection)
+        """This namespace contains the functionality to get and manage Weaviate data collections asynchronously.
+
+        Use it to retrieve collection objects using `client.collections.get("MyCollection")`.
+        """
+
+    async def __aenter__(self) -> "WeaviateAsyncClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Connect to the Weaviate instance performing all the necessary checks.
+
+        The start-up checks, e.g. fetching the server version, run once in a worker thread so that they do not block
+        the event loop. Afterwards, the asynchronous HTTP client and gRPC channel are opened.
+
+        This method is idempotent, any subsequent calls do nothing while `client.is_connected() == True`.
+
+        Raises:
+            `weaviate.WeaviateConnectionError`
+                If the network connection to weaviate fails.
+            `weaviate.UnexpectedStatusCodeException`
+                If weaviate reports a none OK status.
+        """
+        if self._connection.is_connected():
+            return
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._connection.connect, self.__skip_init_checks
+        )
+        await self._connection.aopen()
+
+    async def close(self) -> None:
+        """In order to clean up any resources used by the client, call this method when you are done with it."""
+        await self._connection.aclose()
+        self._connection.close()
+
+    def is_connected(self) -> bool:
+        """Check if the client is connected to Weaviate.
+
+        Returns:
+            `bool`
+                `True` if the client is connected to Weaviate with an open connection pool, `False` otherwise.
+        """
+        return self._connection.is_connected()
+
+    async def is_ready(self) -> bool:
+        """
+        Ping Weaviate's ready state
+
+        Returns:
+            `bool`
+                `True` if Weaviate is ready to accept requests,
+                `False` otherwise.
+        """
+        try:
+            response = await self._connection.aget(path="/.well-known/ready")
+            return response.status_code == 200
+        except (
+            HttpxError,
+            UnexpectedStatusCodeError,
+            WeaviateClosedClientError,
+            WeaviateConnectionError,
+        ):
+            return False
+
+
 class Client(_ClientBase[Connection]):
     """
     The v3 Python-native Weaviate Client class that encapsulates Weaviate functionalities in one object.
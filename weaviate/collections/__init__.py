@@ -1,3 +1,3 @@
-__all__ = ["Collection"]
+__all__ = ["Collection", "CollectionAsync"]
 
-from weaviate.collections.collections import Collection
+from weaviate.collections.collections import Collection, CollectionAsync
@@ -1,4 +1,4 @@
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Optional, Union, cast
 
 
 from weaviate.collections.classes.cluster import Shard
@@ -62,12 +62,16 @@ class _CollectionsBase:
             error_msg="Collection may not have been created properly.",
             status_codes=_ExpectedStatusCodes(ok_in=200, error="Create collection"),
         )
+        self._connection._schema_cache.invalidate()
 
         collection_name = response.json()["class"]
         assert isinstance(collection_name, str)
         return collection_name
 
     def _exists(self, name: str) -> bool:
+        return self._connection._schema_cache.fetch(name, lambda: self.__get(name)) is not None
+
+    def __get(self, name: str) -> Optional[Dict[str, Any]]:
         path = f"/schema/{name}"
         response = self._connection.get(
             path=path,
@@ -76,17 +80,42 @@ class _CollectionsBase:
         )
 
         if response.status_code == 200:
-            return True
+            return cast(Dict[str, Any], response.json())
+        else:
+            assert response.status_code == 404
+            return None
+
+    async def _aexists(self, name: str) -> bool:
+        return (
+            await self._connection._schema_cache.afetch(name, lambda: self.__aget(name)) is not None
+        )
+
+    async def __aget(self, name: str) -> Optional[Dict[str, Any]]:
+        response = await self._connection.aget(
+            path=f"/schema/{name}",
+            error_msg="Collection may not exist.",
+            status_codes=_ExpectedStatusCodes(ok_in=[200, 404], error="collection exists"),
+        )
+
+        if response.status_code == 200:
+            return cast(Dict[str, Any], response.json())
         else:
             assert response.status_code == 404
-            return False
+            return None
 
     def _export(self, name: str) -> _CollectionConfig:
+        res = self._connection._schema_cache.fetch(name, lambda: self.__export(name))
+        if res is None:
+            # cached as missing by `exists`, fetch again to raise the error reported by Weaviate
+            res = self.__export(name)
+        return _collection_config_from_json(res)
+
+    def __export(self, name: str) -> Dict[str, Any]:
         path = f"/schema/{name}"
         response = self._connection.get(path=path, error_msg="Could not export collection config")
         res = _decode_json_response_dict(response, "Get schema export")
         assert res is not None
-        return _collection_config_from_json(res)
+        return res
 
     def _delete(self, name: str) -> None:
         path = f"/schema/{name}"
@@ -95,6 +124,15 @@ class _CollectionsBase:
             error_msg="Collection may not have been deleted properly.",
             status_codes=_ExpectedStatusCodes(ok_in=200, error="Delete collection"),
         )
+        self._connection._schema_cache.invalidate()
+
+    async def _adelete(self, name: str) -> None:
+        await self._connection.adelete(
+            path=f"/schema/{name}",
+            error_msg="Collection may not have been deleted properly.",
+            status_codes=_ExpectedStatusCodes(ok_in=200, error="Delete collection"),
+        )
+        self._connection._schema_cache.invalidate()
 
     def _get_all(
         self, simple: bool
@@ -1,29 +1,36 @@
 import asyncio
-import math
 import threading
 import time
 import uuid as uuid_package
 from abc import ABC
-from collections import deque
-from copy import copy
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import (
     Any,
+    Callable,
+    Deque,
     Dict,
     Generic,
+    Hashable,
     List,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
+    cast,
 )
 
 from pydantic import ValidationError
 from typing_extensions import TypeAlias
 
 from weaviate.cluster import Cluster
+from weaviate.collections.batch.controller import _DynamicBatchingController
 from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
+from weaviate.collections.batch.parallel import _BatchProcessPool
 from weaviate.collections.batch.rest import _BatchRESTAsync
+from weaviate.collections.batch.routing import _ShardRouter
+from weaviate.collections.batch.spill import _SpillLog
 from weaviate.collections.classes.batch import (
     _BatchReference,
     BatchObject,
@@ -34,6 +41,7 @@ from weaviate.collections.classes.batch import (
     _BatchObject,
     BatchObjectReturn,
     BatchReferenceReturn,
+    DynamicBatchingStats,
     Shard,
 )
 from weaviate.collections.classes.config import ConsistencyLevel
@@ -43,9 +51,11 @@ from weaviate.collections.classes.internal import (
     ReferenceInputs,
 )
 from weaviate.collections.classes.types import WeaviateProperties
+from weaviate.collections.queries.byteops import _ByteOps
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import WeaviateBatchValidationError
 from weaviate.types import UUID, VECTORS
+from weaviate.util import _capitalize_first_letter, _get_vector_v4
 from weaviate.warnings import _Warnings
 
 BatchResponse = List[Dict[str, Any]]
@@ -58,13 +68,19 @@ DEFAULT_REQUEST_TIMEOUT = 180
 CONCURRENT_REQUESTS_DYNAMIC_VECTORIZER = 2
 BATCH_TIME_TARGET = 10
 VECTORIZER_BATCHING_STEP_SIZE = 48  # cohere max batch size is 96
+BATCH_LINGER_TIME = (
+    0.01  # how long a batch that is not full yet waits for more items before it is sent
+)
+PARTITION_MAX_AGE = (
+    1.0  # how long a partition of a tenant that is not full yet waits for more items
+)
 
 
 class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
     """`BatchRequest` abstract class used as a interface for batch requests."""
 
     def __init__(self) -> None:
-        self._items: List[TBatchInput] = []
+        self._items: Deque[TBatchInput] = deque()
         self._lock = threading.Lock()
 
     def __len__(self) -> int:
@@ -76,54 +92,430 @@ class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
         self._items.append(item)
         self._lock.release()
 
+    def extend(self, items: List[TBatchInput]) -> None:
+        """Add multiple items to the BatchRequest."""
+        self._lock.acquire()
+        self._items.extend(items)
+        self._lock.release()
+
     def prepend(self, item: List[TBatchInput]) -> None:
         """Add items to the front of the BatchRequest.
 
         This is intended to be used when objects should be retries, eg. after a temporary error.
         """
         self._lock.acquire()
-        self._items = item + self._items
+        self._items.extendleft(reversed(item))
         self._lock.release()
 
 
 class ReferencesBatchRequest(BatchRequest[_BatchReference, BatchReferenceReturn]):
-    """Collect Weaviate-object references to add them in one request to Weaviate."""
+    """Collect Weaviate-object references to add them in one request to Weaviate.
+
+    The references are grouped by the UUID of the object they start from, so that all references of an object that is
+    still being imported are skipped at once when popping.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__groups: "OrderedDict[str, Deque[_BatchReference]]" = OrderedDict()
+        self.__length = 0
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __group(self, from_uuid: str) -> Deque[_BatchReference]:
+        group = self.__groups.get(from_uuid)
+        if group is None:
+            group = deque()
+            self.__groups[from_uuid] = group
+        return group
+
+    def add(self, item: _BatchReference) -> None:
+        """Add an item to the BatchRequest."""
+        self._lock.acquire()
+        self.__group(item.from_uuid).append(item)
+        self.__length += 1
+        self._lock.release()
+
+    def extend(self, items: List[_BatchReference]) -> None:
+        """Add multiple items to the BatchRequest."""
+        self._lock.acquire()
+        for item in items:
+            self.__group(item.from_uuid).append(item)
+        self.__length += len(items)
+        self._lock.release()
+
+    def prepend(self, item: List[_BatchReference]) -> None:
+        """Add items to the front of the BatchRequest.
+
+        This is intended to be used when references should be retried, eg. after a temporary error.
+        """
+        self._lock.acquire()
+        for ref in reversed(item):
+            self.__group(ref.from_uuid).appendleft(ref)
+            self.__groups.move_to_end(ref.from_uuid, last=False)
+        self.__length += len(item)
+        self._lock.release()
 
     def pop_items(self, pop_amount: int, uuid_lookup: Set[str]) -> List[_BatchReference]:
         """Pop the given number of items from the BatchRequest queue.
 
+        References whose source object is in `uuid_lookup`, i.e. has not been imported yet, are skipped.
+
         Returns
             `List[_BatchReference]` items from the BatchRequest.
         """
         ret: List[_BatchReference] = []
-        i = 0
+        emptied: List[str] = []
         self._lock.acquire()
-        while len(ret) < pop_amount and len(self._items) > 0 and i < len(self._items):
-            if self._items[i].from_uuid not in uuid_lookup:
-                ret.append(self._items.pop(i))
-            else:
-                i += 1
+        for from_uuid, group in self.__groups.items():
+            if len(ret) >= pop_amount:
+                break
+            if from_uuid in uuid_lookup:
+                continue
+            while len(group) > 0 and len(ret) < pop_amount:
+                ret.append(group.popleft())
+            if len(group) == 0:
+                emptied.append(from_uuid)
+        for from_uuid in emptied:
+            del self.__groups[from_uuid]
+        self.__length -= len(ret)
         self._lock.release()
         return ret
 
 
+def _merge_references(
+    existing: Optional[ReferenceInput], new: ReferenceInput
+) -> Optional[ReferenceInput]:
+    if existing is None:
+        return new
+    if isinstance(existing, ReferenceToMulti) or isinstance(new, ReferenceToMulti):
+        if (
+            isinstance(existing, ReferenceToMulti)
+            and isinstance(new, ReferenceToMulti)
+            and existing.target_collection == new.target_collection
+        ):
+            return ReferenceToMulti(
+                target_collection=existing.target_collection,
+                uuids=existing.uuids_str + new.uuids_str,
+            )
+        return None  # single- and multi-target references to the same property cannot be combined
+    return [
+        *([existing] if isinstance(existing, (str, uuid_package.UUID)) else existing),
+        *([new] if isinstance(new, (str, uuid_package.UUID)) else new),
+    ]
+
+
 class ObjectsBatchRequest(BatchRequest[_BatchObject, BatchObjectReturn]):
-    """Collect objects for one batch request to weaviate."""
+    """Collect objects for one batch request to weaviate.
+
+    The queued objects are indexed by their UUID so that references can be attached to them while they wait. With
+    `group_by`, they are queued in one deque per group instead, so that a request only contains objects of one group.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._by_uuid: Dict[str, _BatchObject] = {}
+        self.__group: Optional[Callable[[_BatchObject], Hashable]] = None
+        # the groups are popped in turns, a group that is not emptied by a pop is moved to the end
+        self.__groups: "OrderedDict[Hashable, Deque[_BatchObject]]" = OrderedDict()
+        self.__length = 0
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __queue(self, item: _BatchObject) -> Deque[_BatchObject]:
+        if self.__group is None:
+            return self._items
+        key = self.__group(item)
+        group = self.__groups.get(key)
+        if group is None:
+            group = deque()
+            self.__groups[key] = group
+        return group
+
+    def group_by(self, group: Optional[Callable[[_BatchObject], Hashable]]) -> None:
+        """Queue the objects by the key that `group` maps them to, or in a single queue if `group` is `None`.
+
+        The queued objects are regrouped, e.g. after the keys changed.
+        """
+        self._lock.acquire()
+        queued = list(self._items)
+        for items in self.__groups.values():
+            queued.extend(items)
+        self._items = deque()
+        self.__groups = OrderedDict()
+        self.__group = group
+        for item in queued:
+            self.__queue(item).append(item)
+        self._lock.release()
+
+    def add(self, item: _BatchObject) -> None:
+        """Add an item to the BatchRequest."""
+        self._lock.acquire()
+        self.__queue(item).append(item)
+        self.__length += 1
+        self._by_uuid[item.uuid] = item
+        self._lock.release()
+
+    def extend(self, items: List[_BatchObject]) -> None:
+        """Add multiple items to the BatchRequest."""
+        self._lock.acquire()
+        if self.__group is None:
+            self._items.extend(items)
+        else:
+            for item in items:
+                self.__queue(item).append(item)
+        self.__length += len(items)
+        self._by_uuid.update((item.uuid, item) for item in items)
+        self._lock.release()
+
+    def prepend(self, item: List[_BatchObject]) -> None:
+        """Add items to the front of the BatchRequest.
+
+        This is intended to be used when objects should be retries, eg. after a temporary error.
+        """
+        self._lock.acquire()
+        if self.__group is None:
+            self._items.extendleft(reversed(item))
+        else:
+            for obj in reversed(item):
+                key = self.__group(obj)
+                self.__queue(obj).appendleft(obj)
+                self.__groups.move_to_end(key, last=False)
+        for obj in item:
+            self._by_uuid.setdefault(obj.uuid, obj)
+        self.__length += len(item)
+        self._lock.release()
 
     def pop_items(self, pop_amount: int) -> List[_BatchObject]:
         """Pop the given number of items from the BatchRequest queue.
 
+        With `group_by`, the items are only popped from the group that is next in turn.
+
         Returns
             `List[_BatchObject]` items from the BatchRequest.
         """
         self._lock.acquire()
-        if pop_amount >= len(self._items):
-            ret = copy(self._items)
-            self._items.clear()
+        if self.__group is None:
+            ret = [self._items.popleft() for _ in range(min(pop_amount, len(self._items)))]
+        elif len(self.__groups) == 0 or pop_amount == 0:
+            ret = []
         else:
-            ret = copy(self._items[:pop_amount])
-            self._items = self._items[pop_amount:]
+            key, group = next(iter(self.__groups.items()))
+            ret = [group.popleft() for _ in range(min(pop_amount, len(group)))]
+            if len(group) == 0:
+                del self.__groups[key]
+            else:
+                self.__groups.move_to_end(key)
+        self.__length -= len(ret)
+        self._unindex(ret)
+        self._lock.release()
+        return ret
+
+    def _unindex(self, items: List[_BatchObject]) -> None:
+        for obj in items:
+            if self._by_uuid.get(obj.uuid) is obj:
+                del self._by_uuid[obj.uuid]
+
+    def ready(self, pop_amount: int) -> bool:
+        """Whether a full batch of `pop_amount` items is queued."""
+        return 0 < pop_amount <= len(self)
+
+    def time_to_ready(self) -> float:
+        """Return how many seconds to wait at most before a batch that is not full is popped anyway."""
+        return 0.0
+
+    def release(self) -> None:
+        """Make all queued items ready to be popped, e.g. when the batch is flushed."""
+
+    def attach_reference(
+        self,
+        from_uuid: str,
+        collection: str,
+        tenant: Optional[str],
+        from_property: str,
+        to: ReferenceInput,
+        references: List[_BatchReference],
+    ) -> bool:
+        """Attach a reference to the queued object that it starts from, so that both are sent in the same gRPC message.
+
+        `references` are the internal references that `to` stands for. They are kept on the object, so that they can be
+        reported if the object fails.
+
+        Returns `False` if the object is not queued (anymore) or the reference cannot be merged with the references
+        the object already has. The reference then has to be sent on its own.
+        """
+        self._lock.acquire()
+        try:
+            obj = self._by_uuid.get(from_uuid)
+            if (
+                obj is None
+                or obj.spill_offset is not None
+                or obj.collection != collection
+                or obj.tenant != tenant
+            ):
+                return False
+            refs = dict(obj.references) if obj.references is not None else {}
+            merged = _merge_references(refs.get(from_property), to)
+            if merged is None:
+                return False
+            refs[from_property] = merged
+            obj.references = refs
+            obj.attached_references = (obj.attached_references or []) + references
+            obj.serialized = None  # a retried object has to be encoded again with the reference
+            if obj.properties is None:
+                obj.properties = {}  # references are only sent together with the properties
+            return True
+        finally:
+            self._lock.release()
+
+
+class _PartitionedObjectsBatchRequest(ObjectsBatchRequest):
+    """Collect objects in one partition per collection and tenant, see `max_tenants_per_request` of the client batches.
+
+    A request is filled from at most `max_partitions` partitions, starting with the oldest one. A partition is popped
+    once it holds a full batch or waited `max_age` seconds. If more than two batches are queued, the oldest partitions
+    are popped regardless, so that the backpressure on `add_object` never waits for a partition to age.
+    """
+
+    def __init__(self, max_partitions: int, max_age: float) -> None:
+        super().__init__()
+        self.__max_partitions = max_partitions
+        self.__max_age = max_age
+        # the partitions are ordered by the time they were created at, which is kept in `__since`
+        self.__partitions: "OrderedDict[Tuple[str, Optional[str]], Deque[_BatchObject]]" = (
+            OrderedDict()
+        )
+        self.__since: Dict[Tuple[str, Optional[str]], float] = {}
+        self.__largest = 0
+        self.__length = 0
+        self.__group: Optional[Callable[[_BatchObject], Hashable]] = None
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def group_by(self, group: Optional[Callable[[_BatchObject], Hashable]]) -> None:
+        """Only pop partitions that `group` maps to the same key as the first popped partition together."""
+        self._lock.acquire()
+        self.__group = group
+        self._lock.release()
+
+    def __partition(self, item: _BatchObject) -> Deque[_BatchObject]:
+        key = (item.collection, item.tenant)
+        partition = self.__partitions.get(key)
+        if partition is None:
+            partition = deque()
+            self.__partitions[key] = partition
+            self.__since[key] = time.monotonic()
+        return partition
 
+    def add(self, item: _BatchObject) -> None:
+        """Add an item to the BatchRequest."""
+        self._lock.acquire()
+        partition = self.__partition(item)
+        partition.append(item)
+        self.__largest = max(self.__largest, len(partition))
+        self.__length += 1
+        self._by_uuid[item.uuid] = item
+        self._lock.release()
+
+    def extend(self, items: List[_BatchObject]) -> None:
+        """Add multiple items to the BatchRequest."""
+        self._lock.acquire()
+        for item in items:
+            partition = self.__partition(item)
+            partition.append(item)
+            self.__largest = max(self.__largest, len(partition))
+            self._by_uuid[item.uuid] = item
+        self.__length += len(items)
+        self._lock.release()
+
+    def prepend(self, item: List[_BatchObject]) -> None:
+        """Add items to the front of the BatchRequest.
+
+        The partitions of the items are moved to the front and are ready to be popped right away.
+        """
+        self._lock.acquire()
+        for obj in reversed(item):
+            key = (obj.collection, obj.tenant)
+            partition = self.__partition(obj)
+            partition.appendleft(obj)
+            self.__largest = max(self.__largest, len(partition))
+            self.__partitions.move_to_end(key, last=False)
+            self.__since[key] = 0.0
+            self._by_uuid.setdefault(obj.uuid, obj)
+        self.__length += len(item)
+        self._lock.release()
+
+    def __is_ready(self, partition: Deque[_BatchObject], since: float, pop_amount: int) -> bool:
+        return (
+            len(partition) >= pop_amount
+            or time.monotonic() - since >= self.__max_age
+            or self.__length >= 2 * pop_amount
+        )
+
+    def ready(self, pop_amount: int) -> bool:
+        """Whether a partition can be popped, see the class docstring."""
+        with self._lock:
+            if pop_amount == 0 or self.__length == 0:
+                return False
+            # the first partition is the oldest one
+            key, partition = next(iter(self.__partitions.items()))
+            return self.__largest >= pop_amount or self.__is_ready(
+                partition, self.__since[key], pop_amount
+            )
+
+    def time_to_ready(self) -> float:
+        """Return how many seconds are left until the oldest partition has waited long enough to be popped."""
+        with self._lock:
+            if self.__length == 0:
+                return 0.0
+            since = self.__since[next(iter(self.__partitions))]
+        return max(since + self.__max_age - time.monotonic(), 0.0)
+
+    def release(self) -> None:
+        """Make all queued partitions ready to be popped."""
+        self._lock.acquire()
+        for key in self.__since:
+            self.__since[key] = 0.0
+        self._lock.release()
+
+    def pop_items(self, pop_amount: int) -> List[_BatchObject]:
+        """Pop up to the given number of items from at most `max_partitions` ready partitions.
+
+        With `group_by`, only partitions that are mapped to the same key as the first popped partition are popped.
+
+        Returns
+            `List[_BatchObject]` items from the BatchRequest.
+        """
+        ret: List[_BatchObject] = []
+        emptied: List[Tuple[str, Optional[str]]] = []
+        popped = 0
+        first_group: Optional[Hashable] = None
+        self._lock.acquire()
+        for key, partition in self.__partitions.items():
+            if len(ret) >= pop_amount or popped >= self.__max_partitions:
+                break
+            if not self.__is_ready(partition, self.__since[key], pop_amount):
+                continue
+            if self.__group is not None:
+                if popped == 0:
+                    first_group = self.__group(partition[0])
+                elif self.__group(partition[0]) != first_group:
+                    continue
+            popped += 1
+            while len(partition) > 0 and len(ret) < pop_amount:
+                ret.append(partition.popleft())
+            if len(partition) == 0:
+                emptied.append(key)
+        for key in emptied:
+            del self.__partitions[key]
+            del self.__since[key]
+        if popped > 0:
+            self.__largest = max((len(p) for p in self.__partitions.values()), default=0)
+        self.__length -= len(ret)
+        self._unindex(ret)
         self._lock.release()
         return ret
 
@@ -155,6 +547,15 @@ class _RateLimitedBatching:
 _BatchMode: TypeAlias = Union[_DynamicBatching, _FixedSizeBatching, _RateLimitedBatching]
 
 
+def _trusted_vector(vector: Optional[Any]) -> Optional[Any]:
+    # lists and float arrays are passed on as they are, anything else is converted to a list
+    if vector is None or isinstance(vector, list) or _ByteOps.is_float_array(vector):
+        return vector
+    if isinstance(vector, dict):
+        return {name: _trusted_vector(val) for name, val in vector.items()}
+    return _get_vector_v4(vector)
+
+
 class _BatchBase:
     def __init__(
         self,
@@ -165,15 +566,37 @@ class _BatchBase:
         vectorizer_batching: bool,
         objects_: Optional[ObjectsBatchRequest] = None,
         references: Optional[ReferencesBatchRequest] = None,
+        skip_validation: bool = False,
+        workers: Optional[int] = None,
+        shard_routing: bool = False,
+        max_tenants_per_request: Optional[int] = None,
+        spill_directory: Optional[str] = None,
     ) -> None:
-        self.__batch_objects = objects_ or ObjectsBatchRequest()
+        self.__batch_objects = objects_ or (
+            _PartitionedObjectsBatchRequest(max_tenants_per_request, PARTITION_MAX_AGE)
+            if max_tenants_per_request is not None
+            else ObjectsBatchRequest()
+        )
         self.__batch_references = references or ReferencesBatchRequest()
+        # with a spill log, added objects are written to disk and only read into `__batch_objects` when they are sent
+        self.__spill = _SpillLog(spill_directory) if spill_directory is not None else None
         self.__connection = connection
         self.__consistency_level: Optional[ConsistencyLevel] = consistency_level
         self.__vectorizer_batching = vectorizer_batching
 
+        # with skip_validation, objects are trusted and only each collection name is validated once
+        self.__skip_validation = skip_validation
+        self.__collection_names: Dict[str, str] = {}
+        self.__shards: Set[Tuple[str, Optional[str]]] = set()
+
         self.__batch_grpc = _BatchGRPC(connection, self.__consistency_level)
         self.__batch_rest = _BatchRESTAsync(connection, self.__consistency_level)
+        # with workers, objects are serialized and sent by a pool of processes instead of the event loop thread
+        self.__process_pool = (
+            _BatchProcessPool(connection, self.__consistency_level, workers)
+            if workers is not None
+            else None
+        )
 
         # lookup table for objects that are currently being processed - is used to not send references from objects that have not been added yet
         self.__uuid_lookup_lock = threading.Lock()
@@ -186,6 +609,10 @@ class _BatchBase:
         self.__results_lock = threading.Lock()
 
         self.__cluster = Cluster(self.__connection)
+        # with shard routing, every request only contains objects whose shards are held by the same nodes
+        self.__router = _ShardRouter(self.__cluster) if shard_routing else None
+        if self.__router is not None:
+            self.__refresh_routing()  # before the first request is sent
 
         self.__batching_mode: _BatchMode = batch_mode
         self.__max_batch_size: int = 1000
@@ -215,15 +642,27 @@ class _BatchBase:
             self.__dynamic_batching_sleep_time: int = 0
             self._batch_send: bool = False
 
+        if workers is not None:
+            # keep every worker busy from the start, dynamic batching adjusts from there
+            self.__concurrent_requests = max(self.__concurrent_requests, workers)
+
         self.__recommended_num_refs: int = 50
 
         self.__active_requests = 0
-        self.__active_requests_lock = threading.Lock()
+
+        # signalled whenever the queues, the number of active requests or the batching parameters change. It guards
+        # `__active_requests` and is what the sender thread, `flush` and the backpressure in `_add_*` wait on
+        self.__state_changed = threading.Condition()
+        self.__bg_thread_stopped = False
 
         # dynamic batching
-        self.__time_last_scale_up: float = 0
-        self.__rate_queue: deque = deque(maxlen=50)  # 5s with 0.1s refresh rate
+        self.__controller = _DynamicBatchingController(
+            self.__max_batch_size, MAX_CONCURRENT_REQUESTS, BATCH_TIME_TARGET
+        )
+        self.__batching_stats: Optional[DynamicBatchingStats] = None
         self.__took_queue: deque = deque(maxlen=CONCURRENT_REQUESTS_DYNAMIC_VECTORIZER)
+        # durations of the object requests that finished since the last decision of the controller
+        self.__latencies: Deque[float] = deque()
 
         # fixed rate batching
         self.__time_stamp_last_request: float = 0
@@ -233,6 +672,11 @@ class _BatchBase:
         self.__bg_thread = self.__start_bg_threads()
         self.__bg_thread_exception: Optional[Exception] = None
 
+    @property
+    def batching_stats(self) -> Optional[DynamicBatchingStats]:
+        """Get the latest decision of dynamic batching on the batch size and concurrency, `None` for other modes."""
+        return self.__batching_stats
+
     @property
     def number_errors(self) -> int:
         """Return the number of errors in the batch."""
@@ -251,6 +695,9 @@ class _BatchBase:
     def __start_new_event_loop(self) -> asyncio.AbstractEventLoop:
         loop = asyncio.new_event_loop()
 
+        running = threading.Event()
+        loop.call_soon(running.set)
+
         event_loop = threading.Thread(
             target=self.__run_event_loop,
             daemon=True,
@@ -258,9 +705,7 @@ class _BatchBase:
             name="eventLoop",
         )
         event_loop.start()
-
-        while not loop.is_running():
-            time.sleep(0.01)
+        running.wait()
 
         return loop
 
@@ -269,9 +714,14 @@ class _BatchBase:
         self.flush()
 
         # we are done, shut bg threads down and end the event loop
-        self.__shut_background_thread_down.set()
-        while self.__bg_thread.is_alive():
-            time.sleep(0.01)
+        with self.__state_changed:
+            self.__shut_background_thread_down.set()
+            self.__state_changed.notify_all()
+        self.__bg_thread.join()
+        if self.__process_pool is not None:
+            self.__process_pool.shutdown()
+        if self.__spill is not None:
+            self.__spill.close()
 
         # copy the results to the public results
         self.__results_for_wrapper_backup.results = self.__results_for_wrapper.results
@@ -287,7 +737,7 @@ class _BatchBase:
         loop = self.__start_new_event_loop()
         future = asyncio.run_coroutine_threadsafe(self.__connection.aopen(), loop)
         future.result()  # Wait for self._connection.aopen() to finish
-        refresh_time: float = 0.01
+        linger_time: float = BATCH_LINGER_TIME
 
         try:
             while (
@@ -299,10 +749,10 @@ class _BatchBase:
                         time.time() - self.__time_stamp_last_request
                         < self.__fix_rate_batching_base_time // self.__concurrent_requests
                     ):
-                        time.sleep(1)
+                        self.__shut_background_thread_down.wait(1)
                         continue
                     self.__time_stamp_last_request = time.time()
-                    refresh_time = 0
+                    linger_time = 0
                 elif (
                     isinstance(self.__batching_mode, _DynamicBatching)
                     and self.__vectorizer_batching
@@ -312,25 +762,14 @@ class _BatchBase:
                             time.time() - self.__time_stamp_last_request
                             < self.__dynamic_batching_sleep_time
                         ):
-                            time.sleep(1)
+                            self.__shut_background_thread_down.wait(1)
                             continue
 
                     self.__time_stamp_last_request = time.time()
 
-                if self.__active_requests < self.__concurrent_requests and (
-                    len(self.__batch_objects) > 0 or len(self.__batch_references) > 0
-                ):
+                objs, refs = self.__next_batch(linger_time)
+                if len(objs) > 0 or len(refs) > 0:
                     self._batch_send = True
-                    self.__active_requests_lock.acquire()
-                    self.__active_requests += 1
-                    self.__active_requests_lock.release()
-
-                    objs = self.__batch_objects.pop_items(self.__recommended_num_objects)
-                    self.__uuid_lookup_lock.acquire()
-                    refs = self.__batch_references.pop_items(
-                        self.__recommended_num_refs, uuid_lookup=self.__uuid_lookup
-                    )
-                    self.__uuid_lookup_lock.release()
                     # do not block the thread - the results are written to a central (locked) list and we want to have multiple concurrent batch-requests
                     asyncio.run_coroutine_threadsafe(
                         self.__send_batch_async(
@@ -341,28 +780,108 @@ class _BatchBase:
                         loop,
                     )
 
-                time.sleep(refresh_time)
-
         finally:
             future = asyncio.run_coroutine_threadsafe(self.__connection.aclose(), loop)
             future.result()  # Wait for self._connection.aclose() to finish
             loop.call_soon_threadsafe(loop.stop)
 
+    def __has_pending(self) -> bool:
+        return (
+            len(self.__batch_objects) > 0
+            or len(self.__batch_references) > 0
+            or (self.__spill is not None and self.__spill.unread() > 0)
+        )
+
+    def __is_batch_full(self) -> bool:
+        spilled = self.__spill.unread() if self.__spill is not None else 0
+        return (
+            self.__batch_objects.ready(self.__recommended_num_objects)
+            or len(self.__batch_references) >= self.__recommended_num_refs
+            or (
+                spilled > 0
+                and 0 < self.__recommended_num_objects <= len(self.__batch_objects) + spilled
+            )
+        )
+
+    def __read_spilled(self) -> None:
+        # keep as many objects in memory as the backpressure on `add_object` would without a spill log
+        assert self.__spill is not None
+        missing = 2 * self.__recommended_num_objects - len(self.__batch_objects)
+        if missing > 0 and self.__spill.unread() > 0:
+            self.__batch_objects.extend(self.__spill.read(missing))
+
+    def __next_batch(self, linger_time: float) -> Tuple[List[_BatchObject], List[_BatchReference]]:
+        """Wait for the next batch and pop it from the queues.
+
+        Blocks until there is something to send, then waits up to `linger_time` seconds for the batch to fill up, or
+        until the objects queue is ready if it is partitioned by tenant, and finally for a free request slot. Returns
+        empty lists on shutdown or if nothing could be popped.
+        """
+        stopping = self.__shut_background_thread_down.is_set
+        with self.__state_changed:
+            if linger_time > 0:
+                self.__state_changed.wait_for(lambda: stopping() or self.__has_pending())
+                self.__state_changed.wait_for(
+                    lambda: stopping() or self.__is_batch_full(),
+                    timeout=max(linger_time, self.__batch_objects.time_to_ready()),
+                )
+                self.__state_changed.wait_for(
+                    lambda: stopping() or self.__active_requests < self.__concurrent_requests
+                )
+            if (
+                stopping()
+                or self.__active_requests >= self.__concurrent_requests
+                or not self.__has_pending()
+            ):
+                return [], []
+
+            if self.__spill is not None:
+                self.__read_spilled()
+            objs = self.__batch_objects.pop_items(self.__recommended_num_objects)
+            self.__uuid_lookup_lock.acquire()
+            refs = self.__batch_references.pop_items(
+                self.__recommended_num_refs, uuid_lookup=self.__uuid_lookup
+            )
+            self.__uuid_lookup_lock.release()
+            if len(objs) == 0 and len(refs) == 0:
+                # e.g. all queued references start from objects in flight or the batch size is 0. Nothing can be
+                # popped until the state changes, so wait for that instead of popping again right away
+                self.__state_changed.wait(timeout=self.__batch_objects.time_to_ready() or None)
+                return [], []
+            self.__active_requests += 1
+            self.__state_changed.notify_all()  # the queues are shorter now
+            return objs, refs
+
     def __dynamic_batch_rate_loop(self) -> None:
         refresh_time = 1
         while (
             self.__shut_background_thread_down is not None
             and not self.__shut_background_thread_down.is_set()
         ):
-            if not isinstance(self.__batching_mode, _DynamicBatching):
+            if self.__router is not None:
+                self.__refresh_routing()
+            if isinstance(self.__batching_mode, _DynamicBatching):
+                try:
+                    self.__dynamic_batching()
+                except Exception as e:
+                    _Warnings.batch_refresh_failed(repr(e))
+            elif self.__router is None:
                 return
+            with self.__state_changed:
+                self.__state_changed.notify_all()
 
-            try:
-                self.__dynamic_batching()
-            except Exception as e:
-                _Warnings.batch_refresh_failed(repr(e))
+            self.__shut_background_thread_down.wait(refresh_time)
 
-            time.sleep(refresh_time)
+    def __refresh_routing(self) -> None:
+        assert self.__router is not None
+        try:
+            refreshed = self.__router.refresh()
+        except Exception as e:
+            _Warnings.batch_routing_refresh_failed(repr(e))
+            return
+        if refreshed:
+            # the queued objects are regrouped, as the nodes of their shards may have changed
+            self.__batch_objects.group_by(self.__router.nodes)
 
     def __start_bg_threads(self) -> threading.Thread:
         """Create a background thread that periodically checks how congested the batch queue is."""
@@ -386,6 +905,11 @@ class _BatchBase:
                 self.__batch_send()
             except Exception as e:
                 self.__bg_thread_exception = e
+            finally:
+                # wake up everyone that waits on this thread so that they notice that it stopped
+                with self.__state_changed:
+                    self.__bg_thread_stopped = True
+                    self.__state_changed.notify_all()
 
         demonBatchSend = threading.Thread(
             target=batch_send_wrapper,
@@ -396,22 +920,12 @@ class _BatchBase:
         return demonBatchSend
 
     def __dynamic_batching(self) -> None:
-        status = self.__cluster.get_nodes_status()
-        if "batchStats" not in status[0] or "queueLength" not in status[0]["batchStats"]:
-            # async indexing - just send a lot
-            self.__batching_mode = _FixedSizeBatching(1000, 10)
-            self.__recommended_num_objects = 1000
-            self.__concurrent_requests = 10
-            return
-
-        rate: int = status[0]["batchStats"]["ratePerSecond"]
-        rate_per_worker = rate / self.__concurrent_requests
-
-        batch_length = status[0]["batchStats"]["queueLength"]
-
-        self.__rate_queue.append(rate)
-
-        if self.__vectorizer_batching:
+        nodes = self.__cluster.get_nodes_status()
+        latency = max(self.__latencies, default=None)
+        self.__latencies.clear()
+        if self.__vectorizer_batching and all(
+            "queueLength" in node.get("batchStats", {}) for node in nodes
+        ):
             # slow vectorizer, we want to send larger batches that can take a bit longer, but fewer of them. We might need to sleep
             if len(self.__took_queue) > 0 and self._batch_send:
                 max_took = max(self.__took_queue)
@@ -445,46 +959,20 @@ class _BatchBase:
                             current_step + 1
                         )
                 self._batch_send = False
-        else:
-            if batch_length == 0:  # scale up if queue is empty
-                self.__recommended_num_objects = min(
-                    self.__recommended_num_objects + 50,
-                    self.__max_batch_size,
-                )
-
-                if (
-                    self.__max_batch_size == self.__recommended_num_objects
-                    and len(self.__batch_objects) > self.__recommended_num_objects
-                    and time.time() - self.__time_last_scale_up > 1
-                    and self.__concurrent_requests < MAX_CONCURRENT_REQUESTS
-                ):
-                    self.__concurrent_requests += 1
-                    self.__time_last_scale_up = time.time()
-
-            else:
-                ratio = batch_length / rate
-                if 2.1 > ratio > 1.9:  # ideal, send exactly as many objects as weaviate can process
-                    self.__recommended_num_objects = math.floor(rate_per_worker)
-                elif ratio <= 1.9:  # we can send more
-                    self.__recommended_num_objects = math.floor(
-                        min(
-                            self.__recommended_num_objects * 1.5,
-                            rate_per_worker * 2 / ratio,
-                        )
-                    )
-
-                    if self.__max_batch_size == self.__recommended_num_objects:
-                        self.__concurrent_requests += 1
-
-                elif ratio < 10:  # too high, scale down
-                    self.__recommended_num_objects = math.floor(rate_per_worker * 2 / ratio)
-
-                    if self.__recommended_num_objects < 100 and self.__concurrent_requests > 2:
-                        self.__concurrent_requests -= 1
+            return
 
-                else:  # way too high, stop sending new batches
-                    self.__recommended_num_objects = 0
-                    self.__concurrent_requests = 2
+        stats = self.__controller.update(
+            nodes,
+            self.__recommended_num_objects,
+            self.__concurrent_requests,
+            len(self.__batch_objects),
+            latency,
+        )
+        if stats.decision == "fixed":
+            self.__batching_mode = _FixedSizeBatching(stats.batch_size, stats.concurrent_requests)
+        self.__recommended_num_objects = stats.batch_size
+        self.__concurrent_requests = stats.concurrent_requests
+        self.__batching_stats = stats
 
     async def __send_batch_async(
         self, objs: List[_BatchObject], refs: List[_BatchReference], readd_rate_limit: bool
@@ -492,9 +980,14 @@ class _BatchBase:
         if len(objs) > 0:
             start = time.time()
             try:
-                response_obj = await self.__batch_grpc.aobjects(
-                    objects=objs, timeout=DEFAULT_REQUEST_TIMEOUT
-                )
+                if self.__process_pool is not None:
+                    response_obj = await self.__process_pool.objects(
+                        objects=objs, timeout=DEFAULT_REQUEST_TIMEOUT
+                    )
+                else:
+                    response_obj = await self.__batch_grpc.aobjects(
+                        objects=objs, timeout=DEFAULT_REQUEST_TIMEOUT, keep_messages=True
+                    )
             except Exception as e:
                 errors_obj = {
                     idx: ErrorObject(message=repr(e), object_=obj) for idx, obj in enumerate(objs)
@@ -539,6 +1032,16 @@ class _BatchBase:
                     err.object_.retry_count += 1
                     readded_objects.append(i)
 
+            for i, err in response_obj.errors.items():
+                obj = err.object_
+                if i in readded_objects:
+                    if obj.sent_message is not None:
+                        # retries send the message as it is instead of translating the properties again
+                        obj.serialized = obj.sent_message.SerializeToString()
+                elif obj.spill_offset is None:
+                    obj.serialized = None  # reported failures do not hold on to their encoding
+                obj.sent_message = None
+
             if len(readded_objects) > 0:
                 _Warnings.batch_rate_limit_reached(
                     response_obj.errors[readded_objects[0]].message,
@@ -551,6 +1054,8 @@ class _BatchBase:
                 readded_uuids = {obj.uuid for obj in readd_objects}
 
                 self.__batch_objects.prepend(readd_objects)
+                with self.__state_changed:
+                    self.__state_changed.notify_all()
 
                 new_errors = {
                     i: err for i, err in response_obj.errors.items() if i not in readded_objects
@@ -584,12 +1089,41 @@ class _BatchBase:
                 obj.uuid for obj in objs if obj.uuid not in readded_uuids
             )
             self.__uuid_lookup_lock.release()
+            if self.__spill is not None:
+                self.__spill.sent([obj for obj in objs if obj.uuid not in readded_uuids])
+            if self.__connection._schema_cache.enabled:
+                # auto-schema adds the properties of the sent objects that their collection does not have yet
+                written: Dict[str, Set[str]] = {}
+                for obj in objs:
+                    if obj.properties is not None:
+                        written.setdefault(obj.collection, set()).update(obj.properties)
+                for collection, properties in written.items():
+                    self.__connection._schema_cache.written(collection, properties)
+
+            # references that were attached to an object are only sent with it, so they fail with it
+            failed_attached = {
+                idx: ErrorReference(
+                    message=f"The object the reference starts from failed: {err.message}",
+                    reference=ref,
+                )
+                for idx, (err, ref) in enumerate(
+                    (err, ref)
+                    for err in response_obj.errors.values()
+                    for ref in err.object_.attached_references or []
+                )
+            }
 
             self.__results_lock.acquire()
             self.__results_for_wrapper.results.objs += response_obj
             self.__results_for_wrapper.failed_objects.extend(response_obj.errors.values())
+            if len(failed_attached) > 0:
+                self.__results_for_wrapper.results.refs += BatchReferenceReturn(
+                    elapsed_seconds=0.0, errors=failed_attached, has_errors=True
+                )
+                self.__results_for_wrapper.failed_references.extend(failed_attached.values())
             self.__results_lock.release()
             self.__took_queue.append(time.time() - start)
+            self.__latencies.append(time.time() - start)
 
         if len(refs) > 0:
             start = time.time()
@@ -611,20 +1145,53 @@ class _BatchBase:
             self.__results_for_wrapper.failed_references.extend(response_ref.errors.values())
             self.__results_lock.release()
 
-        self.__active_requests_lock.acquire()
-        self.__active_requests -= 1
-        self.__active_requests_lock.release()
+        with self.__state_changed:
+            self.__active_requests -= 1
+            self.__state_changed.notify_all()
 
     def flush(self) -> None:
         """Flush the batch queue and wait for all requests to be finished."""
         # bg thread is sending objs+refs automatically, so simply wait for everything to be done
-        while (
-            self.__active_requests > 0
-            or len(self.__batch_objects) > 0
-            or len(self.__batch_references) > 0
-        ):
-            time.sleep(0.01)
-            self.__check_bg_thread_alive()
+        self.__batch_objects.release()
+        with self.__state_changed:
+            self.__state_changed.notify_all()
+        self.__wait_while(lambda: self.__active_requests > 0 or self.__has_pending())
+
+    def __wait_while(self, condition: Callable[[], bool]) -> None:
+        """Block until `condition` is false, waking up whenever the state of the batch changes.
+
+        Raises if the background thread stops in the meantime.
+        """
+        with self.__state_changed:
+            while condition():
+                self.__check_bg_thread_alive()
+                self.__state_changed.wait()
+
+    def __is_overloaded(self) -> bool:
+        if self.__spill is not None:
+            return False  # the objects wait on disk
+        return (
+            self.__recommended_num_objects == 0
+            or len(self.__batch_objects) >= self.__recommended_num_objects * 2
+        )
+
+    def __spill_objects(self, objects: List[_BatchObject]) -> None:
+        assert self.__spill is not None
+        for obj in objects:
+            try:
+                data = self.__spill.encode(obj)
+            except Exception as e:
+                # reported like the objects that Weaviate rejects, as they would have failed when being sent
+                self.__uuid_lookup_lock.acquire()
+                self.__uuid_lookup.discard(obj.uuid)
+                self.__uuid_lookup_lock.release()
+                self.__results_lock.acquire()
+                self.__results_for_wrapper.failed_objects.append(
+                    ErrorObject(message=repr(e), object_=obj)
+                )
+                self.__results_lock.release()
+                continue
+            self.__spill.append(data)
 
     def _add_object(
         self,
@@ -636,36 +1203,91 @@ class _BatchBase:
         tenant: Optional[str] = None,
     ) -> UUID:
         self.__check_bg_thread_alive()
-        try:
-            batch_object = BatchObject(
-                collection=collection,
-                properties=properties,
-                references=references,
-                uuid=uuid,
-                vector=vector,
+        if self.__skip_validation:
+            uuid = str(uuid) if uuid is not None else uuid_package.uuid4()
+            internal = _BatchObject(
+                collection=self.__validated_collection_name(collection),
+                vector=_trusted_vector(vector),
+                uuid=str(uuid),
+                properties=cast(dict, properties),
                 tenant=tenant,
+                references=references,
             )
+        else:
+            try:
+                batch_object = BatchObject(
+                    collection=collection,
+                    properties=properties,
+                    references=references,
+                    uuid=uuid,
+                    vector=vector,
+                    tenant=tenant,
+                )
+            except ValidationError as e:
+                raise WeaviateBatchValidationError(repr(e))
+            assert batch_object.uuid is not None
+            uuid = batch_object.uuid
+            internal = batch_object._to_internal()
+        if (collection, tenant) not in self.__shards:
+            self.__shards.add((collection, tenant))
             self.__results_for_wrapper.imported_shards.add(
                 Shard(collection=collection, tenant=tenant)
             )
-        except ValidationError as e:
-            raise WeaviateBatchValidationError(repr(e))
         self.__uuid_lookup_lock.acquire()
-        self.__uuid_lookup.add(str(batch_object.uuid))
+        self.__uuid_lookup.add(internal.uuid)
         self.__uuid_lookup_lock.release()
-        self.__batch_objects.add(batch_object._to_internal())
+        if self.__spill is not None:
+            self.__spill_objects([internal])
+        else:
+            self.__batch_objects.add(internal)
+        with self.__state_changed:
+            self.__state_changed.notify_all()
 
         # block if queue gets too long or weaviate is overloaded - reading files is faster them sending them so we do
         # not need a long queue
-        while (
-            self.__recommended_num_objects == 0
-            or len(self.__batch_objects) >= self.__recommended_num_objects * 2
-        ):
-            self.__check_bg_thread_alive()
-            time.sleep(0.01)
+        self.__wait_while(self.__is_overloaded)
 
-        assert batch_object.uuid is not None
-        return batch_object.uuid
+        return uuid
+
+    def __validated_collection_name(self, collection: str) -> str:
+        name = self.__collection_names.get(collection)
+        if name is None:
+            if len(collection) == 0:
+                raise WeaviateBatchValidationError("The collection name must not be empty")
+            name = _capitalize_first_letter(collection)
+            self.__collection_names[collection] = name
+        return name
+
+    def _add_objects(self, objects: List[_BatchObject]) -> List[UUID]:
+        self.__check_bg_thread_alive()
+        if len(objects) > 0:
+            self.__results_for_wrapper.imported_shards.add(
+                Shard(collection=objects[0].collection, tenant=objects[0].tenant)
+            )
+
+        if self.__spill is not None:
+            self.__uuid_lookup_lock.acquire()
+            self.__uuid_lookup.update(obj.uuid for obj in objects)
+            self.__uuid_lookup_lock.release()
+            self.__spill_objects(objects)
+            with self.__state_changed:
+                self.__state_changed.notify_all()
+            return [obj.uuid for obj in objects]
+
+        # add the objects in chunks of the recommended size to apply the same backpressure as `_add_object`
+        start = 0
+        while start < len(objects):
+            self.__wait_while(self.__is_overloaded)
+            chunk = objects[start : start + self.__recommended_num_objects]
+            self.__uuid_lookup_lock.acquire()
+            self.__uuid_lookup.update(obj.uuid for obj in chunk)
+            self.__uuid_lookup_lock.release()
+            self.__batch_objects.extend(chunk)
+            start += len(chunk)
+            with self.__state_changed:
+                self.__state_changed.notify_all()
+
+        return [obj.uuid for obj in objects]
 
     def _add_reference(
         self,
@@ -683,29 +1305,59 @@ class _BatchBase:
         else:
             to_strs = list(to)
 
+        batch_references: List[BatchReference] = []
         for uid in to_strs:
             try:
-                batch_reference = BatchReference(
-                    from_object_collection=from_object_collection,
-                    from_object_uuid=from_object_uuid,
-                    from_property_name=from_property_name,
-                    to_object_collection=(
-                        to.target_collection if isinstance(to, ReferenceToMulti) else None
-                    ),
-                    to_object_uuid=uid,
-                    tenant=tenant,
+                batch_references.append(
+                    BatchReference(
+                        from_object_collection=from_object_collection,
+                        from_object_uuid=from_object_uuid,
+                        from_property_name=from_property_name,
+                        to_object_collection=(
+                            to.target_collection if isinstance(to, ReferenceToMulti) else None
+                        ),
+                        to_object_uuid=uid,
+                        tenant=tenant,
+                    )
                 )
             except ValidationError as e:
                 raise WeaviateBatchValidationError(repr(e))
-            self.__batch_references.add(batch_reference._to_internal())
 
-        # block if queue gets too long or weaviate is overloaded
-        while self.__recommended_num_objects == 0:
-            time.sleep(0.01)  # block if weaviate is overloaded, also do not send any refs
-            self.__check_bg_thread_alive()
+        # references whose source object is still queued are sent with it over gRPC, all others over REST
+        unattached = self.__attach_references(batch_references)
+        if len(unattached) > 0:
+            for internal_reference in unattached:
+                self.__batch_references.add(internal_reference)
+            with self.__state_changed:
+                self.__state_changed.notify_all()
+
+        # block if weaviate is overloaded, also do not send any refs
+        self.__wait_while(lambda: self.__recommended_num_objects == 0)
+
+    def __attach_references(self, batch_references: List[BatchReference]) -> List[_BatchReference]:
+        """Attach the references to their queued source object and return the ones that have to be sent over REST."""
+        if len(batch_references) == 0:
+            return []
+        first = batch_references[0]
+        target_uuids = [str(ref.to_object_uuid) for ref in batch_references]
+        to: ReferenceInput = (
+            ReferenceToMulti(target_collection=first.to_object_collection, uuids=target_uuids)
+            if first.to_object_collection is not None
+            else target_uuids
+        )
+        internal_references = [ref._to_internal() for ref in batch_references]
+        attached = self.__batch_objects.attach_reference(
+            str(first.from_object_uuid),
+            first.from_object_collection,
+            first.tenant,
+            first.from_property_name,
+            to,
+            internal_references,
+        )
+        return [] if attached else internal_references
 
     def __check_bg_thread_alive(self) -> None:
-        if self.__bg_thread.is_alive():
+        if self.__bg_thread.is_alive() and not self.__bg_thread_stopped:
             return
 
         raise self.__bg_thread_exception or Exception("Batch thread died unexpectedly")
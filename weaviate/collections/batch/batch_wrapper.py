@@ -1,3 +1,4 @@
+import os
 import time
 from typing import Generic, List, Optional, Any, TypeVar, cast
 
@@ -10,9 +11,24 @@ from weaviate.collections.batch.base import (
 from weaviate.collections.classes.batch import BatchResult, ErrorObject, ErrorReference, Shard
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.connect import ConnectionV4
+from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.util import _capitalize_first_letter, _decode_json_response_list
 
 
+def _validate_workers(workers: Optional[int]) -> int:
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise WeaviateInvalidInputError("workers must be a positive integer")
+    return workers
+
+
+def _validate_max_tenants_per_request(max_tenants_per_request: Optional[int]) -> Optional[int]:
+    if max_tenants_per_request is not None and max_tenants_per_request < 1:
+        raise WeaviateInvalidInputError("max_tenants_per_request must be a positive integer")
+    return max_tenants_per_request
+
+
 class _BatchWrapper:
     def __init__(self, connection: ConnectionV4, consistency_level: Optional[ConsistencyLevel]):
         self._connection = connection
@@ -20,6 +36,11 @@ class _BatchWrapper:
         self._current_batch: Optional[_BatchBase] = None
         # config options
         self._batch_mode: _BatchMode = _DynamicBatching()
+        self._skip_validation = False
+        self._workers: Optional[int] = None
+        self._shard_routing = False
+        self._max_tenants_per_request: Optional[int] = None
+        self._spill_directory: Optional[str] = None
 
         self._batch_data = _BatchDataWrapper()
 
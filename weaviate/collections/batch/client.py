@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Any, List, Mapping, Optional, Sequence, Union
 
 from weaviate.collections.batch.base import (
     _BatchBase,
@@ -11,12 +11,16 @@ from weaviate.collections.batch.batch_wrapper import (
     _BatchWrapper,
     _BatchMode,
     _ContextManagerWrapper,
+    _validate_max_tenants_per_request,
+    _validate_workers,
 )
+from weaviate.collections.classes.batch import _batch_objects_from_columns
 from weaviate.collections.classes.config import ConsistencyLevel, Vectorizers
 from weaviate.collections.classes.internal import ReferenceInput, ReferenceInputs
 from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.classes.types import WeaviateProperties
 from weaviate.types import UUID, VECTORS
+from weaviate.util import _capitalize_first_letter
 
 from weaviate.connect.v4 import ConnectionV4
 
@@ -79,6 +83,55 @@ class _BatchClient(_BatchBase):
             tenant=tenant.name if isinstance(tenant, Tenant) else tenant,
         )
 
+    def add_columns(
+        self,
+        collection: str,
+        properties: Optional[Mapping[str, Any]] = None,
+        *,
+        vectors: Optional[Any] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+        tenant: Optional[Union[str, Tenant]] = None,
+    ) -> List[UUID]:
+        """Add the rows of column-oriented data to this batch, e.g. an `(N, D)` embedding matrix with its properties.
+
+        The i-th object is built from the i-th entry of every property column, the i-th row of every vector matrix and
+        the i-th UUID, without the per-object validation of `add_object`.
+
+        NOTE: If the UUID of one of the objects already exists then the existing object will be
+        replaced by the new object.
+
+        Arguments:
+            `collection`
+                The name of the collection the objects belong to.
+            `properties`
+                The properties of the objects as a mapping of property names to columns. A column can be a `list`,
+                `numpy.ndarray`, `pd.Series` or `pa.Array`.
+            `vectors`
+                The vectors of the objects as a 2-D `numpy.ndarray` or a list of vectors with one row per object. For
+                named vectors, use a mapping of vector names to matrices.
+            `uuids`
+                The UUIDs of the objects. If not provided, a UUIDv4 is generated for each object.
+            `tenant`
+                The tenant name or Tenant object to be used for this request.
+
+        Returns:
+            `List[str]`
+                The UUIDs of the added objects in row order.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If the columns, vectors and uuids do not all have the same number of rows.
+        """
+        return super()._add_objects(
+            _batch_objects_from_columns(
+                _capitalize_first_letter(collection),
+                tenant.name if isinstance(tenant, Tenant) else tenant,
+                properties,
+                vectors,
+                uuids,
+            )
+        )
+
     def add_reference(
         self,
         from_uuid: UUID,
@@ -89,6 +142,9 @@ class _BatchClient(_BatchBase):
     ) -> None:
         """Add one reference to this batch.
 
+        If the object that the reference starts from is still waiting in this batch, the reference is sent together with it
+        in the same gRPC request. Otherwise it is sent on its own through the REST API.
+
         Arguments:
             `from_uuid`
                 The UUID of the object, as an uuid.UUID object or str, that should reference another object.
@@ -150,11 +206,21 @@ class _BatchClientWrapper(_BatchWrapper):
                 results=self._batch_data,
                 batch_mode=self._batch_mode,
                 vectorizer_batching=self._vectorizer_batching,
+                skip_validation=self._skip_validation,
+                workers=self._workers,
+                shard_routing=self._shard_routing,
+                max_tenants_per_request=self._max_tenants_per_request,
+                spill_directory=self._spill_directory,
             )
         )
 
     def dynamic(
-        self, consistency_level: Optional[ConsistencyLevel] = None
+        self,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        skip_validation: bool = False,
+        shard_routing: bool = False,
+        max_tenants_per_request: Optional[int] = None,
+        spill_directory: Optional[str] = None,
     ) -> _ContextManagerWrapper[_BatchClient]:
         """Configure dynamic batching.
 
@@ -163,9 +229,35 @@ class _BatchClientWrapper(_BatchWrapper):
         Arguments:
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `skip_validation`
+                Whether to trust the added objects and skip their client-side validation, which considerably reduces the
+                overhead of `add_object`. Only the collection names are validated, once per collection. Malformed objects are
+                then rejected by Weaviate and reported in `failed_objects` instead of raising in `add_object`.
+            `shard_routing`
+                Whether to fill every request only with objects whose shards are held by the same nodes, so that the node
+                the client is connected to forwards it to these nodes instead of fanning it out across the cluster. This
+                reduces the traffic between the nodes when importing into many tenants on a multi-node cluster. The shards
+                of tenants and of collections with a single shard are known to the client, all other objects are sent in
+                arrival order.
+            `max_tenants_per_request`
+                If set, the objects are collected in one partition per collection and tenant and every request contains
+                the objects of at most this many tenants. A partition is sent once it holds a full batch or its oldest
+                object waited for one second, so that a tenant which has to be loaded by Weaviate does not hold up the
+                objects of the other tenants. If not provided, the objects are sent in arrival order.
+            `spill_directory`
+                A directory to queue the added objects in on disk instead of in memory, so that `add_object` does not wait
+                for Weaviate to catch up. If an import is interrupted, e.g. by a crash, the objects that were left are sent
+                when a batch is started with the same directory again. Objects are written in their encoded form, so failed
+                objects are reported in `failed_objects` with only their collection, UUID and tenant. If not provided, the
+                objects are queued in memory.
         """
         self._batch_mode: _BatchMode = _DynamicBatching()
         self._consistency_level = consistency_level
+        self._skip_validation = skip_validation
+        self._workers = None
+        self._shard_routing = shard_routing
+        self._max_tenants_per_request = _validate_max_tenants_per_request(max_tenants_per_request)
+        self._spill_directory = spill_directory
         return self.__create_batch_and_reset()
 
     def fixed_size(
@@ -173,6 +265,10 @@ class _BatchClientWrapper(_BatchWrapper):
         batch_size: int = 100,
         concurrent_requests: int = 2,
         consistency_level: Optional[ConsistencyLevel] = None,
+        skip_validation: bool = False,
+        shard_routing: bool = False,
+        max_tenants_per_request: Optional[int] = None,
+        spill_directory: Optional[str] = None,
     ) -> _ContextManagerWrapper[_BatchClient]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -186,14 +282,43 @@ class _BatchClientWrapper(_BatchWrapper):
                 made to Weaviate and not the speed of batch creation within Python.
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `skip_validation`
+                Whether to trust the added objects and skip their client-side validation, which considerably reduces the
+                overhead of `add_object`. Only the collection names are validated, once per collection. Malformed objects are
+                then rejected by Weaviate and reported in `failed_objects` instead of raising in `add_object`.
+            `shard_routing`
+                Whether to fill every request only with objects whose shards are held by the same nodes, so that the node
+                the client is connected to forwards it to these nodes instead of fanning it out across the cluster. This
+                reduces the traffic between the nodes when importing into many tenants on a multi-node cluster. The shards
+                of tenants and of collections with a single shard are known to the client, all other objects are sent in
+                arrival order.
+            `max_tenants_per_request`
+                If set, the objects are collected in one partition per collection and tenant and every request contains
+                the objects of at most this many tenants. A partition is sent once it holds a full batch or its oldest
+                object waited for one second, so that a tenant which has to be loaded by Weaviate does not hold up the
+                objects of the other tenants. If not provided, the objects are sent in arrival order.
+            `spill_directory`
+                A directory to queue the added objects in on disk instead of in memory, so that `add_object` does not wait
+                for Weaviate to catch up. If an import is interrupted, e.g. by a crash, the objects that were left are sent
+                when a batch is started with the same directory again. Objects are written in their encoded form, so failed
+                objects are reported in `failed_objects` with only their collection, UUID and tenant. If not provided, the
+                objects are queued in memory.
 
         """
         self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
         self._consistency_level = consistency_level
+        self._skip_validation = skip_validation
+        self._workers = None
+        self._shard_routing = shard_routing
+        self._max_tenants_per_request = _validate_max_tenants_per_request(max_tenants_per_request)
+        self._spill_directory = spill_directory
         return self.__create_batch_and_reset()
 
     def rate_limit(
-        self, requests_per_minute: int, consistency_level: Optional[ConsistencyLevel] = None
+        self,
+        requests_per_minute: int,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        skip_validation: bool = False,
     ) -> _ContextManagerWrapper[_BatchClient]:
         """Configure batches with a rate limited vectorizer.
 
@@ -204,7 +329,52 @@ class _BatchClientWrapper(_BatchWrapper):
                 The number of requests that the vectorizer can process per minute.
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `skip_validation`
+                Whether to trust the added objects and skip their client-side validation, which considerably reduces the
+                overhead of `add_object`. Only the collection names are validated, once per collection. Malformed objects are
+                then rejected by Weaviate and reported in `failed_objects` instead of raising in `add_object`.
         """
         self._batch_mode = _RateLimitedBatching(requests_per_minute)
         self._consistency_level = consistency_level
+        self._skip_validation = skip_validation
+        self._workers = None
+        self._shard_routing = False
+        self._max_tenants_per_request = None
+        self._spill_directory = None
+        return self.__create_batch_and_reset()
+
+    def parallel(
+        self,
+        workers: Optional[int] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        skip_validation: bool = False,
+    ) -> _ContextManagerWrapper[_BatchClient]:
+        """Configure dynamic batching where the batches are serialized and sent by a pool of worker processes.
+
+        Use this mode if building the gRPC messages is the bottleneck of an import, e.g. for objects with many
+        properties. Adding objects, retries and the dynamic batch sizing stay in the current process and the results
+        of all workers are collected in `results`, `failed_objects` and `failed_references` as usual.
+
+        When you exit the context manager, the final batch will be sent automatically.
+
+        The workers are started with the `spawn` method, which re-imports the `__main__` module in every worker. Scripts
+        using this mode must therefore guard their entry point with `if __name__ == "__main__":`.
+
+        Arguments:
+            `workers`
+                The number of worker processes. If not provided, the number of CPUs is used.
+            `consistency_level`
+                The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `skip_validation`
+                Whether to trust the added objects and skip their client-side validation, which considerably reduces the
+                overhead of `add_object`. Only the collection names are validated, once per collection. Malformed objects are
+                then rejected by Weaviate and reported in `failed_objects` instead of raising in `add_object`.
+        """
+        self._batch_mode = _DynamicBatching()
+        self._consistency_level = consistency_level
+        self._skip_validation = skip_validation
+        self._workers = _validate_workers(workers)
+        self._shard_routing = False
+        self._max_tenants_per_request = None
+        self._spill_directory = None
         return self.__create_batch_and_reset()
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Generic, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Generic, List, Mapping, Optional, Sequence, Union
 
 from weaviate.collections.batch.base import (
     _BatchBase,
@@ -8,7 +8,12 @@ from weaviate.collections.batch.base import (
     _FixedSizeBatching,
     _RateLimitedBatching,
 )
-from weaviate.collections.batch.batch_wrapper import _BatchWrapper, _ContextManagerWrapper
+from weaviate.collections.batch.batch_wrapper import (
+    _BatchWrapper,
+    _ContextManagerWrapper,
+    _validate_workers,
+)
+from weaviate.collections.classes.batch import _batch_objects_from_columns
 from weaviate.collections.classes.config import ConsistencyLevel, Vectorizers
 from weaviate.collections.classes.internal import ReferenceInputs, ReferenceInput
 from weaviate.collections.classes.types import Properties
@@ -30,6 +35,8 @@ class _BatchCollection(Generic[Properties], _BatchBase):
         name: str,
         tenant: Optional[str],
         vectorizer_batching: bool,
+        skip_validation: bool = False,
+        workers: Optional[int] = None,
     ) -> None:
         super().__init__(
             connection=connection,
@@ -37,6 +44,8 @@ class _BatchCollection(Generic[Properties], _BatchBase):
             results=results,
             batch_mode=batch_mode,
             vectorizer_batching=vectorizer_batching,
+            skip_validation=skip_validation,
+            workers=workers,
         )
         self.__name = name
         self.__tenant = tenant
@@ -84,11 +93,50 @@ class _BatchCollection(Generic[Properties], _BatchBase):
             tenant=self.__tenant,
         )
 
+    def add_columns(
+        self,
+        properties: Optional[Mapping[str, Any]] = None,
+        *,
+        vectors: Optional[Any] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+    ) -> List[UUID]:
+        """Add the rows of column-oriented data to this batch, e.g. an `(N, D)` embedding matrix with its properties.
+
+        The i-th object is built from the i-th entry of every property column, the i-th row of every vector matrix and
+        the i-th UUID, without the per-object validation of `add_object`.
+
+        NOTE: If the UUID of one of the objects already exists then the existing object will be replaced by the new object.
+
+        Arguments:
+            `properties`
+                The properties of the objects as a mapping of property names to columns. A column can be a `list`,
+                `numpy.ndarray`, `pd.Series` or `pa.Array`.
+            `vectors`
+                The vectors of the objects as a 2-D `numpy.ndarray` or a list of vectors with one row per object. For
+                named vectors, use a mapping of vector names to matrices.
+            `uuids`
+                The UUIDs of the objects. If not provided, a UUIDv4 is generated for each object.
+
+        Returns:
+            `List[str]`
+                The UUIDs of the added objects in row order.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If the columns, vectors and uuids do not all have the same number of rows.
+        """
+        return self._add_objects(
+            _batch_objects_from_columns(self.__name, self.__tenant, properties, vectors, uuids)
+        )
+
     def add_reference(
         self, from_uuid: UUID, from_property: str, to: Union[ReferenceInput, List[UUID]]
     ) -> None:
         """Add a reference to this batch.
 
+        If the object that the reference starts from is still waiting in this batch, the reference is sent together with it
+        in the same gRPC request. Otherwise it is sent on its own through the REST API.
+
         Arguments:
             `from_uuid`
                 The UUID of the object, as an uuid.UUID object or str, that should reference another object.
@@ -155,19 +203,31 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
                 name=self.__name,
                 tenant=self.__tenant,
                 vectorizer_batching=self._vectorizer_batching,
+                skip_validation=self._skip_validation,
+                workers=self._workers,
             )
         )
 
-    def dynamic(self) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
+    def dynamic(
+        self, skip_validation: bool = False
+    ) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
         """Configure dynamic batching.
 
         When you exit the context manager, the final batch will be sent automatically.
+
+        Arguments:
+            `skip_validation`
+                Whether to trust the added objects and skip their client-side validation, which considerably reduces the
+                overhead of `add_object`. Only the collection names are validated, once per collection. Malformed objects are
+                then rejected by Weaviate and reported in `failed_objects` instead of raising in `add_object`.
         """
         self._batch_mode: _BatchMode = _DynamicBatching()
+        self._skip_validation = skip_validation
+        self._workers = None
         return self.__create_batch_and_reset()
 
     def fixed_size(
-        self, batch_size: int = 100, concurrent_requests: int = 2
+        self, batch_size: int = 100, concurrent_requests: int = 2, skip_validation: bool = False
     ) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -179,12 +239,18 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
             `concurrent_requests`
                 The number of concurrent requests when sending batches. This controls the number of concurrent requests
                 made to Weaviate and not the speed of batch creation within Python.
+            `skip_validation`
+                Whether to trust the added objects and skip their client-side validation, which considerably reduces the
+                overhead of `add_object`. Only the collection names are validated, once per collection. Malformed objects are
+                then rejected by Weaviate and reported in `failed_objects` instead of raising in `add_object`.
         """
         self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
+        self._skip_validation = skip_validation
+        self._workers = None
         return self.__create_batch_and_reset()
 
     def rate_limit(
-        self, requests_per_minute: int
+        self, requests_per_minute: int, skip_validation: bool = False
     ) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
         """Configure batches with a rate limited vectorizer.
 
@@ -193,6 +259,39 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
         Arguments:
             `requests_per_minute`
                 The number of requests that the vectorizer can process per minute.
+            `skip_validation`
+                Whether to trust the added objects and skip their client-side validation, which considerably reduces the
+                overhead of `add_object`. Only the collection names are validated, once per collection. Malformed objects are
+                then rejected by Weaviate and reported in `failed_objects` instead of raising in `add_object`.
         """
         self._batch_mode = _RateLimitedBatching(requests_per_minute)
+        self._skip_validation = skip_validation
+        self._workers = None
+        return self.__create_batch_and_reset()
+
+    def parallel(
+        self, workers: Optional[int] = None, skip_validation: bool = False
+    ) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
+        """Configure dynamic batching where the batches are serialized and sent by a pool of worker processes.
+
+        Use this mode if building the gRPC messages is the bottleneck of an import, e.g. for objects with many
+        properties. Adding objects, retries and the dynamic batch sizing stay in the current process and the results
+        of all workers are collected in `results`, `failed_objects` and `failed_references` as usual.
+
+        When you exit the context manager, the final batch will be sent automatically.
+
+        The workers are started with the `spawn` method, which re-imports the `__main__` module in every worker. Scripts
+        using this mode must therefore guard their entry point with `if __name__ == "__main__":`.
+
+        Arguments:
+            `workers`
+                The number of worker processes. If not provided, the number of CPUs is used.
+            `skip_validation`
+                Whether to trust the added objects and skip their client-side validation, which considerably reduces the
+                overhead of `add_object`. Only the collection names are validated, once per collection. Malformed objects are
+                then rejected by Weaviate and reported in `failed_objects` instead of raising in `add_object`.
+        """
+        self._batch_mode = _DynamicBatching()
+        self._skip_validation = skip_validation
+        self._workers = _validate_workers(workers)
         return self.__create_batch_and_reset()
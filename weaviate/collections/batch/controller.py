@@ -0,0 +1,127 @@
+import math
+import time
+from typing import Literal, Optional, Sequence
+
+from weaviate.cluster.types import Node
+from weaviate.collections.classes.batch import DynamicBatchingStats
+
+# the number of seconds of work that the slowest node should have queued, enough to keep it busy between two requests
+TARGET_BACKLOG = 2.0
+# the least the batch size grows by while the nodes keep up
+BATCH_SIZE_STEP = 50
+
+
+class _DynamicBatchingController:
+    """Tunes the batch size and the number of concurrent requests of dynamic batching to the load of the cluster.
+
+    It is fed the batch statistics of all nodes and the durations of the latest requests once per second and
+    increases additively while the cluster keeps up, but decreases multiplicatively once the slowest node queues more
+    than `TARGET_BACKLOG` seconds of work or requests take longer than `latency_target`. Once a node falls too far
+    behind, sending is paused until it catches up.
+    """
+
+    def __init__(
+        self, max_batch_size: int, max_concurrent_requests: int, latency_target: float
+    ) -> None:
+        self.__max_batch_size = max_batch_size
+        self.__max_concurrent_requests = max_concurrent_requests
+        self.__latency_target = latency_target
+        self.__time_last_scale_up: float = 0
+
+    def update(
+        self,
+        nodes: Sequence[Node],
+        batch_size: int,
+        concurrent_requests: int,
+        pending: int,
+        latency: Optional[float],
+    ) -> DynamicBatchingStats:
+        """Decide on the batch size and concurrency for the next second.
+
+        `pending` is the number of objects that wait to be sent and `latency` the duration of the slowest request that
+        finished since the previous update.
+        """
+        if len(nodes) == 0 or any(
+            "queueLength" not in node.get("batchStats", {}) for node in nodes
+        ):
+            # async indexing - just send a lot
+            return DynamicBatchingStats(
+                batch_size=self.__max_batch_size,
+                concurrent_requests=self.__max_concurrent_requests,
+                queue_length=0,
+                rate_per_second=0,
+                backlog_seconds=0.0,
+                latency_seconds=latency,
+                decision="fixed",
+            )
+
+        queue_length = sum(node["batchStats"]["queueLength"] for node in nodes)
+        rate = sum(node["batchStats"]["ratePerSecond"] for node in nodes)
+        backlog = max(
+            _backlog(node["batchStats"]["queueLength"], node["batchStats"]["ratePerSecond"])
+            for node in nodes
+        )
+        rate_per_worker = rate / concurrent_requests
+
+        decision: Literal["increase", "hold", "decrease", "pause"] = "hold"
+        if latency is not None and latency > self.__latency_target:
+            # requests are too slow, whatever the queues say
+            batch_size = batch_size // 2
+            concurrent_requests = max(concurrent_requests - 1, 1)
+            decision = "decrease"
+        elif queue_length == 0:  # scale up if queue is empty
+            batch_size = batch_size + BATCH_SIZE_STEP
+            decision = "increase"
+            if (
+                batch_size >= self.__max_batch_size
+                and pending > self.__max_batch_size
+                and time.time() - self.__time_last_scale_up > 1
+                and concurrent_requests < self.__max_concurrent_requests
+            ):
+                concurrent_requests += 1
+                self.__time_last_scale_up = time.time()
+        elif abs(backlog - TARGET_BACKLOG) < 0.1:
+            # ideal, send exactly as many objects as weaviate can process
+            batch_size = math.floor(rate_per_worker)
+        elif backlog < TARGET_BACKLOG:  # we can send more
+            batch_size = math.floor(
+                min(
+                    max(batch_size * 1.5, batch_size + BATCH_SIZE_STEP),
+                    rate_per_worker * TARGET_BACKLOG / backlog,
+                )
+            )
+            decision = "increase"
+            if (
+                batch_size >= self.__max_batch_size
+                and concurrent_requests < self.__max_concurrent_requests
+            ):
+                concurrent_requests += 1
+        elif backlog < 5 * TARGET_BACKLOG:  # too high, scale down
+            batch_size = math.floor(rate_per_worker * TARGET_BACKLOG / backlog)
+            decision = "decrease"
+            if batch_size < 100 and concurrent_requests > 2:
+                concurrent_requests -= 1
+        else:  # way too high, stop sending new batches
+            batch_size = 0
+            concurrent_requests = 2
+            decision = "pause"
+
+        if decision != "pause":
+            batch_size = min(max(batch_size, 1), self.__max_batch_size)
+        return DynamicBatchingStats(
+            batch_size=batch_size,
+            concurrent_requests=concurrent_requests,
+            queue_length=queue_length,
+            rate_per_second=rate,
+            backlog_seconds=backlog,
+            latency_seconds=latency,
+            decision=decision,
+        )
+
+
+def _backlog(queue_length: int, rate: int) -> float:
+    if queue_length == 0:
+        return 0.0
+    if rate == 0:
+        return math.inf
+    return queue_length / rate
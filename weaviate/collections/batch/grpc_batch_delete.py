@@ -31,37 +31,61 @@ class _BatchDeleteGRPC(_BaseGRPC):
             assert self._connection.grpc_stub is not None
             res: batch_delete_pb2.BatchDeleteReply
             res, _ = self._connection.grpc_stub.BatchDelete.with_call(
-                batch_delete_pb2.BatchDeleteRequest(
-                    collection=name,
-                    consistency_level=self._consistency_level,
-                    verbose=verbose,
-                    dry_run=dry_run,
-                    tenant=tenant,
-                    filters=_FilterToGRPC.convert(filters),
-                ),
+                self.__request(name, filters, verbose, dry_run, tenant),
                 metadata=metadata,
                 timeout=self._connection.timeout_config.insert,
             )
+            return self.__to_return(res, verbose)
+        except grpc.RpcError as e:
+            raise WeaviateDeleteManyError(e.details())  # pyright: ignore
 
-            if verbose:
-                objects: List[DeleteManyObject] = [
-                    DeleteManyObject(
-                        uuid=_WeaviateUUIDInt(int.from_bytes(obj.uuid, byteorder="big")),
-                        successful=obj.successful,
-                        error=obj.error if obj.error != "" else None,
-                    )
-                    for obj in res.objects
-                ]
-                return DeleteManyReturn(
-                    failed=res.failed,
-                    successful=res.successful,
-                    matches=res.matches,
-                    objects=objects,
-                )
-            else:
-                return DeleteManyReturn(
-                    failed=res.failed, successful=res.successful, matches=res.matches, objects=None
-                )
-
+    async def abatch_delete(
+        self, name: str, filters: _Filters, verbose: bool, dry_run: bool, tenant: Optional[str]
+    ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]:
+        metadata = self._get_metadata()
+        try:
+            assert self._connection.agrpc_stub is not None
+            res: batch_delete_pb2.BatchDeleteReply = await self._connection.agrpc_stub.BatchDelete(
+                self.__request(name, filters, verbose, dry_run, tenant),
+                metadata=metadata,
+                timeout=self._connection.timeout_config.insert,
+            )
+            return self.__to_return(res, verbose)
         except grpc.RpcError as e:
             raise WeaviateDeleteManyError(e.details())  # pyright: ignore
+
+    def __request(
+        self, name: str, filters: _Filters, verbose: bool, dry_run: bool, tenant: Optional[str]
+    ) -> batch_delete_pb2.BatchDeleteRequest:
+        return batch_delete_pb2.BatchDeleteRequest(
+            collection=name,
+            consistency_level=self._consistency_level,
+            verbose=verbose,
+            dry_run=dry_run,
+            tenant=tenant,
+            filters=_FilterToGRPC.convert(filters),
+        )
+
+    @staticmethod
+    def __to_return(
+        res: batch_delete_pb2.BatchDeleteReply, verbose: bool
+    ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]:
+        if verbose:
+            objects: List[DeleteManyObject] = [
+                DeleteManyObject(
+                    uuid=_WeaviateUUIDInt(int.from_bytes(obj.uuid, byteorder="big")),
+                    successful=obj.successful,
+                    error=obj.error if obj.error != "" else None,
+                )
+                for obj in res.objects
+            ]
+            return DeleteManyReturn(
+                failed=res.failed,
+                successful=res.successful,
+                matches=res.matches,
+                objects=objects,
+            )
+        else:
+            return DeleteManyReturn(
+                failed=res.failed, successful=res.successful, matches=res.matches, objects=None
+            )
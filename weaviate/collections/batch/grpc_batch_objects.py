@@ -2,7 +2,7 @@ import datetime
 import struct
 import time
 import uuid as uuid_package
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import grpc  # type: ignore
 from google.protobuf.struct_pb2 import Struct
@@ -16,6 +16,7 @@ from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.types import GeoCoordinate, PhoneNumber
 from weaviate.collections.classes.internal import ReferenceToMulti, ReferenceInputs
 from weaviate.collections.grpc.shared import _BaseGRPC
+from weaviate.collections.queries.byteops import _ByteOps
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import (
     WeaviateBatchError,
@@ -24,19 +25,47 @@ from weaviate.exceptions import (
     WeaviateInvalidInputError,
 )
 from weaviate.proto.v1 import batch_pb2, base_pb2
-from weaviate.util import _datetime_to_string, _get_vector_v4
+from weaviate.util import _datetime_to_string
 
 
-def _pack_named_vectors(vectors: Dict[str, List[float]]) -> List[base_pb2.Vectors]:
+def _pack_named_vectors(vectors: Dict[str, Any]) -> List[base_pb2.Vectors]:
     return [
-        base_pb2.Vectors(
-            name=name,
-            vector_bytes=struct.pack("{}f".format(len(vector)), *vector),
-        )
+        base_pb2.Vectors(name=name, vector_bytes=_ByteOps.encode_float32s(vector))
         for name, vector in vectors.items()
     ]
 
 
+def _batch_object_to_grpc(obj: _BatchObject, plans: "_PropertyPlans") -> batch_pb2.BatchObject:
+    if obj.serialized is not None:
+        # this still parses the bytes and encodes the message again when it is sent, only the translation of the
+        # properties is skipped
+        return batch_pb2.BatchObject.FromString(obj.serialized)
+    return batch_pb2.BatchObject(
+        collection=obj.collection,
+        vector_bytes=(
+            _ByteOps.encode_float32s(obj.vector)
+            if obj.vector is not None and not isinstance(obj.vector, dict)
+            else None
+        ),
+        uuid=str(obj.uuid) if obj.uuid is not None else str(uuid_package.uuid4()),
+        properties=(
+            _translate_properties_from_python_to_grpc(
+                obj.properties,
+                obj.references if obj.references is not None else {},
+                plans,
+            )
+            if obj.properties is not None
+            else None
+        ),
+        tenant=obj.tenant,
+        vectors=(
+            _pack_named_vectors(obj.vector)
+            if obj.vector is not None and isinstance(obj.vector, dict)
+            else None
+        ),
+    )
+
+
 class _BatchGRPC(_BaseGRPC):
     """This class is used to insert multiple objects into Weaviate using the gRPC API.
 
@@ -48,36 +77,8 @@ class _BatchGRPC(_BaseGRPC):
         super().__init__(connection, consistency_level)
 
     def __grpc_objects(self, objects: List[_BatchObject]) -> List[batch_pb2.BatchObject]:
-        def pack_vector(vector: Any) -> bytes:
-            vector_list = _get_vector_v4(vector)
-            return struct.pack("{}f".format(len(vector_list)), *vector_list)
-
-        return [
-            batch_pb2.BatchObject(
-                collection=obj.collection,
-                vector_bytes=(
-                    pack_vector(obj.vector)
-                    if obj.vector is not None and isinstance(obj.vector, list)
-                    else None
-                ),
-                uuid=str(obj.uuid) if obj.uuid is not None else str(uuid_package.uuid4()),
-                properties=(
-                    self.__translate_properties_from_python_to_grpc(
-                        obj.properties,
-                        obj.references if obj.references is not None else {},
-                    )
-                    if obj.properties is not None
-                    else None
-                ),
-                tenant=obj.tenant,
-                vectors=(
-                    _pack_named_vectors(obj.vector)
-                    if obj.vector is not None and isinstance(obj.vector, dict)
-                    else None
-                ),
-            )
-            for obj in objects
-        ]
+        plans: _PropertyPlans = {}
+        return [_batch_object_to_grpc(obj, plans) for obj in objects]
 
     def objects(self, objects: List[_BatchObject], timeout: int) -> BatchObjectReturn:
         """Insert multiple objects into Weaviate through the gRPC API.
@@ -91,20 +92,38 @@ class _BatchGRPC(_BaseGRPC):
             `tenant`
                 The tenant to be used for this batch operation
         """
-        weaviate_objs = self.__grpc_objects(objects)
-
-        start = time.time()
-        errors = self.__send_batch(weaviate_objs, timeout=timeout)
-        elapsed_time = time.time() - start
-
-        if len(errors) == len(weaviate_objs):
+        ret = self._objects(objects, timeout)
+        if len(ret.errors) == len(objects):
             # Escape sequence (backslash) not allowed in expression portion of f-string prior to Python 3.12: pylance
             raise WeaviateInsertManyAllFailedError(
                 "Here is the set of all errors: {}".format(
-                    "\n".join(err for err in set(errors.values()))
+                    "\n".join({err.message for err in ret.errors.values()})
                 )
             )
+        return ret
+
+    def _objects(
+        self, objects: List[_BatchObject], timeout: int, keep_messages: bool = False
+    ) -> BatchObjectReturn:
+        """Insert objects like `objects`, but return the per-object errors even if every object failed.
+
+        With `keep_messages`, the objects that failed keep the message they were sent as in `sent_message`.
+        """
+        weaviate_objs = self.__grpc_objects(objects)
 
+        start = time.time()
+        errors = self.__send_batch(weaviate_objs, timeout=timeout)
+        elapsed_time = time.time() - start
+        return self.__batch_return(objects, weaviate_objs, errors, elapsed_time, keep_messages)
+
+    def __batch_return(
+        self,
+        objects: List[_BatchObject],
+        weaviate_objs: List[batch_pb2.BatchObject],
+        errors: Dict[int, str],
+        elapsed_time: float,
+        keep_messages: bool,
+    ) -> BatchObjectReturn:
         all_responses: List[Union[uuid_package.UUID, ErrorObject]] = cast(
             List[Union[uuid_package.UUID, ErrorObject]], list(range(len(weaviate_objs)))
         )
@@ -113,6 +132,9 @@ class _BatchGRPC(_BaseGRPC):
 
         for idx, obj in enumerate(weaviate_objs):
             if idx in errors:
+                if keep_messages and objects[idx].serialized is None:
+                    # the batch encodes the message of the objects it retries, so they are sent as they are
+                    objects[idx].sent_message = obj
                 error = ErrorObject(errors[idx], objects[idx], original_uuid=objects[idx].uuid)
                 return_errors[idx] = error
                 all_responses[idx] = error
@@ -150,7 +172,9 @@ class _BatchGRPC(_BaseGRPC):
         except grpc.RpcError as e:
             raise WeaviateBatchError(e.details())  # pyright: ignore
 
-    async def aobjects(self, objects: List[_BatchObject], timeout: int) -> BatchObjectReturn:
+    async def aobjects(
+        self, objects: List[_BatchObject], timeout: int, keep_messages: bool = False
+    ) -> BatchObjectReturn:
         """Insert multiple objects into Weaviate through the gRPC API.
 
         Parameters:
@@ -161,36 +185,15 @@ class _BatchGRPC(_BaseGRPC):
                 The UUIDs of the objects that failed to be inserted will be returned in the `errors` attribute of the returned `_BatchReturn` object.
             `tenant`
                 The tenant to be used for this batch operation
+            `keep_messages`
+                Whether the objects that failed keep the message they were sent as in `sent_message`.
         """
         weaviate_objs = self.__grpc_objects(objects)
 
         start = time.time()
         errors = await self.__send_batch_async(weaviate_objs, timeout=timeout)
         elapsed_time = time.time() - start
-
-        all_responses: List[Union[uuid_package.UUID, ErrorObject]] = cast(
-            List[Union[uuid_package.UUID, ErrorObject]], list(range(len(weaviate_objs)))
-        )
-        return_success: Dict[int, uuid_package.UUID] = {}
-        return_errors: Dict[int, ErrorObject] = {}
-
-        for idx, obj in enumerate(weaviate_objs):
-            if idx in errors:
-                error = ErrorObject(errors[idx], objects[idx], original_uuid=objects[idx].uuid)
-                return_errors[idx] = error
-                all_responses[idx] = error
-            else:
-                success = uuid_package.UUID(obj.uuid)
-                return_success[idx] = success
-                all_responses[idx] = success
-
-        return BatchObjectReturn(
-            uuids=return_success,
-            errors=return_errors,
-            has_errors=len(errors) > 0,
-            all_responses=all_responses,
-            elapsed_seconds=elapsed_time,
-        )
+        return self.__batch_return(objects, weaviate_objs, errors, elapsed_time, keep_messages)
 
     async def __send_batch_async(
         self, batch: List[batch_pb2.BatchObject], timeout: int
@@ -215,123 +218,160 @@ class _BatchGRPC(_BaseGRPC):
         except grpc.RpcError as e:
             raise WeaviateBatchError(e.details())  # pyright: ignore
 
-    def __translate_properties_from_python_to_grpc(
-        self, data: Dict[str, Any], refs: ReferenceInputs
-    ) -> batch_pb2.BatchObject.Properties:
-        _validate_props(data)
-
-        multi_target: List[batch_pb2.BatchObject.MultiTargetRefProps] = []
-        single_target: List[batch_pb2.BatchObject.SingleTargetRefProps] = []
-        non_ref_properties: Struct = Struct()
-        bool_arrays: List[base_pb2.BooleanArrayProperties] = []
-        text_arrays: List[base_pb2.TextArrayProperties] = []
-        int_arrays: List[base_pb2.IntArrayProperties] = []
-        float_arrays: List[base_pb2.NumberArrayProperties] = []
-        object_properties: List[base_pb2.ObjectProperties] = []
-        object_array_properties: List[base_pb2.ObjectArrayProperties] = []
-        empty_lists: List[str] = []
-
-        for key, ref in refs.items():
-            if isinstance(ref, ReferenceToMulti):
-                multi_target.append(
-                    batch_pb2.BatchObject.MultiTargetRefProps(
-                        uuids=ref.uuids_str, target_collection=ref.target_collection, prop_name=key
-                    )
-                )
-            elif isinstance(ref, str) or isinstance(ref, uuid_package.UUID):
-                single_target.append(
-                    batch_pb2.BatchObject.SingleTargetRefProps(uuids=[str(ref)], prop_name=key)
-                )
-            elif isinstance(ref, list):
-                single_target.append(
-                    batch_pb2.BatchObject.SingleTargetRefProps(
-                        uuids=[str(v) for v in ref], prop_name=key
-                    )
-                )
-            else:
-                raise WeaviateInvalidInputError(f"Invalid reference: {ref}")
-
-        for key, entry in data.items():
-            if isinstance(entry, dict):
-                parsed = self.__translate_properties_from_python_to_grpc(entry, {})
-                object_properties.append(
-                    base_pb2.ObjectProperties(
-                        prop_name=key,
-                        value=base_pb2.ObjectPropertiesValue(
-                            non_ref_properties=parsed.non_ref_properties,
-                            int_array_properties=parsed.int_array_properties,
-                            text_array_properties=parsed.text_array_properties,
-                            number_array_properties=parsed.number_array_properties,
-                            boolean_array_properties=parsed.boolean_array_properties,
-                            object_properties=parsed.object_properties,
-                            object_array_properties=parsed.object_array_properties,
-                            empty_list_props=parsed.empty_list_props,
-                        ),
-                    )
-                )
-            elif isinstance(entry, list) and len(entry) == 0:
-                empty_lists.append(key)
-            elif isinstance(entry, list) and isinstance(entry[0], dict):
-                entry = cast(List[Dict[str, Any]], entry)
-                object_array_properties.append(
-                    base_pb2.ObjectArrayProperties(
-                        values=[
-                            base_pb2.ObjectPropertiesValue(
-                                non_ref_properties=parsed.non_ref_properties,
-                                int_array_properties=parsed.int_array_properties,
-                                text_array_properties=parsed.text_array_properties,
-                                number_array_properties=parsed.number_array_properties,
-                                boolean_array_properties=parsed.boolean_array_properties,
-                                object_properties=parsed.object_properties,
-                                object_array_properties=parsed.object_array_properties,
-                                empty_list_props=parsed.empty_list_props,
-                            )
-                            for v in entry
-                            if (parsed := self.__translate_properties_from_python_to_grpc(v, {}))
-                        ],
-                        prop_name=key,
-                    )
-                )
-            elif isinstance(entry, list) and isinstance(entry[0], bool):
-                bool_arrays.append(base_pb2.BooleanArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], str):
-                text_arrays.append(base_pb2.TextArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], datetime.datetime):
-                text_arrays.append(
-                    base_pb2.TextArrayProperties(
-                        prop_name=key, values=[_datetime_to_string(x) for x in entry]
-                    )
-                )
-            elif isinstance(entry, list) and isinstance(entry[0], uuid_package.UUID):
-                text_arrays.append(
-                    base_pb2.TextArrayProperties(prop_name=key, values=[str(x) for x in entry])
+
+# How to encode the properties of dicts with the same shape: the target field of `BatchObject.Properties` and the encoder
+# of every property, where no encoder means that the value is used as it is. Batches usually consist of many objects
+# with the same properties, so the type of every property only needs to be determined once per shape.
+_PropertyShape = Tuple[Tuple[str, type, Optional[type]], ...]
+_PropertyPlan = Tuple[Tuple[str, str, Optional["_PropertyEncoder"]], ...]
+_PropertyPlans = Dict[_PropertyShape, _PropertyPlan]
+_PropertyEncoder = Callable[[str, Any, _PropertyPlans], Any]
+
+
+def _translate_properties_from_python_to_grpc(
+    data: Dict[str, Any], refs: ReferenceInputs, plans: _PropertyPlans
+) -> batch_pb2.BatchObject.Properties:
+    multi_target: List[batch_pb2.BatchObject.MultiTargetRefProps] = []
+    single_target: List[batch_pb2.BatchObject.SingleTargetRefProps] = []
+
+    for key, ref in refs.items():
+        if isinstance(ref, ReferenceToMulti):
+            multi_target.append(
+                batch_pb2.BatchObject.MultiTargetRefProps(
+                    uuids=ref.uuids_str, target_collection=ref.target_collection, prop_name=key
                 )
-            elif isinstance(entry, list) and isinstance(entry[0], int):
-                int_arrays.append(base_pb2.IntArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], float):
-                values_bytes = struct.pack("{}d".format(len(entry)), *entry)
-                float_arrays.append(
-                    base_pb2.NumberArrayProperties(prop_name=key, values_bytes=values_bytes)
+            )
+        elif isinstance(ref, str) or isinstance(ref, uuid_package.UUID):
+            single_target.append(
+                batch_pb2.BatchObject.SingleTargetRefProps(uuids=[str(ref)], prop_name=key)
+            )
+        elif isinstance(ref, list):
+            single_target.append(
+                batch_pb2.BatchObject.SingleTargetRefProps(
+                    uuids=[str(v) for v in ref], prop_name=key
                 )
-            elif isinstance(entry, GeoCoordinate):
-                non_ref_properties.update({key: entry._to_dict()})
-            elif isinstance(entry, PhoneNumber):
-                non_ref_properties.update({key: entry._to_dict()})
-            else:
-                non_ref_properties.update({key: _serialize_primitive(entry)})
-
-        return batch_pb2.BatchObject.Properties(
-            non_ref_properties=non_ref_properties,
-            multi_target_ref_props=multi_target,
-            single_target_ref_props=single_target,
-            text_array_properties=text_arrays,
-            number_array_properties=float_arrays,
-            int_array_properties=int_arrays,
-            boolean_array_properties=bool_arrays,
-            object_properties=object_properties,
-            object_array_properties=object_array_properties,
-            empty_list_props=empty_lists,
-        )
+            )
+        else:
+            raise WeaviateInvalidInputError(f"Invalid reference: {ref}")
+
+    return batch_pb2.BatchObject.Properties(
+        multi_target_ref_props=multi_target,
+        single_target_ref_props=single_target,
+        **_encode_properties(data, plans),
+    )
+
+
+def _encode_properties(data: Dict[str, Any], plans: _PropertyPlans) -> Dict[str, Any]:
+    """Encode the non-reference properties into the fields shared by `BatchObject.Properties` and `ObjectPropertiesValue`."""
+    shape: _PropertyShape = tuple(
+        (key, type(entry), type(entry[0]) if isinstance(entry, list) and len(entry) > 0 else None)
+        for key, entry in data.items()
+    )
+    plan = plans.get(shape)
+    if plan is None:
+        plan = plans[shape] = _compile_property_plan(data)
+
+    non_ref_properties: Dict[str, Any] = {}
+    fields: Dict[str, Any] = {}
+    for key, target, encode in plan:
+        value = data[key] if encode is None else encode(key, data[key], plans)
+        if target == "non_ref_properties":
+            non_ref_properties[key] = value
+        elif target in fields:
+            fields[target].append(value)
+        else:
+            fields[target] = [value]
+
+    fields["non_ref_properties"] = Struct()
+    if len(non_ref_properties) > 0:
+        fields["non_ref_properties"].update(non_ref_properties)
+    return fields
+
+
+def _compile_property_plan(data: Dict[str, Any]) -> _PropertyPlan:
+    _validate_props(data)
+    return tuple((key, *_property_encoder(entry)) for key, entry in data.items())
+
+
+def _property_encoder(entry: Any) -> Tuple[str, Optional[_PropertyEncoder]]:
+    if isinstance(entry, dict):
+        return "object_properties", _encode_object
+    elif isinstance(entry, list) and len(entry) == 0:
+        return "empty_list_props", _encode_empty_list
+    elif isinstance(entry, list) and isinstance(entry[0], dict):
+        return "object_array_properties", _encode_object_array
+    elif isinstance(entry, list) and isinstance(entry[0], bool):
+        return "boolean_array_properties", _encode_bool_array
+    elif isinstance(entry, list) and isinstance(entry[0], str):
+        return "text_array_properties", _encode_text_array
+    elif isinstance(entry, list) and isinstance(entry[0], datetime.datetime):
+        return "text_array_properties", _encode_date_array
+    elif isinstance(entry, list) and isinstance(entry[0], uuid_package.UUID):
+        return "text_array_properties", _encode_uuid_array
+    elif isinstance(entry, list) and isinstance(entry[0], int):
+        return "int_array_properties", _encode_int_array
+    elif isinstance(entry, list) and isinstance(entry[0], float):
+        return "number_array_properties", _encode_number_array
+    elif isinstance(entry, GeoCoordinate) or isinstance(entry, PhoneNumber):
+        return "non_ref_properties", _encode_to_dict
+    elif isinstance(entry, (uuid_package.UUID, datetime.datetime, list)):
+        return "non_ref_properties", _encode_primitive
+    else:
+        return "non_ref_properties", None
+
+
+def _encode_object(key: str, entry: Dict[str, Any], plans: _PropertyPlans) -> Any:
+    return base_pb2.ObjectProperties(
+        prop_name=key, value=base_pb2.ObjectPropertiesValue(**_encode_properties(entry, plans))
+    )
+
+
+def _encode_object_array(key: str, entry: List[Dict[str, Any]], plans: _PropertyPlans) -> Any:
+    return base_pb2.ObjectArrayProperties(
+        values=[base_pb2.ObjectPropertiesValue(**_encode_properties(v, plans)) for v in entry],
+        prop_name=key,
+    )
+
+
+def _encode_empty_list(key: str, entry: List[Any], plans: _PropertyPlans) -> Any:
+    return key
+
+
+def _encode_bool_array(key: str, entry: List[bool], plans: _PropertyPlans) -> Any:
+    return base_pb2.BooleanArrayProperties(prop_name=key, values=entry)
+
+
+def _encode_text_array(key: str, entry: List[str], plans: _PropertyPlans) -> Any:
+    return base_pb2.TextArrayProperties(prop_name=key, values=entry)
+
+
+def _encode_date_array(key: str, entry: List[datetime.datetime], plans: _PropertyPlans) -> Any:
+    return base_pb2.TextArrayProperties(
+        prop_name=key, values=[_datetime_to_string(x) for x in entry]
+    )
+
+
+def _encode_uuid_array(key: str, entry: List[uuid_package.UUID], plans: _PropertyPlans) -> Any:
+    return base_pb2.TextArrayProperties(prop_name=key, values=[str(x) for x in entry])
+
+
+def _encode_int_array(key: str, entry: List[int], plans: _PropertyPlans) -> Any:
+    return base_pb2.IntArrayProperties(prop_name=key, values=entry)
+
+
+def _encode_number_array(key: str, entry: List[float], plans: _PropertyPlans) -> Any:
+    values_bytes = struct.pack("{}d".format(len(entry)), *entry)
+    return base_pb2.NumberArrayProperties(prop_name=key, values_bytes=values_bytes)
+
+
+def _encode_to_dict(
+    key: str, entry: Union[GeoCoordinate, PhoneNumber], plans: _PropertyPlans
+) -> Any:
+    return entry._to_dict()
+
+
+def _encode_primitive(key: str, entry: Any, plans: _PropertyPlans) -> Any:
+    return _serialize_primitive(entry)
 
 
 def _validate_props(props: Dict[str, Any]) -> None:
@@ -0,0 +1,96 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, cast
+
+from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
+from weaviate.collections.classes.batch import BatchObjectReturn, _BatchObject
+from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.connect import ConnectionV4
+from weaviate.connect.base import ConnectionParams
+from weaviate.proto.v1 import weaviate_pb2_grpc
+
+
+class _WorkerConnection:
+    """The parts of `ConnectionV4` that `_BatchGRPC` needs to send objects from a worker process.
+
+    Authentication is owned by the parent process, which passes the current bearer token and headers along with every
+    batch so that token refreshes are picked up by the workers.
+    """
+
+    def __init__(self, connection_params: ConnectionParams, proxies: Dict[str, str]) -> None:
+        self.__channel = connection_params._grpc_channel(async_channel=False, proxies=proxies)
+        self.grpc_stub = weaviate_pb2_grpc.WeaviateStub(self.__channel)
+        self.additional_headers: Dict[str, str] = {}
+        self.bearer_token = ""
+
+    def get_current_bearer_token(self) -> str:
+        return self.bearer_token
+
+
+# state of a worker process, set up once by `_init_worker`
+_worker_connection: Optional[_WorkerConnection] = None
+_worker_batch_grpc: Optional[_BatchGRPC] = None
+
+
+def _init_worker(
+    connection_params: ConnectionParams,
+    proxies: Dict[str, str],
+    consistency_level: Optional[ConsistencyLevel],
+) -> None:
+    global _worker_connection, _worker_batch_grpc
+    _worker_connection = _WorkerConnection(connection_params, proxies)
+    _worker_batch_grpc = _BatchGRPC(cast(ConnectionV4, _worker_connection), consistency_level)
+
+
+def _send_objects(
+    objects: List[_BatchObject],
+    timeout: int,
+    bearer_token: str,
+    additional_headers: Dict[str, str],
+) -> BatchObjectReturn:
+    assert _worker_connection is not None and _worker_batch_grpc is not None
+    _worker_connection.bearer_token = bearer_token
+    _worker_connection.additional_headers = additional_headers
+    return _worker_batch_grpc._objects(objects, timeout, keep_messages=True)
+
+
+class _BatchProcessPool:
+    """Serializes and sends batches of objects in a pool of worker processes.
+
+    Each worker keeps its own gRPC channel, so building the protobuf messages and sending them does not compete for
+    the GIL of the process that adds the objects. Everything else (queueing, retries, the dynamic batch sizing and
+    collecting the results) stays with the `_BatchBase` of the parent process.
+    """
+
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        consistency_level: Optional[ConsistencyLevel],
+        workers: int,
+    ) -> None:
+        self.__connection = connection
+        # spawn works on every platform and does not fork the (threaded) gRPC runtime of the parent
+        self.__executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                connection._connection_params,
+                connection.get_proxies(),
+                consistency_level,
+            ),
+        )
+
+    async def objects(self, objects: List[_BatchObject], timeout: int) -> BatchObjectReturn:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor,
+            _send_objects,
+            objects,
+            timeout,
+            self.__connection.get_current_bearer_token(),
+            dict(self.__connection.additional_headers),
+        )
+
+    def shutdown(self) -> None:
+        self.__executor.shutdown(wait=True)
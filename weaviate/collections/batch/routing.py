@@ -0,0 +1,66 @@
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from weaviate.cluster import Cluster
+from weaviate.collections.classes.batch import _BatchObject
+
+# how often the placement of the shards is fetched again, e.g. to pick up tenants that were created during the import
+ROUTING_REFRESH_TIME = 10.0
+
+_Nodes = Tuple[str, ...]
+
+
+class _ShardRouter:
+    """Maps queued objects to the nodes that hold their target shard, see `shard_routing` of the client batches.
+
+    The placement is read from the verbose output of `/nodes`. The shard of an object can only be determined on the
+    client if it is the shard of its tenant or the only shard of its collection, because Weaviate distributes the
+    objects of a multi-shard collection over virtual shards whose hash ranges are not published. The nodes of all
+    other objects are unknown.
+    """
+
+    def __init__(self, cluster: Cluster) -> None:
+        self.__cluster = cluster
+        self.__tenant_shards: Dict[Tuple[str, str], _Nodes] = {}
+        self.__single_shards: Dict[str, _Nodes] = {}
+        self.__refreshed_at: Optional[float] = None
+
+    def refresh(self) -> bool:
+        """Fetch the placement of the shards if it has not been fetched in the last `ROUTING_REFRESH_TIME` seconds.
+
+        Returns
+            `True` if the placement was fetched.
+        """
+        if (
+            self.__refreshed_at is not None
+            and time.monotonic() - self.__refreshed_at < ROUTING_REFRESH_TIME
+        ):
+            return False
+        self.__refreshed_at = time.monotonic()
+
+        placement: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        for node in self.__cluster.get_nodes_status(output="verbose"):
+            for shard in node.get("shards") or []:
+                placement[(shard["class"], shard["name"])].add(node["name"])
+
+        shards_per_collection: Dict[str, List[_Nodes]] = defaultdict(list)
+        tenant_shards: Dict[Tuple[str, str], _Nodes] = {}
+        for (collection, name), nodes in placement.items():
+            tenant_shards[(collection, name)] = tuple(sorted(nodes))
+            shards_per_collection[collection].append(tenant_shards[(collection, name)])
+
+        # replaced as a whole, so that the sender thread never sees a half-built placement
+        self.__tenant_shards = tenant_shards
+        self.__single_shards = {
+            collection: shards[0]
+            for collection, shards in shards_per_collection.items()
+            if len(shards) == 1
+        }
+        return True
+
+    def nodes(self, obj: _BatchObject) -> Optional[_Nodes]:
+        """Return the names of the nodes that hold the shard of the object, or `None` if they are unknown."""
+        if obj.tenant is not None:
+            return self.__tenant_shards.get((obj.collection, obj.tenant))
+        return self.__single_shards.get(obj.collection)
@@ -0,0 +1,202 @@
+import os
+import struct
+import threading
+import zlib
+from collections import deque
+from typing import BinaryIO, Deque, List, Optional, Set, Tuple
+
+from weaviate.collections.batch.grpc_batch_objects import _batch_object_to_grpc, _PropertyPlans
+from weaviate.collections.classes.batch import _BatchObject
+from weaviate.proto.v1 import batch_pb2
+
+SPILL_SEGMENT_BYTES = 64 * 1024 * 1024
+_HEADER = struct.Struct("<II")  # length and crc32 of the record that follows
+_SEGMENT_SUFFIX = ".log"
+_CHECKPOINT = "checkpoint"
+
+
+class _SpillLog:
+    """A write-ahead log of objects on disk, see `spill_directory` of the client batches.
+
+    Objects are appended as encoded `batch_pb2.BatchObject` records to segment files named after the offset of their
+    first record in the log. The offset up to which all records were sent is kept in a checkpoint file and segments
+    below it are deleted. A log that is opened again resumes after its checkpoint, so that an interrupted import sends
+    the remaining objects without reading them from the source again. Objects that were in flight when the import was
+    interrupted are sent again, which replaces them with themselves in Weaviate.
+
+    Every record is written to the operating system right away, so that it survives a crash of the process.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = SPILL_SEGMENT_BYTES) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__segment_bytes = segment_bytes
+        self.__lock = threading.Lock()
+        self.__plans: _PropertyPlans = {}
+
+        # offsets of the records that were read but not sent yet, in the order they were read
+        self.__in_flight: Deque[int] = deque()
+        self.__sent: Set[int] = set()
+
+        self.__segments = sorted(
+            int(name[: -len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(_SEGMENT_SUFFIX)
+        )
+        self.__checkpoint = self.__read_checkpoint()
+        if len(self.__segments) == 0:
+            self.__segments.append(self.__checkpoint)
+            open(self.__path(self.__checkpoint), "ab").close()
+        self.__unread, end = self.__recover()
+
+        self.__writer: BinaryIO = open(self.__path(self.__segments[-1]), "ab", buffering=0)
+        self.__write_offset = end
+        self.__reader: Optional[BinaryIO] = None
+        self.__read_offset = self.__checkpoint
+
+    def __path(self, segment: int) -> str:
+        return os.path.join(self.__directory, f"{segment:020d}{_SEGMENT_SUFFIX}")
+
+    def __read_checkpoint(self) -> int:
+        try:
+            with open(os.path.join(self.__directory, _CHECKPOINT)) as f:
+                return int(f.read())
+        except FileNotFoundError:
+            return self.__segments[0] if len(self.__segments) > 0 else 0
+
+    def __write_checkpoint(self) -> None:
+        path = os.path.join(self.__directory, _CHECKPOINT)
+        with open(path + ".tmp", "w") as f:
+            f.write(str(self.__checkpoint))
+        os.replace(path + ".tmp", path)
+
+    def __recover(self) -> Tuple[int, int]:
+        """Count the records after the checkpoint and cut off a record that was only partially written.
+
+        Returns the number of records to send and the offset of the end of the log.
+        """
+        count = 0
+        for i, segment in enumerate(self.__segments):
+            with open(self.__path(segment), "rb+") as f:
+                position = max(self.__checkpoint - segment, 0)
+                f.seek(position)
+                while True:
+                    record = _read_record(f)
+                    if record is None:
+                        break
+                    position = f.tell()
+                    count += 1
+                if position < os.fstat(f.fileno()).st_size:
+                    # a torn or corrupt record, everything after it is lost
+                    f.truncate(position)
+                    for later in self.__segments[i + 1 :]:
+                        os.remove(self.__path(later))
+                    del self.__segments[i + 1 :]
+                    return count, segment + position
+        return count, self.__segments[-1] + os.path.getsize(self.__path(self.__segments[-1]))
+
+    def unread(self) -> int:
+        """Return the number of records that have not been read yet."""
+        return self.__unread
+
+    def encode(self, obj: _BatchObject) -> bytes:
+        """Encode an object for `append`.
+
+        Raises if the object cannot be encoded, e.g. because of an invalid property.
+        """
+        return _batch_object_to_grpc(obj, self.__plans).SerializeToString()
+
+    def append(self, data: bytes) -> None:
+        """Append an encoded object to the log."""
+        record = _HEADER.pack(len(data), zlib.crc32(data)) + data
+        with self.__lock:
+            if self.__write_offset - self.__segments[-1] >= self.__segment_bytes:
+                self.__writer.close()
+                self.__segments.append(self.__write_offset)
+                self.__writer = open(self.__path(self.__write_offset), "ab", buffering=0)
+            self.__writer.write(record)
+            self.__write_offset += len(record)
+            self.__unread += 1
+
+    def read(self, max_records: int) -> List[_BatchObject]:
+        """Read the next records of the log, which have to be passed to `sent` once they were sent."""
+        ret: List[_BatchObject] = []
+        with self.__lock:
+            while len(ret) < max_records and self.__unread > 0:
+                segment = self.__segment_of(self.__read_offset)
+                if self.__reader is None or self.__reader.name != self.__path(segment):
+                    if self.__reader is not None:
+                        self.__reader.close()
+                    self.__reader = open(self.__path(segment), "rb")
+                    self.__reader.seek(self.__read_offset - segment)
+                data = _read_record(self.__reader)
+                if data is None:
+                    # the end of a segment, the next record is in the next one
+                    self.__read_offset = self.__segments[self.__segments.index(segment) + 1]
+                    continue
+                self.__read_offset = segment + self.__reader.tell()
+                self.__unread -= 1
+                self.__in_flight.append(self.__read_offset)
+                ret.append(_spilled_object(data, self.__read_offset))
+        return ret
+
+    def __segment_of(self, offset: int) -> int:
+        return max(segment for segment in self.__segments if segment <= offset)
+
+    def sent(self, objects: List[_BatchObject]) -> None:
+        """Mark objects that were read from the log as sent and move the checkpoint past all sent records."""
+        with self.__lock:
+            self.__sent.update(obj.spill_offset for obj in objects if obj.spill_offset is not None)
+            checkpoint = self.__checkpoint
+            while len(self.__in_flight) > 0 and self.__in_flight[0] in self.__sent:
+                checkpoint = self.__in_flight.popleft()
+                self.__sent.remove(checkpoint)
+            if checkpoint == self.__checkpoint:
+                return
+            self.__checkpoint = checkpoint
+            self.__write_checkpoint()
+            while len(self.__segments) > 1 and self.__segments[1] <= checkpoint:
+                if self.__reader is not None and self.__reader.name == self.__path(
+                    self.__segments[0]
+                ):
+                    self.__reader.close()
+                    self.__reader = None
+                os.remove(self.__path(self.__segments.pop(0)))
+
+    def close(self) -> None:
+        """Close the log and delete its files if all records were sent."""
+        with self.__lock:
+            self.__writer.close()
+            if self.__reader is not None:
+                self.__reader.close()
+            if self.__checkpoint < self.__write_offset:
+                return
+            for segment in self.__segments:
+                os.remove(self.__path(segment))
+            if os.path.exists(os.path.join(self.__directory, _CHECKPOINT)):
+                os.remove(os.path.join(self.__directory, _CHECKPOINT))
+
+
+def _read_record(f: BinaryIO) -> Optional[bytes]:
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    length, crc = _HEADER.unpack(header)
+    data = f.read(length)
+    if len(data) < length or zlib.crc32(data) != crc:
+        return None
+    return data
+
+
+def _spilled_object(data: bytes, offset: int) -> _BatchObject:
+    msg = batch_pb2.BatchObject.FromString(data)
+    return _BatchObject(
+        collection=msg.collection,
+        vector=None,
+        uuid=msg.uuid,
+        properties=None,
+        tenant=msg.tenant or None,
+        references=None,
+        serialized=data,
+        spill_offset=offset,
+    )
@@ -1,11 +1,26 @@
 import uuid as uuid_package
-from dataclasses import dataclass
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union, cast
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from pydantic import BaseModel, Field, field_validator
 
 from weaviate.collections.classes.internal import ReferenceInputs
 from weaviate.collections.classes.types import WeaviateField
+from weaviate.collections.queries.byteops import _ByteOps
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import batch_pb2
 from weaviate.types import BEACON, UUID, VECTORS
 from weaviate.util import _capitalize_first_letter, get_valid_uuid, _get_vector_v4
 
@@ -19,6 +34,18 @@ class _BatchObject:
     tenant: Optional[str]
     references: Optional[ReferenceInputs]
     retry_count: int = 0
+    # the encoded `batch_pb2.BatchObject`, which is kept for objects that are retried so that their properties are not
+    # translated again. Objects read back from a spill file only have their collection, uuid and tenant besides it and
+    # `spill_offset`, the end of their record in the file
+    serialized: Optional[bytes] = field(default=None, repr=False, compare=False)
+    # the message an object that failed was sent as, until the batch decides whether to retry it
+    sent_message: Optional[batch_pb2.BatchObject] = field(default=None, repr=False, compare=False)
+    spill_offset: Optional[int] = None
+    # the references that `batch.add_reference` attached to the object while it was queued, which are reported as
+    # failed references if the object fails
+    attached_references: Optional[List["_BatchReference"]] = field(
+        default=None, repr=False, compare=False
+    )
 
 
 @dataclass
@@ -34,7 +61,8 @@ class BatchObject(BaseModel):
     A Weaviate object to be added to the database.
 
     Performs validation on the class name and UUID, and automatically generates a UUID if one is not provided.
-    Also converts the vector to a list of floats if it is provided as a numpy array.
+    Numeric numpy arrays are kept as vectors so that they can be encoded straight from their buffer, all other vector
+    types are converted to a list of floats.
     """
 
     collection: str = Field(min_length=1)
@@ -45,12 +73,18 @@ class BatchObject(BaseModel):
     tenant: Optional[str] = Field(default=None)
 
     def __init__(self, **data: Any) -> None:
+        # float arrays bypass the validation of `vector` so that they are encoded from their buffer when sent
+        arrays: Optional[Any] = None
         v = data.get("vector")
         if v is not None:
             if isinstance(v, dict):  # named vector
-                for key, val in v.items():
-                    v[key] = _get_vector_v4(val)
-                data["vector"] = v
+                arrays = {key: val for key, val in v.items() if _ByteOps.is_float_array(val)}
+                data["vector"] = {
+                    key: _get_vector_v4(val) for key, val in v.items() if key not in arrays
+                }
+            elif _ByteOps.is_float_array(v):
+                arrays = v
+                data["vector"] = None
             else:
                 data["vector"] = _get_vector_v4(v)
 
@@ -58,11 +92,15 @@ class BatchObject(BaseModel):
             get_valid_uuid(u) if (u := data.get("uuid")) is not None else uuid_package.uuid4()
         )
         super().__init__(**data)
+        if isinstance(arrays, dict):
+            self.vector = {**cast(dict, self.vector), **arrays}
+        elif arrays is not None:
+            self.vector = arrays
 
     def _to_internal(self) -> _BatchObject:
         return _BatchObject(
             collection=self.collection,
-            vector=cast(list, self.vector),
+            vector=self.vector,
             uuid=str(self.uuid),
             properties=self.properties,
             tenant=self.tenant,
@@ -74,6 +112,68 @@ class BatchObject(BaseModel):
         return _capitalize_first_letter(v)
 
 
+def _column_to_list(column: Any) -> List[Any]:
+    if hasattr(column, "to_pylist"):  # pyarrow
+        return cast(List[Any], column.to_pylist())
+    if hasattr(column, "tolist"):  # numpy, pandas
+        return cast(List[Any], column.tolist())
+    return list(column)
+
+
+def _batch_objects_from_columns(
+    collection: str,
+    tenant: Optional[str],
+    properties: Optional[Mapping[str, Any]],
+    vectors: Optional[Any],
+    uuids: Optional[Sequence[UUID]],
+) -> List[_BatchObject]:
+    """Slice property columns, a vector matrix and UUIDs into one `_BatchObject` per row.
+
+    Each column is converted to a list once, and numpy vector matrices are converted to float32 once so that each row
+    is a view of the matrix. This skips the per-object validation of `BatchObject`.
+    """
+    columns = {name: _column_to_list(column) for name, column in (properties or {}).items()}
+    named = vectors is not None and isinstance(vectors, Mapping)
+    matrices: Dict[str, Any] = {}
+    if vectors is not None:
+        matrices = (
+            {name: _ByteOps.float32_rows(matrix) for name, matrix in vectors.items()}
+            if named
+            else {"": _ByteOps.float32_rows(vectors)}
+        )
+
+    lengths = {len(column) for column in columns.values()} | {
+        len(matrix) for matrix in matrices.values()
+    }
+    if uuids is not None:
+        lengths.add(len(uuids))
+    if len(lengths) > 1:
+        raise WeaviateInvalidInputError(
+            f"All property columns, vectors and uuids must have the same number of rows, got {sorted(lengths)}"
+        )
+    rows = lengths.pop() if len(lengths) > 0 else 0
+
+    names = list(columns.keys())
+    values = list(columns.values())
+    return [
+        _BatchObject(
+            collection=collection,
+            vector=(
+                {name: matrix[i] for name, matrix in matrices.items()}
+                if named
+                else matrices[""][i]
+                if vectors is not None
+                else None
+            ),
+            uuid=get_valid_uuid(uuids[i]) if uuids is not None else str(uuid_package.uuid4()),
+            properties={name: column[i] for name, column in zip(names, values)},
+            tenant=tenant,
+            references=None,
+        )
+        for i in range(rows)
+    ]
+
+
 class Shard(BaseModel):
     """Use this class when defining a shard whose vector indexing process will be awaited for in a sync blocking fashion."""
 
@@ -232,6 +332,40 @@ class BatchResult:
         self.refs: BatchReferenceReturn = BatchReferenceReturn(0.0, {})
 
 
+@dataclass
+class DynamicBatchingStats:
+    """This class contains the latest decision of the controller that sizes the batches of dynamic batching.
+
+    Attributes:
+        `batch_size`
+            The number of objects that are sent per request. If this is `0`, no new requests are sent until the nodes
+            have caught up.
+        `concurrent_requests`
+            The number of requests that are sent concurrently.
+        `queue_length`
+            The number of objects that wait to be indexed, summed over all nodes.
+        `rate_per_second`
+            The number of objects that are indexed per second, summed over all nodes.
+        `backlog_seconds`
+            How many seconds the node with the longest queue needs to index it. A batch is only done once its slowest
+            node indexed its share, so this is what the batch size is tuned to.
+        `latency_seconds`
+            The duration of the slowest request that finished since the previous decision, if any did.
+        `decision`
+            Whether the controller sent more (`increase`), the same (`hold`), less (`decrease`) or nothing (`pause`).
+            `fixed` means that the nodes do not report their queues, e.g. with asynchronous indexing, and the largest
+            batches are sent at the highest concurrency.
+    """
+
+    batch_size: int
+    concurrent_requests: int
+    queue_length: int
+    rate_per_second: int
+    backlog_seconds: float
+    latency_seconds: Optional[float]
+    decision: Literal["increase", "hold", "decrease", "pause", "fixed"]
+
+
 @dataclass
 class DeleteManyObject:
     """This class contains the objects of a `delete_many` operation."""
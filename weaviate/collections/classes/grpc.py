@@ -1,13 +1,31 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import ClassVar, List, Literal, Optional, Sequence, Type, Union
+from io import BufferedReader
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from pydantic import ConfigDict, Field
 
+from weaviate.collections.classes.filters import _Filters
 from weaviate.collections.classes.types import _WeaviateInput
-from weaviate.types import INCLUDE_VECTOR, UUID
+from weaviate.types import INCLUDE_VECTOR, NUMBER, RETURN_FORMAT, UUID, VECTOR_FORMAT
 from weaviate.util import BaseEnum
 
+if TYPE_CHECKING:
+    from weaviate.collections.classes.internal import ReturnProperties, ReturnReferences
+
 
 class HybridFusion(str, BaseEnum):
     """Define how the query's hybrid fusion operation should be performed."""
@@ -361,3 +379,392 @@ class NearMediaType(str, Enum):
     IMU = "imu"
     THERMAL = "thermal"
     VIDEO = "video"
+
+
+_BatchQueryMethod = Literal[
+    "bm25",
+    "fetch_object_by_id",
+    "fetch_objects",
+    "hybrid",
+    "near_image",
+    "near_media",
+    "near_object",
+    "near_text",
+    "near_vector",
+]
+
+
+@dataclass
+class _BatchQuery:
+    method: _BatchQueryMethod
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+
+
+class BatchQuery:
+    """Use this factory class to define the searches that are run concurrently by `collection.query.batch`.
+
+    Each method takes the same arguments as the search method of `collection.query` with the same name. The arguments
+    are validated when the search is run, so an invalid argument only fails its own search.
+    """
+
+    @staticmethod
+    def bm25(
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional["ReturnProperties[Any]"] = None,
+        return_references: Optional["ReturnReferences[Any]"] = None,
+    ) -> _BatchQuery:
+        """Define a `query.bm25` search."""
+        return _BatchQuery(
+            "bm25",
+            (query,),
+            {
+                "query_properties": query_properties,
+                "limit": limit,
+                "offset": offset,
+                "auto_limit": auto_limit,
+                "filters": filters,
+                "group_by": group_by,
+                "rerank": rerank,
+                "include_vector": include_vector,
+                "vector_format": vector_format,
+                "return_format": return_format,
+                "return_metadata": return_metadata,
+                "return_properties": return_properties,
+                "return_references": return_references,
+            },
+        )
+
+    @staticmethod
+    def fetch_object_by_id(
+        uuid: UUID,
+        *,
+        include_vector: INCLUDE_VECTOR = False,
+        return_properties: Optional["ReturnProperties[Any]"] = None,
+        return_references: Optional["ReturnReferences[Any]"] = None,
+        vector_format: VECTOR_FORMAT = "list",
+    ) -> _BatchQuery:
+        """Define a `query.fetch_object_by_id` search."""
+        return _BatchQuery(
+            "fetch_object_by_id",
+            (uuid,),
+            {
+                "include_vector": include_vector,
+                "return_properties": return_properties,
+                "return_references": return_references,
+                "vector_format": vector_format,
+            },
+        )
+
+    @staticmethod
+    def fetch_objects(
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional["ReturnProperties[Any]"] = None,
+        return_references: Optional["ReturnReferences[Any]"] = None,
+    ) -> _BatchQuery:
+        """Define a `query.fetch_objects` search."""
+        return _BatchQuery(
+            "fetch_objects",
+            (),
+            {
+                "limit": limit,
+                "offset": offset,
+                "after": after,
+                "filters": filters,
+                "sort": sort,
+                "include_vector": include_vector,
+                "vector_format": vector_format,
+                "return_format": return_format,
+                "return_metadata": return_metadata,
+                "return_properties": return_properties,
+                "return_references": return_references,
+            },
+        )
+
+    @staticmethod
+    def hybrid(
+        query: Optional[str],
+        *,
+        alpha: NUMBER = 0.7,
+        vector: Optional[HybridVectorType] = None,
+        query_properties: Optional[List[str]] = None,
+        fusion_type: Optional[HybridFusion] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional["ReturnProperties[Any]"] = None,
+        return_references: Optional["ReturnReferences[Any]"] = None,
+    ) -> _BatchQuery:
+        """Define a `query.hybrid` search."""
+        return _BatchQuery(
+            "hybrid",
+            (query,),
+            {
+                "alpha": alpha,
+                "vector": vector,
+                "query_properties": query_properties,
+                "fusion_type": fusion_type,
+                "limit": limit,
+                "offset": offset,
+                "auto_limit": auto_limit,
+                "filters": filters,
+                "group_by": group_by,
+                "rerank": rerank,
+                "target_vector": target_vector,
+                "include_vector": include_vector,
+                "vector_format": vector_format,
+                "return_format": return_format,
+                "return_metadata": return_metadata,
+                "return_properties": return_properties,
+                "return_references": return_references,
+            },
+        )
+
+    @staticmethod
+    def near_image(
+        near_image: Union[str, Path, BufferedReader],
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional["ReturnProperties[Any]"] = None,
+        return_references: Optional["ReturnReferences[Any]"] = None,
+    ) -> _BatchQuery:
+        """Define a `query.near_image` search."""
+        return _BatchQuery(
+            "near_image",
+            (near_image,),
+            {
+                "certainty": certainty,
+                "distance": distance,
+                "limit": limit,
+                "offset": offset,
+                "auto_limit": auto_limit,
+                "filters": filters,
+                "group_by": group_by,
+                "rerank": rerank,
+                "target_vector": target_vector,
+                "include_vector": include_vector,
+                "vector_format": vector_format,
+                "return_format": return_format,
+                "return_metadata": return_metadata,
+                "return_properties": return_properties,
+                "return_references": return_references,
+            },
+        )
+
+    @staticmethod
+    def near_media(
+        media: Union[str, Path, BufferedReader],
+        media_type: NearMediaType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional["ReturnProperties[Any]"] = None,
+        return_references: Optional["ReturnReferences[Any]"] = None,
+    ) -> _BatchQuery:
+        """Define a `query.near_media` search."""
+        return _BatchQuery(
+            "near_media",
+            (media, media_type),
+            {
+                "certainty": certainty,
+                "distance": distance,
+                "limit": limit,
+                "offset": offset,
+                "auto_limit": auto_limit,
+                "filters": filters,
+                "group_by": group_by,
+                "rerank": rerank,
+                "target_vector": target_vector,
+                "include_vector": include_vector,
+                "vector_format": vector_format,
+                "return_format": return_format,
+                "return_metadata": return_metadata,
+                "return_properties": return_properties,
+                "return_references": return_references,
+            },
+        )
+
+    @staticmethod
+    def near_object(
+        near_object: UUID,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional["ReturnProperties[Any]"] = None,
+        return_references: Optional["ReturnReferences[Any]"] = None,
+    ) -> _BatchQuery:
+        """Define a `query.near_object` search."""
+        return _BatchQuery(
+            "near_object",
+            (near_object,),
+            {
+                "certainty": certainty,
+                "distance": distance,
+                "limit": limit,
+                "offset": offset,
+                "auto_limit": auto_limit,
+                "filters": filters,
+                "group_by": group_by,
+                "rerank": rerank,
+                "target_vector": target_vector,
+                "include_vector": include_vector,
+                "vector_format": vector_format,
+                "return_format": return_format,
+                "return_metadata": return_metadata,
+                "return_properties": return_properties,
+                "return_references": return_references,
+            },
+        )
+
+    @staticmethod
+    def near_text(
+        query: Union[List[str], str],
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        move_to: Optional[Move] = None,
+        move_away: Optional[Move] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional["ReturnProperties[Any]"] = None,
+        return_references: Optional["ReturnReferences[Any]"] = None,
+    ) -> _BatchQuery:
+        """Define a `query.near_text` search."""
+        return _BatchQuery(
+            "near_text",
+            (query,),
+            {
+                "certainty": certainty,
+                "distance": distance,
+                "move_to": move_to,
+                "move_away": move_away,
+                "limit": limit,
+                "offset": offset,
+                "auto_limit": auto_limit,
+                "filters": filters,
+                "group_by": group_by,
+                "rerank": rerank,
+                "target_vector": target_vector,
+                "include_vector": include_vector,
+                "vector_format": vector_format,
+                "return_format": return_format,
+                "return_metadata": return_metadata,
+                "return_properties": return_properties,
+                "return_references": return_references,
+            },
+        )
+
+    @staticmethod
+    def near_vector(
+        near_vector: List[float],
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional["ReturnProperties[Any]"] = None,
+        return_references: Optional["ReturnReferences[Any]"] = None,
+    ) -> _BatchQuery:
+        """Define a `query.near_vector` search."""
+        return _BatchQuery(
+            "near_vector",
+            (near_vector,),
+            {
+                "certainty": certainty,
+                "distance": distance,
+                "limit": limit,
+                "offset": offset,
+                "auto_limit": auto_limit,
+                "filters": filters,
+                "group_by": group_by,
+                "rerank": rerank,
+                "target_vector": target_vector,
+                "include_vector": include_vector,
+                "vector_format": vector_format,
+                "return_format": return_format,
+                "return_metadata": return_metadata,
+                "return_properties": return_properties,
+                "return_references": return_references,
+            },
+        )
@@ -1,6 +1,6 @@
 import datetime
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import (
     Any,
     Dict,
@@ -11,6 +11,7 @@ from typing import (
     Sequence,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -43,16 +44,43 @@ from weaviate.collections.classes.types import (
     P,
     R,
     TProperties,
+    V,
     WeaviateProperties,
     _WeaviateInput,
 )
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.util import _to_beacons
-from weaviate.types import INCLUDE_VECTOR, UUID, UUIDS
+from weaviate.types import (
+    INCLUDE_VECTOR,
+    RETURN_FORMAT,
+    UUID,
+    UUIDS,
+    VECTOR_FORMAT,
+)
 
 from weaviate.proto.v1 import search_get_pb2
 
+_C = TypeVar("_C", bound=type)
+
+
+def _slotted(cls: _C) -> _C:
+    """Recreate a dataclass with `__slots__` for its fields, like `@dataclass(slots=True)` on Python 3.10+.
 
+    Query results can consist of many objects, so they should not carry a `__dict__` per instance. This only saves
+    memory if every base class is slotted as well.
+    """
+    inherited = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+    names = tuple(f.name for f in fields(cls) if f.name not in inherited)
+    cls_dict = {
+        key: val
+        for key, val in cls.__dict__.items()
+        if key not in names + ("__dict__", "__weakref__")
+    }
+    cls_dict["__slots__"] = names
+    return cast(_C, type(cls)(cls.__name__, cls.__bases__, cls_dict))
+
+
+@_slotted
 @dataclass
 class MetadataReturn:
     """Metadata of an object returned by a query."""
@@ -81,6 +109,7 @@ class MetadataReturn:
         )
 
 
+@_slotted
 @dataclass
 class GroupByMetadataReturn:
     """Metadata of an object returned by a group by query."""
@@ -88,23 +117,26 @@ class GroupByMetadataReturn:
     distance: Optional[float] = None
 
 
+@_slotted
 @dataclass
-class _Object(Generic[P, R, M]):
+class _Object(Generic[P, R, M, V]):
     uuid: uuid_package.UUID
     metadata: M
     properties: P
     references: R
-    vector: Dict[str, List[float]]
+    vector: Dict[str, V]
     collection: str
 
 
+@_slotted
 @dataclass
-class Object(Generic[P, R], _Object[P, R, MetadataReturn]):
+class Object(Generic[P, R, V], _Object[P, R, MetadataReturn, V]):
     """A single Weaviate object returned by a query within the `.query` namespace of a collection."""
 
     pass
 
 
+@_slotted
 @dataclass
 class MetadataSingleObjectReturn:
     """Metadata of an object returned by the `fetch_object_by_id` query."""
@@ -114,76 +146,158 @@ class MetadataSingleObjectReturn:
     is_consistent: Optional[bool]
 
 
+@_slotted
 @dataclass
-class ObjectSingleReturn(Generic[P, R], _Object[P, R, MetadataSingleObjectReturn]):
+class ObjectSingleReturn(Generic[P, R, V], _Object[P, R, MetadataSingleObjectReturn, V]):
     """A single Weaviate object returned by the `fetch_object_by_id` query."""
 
     pass
 
 
+@_slotted
 @dataclass
-class GroupByObject(Generic[P, R], _Object[P, R, GroupByMetadataReturn]):
+class GroupByObject(Generic[P, R, V], _Object[P, R, GroupByMetadataReturn, V]):
     """A single Weaviate object returned by a query with the `group_by` argument specified."""
 
     belongs_to_group: str
 
 
+@_slotted
 @dataclass
-class GenerativeObject(Generic[P, R], Object[P, R]):
+class GenerativeObject(Generic[P, R, V], Object[P, R, V]):
     """A single Weaviate object returned by a query within the `generate` namespace of a collection."""
 
     generated: Optional[str]
 
 
 @dataclass
-class GenerativeReturn(Generic[P, R]):
+class GenerativeReturn(Generic[P, R, V]):
     """The return type of a query within the `generate` namespace of a collection."""
 
-    objects: List[GenerativeObject[P, R]]
+    objects: List[GenerativeObject[P, R, V]]
     generated: Optional[str]
 
 
 @dataclass
-class Group(Generic[P, R]):
+class Group(Generic[P, R, V]):
     """A group of objects returned in a group by query."""
 
     name: str
     min_distance: float
     max_distance: float
     number_of_objects: int
-    objects: List[GroupByObject[P, R]]
+    objects: List[GroupByObject[P, R, V]]
     rerank_score: Optional[float]
 
 
 @dataclass
-class GenerativeGroup(Generic[P, R], Group[P, R]):
+class GenerativeGroup(Generic[P, R, V], Group[P, R, V]):
     """A group of objects returned in a generative group by query."""
 
     generated: Optional[str]
 
 
 @dataclass
-class GenerativeGroupByReturn(Generic[P, R]):
+class GenerativeGroupByReturn(Generic[P, R, V]):
     """The return type of a query within the `.generate` namespace of a collection with the `group_by` argument specified."""
 
-    objects: List[GroupByObject[P, R]]
-    groups: Dict[str, GenerativeGroup[P, R]]
+    objects: List[GroupByObject[P, R, V]]
+    groups: Dict[str, GenerativeGroup[P, R, V]]
     generated: Optional[str]
 
 
 @dataclass
-class GroupByReturn(Generic[P, R]):
+class GroupByReturn(Generic[P, R, V]):
     """The return type of a query within the `.query` namespace of a collection with the `group_by` argument specified."""
 
-    objects: List[GroupByObject[P, R]]
-    groups: Dict[str, Group[P, R]]
+    objects: List[GroupByObject[P, R, V]]
+    groups: Dict[str, Group[P, R, V]]
 
 
 @dataclass
-class QueryReturn(Generic[P, R]):
+class QueryReturn(Generic[P, R, V]):
     """The return type of a query within the `.query` namespace of a collection."""
 
-    objects: List[Object[P, R]]
+    objects: List[Object[P, R, V]]
+
+
+@dataclass
+class ColumnarReturn:
+    """The return type of a query within the `.query` namespace of a collection with `return_format="columnar"`.
+
+    Instead of one `Object` per result, every field is stored as one column with one entry per result. Properties and
+    metadata fields that are missing for a result are `None` in their column. Each vector is a 2-D float32
+    `numpy.ndarray` of shape `(len(uuids), dimensions)`, or a list of lists if `numpy` is not installed.
+    """
+
+    collection: str
+    uuids: List[uuid_package.UUID]
+    properties: Dict[str, List[Any]]
+    metadata: Dict[str, List[Any]]
+    vectors: Dict[str, Any]
+    # the big-endian bytes of all `uuids` back to back, if they were returned by Weaviate
+    _uuid_bytes: Optional[bytes] = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def __vector_columns(self) -> Dict[str, Any]:
+        return {
+            "vector" if name == "default" else f"vector_{name}": vectors
+            for name, vectors in self.vectors.items()
+        }
+
+    @staticmethod
+    def __arrow_vectors(vectors: Any) -> Any:
+        import pyarrow as pa  # type: ignore
+
+        if hasattr(vectors, "ndim") and vectors.ndim == 2:
+            # the flattened matrix is wrapped without copying it
+            return pa.FixedSizeListArray.from_arrays(
+                pa.array(vectors.reshape(-1)), vectors.shape[1]
+            )
+        return pa.array(vectors)
+
+    def to_pandas(self) -> Any:
+        """Convert the columns into a `pandas.DataFrame`. Requires `pandas` to be installed.
+
+        Each vector matrix is stored as a single column of fixed-size lists with a `pd.ArrowDtype` if `pyarrow` is
+        installed. Otherwise, each row of the column is a view on the vector matrix.
+        """
+        import pandas as pd  # type: ignore
+
+        columns: Dict[str, Any] = {"uuid": self.uuids, **self.properties, **self.metadata}
+        try:
+            for name, vectors in self.__vector_columns().items():
+                columns[name] = pd.Series(
+                    pd.arrays.ArrowExtensionArray(self.__arrow_vectors(vectors))
+                )
+        except ImportError:
+            columns.update(
+                (name, list(vectors)) for name, vectors in self.__vector_columns().items()
+            )
+        return pd.DataFrame(columns)
+
+    def to_arrow(self) -> Any:
+        """Convert the columns into a `pyarrow.Table`. Requires `pyarrow` to be installed.
+
+        The UUIDs are stored as 16-byte binaries and the vectors as fixed-size lists of float32, both share memory with
+        the returned data where possible.
+        """
+        import pyarrow as pa  # type: ignore
+
+        if self._uuid_bytes is not None and len(self._uuid_bytes) == 16 * len(self.uuids):
+            uuids = pa.FixedSizeBinaryArray.from_buffers(
+                pa.binary(16), len(self.uuids), [None, pa.py_buffer(self._uuid_bytes)]
+            )
+        else:
+            uuids = pa.array([uuid.bytes for uuid in self.uuids], pa.binary(16))
+        arrays: Dict[str, Any] = {"uuid": uuids}
+        for name, col in {**self.properties, **self.metadata}.items():
+            arrays[name] = pa.array(col)
+        for name, vectors in self.__vector_columns().items():
+            arrays[name] = self.__arrow_vectors(vectors)
+        return pa.table(arrays)
 
 
 _GQLEntryReturnType: TypeAlias = Dict[str, List[Dict[str, Any]]]
@@ -501,6 +615,8 @@ class _QueryOptions:
     include_references: bool
     include_vector: bool
     is_group_by: bool
+    vector_format: VECTOR_FORMAT = "list"
+    return_format: RETURN_FORMAT = "objects"
 
     @classmethod
     def from_input(
@@ -512,7 +628,17 @@ class _QueryOptions:
         query_references: Optional[ReturnReferences[Any]],
         rerank: Optional[Rerank] = None,
         group_by: Optional[GroupBy] = None,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
     ) -> "_QueryOptions":
+        if return_format != "objects" and group_by is not None:
+            raise WeaviateInvalidInputError(
+                f"return_format='{return_format}' cannot be used together with group_by"
+            )
+        if return_format == "columnar" and query_references is not None:
+            raise WeaviateInvalidInputError(
+                "return_format='columnar' cannot be used together with return_references"
+            )
         return cls(
             include_metadata=return_metadata is not None or rerank is not None,
             include_properties=not (
@@ -521,6 +647,8 @@ class _QueryOptions:
             include_references=collection_references is not None or query_references is not None,
             include_vector=include_vector if isinstance(include_vector, bool) else True,
             is_group_by=group_by is not None,
+            vector_format=vector_format,
+            return_format=return_format,
         )
 
 
@@ -594,3 +722,13 @@ QueryNearMediaReturnType = Union[
     GroupByReturnType[Properties, References, TProperties, TReferences],
 ]
 """@Deprecated: Use `QuerySearchReturnType` instead."""
+
+BatchQueryReturnType = Union[
+    QueryReturn[Any, Any, Any],
+    GroupByReturn[Any, Any, Any],
+    ColumnarReturn,
+    ObjectSingleReturn[Any, Any, Any],
+    None,
+    Exception,
+]
+"""The result of one search of `collection.query.batch`, or the exception that the search raised."""
@@ -1,7 +1,7 @@
 import datetime
 import uuid as uuid_package
 
-from typing import Any, Dict, Mapping, Optional, Sequence, Type, Union, get_origin
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Type, Union, get_origin
 from typing_extensions import TypeAlias, TypeVar, is_typeddict
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -114,6 +114,9 @@ R = TypeVar("R")
 """`R` is a completely general type that is used wherever generic reference objects are defined that can be used
 within the non-ORM and ORM APIs interchangeably"""
 
+V = TypeVar("V", default=List[float])
+"""`V` is the type of the vectors of returned objects, a float32 `numpy.ndarray` for queries with `vector_format="numpy"`"""
+
 QR = TypeVar("QR")
 """`QR` is a completely general type that is used wherever generic reference objects are defined that can be used
 within the non-ORM and ORM APIs interchangeably"""
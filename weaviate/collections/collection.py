@@ -21,12 +21,21 @@ from weaviate.collections.classes.internal import (
 from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.classes.types import Properties, TProperties
 from weaviate.collections.config import _ConfigCollection
-from weaviate.collections.data import _DataCollection
-from weaviate.collections.iterator import _ObjectIterator
-from weaviate.collections.query import _GenerateCollection, _QueryCollection
+from weaviate.collections.data import _DataCollection, _DataCollectionAsync
+from weaviate.collections.export import _CollectionExport
+from weaviate.collections.iterator import ITERATOR_CACHE_SIZE, _ObjectIterator
+from weaviate.collections.query import (
+    _GenerateCollection,
+    _GenerateCollectionAsync,
+    _QueryCollection,
+    _QueryCollectionAsync,
+)
+from weaviate.collections.query_cache import QUERY_CACHE_MAX_BYTES, QUERY_CACHE_TTL, _QueryCache
 from weaviate.collections.tenants import _Tenants
 from weaviate.connect import ConnectionV4
+from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.types import UUID
+from weaviate.util import _capitalize_first_letter
 from weaviate.validator import _validate_input, _ValidateArgument
 
 
@@ -48,12 +57,16 @@ class Collection(_CollectionBase, Generic[Properties, References]):
             This namespace includes all the CRUD methods available to you when modifying the configuration of the collection in Weaviate.
         `data`
             This namespace includes all the CUD methods available to you when modifying the data of the collection in Weaviate.
+        `export`
+            This namespace includes all the methods available to you when exporting all the objects of the collection in bulk.
         `generate`
             This namespace includes all the querying methods available to you when using Weaviate's generative capabilities.
         `query_group_by`
             This namespace includes all the querying methods available to you when using Weaviate's querying group-by capabilities.
         `query`
             This namespace includes all the querying methods available to you when using Weaviate's standard query capabilities.
+        `query_cache`
+            The client-side cache of the `query` namespace if it was enabled with `with_query_cache`, otherwise `None`.
         `tenants`
             This namespace includes all the CRUD methods available to you when modifying the tenants of a multi-tenancy-enabled collection in Weaviate.
     """
@@ -67,6 +80,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         tenant: Optional[str] = None,
         properties: Optional[Type[Properties]] = None,
         references: Optional[Type[References]] = None,
+        query_cache: Optional[_QueryCache] = None,
     ) -> None:
         super().__init__(connection, name, validate_arguments)
 
@@ -102,8 +116,13 @@ class Collection(_CollectionBase, Generic[Properties, References]):
             properties,
             references,
             validate_arguments,
+            query_cache,
         )
         """This namespace includes all the querying methods available to you when using Weaviate's standard query capabilities."""
+        self.query_cache = query_cache
+        """The client-side cache of the `query` namespace if it was enabled with `with_query_cache`, otherwise `None`."""
+        self.export = _CollectionExport(self.query.fetch_objects)
+        """This namespace includes all the methods available to you when exporting all the objects of the collection in bulk."""
         self.tenants = _Tenants(connection, self.name, consistency_level, validate_arguments)
         """This namespace includes all the CRUD methods available to you when modifying the tenants of a multi-tenancy-enabled collection in Weaviate."""
 
@@ -140,6 +159,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
             tenant.name if isinstance(tenant, Tenant) else tenant,
             self.__properties,
             self.__references,
+            self.query_cache,
         )
 
     def with_consistency_level(
@@ -174,6 +194,43 @@ class Collection(_CollectionBase, Generic[Properties, References]):
             self.__tenant,
             self.__properties,
             self.__references,
+            self.query_cache,
+        )
+
+    def with_query_cache(
+        self, max_bytes: int = QUERY_CACHE_MAX_BYTES, ttl: float = QUERY_CACHE_TTL
+    ) -> "Collection[Properties, References]":
+        """Use this method to return a collection object whose `query` namespace caches the replies of Weaviate.
+
+        Repeated searches with the same arguments, tenant and consistency level are then answered from the cache.
+        Writes made through the `data` namespace of any collection object of this client invalidate the cached replies
+        of the collection. Writes made in any other way, e.g. by batch imports or by other clients, are only picked up
+        once the cached replies expire. The `generate` namespace is not cached.
+
+        This method does not send a request to Weaviate. The returned collection object shares its cache with the
+        collection objects created from it with `with_tenant` and `with_consistency_level`. Use its `query_cache`
+        attribute to read the hit and miss metrics of the cache or to clear it.
+
+        Arguments:
+            `max_bytes`
+                The maximum size of all cached replies in bytes. If a new reply would exceed it, the least recently used
+                replies are evicted. Defaults to 64 MiB.
+            `ttl`
+                The number of seconds for which a cached reply is used. Defaults to 60 seconds.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `max_bytes` or `ttl` is not positive.
+        """
+        return Collection[Properties, References](
+            self._connection,
+            self.name,
+            self._validate_arguments,
+            self.__consistency_level,
+            self.__tenant,
+            self.__properties,
+            self.__references,
+            _QueryCache(self._connection, self.name, max_bytes, ttl),
         )
 
     def __len__(self) -> int:
@@ -195,6 +252,8 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        prefetch: int = 0,
     ) -> _ObjectIterator[Properties, References]:
         ...
 
@@ -207,6 +266,8 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        prefetch: int = 0,
     ) -> _ObjectIterator[Properties, CrossReferences]:
         ...
 
@@ -219,6 +280,8 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        prefetch: int = 0,
     ) -> _ObjectIterator[Properties, TReferences]:
         ...
 
@@ -231,6 +294,8 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        prefetch: int = 0,
     ) -> _ObjectIterator[TProperties, References]:
         ...
 
@@ -243,6 +308,8 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Type[TProperties],
         return_references: REFERENCES,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        prefetch: int = 0,
     ) -> _ObjectIterator[TProperties, CrossReferences]:
         ...
 
@@ -255,6 +322,8 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        prefetch: int = 0,
     ) -> _ObjectIterator[TProperties, TReferences]:
         ...
 
@@ -267,6 +336,8 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        prefetch: int = 0,
     ) -> Union[
         _ObjectIterator[Properties, References],
         _ObjectIterator[Properties, CrossReferences],
@@ -296,11 +367,31 @@ class Collection(_CollectionBase, Generic[Properties, References]):
                 The references to return with each object.
             `after`
                 The cursor to use to mark the initial starting point of the iterator in the collection.
+            `page_size`
+                The number of objects to fetch from Weaviate per request. Defaults to 100.
+            `prefetch`
+                The number of pages to fetch ahead in a background thread while the current page is being consumed.
+                Defaults to 0, in which case each page is fetched only once the previous one is exhausted. If the
+                loop over the iterator is left early, e.g. with `break`, up to `prefetch` of these requests can still
+                run in the background. Iterating again cancels the ones that have not started yet.
 
         Raises:
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `page_size` is not positive or `prefetch` is negative.
         """
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[int], name="page_size", value=page_size),
+                    _ValidateArgument(expected=[int], name="prefetch", value=prefetch),
+                ]
+            )
+        if page_size < 1 or prefetch < 0:
+            raise WeaviateInvalidInputError(
+                f"page_size must be positive and prefetch must not be negative, got page_size={page_size} and prefetch={prefetch}"
+            )
         return _ObjectIterator(  # type: ignore
             lambda limit, after: self.query.fetch_objects(  # pyright: ignore # problems with invariance of list
                 limit=limit,
@@ -313,4 +404,158 @@ class Collection(_CollectionBase, Generic[Properties, References]):
             after
             if after is None or isinstance(after, uuid_package.UUID)
             else uuid_package.UUID(after),
+            page_size,
+            prefetch,
+        )
+
+
+class CollectionAsync(Generic[Properties, References]):
+    """The asynchronous counterpart of `Collection` that is returned by `WeaviateAsyncClient.collections.get`.
+
+    Its namespaces build the same requests and parse the same responses as those of `Collection`, but send them over
+    the asynchronous HTTP and gRPC connections, so every method has to be awaited, e.g.,
+    `await collection.query.near_vector(...)`.
+
+    Attributes:
+        `data`
+            This namespace includes all the CUD methods available to you when modifying the data of the collection in Weaviate.
+        `generate`
+            This namespace includes all the querying methods available to you when using Weaviate's generative capabilities.
+        `query`
+            This namespace includes all the querying methods available to you when using Weaviate's standard query capabilities.
+        `query_cache`
+            The client-side cache of the `query` namespace if it was enabled with `with_query_cache`, otherwise `None`.
+    """
+
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        name: str,
+        validate_arguments: bool,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+        properties: Optional[Type[Properties]] = None,
+        references: Optional[Type[References]] = None,
+        query_cache: Optional[_QueryCache] = None,
+    ) -> None:
+        self._connection = connection
+        self.name = _capitalize_first_letter(name)
+        self._validate_arguments = validate_arguments
+
+        self.data = _DataCollectionAsync[Properties](
+            connection, self.name, consistency_level, tenant, validate_arguments, properties
+        )
+        """This namespace includes all the CUD methods available to you when modifying the data of the collection in Weaviate."""
+        self.generate = _GenerateCollectionAsync(
+            connection,
+            self.name,
+            consistency_level,
+            tenant,
+            properties,
+            references,
+            validate_arguments,
+        )
+        """This namespace includes all the querying methods available to you when using Weaviate's generative capabilities."""
+        self.query = _QueryCollectionAsync[Properties, References](
+            connection,
+            self.name,
+            consistency_level,
+            tenant,
+            properties,
+            references,
+            validate_arguments,
+            query_cache,
+        )
+        """This namespace includes all the querying methods available to you when using Weaviate's standard query capabilities."""
+        self.query_cache = query_cache
+        """The client-side cache of the `query` namespace if it was enabled with `with_query_cache`, otherwise `None`."""
+
+        self.__tenant = tenant
+        self.__consistency_level = consistency_level
+        self.__properties = properties
+        self.__references = references
+
+    def with_tenant(
+        self, tenant: Optional[Union[str, Tenant]] = None
+    ) -> "CollectionAsync[Properties, References]":
+        """Use this method to return a collection object specific to a single tenant.
+
+        This method does not send a request to Weaviate. See `Collection.with_tenant` for details.
+
+        Arguments:
+            `tenant`
+                The tenant to use. Can be `str` or `wvc.tenants.Tenant`.
+        """
+        _validate_input(
+            [_ValidateArgument(expected=[str, Tenant, None], name="tenant", value=tenant)]
+        )
+        return CollectionAsync[Properties, References](
+            self._connection,
+            self.name,
+            self._validate_arguments,
+            self.__consistency_level,
+            tenant.name if isinstance(tenant, Tenant) else tenant,
+            self.__properties,
+            self.__references,
+            self.query_cache,
+        )
+
+    def with_consistency_level(
+        self, consistency_level: Optional[ConsistencyLevel] = None
+    ) -> "CollectionAsync[Properties, References]":
+        """Use this method to return a collection object specific to a single consistency level.
+
+        This method does not send a request to Weaviate. See `Collection.with_consistency_level` for details.
+
+        Arguments:
+            `consistency_level`
+                The consistency level to use.
+        """
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(
+                        expected=[ConsistencyLevel, None],
+                        name="consistency_level",
+                        value=consistency_level,
+                    )
+                ]
+            )
+        return CollectionAsync[Properties, References](
+            self._connection,
+            self.name,
+            self._validate_arguments,
+            consistency_level,
+            self.__tenant,
+            self.__properties,
+            self.__references,
+            self.query_cache,
+        )
+
+    def with_query_cache(
+        self, max_bytes: int = QUERY_CACHE_MAX_BYTES, ttl: float = QUERY_CACHE_TTL
+    ) -> "CollectionAsync[Properties, References]":
+        """Use this method to return a collection object whose `query` namespace caches the replies of Weaviate.
+
+        This method does not send a request to Weaviate. See `Collection.with_query_cache` for details.
+
+        Arguments:
+            `max_bytes`
+                The maximum size of all cached replies in bytes. Defaults to 64 MiB.
+            `ttl`
+                The number of seconds for which a cached reply is used. Defaults to 60 seconds.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `max_bytes` or `ttl` is not positive.
+        """
+        return CollectionAsync[Properties, References](
+            self._connection,
+            self.name,
+            self._validate_arguments,
+            self.__consistency_level,
+            self.__tenant,
+            self.__properties,
+            self.__references,
+            _QueryCache(self._connection, self.name, max_bytes, ttl),
         )
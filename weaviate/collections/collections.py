@@ -23,7 +23,7 @@ from weaviate.collections.classes.types import (
     _check_properties_generic,
     _check_references_generic,
 )
-from weaviate.collections.collection import Collection
+from weaviate.collections.collection import Collection, CollectionAsync
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.util import _capitalize_first_letter
 from weaviate.validator import _validate_input, _ValidateArgument
@@ -334,3 +334,85 @@ class _Collections(_CollectionsBase):
                 If Weaviate reports a non-OK status.
         """
         return self.create_from_dict(config.to_dict())
+
+
+class _CollectionsAsync(_CollectionsBase):
+    def get(
+        self,
+        name: str,
+        data_model_properties: Optional[Type[Properties]] = None,
+        data_model_references: Optional[Type[References]] = None,
+        skip_argument_validation: bool = False,
+    ) -> CollectionAsync[Properties, References]:
+        """Use this method to return a collection object to be used when interacting with your Weaviate collection asynchronously.
+
+        This method does not send a request to Weaviate. It simply creates a Python object for you to use to make requests.
+
+        Arguments:
+            `name`
+                The name of the collection to get.
+            `data_model_properties`
+                The generic class that you want to use to represent the properties of objects in this collection when mutating objects through the `.query` namespace.
+            `data_model_references`
+                The generic class that you want to use to represent the objects of references in this collection when mutating objects through the `.query` namespace.
+            `skip_argument_validation`
+                If arguments to functions such as near_vector should be validated. Disable this if you need to squeeze out some extra performance.
+        Raises:
+            `weaviate.WeaviateInvalidInputError`
+                If the input parameters are invalid.
+            `weaviate.exceptions.InvalidDataModelException`
+                If the data model is not a valid data model, i.e., it is not a `dict` nor a `TypedDict`.
+        """
+        if not skip_argument_validation:
+            _validate_input([_ValidateArgument(expected=[str], name="name", value=name)])
+            _check_properties_generic(data_model_properties)
+            _check_references_generic(data_model_references)
+        name = _capitalize_first_letter(name)
+        return CollectionAsync[Properties, References](
+            self._connection,
+            name,
+            properties=data_model_properties,
+            references=data_model_references,
+            validate_arguments=not skip_argument_validation,
+        )
+
+    async def delete(self, name: Union[str, List[str]]) -> None:
+        """Use this method to delete collection(s) from the Weaviate instance by its/their name(s).
+
+        Arguments:
+            `name`
+                The name(s) of the collection(s) to delete.
+
+        Raises:
+            `weaviate.WeaviateInvalidInputError`
+                If the input parameters are invalid.
+            `weaviate.WeaviateConnectionError`
+                If the network connection to Weaviate fails.
+            `weaviate.UnexpectedStatusCodeError`
+                If Weaviate reports a non-OK status.
+        """
+        _validate_input([_ValidateArgument(expected=[str, List[str]], name="name", value=name)])
+
+        for n in [name] if isinstance(name, str) else name:
+            await self._adelete(_capitalize_first_letter(n))
+
+    async def exists(self, name: str) -> bool:
+        """Use this method to check if a collection exists in the Weaviate instance.
+
+        Arguments:
+            `name`
+                The name of the collection to check.
+
+        Returns:
+            `True` if the collection exists, `False` otherwise.
+
+        Raises:
+            `weaviate.WeaviateInvalidInputError`
+                If the input parameters are invalid.
+            `weaviate.WeaviateConnectionError`
+                If the network connection to Weaviate fails.
+            `weaviate.UnexpectedStatusCodeError`
+                If Weaviate reports a non-OK status.
+        """
+        _validate_input([_ValidateArgument(expected=[str], name="name", value=name)])
+        return await self._aexists(_capitalize_first_letter(name))
@@ -46,6 +46,13 @@ class _ConfigBase:
         self.__tenant = tenant
 
     def __get(self) -> Dict[str, Any]:
+        schema = self.__connection._schema_cache.fetch(self._name, self.__fetch)
+        if schema is None:
+            # cached as missing by `exists`, fetch again to raise the error reported by Weaviate
+            schema = self.__fetch()
+        return schema
+
+    def __fetch(self) -> Dict[str, Any]:
         response = self.__connection.get(
             path=f"/schema/{self._name}",
             error_msg="Collection configuration could not be retrieved.",
@@ -152,14 +159,14 @@ class _ConfigBase:
             )
         except ValidationError as e:
             raise WeaviateInvalidInputError("Invalid collection config update parameters.") from e
-        schema = self.__get()
-        schema = config.merge_with_existing(schema)
+        schema = config.merge_with_existing(self.__fetch())
         self.__connection.put(
             path=f"/schema/{self._name}",
             weaviate_object=schema,
             error_msg="Collection configuration may not have been updated.",
             status_codes=_ExpectedStatusCodes(ok_in=200, error="Update collection configuration"),
         )
+        self.__connection._schema_cache.invalidate()
 
     def _add_property(self, additional_property: PropertyType) -> None:
         path = f"/schema/{self._name}/properties"
@@ -170,6 +177,7 @@ class _ConfigBase:
             error_msg="Property may not have been added properly.",
             status_codes=_ExpectedStatusCodes(ok_in=200, error="Add property to collection"),
         )
+        self.__connection._schema_cache.invalidate()
 
     def _get_property_by_name(self, property_name: str) -> Optional[_Property]:
         for prop in self.get().properties:
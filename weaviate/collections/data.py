@@ -5,6 +5,7 @@ from typing import (
     Any,
     Literal,
     Optional,
+    Iterable,
     List,
     Mapping,
     Tuple,
@@ -16,9 +17,12 @@ from typing import (
     overload,
 )
 
+from httpx import Response
+from typing_extensions import TypedDict
+
 from weaviate.collections.batch.grpc_batch_delete import _BatchDeleteGRPC
 from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
-from weaviate.collections.batch.rest import _BatchREST
+from weaviate.collections.batch.rest import _BatchREST, _BatchRESTAsync
 from weaviate.collections.classes.batch import (
     DeleteManyObject,
     _BatchObject,
@@ -26,6 +30,7 @@ from weaviate.collections.classes.batch import (
     _BatchReference,
     BatchReferenceReturn,
     DeleteManyReturn,
+    _batch_objects_from_columns,
 )
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.data import DataObject, DataReferences
@@ -46,9 +51,11 @@ from weaviate.collections.classes.types import (
     WeaviateField,
     _check_properties_generic,
 )
+from weaviate.collections.query_cache import _invalidate_query_caches
 from weaviate.connect import ConnectionV4
+from weaviate.connect.base import JSONPayload
 from weaviate.connect.v4 import _ExpectedStatusCodes
-from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.exceptions import WeaviateInsertManyAllFailedError, WeaviateInvalidInputError
 from weaviate.types import BEACON, UUID, VECTORS
 from weaviate.util import (
     _datetime_to_string,
@@ -56,8 +63,25 @@ from weaviate.util import (
 )
 from weaviate.validator import _validate_input, _ValidateArgument
 
+_DeleteManyReturn = Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]
+
+
+class _Request(TypedDict):
+    """The arguments of a REST request of the data namespaces, sent as `**request` by the sync and async classes."""
+
+    path: str
+    params: Dict[str, Any]
+    error_msg: str
+    status_codes: _ExpectedStatusCodes
+
+
+class _ObjectRequest(_Request):
+    weaviate_object: JSONPayload
+
+
+class _DataBase:
+    """Validation and serialization shared by the synchronous and asynchronous data namespaces."""
 
-class _Data:
     def __init__(
         self,
         connection: ConnectionV4,
@@ -73,73 +97,806 @@ class _Data:
         self._validate_arguments = validate_arguments
         self._batch_grpc = _BatchGRPC(connection, consistency_level)
         self._batch_delete_grpc = _BatchDeleteGRPC(connection, consistency_level)
-        self._batch_rest = _BatchREST(connection, consistency_level)
 
-    def _insert(self, weaviate_obj: Dict[str, Any]) -> uuid_package.UUID:
-        path = "/objects"
+    def _prepare_insert(
+        self,
+        properties: Mapping[str, Any],
+        references: Optional[ReferenceInputs],
+        uuid: Optional[UUID],
+        vector: Optional[VECTORS],
+    ) -> Dict[str, Any]:
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[UUID, None], name="uuid", value=uuid),
+                    _ValidateArgument(expected=[Mapping], name="properties", value=properties),
+                    _ValidateArgument(
+                        expected=[Mapping, None], name="references", value=references
+                    ),
+                ],
+            )
+        props = self._serialize_props(properties) if properties is not None else {}
+        refs = self._serialize_refs(references) if references is not None else {}
+        weaviate_obj: Dict[str, Any] = {
+            "class": self.name,
+            "properties": {**props, **refs},
+            "id": str(uuid if uuid is not None else uuid_package.uuid4()),
+        }
+        if vector is not None:
+            weaviate_obj = self._parse_vector(weaviate_obj, vector)
+        return weaviate_obj
+
+    def _prepare_insert_many(
+        self,
+        objects: Sequence[Union[Mapping[str, Any], DataObject[Any, Optional[ReferenceInputs]]]],
+    ) -> List[_BatchObject]:
+        return [
+            (
+                _BatchObject(
+                    collection=self.name,
+                    vector=obj.vector,
+                    uuid=str(obj.uuid if obj.uuid is not None else uuid_package.uuid4()),
+                    properties=cast(dict, obj.properties),
+                    tenant=self._tenant,
+                    references=obj.references,
+                )
+                if isinstance(obj, DataObject)
+                else _BatchObject(
+                    collection=self.name,
+                    vector=None,
+                    uuid=str(uuid_package.uuid4()),
+                    properties=cast(dict, obj),
+                    tenant=self._tenant,
+                    references=None,
+                )
+            )
+            for obj in objects
+        ]
+
+    def _prepare_insert_columns(
+        self,
+        properties: Optional[Mapping[str, Any]],
+        vectors: Optional[Any],
+        uuids: Optional[Sequence[UUID]],
+    ) -> List[_BatchObject]:
+        return _batch_objects_from_columns(self.name, self._tenant, properties, vectors, uuids)
+
+    def _prepare_replace(
+        self,
+        uuid: UUID,
+        properties: Mapping[str, Any],
+        references: Optional[ReferenceInputs],
+        vector: Optional[VECTORS],
+    ) -> Dict[str, Any]:
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[UUID], name="uuid", value=uuid),
+                    _ValidateArgument(expected=[Mapping], name="properties", value=properties),
+                    _ValidateArgument(
+                        expected=[Mapping, None], name="references", value=references
+                    ),
+                ]
+            )
+        props = self._serialize_props(properties) if properties is not None else {}
+        refs = self._serialize_refs(references) if references is not None else {}
+        weaviate_obj: Dict[str, Any] = {
+            "class": self.name,
+            "properties": {**props, **refs},
+        }
+        if vector is not None:
+            weaviate_obj = self._parse_vector(weaviate_obj, vector)
+        return weaviate_obj
+
+    def _prepare_update(
+        self,
+        uuid: UUID,
+        properties: Optional[Mapping[str, Any]],
+        references: Optional[ReferenceInputs],
+        vector: Optional[VECTORS],
+    ) -> Dict[str, Any]:
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[UUID], name="uuid", value=uuid),
+                    _ValidateArgument(
+                        expected=[Mapping, None], name="properties", value=properties
+                    ),
+                    _ValidateArgument(
+                        expected=[Mapping, None], name="references", value=references
+                    ),
+                ],
+            )
+        props = self._serialize_props(properties) if properties is not None else {}
+        refs = self._serialize_refs(references) if references is not None else {}
+        weaviate_obj: Dict[str, Any] = {"class": self.name, "properties": {**props, **refs}}
+        if vector is not None:
+            weaviate_obj = self._parse_vector(weaviate_obj, vector)
+        return weaviate_obj
+
+    def _prepare_reference(
+        self, from_uuid: UUID, from_property: str, to: SingleReferenceInput
+    ) -> _Reference:
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[UUID], name="from_uuid", value=from_uuid),
+                    _ValidateArgument(expected=[str], name="from_property", value=from_property),
+                    _ValidateArgument(
+                        expected=[UUID, ReferenceToMulti], name="references", value=to
+                    ),
+                ],
+            )
+        if isinstance(to, ReferenceToMulti):
+            return _Reference(target_collection=to.target_collection, uuids=to.uuids)
+        return _Reference(target_collection=None, uuids=to)
+
+    def _prepare_reference_replace(
+        self, from_uuid: UUID, from_property: str, to: ReferenceInput
+    ) -> _Reference:
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[UUID], name="from_uuid", value=from_uuid),
+                    _ValidateArgument(expected=[str], name="from_property", value=from_property),
+                    _ValidateArgument(
+                        expected=[
+                            UUID,
+                            ReferenceToMulti,
+                            List[str],
+                            List[uuid_package.UUID],
+                            List[UUID],
+                        ],
+                        name="references",
+                        value=to,
+                    ),
+                ]
+            )
+        if isinstance(to, ReferenceToMulti):
+            return _Reference(target_collection=to.target_collection, uuids=to.uuids)
+        return _Reference(target_collection=None, uuids=to)
+
+    def _prepare_reference_add_many(self, refs: List[DataReferences]) -> List[_BatchReference]:
+        return [
+            _BatchReference(
+                from_=f"{BEACON}{self.name}/{ref.from_uuid}/{ref.from_property}",
+                to=beacon,
+                tenant=self._tenant,
+                from_uuid=str(ref.from_uuid),
+            )
+            for ref in refs
+            for beacon in ref._to_beacons()
+        ]
+
+    def _invalidate_query_cache(self) -> None:
+        _invalidate_query_caches(self._connection, self.name)
 
-        params, weaviate_obj = self.__apply_context_to_params_and_object({}, weaviate_obj)
-        self._connection.post(
-            path=path,
+    def _invalidate_schema_cache(self, properties: Iterable[Optional[Mapping[str, Any]]]) -> None:
+        # auto-schema adds the properties of the written objects that the collection does not have yet
+        self._connection._schema_cache.written(
+            self.name, (name for props in properties if props is not None for name in props)
+        )
+
+    def _written(self, weaviate_obj: Dict[str, Any]) -> None:
+        self._invalidate_query_cache()
+        self._invalidate_schema_cache([weaviate_obj.get("properties")])
+
+    def _insert_request(self, weaviate_obj: Dict[str, Any]) -> _ObjectRequest:
+        params, weaviate_obj = self._apply_context_to_params_and_object({}, weaviate_obj)
+        return _ObjectRequest(
+            path="/objects",
             weaviate_object=weaviate_obj,
             params=params,
             error_msg="Object was not added",
             status_codes=_ExpectedStatusCodes(ok_in=200, error="insert object"),
         )
-        return uuid_package.UUID(weaviate_obj["id"])
 
-    def _exists(self, uuid: str) -> bool:
-        path = "/objects/" + self.name + "/" + uuid
+    def _inserted(self, weaviate_obj: Dict[str, Any]) -> uuid_package.UUID:
+        self._written(weaviate_obj)
+        return uuid_package.UUID(weaviate_obj["id"])
 
-        params = self.__apply_context({})
-        request = self._connection.head(
-            path=path,
-            params=params,
+    def _inserted_many(
+        self,
+        ret: BatchObjectReturn,
+        objects: List[_BatchObject],
+        properties: Iterable[Optional[Mapping[str, Any]]],
+    ) -> BatchObjectReturn:
+        if len(ret.errors) == len(objects):
+            raise WeaviateInsertManyAllFailedError(
+                "Here is the set of all errors: {}".format(
+                    "\n".join({error.message for error in ret.errors.values()})
+                )
+            )
+        self._invalidate_query_cache()
+        self._invalidate_schema_cache(properties)
+        return ret
+
+    def _exists_request(self, uuid: str) -> _Request:
+        return _Request(
+            path="/objects/" + self.name + "/" + uuid,
+            params=self._apply_context({}),
             error_msg="object existence",
             status_codes=_ExpectedStatusCodes(ok_in=[204, 404], error="object existence"),
         )
-        return request.status_code == 204
-
-    def delete_by_id(self, uuid: UUID) -> bool:
-        """Delete an object from the collection based on its UUID.
-
-        Arguments:
-            `uuid`
-                The UUID of the object to delete, REQUIRED.
-        """
-        path = f"/objects/{self.name}/{uuid}"
 
-        response = self._connection.delete(
-            path=path,
-            params=self.__apply_context({}),
+    def _delete_by_id_request(self, uuid: UUID) -> _Request:
+        return _Request(
+            path=f"/objects/{self.name}/{uuid}",
+            params=self._apply_context({}),
             error_msg="Object could not be deleted.",
             status_codes=_ExpectedStatusCodes(ok_in=[204, 404], error="delete object"),
         )
+
+    def _deleted_by_id(self, response: Response) -> bool:
         if response.status_code == 204:
+            self._invalidate_query_cache()
             return True  # Successfully deleted
         else:
             assert response.status_code == 404
             return False  # did not exist
 
+    def _deleted_many(self, ret: _DeleteManyReturn, dry_run: bool) -> _DeleteManyReturn:
+        if not dry_run:
+            self._invalidate_query_cache()
+        return ret
+
+    def _replace_request(self, weaviate_obj: Dict[str, Any], uuid: UUID) -> _ObjectRequest:
+        params, weaviate_obj = self._apply_context_to_params_and_object({}, weaviate_obj)
+
+        weaviate_obj["id"] = str(uuid)  # must add ID to payload for PUT request
+
+        return _ObjectRequest(
+            path=f"/objects/{self.name}/{uuid}",
+            weaviate_object=weaviate_obj,
+            params=params,
+            error_msg="Object was not replaced.",
+            status_codes=_ExpectedStatusCodes(ok_in=200, error="replace object"),
+        )
+
+    def _update_request(self, weaviate_obj: Dict[str, Any], uuid: UUID) -> _ObjectRequest:
+        params, weaviate_obj = self._apply_context_to_params_and_object({}, weaviate_obj)
+        return _ObjectRequest(
+            path=f"/objects/{self.name}/{uuid}",
+            weaviate_object=weaviate_obj,
+            params=params,
+            error_msg="Object was not updated.",
+            status_codes=_ExpectedStatusCodes(ok_in=[200, 204], error="update object"),
+        )
+
+    def _reference_add_requests(
+        self, from_uuid: UUID, from_property: str, ref: _Reference
+    ) -> List[_ObjectRequest]:
+        if ref.is_one_to_many:
+            raise WeaviateInvalidInputError(
+                "reference_add does not support adding multiple objects to a reference at once. Use reference_add_many or reference_replace instead."
+            )
+        return [
+            _ObjectRequest(
+                path=f"/objects/{self.name}/{from_uuid}/references/{from_property}",
+                weaviate_object=beacon,
+                params=self._apply_context({}),
+                error_msg="Reference was not added.",
+                status_codes=_ExpectedStatusCodes(ok_in=200, error="add reference to object"),
+            )
+            for beacon in ref._to_beacons()
+        ]
+
+    def _reference_delete_requests(
+        self, from_uuid: UUID, from_property: str, ref: _Reference
+    ) -> List[_ObjectRequest]:
+        if ref.is_one_to_many:
+            raise WeaviateInvalidInputError(
+                "reference_delete does not support deleting multiple objects from a reference at once. Use reference_replace instead."
+            )
+        return [
+            _ObjectRequest(
+                path=f"/objects/{self.name}/{from_uuid}/references/{from_property}",
+                weaviate_object=beacon,
+                params=self._apply_context({}),
+                error_msg="Reference was not deleted.",
+                status_codes=_ExpectedStatusCodes(ok_in=204, error="delete reference from object"),
+            )
+            for beacon in ref._to_beacons()
+        ]
+
+    def _reference_replace_request(
+        self, from_uuid: UUID, from_property: str, ref: _Reference
+    ) -> _ObjectRequest:
+        return _ObjectRequest(
+            path=f"/objects/{self.name}/{from_uuid}/references/{from_property}",
+            weaviate_object=ref._to_beacons(),
+            params=self._apply_context({}),
+            error_msg="Reference was not replaced.",
+            status_codes=_ExpectedStatusCodes(ok_in=200, error="replace reference on object"),
+        )
+
+    def _apply_context(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if self._tenant is not None:
+            params["tenant"] = self._tenant
+        if self._consistency_level is not None:
+            params["consistency_level"] = self._consistency_level.value
+        return params
+
+    def _apply_context_to_params_and_object(
+        self, params: Dict[str, Any], obj: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if self._tenant is not None:
+            obj["tenant"] = self._tenant
+        if self._consistency_level is not None:
+            params["consistency_level"] = self._consistency_level.value
+        return params, obj
+
+    def _parse_vector(self, obj: Dict[str, Any], vector: VECTORS) -> Dict[str, Any]:
+        if isinstance(vector, dict):
+            obj["vectors"] = {key: _get_vector_v4(val) for key, val in vector.items()}
+        else:
+            obj["vector"] = _get_vector_v4(vector)
+        return obj
+
+    def _serialize_props(self, props: Mapping[str, Any]) -> Dict[str, Any]:
+        return {key: self.__serialize_primitive(val) for key, val in props.items()}
+
+    def _serialize_refs(self, refs: ReferenceInputs) -> Dict[str, Any]:
+        return {
+            key: (
+                val._to_beacons()
+                if isinstance(val, _Reference) or isinstance(val, ReferenceToMulti)
+                else _Reference(target_collection=None, uuids=val)._to_beacons()
+            )
+            for key, val in refs.items()
+        }
+
+    def __serialize_primitive(self, value: WeaviateField) -> Any:
+        if isinstance(value, str) or isinstance(value, int) or isinstance(value, float):
+            return value
+        if isinstance(value, uuid_package.UUID):
+            return str(value)
+        if isinstance(value, datetime.datetime):
+            return _datetime_to_string(value)
+        if isinstance(value, GeoCoordinate):
+            return value._to_dict()
+        if isinstance(value, PhoneNumber):
+            return value._to_dict()
+        if isinstance(value, _PhoneNumber):
+            raise WeaviateInvalidInputError(
+                "Cannot use _PhoneNumber when inserting a phone number. Use PhoneNumber instead."
+            )
+        if isinstance(value, Mapping):
+            return {key: self.__serialize_primitive(val) for key, val in value.items()}
+        if isinstance(value, Sequence):
+            return [self.__serialize_primitive(val) for val in value]
+        if value is None:
+            return value
+        raise WeaviateInvalidInputError(
+            f"Cannot serialize value of type {type(value)} to Weaviate."
+        )
+
+
+class _Data(_DataBase):
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        name: str,
+        consistency_level: Optional[ConsistencyLevel],
+        tenant: Optional[str],
+        validate_arguments: bool,
+    ) -> None:
+        super().__init__(connection, name, consistency_level, tenant, validate_arguments)
+        self._batch_rest = _BatchREST(connection, consistency_level)
+
+    def _insert(self, weaviate_obj: Dict[str, Any]) -> uuid_package.UUID:
+        self._connection.post(**self._insert_request(weaviate_obj))
+        return self._inserted(weaviate_obj)
+
+    def _insert_many(
+        self, objects: List[_BatchObject], properties: Iterable[Optional[Mapping[str, Any]]]
+    ) -> BatchObjectReturn:
+        ret = self._batch_grpc._objects(objects, timeout=self._connection.timeout_config.insert)
+        return self._inserted_many(ret, objects, properties)
+
+    def _exists(self, uuid: str) -> bool:
+        return self._connection.head(**self._exists_request(uuid)).status_code == 204
+
+    def delete_by_id(self, uuid: UUID) -> bool:
+        """Delete an object from the collection based on its UUID.
+
+        Arguments:
+            `uuid`
+                The UUID of the object to delete, REQUIRED.
+        """
+        return self._deleted_by_id(self._connection.delete(**self._delete_by_id_request(uuid)))
+
+    @overload
+    def delete_many(
+        self, where: _Filters, verbose: Literal[False] = ..., *, dry_run: bool = False
+    ) -> DeleteManyReturn[None]:
+        ...
+
+    @overload
+    def delete_many(
+        self, where: _Filters, verbose: Literal[True], *, dry_run: bool = False
+    ) -> DeleteManyReturn[List[DeleteManyObject]]:
+        ...
+
+    @overload
+    def delete_many(
+        self, where: _Filters, verbose: bool = ..., *, dry_run: bool = False
+    ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]:
+        ...
+
+    def delete_many(
+        self, where: _Filters, verbose: bool = False, *, dry_run: bool = False
+    ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]:
+        """Delete multiple objects from the collection based on a filter.
+
+        Arguments:
+            `where`
+                The filter to apply. This filter is the same that is used when performing queries and has the same syntax, REQUIRED.
+            `verbose`
+                Whether to return the deleted objects in the response.
+            `dry_run`
+                Whether to perform a dry run. If set to `True`, the objects will not be deleted, but the response will contain the objects that would have been deleted.
+
+        Raises:
+            `weaviate.WeaviateConnectionError`:
+                If the network connection to Weaviate fails.
+            `weaviate.UnexpectedStatusCodeError`:
+                If Weaviate reports a non-OK status.
+        """
+        _ValidateArgument(expected=[_Filters], name="where", value=where)
+        ret = self._batch_delete_grpc.batch_delete(self.name, where, verbose, dry_run, self._tenant)
+        return self._deleted_many(ret, dry_run)
+
+    def _replace(self, weaviate_obj: Dict[str, Any], uuid: UUID) -> None:
+        self._connection.put(**self._replace_request(weaviate_obj, uuid))
+        self._written(weaviate_obj)
+
+    def _update(self, weaviate_obj: Dict[str, Any], uuid: UUID) -> None:
+        self._connection.patch(**self._update_request(weaviate_obj, uuid))
+        self._written(weaviate_obj)
+
+    def _reference_add(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
+        for request in self._reference_add_requests(from_uuid, from_property, ref):
+            self._connection.post(**request)
+        self._invalidate_query_cache()
+
+    def _reference_add_many(self, refs: List[DataReferences]) -> BatchReferenceReturn:
+        ret = self._batch_rest.references(self._prepare_reference_add_many(refs))
+        self._invalidate_query_cache()
+        return ret
+
+    def _reference_delete(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
+        for request in self._reference_delete_requests(from_uuid, from_property, ref):
+            self._connection.delete(**request)
+        self._invalidate_query_cache()
+
+    def _reference_replace(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
+        self._connection.put(**self._reference_replace_request(from_uuid, from_property, ref))
+        self._invalidate_query_cache()
+
+
+class _DataCollection(Generic[Properties], _Data):
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        name: str,
+        consistency_level: Optional[ConsistencyLevel],
+        tenant: Optional[str],
+        validate_arguments: bool,
+        type_: Optional[Type[Properties]] = None,
+    ):
+        super().__init__(connection, name, consistency_level, tenant, validate_arguments)
+        self.__type = type_
+
+    def with_data_model(self, data_model: Type[TProperties]) -> "_DataCollection[TProperties]":
+        _check_properties_generic(data_model)
+        return _DataCollection[TProperties](
+            self._connection,
+            self.name,
+            self._consistency_level,
+            self._tenant,
+            self._validate_arguments,
+            data_model,
+        )
+
+    def insert(
+        self,
+        properties: Properties,
+        references: Optional[ReferenceInputs] = None,
+        uuid: Optional[UUID] = None,
+        vector: Optional[VECTORS] = None,
+    ) -> uuid_package.UUID:
+        """Insert a single object into the collection.
+
+        Arguments:
+            `properties`
+                The properties of the object, REQUIRED.
+            `references`
+                Any references to other objects in Weaviate.
+            `uuid`
+                The UUID of the object. If not provided, a random UUID will be generated.
+            `vector`
+                The vector(s) of the object.
+                Supported types are
+                - for single vectors: `list`, 'numpy.ndarray`, `torch.Tensor`, `tf.Tensor`, `pd.Series` and `pl.Series`, by default None.
+                - for named vectors: Dict[str, *list above*], where the string is the name of the vector.
+
+        Returns:
+            `uuid.UUID`, the UUID of the inserted object.
+
+        Raises:
+            `weaviate.exceptions.UnexpectedStatusCodeError`:
+                If any unexpected error occurs during the insert operation, for example the given UUID already exists.
+        """
+        return self._insert(self._prepare_insert(properties, references, uuid, vector))
+
+    def insert_many(
+        self,
+        objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
+    ) -> BatchObjectReturn:
+        """Insert multiple objects into the collection.
+
+        Arguments:
+            `objects`
+                The objects to insert. This can be either a list of `Properties` or `DataObject[Properties, ReferenceInputs]`
+                    If you didn't set `data_model` then `Properties` will be `Data[str, Any]` in which case you can insert simple dictionaries here.
+                        If you want to insert references, vectors, or UUIDs alongside your properties, you will have to use `DataObject` instead.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCBatchError`:
+                If any unexpected error occurs during the batch operation.
+            `weaviate.exceptions.WeaviateInsertInvalidPropertyError`:
+                If a property is invalid. I.e., has name `id` or `vector`, which are reserved.
+            `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
+                If every object in the batch fails to be inserted. The exception message contains details about the failure.
+        """
+        batch_objects = self._prepare_insert_many(objects)
+        return self._insert_many(batch_objects, (obj.properties for obj in batch_objects))
+
+    def insert_columns(
+        self,
+        properties: Optional[Mapping[str, Any]] = None,
+        *,
+        vectors: Optional[Any] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+    ) -> BatchObjectReturn:
+        """Insert the rows of column-oriented data into the collection, e.g. an `(N, D)` embedding matrix with its properties.
+
+        The i-th object is built from the i-th entry of every property column, the i-th row of every vector matrix and
+        the i-th UUID. Rows are sliced straight into the gRPC batch request without validating every object, which makes
+        this considerably faster than `insert_many` for large arrays.
+
+        Arguments:
+            `properties`
+                The properties of the objects as a mapping of property names to columns. A column can be a `list`,
+                `numpy.ndarray`, `pd.Series` or `pa.Array`.
+            `vectors`
+                The vectors of the objects as a 2-D `numpy.ndarray` or a list of vectors with one row per object. For
+                named vectors, use a mapping of vector names to matrices.
+            `uuids`
+                The UUIDs of the objects. If not provided, a UUIDv4 is generated for each object.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCBatchError`:
+                If any unexpected error occurs during the batch operation.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If the columns, vectors and uuids do not all have the same number of rows.
+            `weaviate.exceptions.WeaviateInsertInvalidPropertyError`:
+                If a property is invalid. I.e., has name `id` or `vector`, which are reserved.
+            `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
+                If every object in the batch fails to be inserted. The exception message contains details about the failure.
+        """
+        # the properties of all objects are the keys of `properties`
+        batch_objects = self._prepare_insert_columns(properties, vectors, uuids)
+        return self._insert_many(batch_objects, [properties])
+
+    def replace(
+        self,
+        uuid: UUID,
+        properties: Properties,
+        references: Optional[ReferenceInputs] = None,
+        vector: Optional[VECTORS] = None,
+    ) -> None:
+        """Replace an object in the collection.
+
+        This is equivalent to a PUT operation.
+
+        Arguments:
+            `uuid`
+                The UUID of the object, REQUIRED.
+            `properties`
+                The properties of the object, REQUIRED.
+            `references`
+                Any references to other objects in Weaviate, REQUIRED.
+            `vector`
+                The vector(s) of the object.
+                Supported types are
+                - for single vectors: `list`, 'numpy.ndarray`, `torch.Tensor`, `tf.Tensor`, `pd.Series` and `pl.Series`, by default None.
+                - for named vectors: Dict[str, *list above*], where the string is the name of the vector.
+
+        Raises:
+            `weaviate.WeaviateConnectionError`:
+                If the network connection to Weaviate fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If any of the arguments are invalid.
+            `weaviate.UnexpectedStatusCodeError`:
+                If Weaviate reports a non-OK status.
+            `weaviate.exceptions.WeaviateInsertInvalidPropertyError`:
+                If a property is invalid. I.e., has name `id` or `vector`, which are reserved.
+        """
+        self._replace(self._prepare_replace(uuid, properties, references, vector), uuid=uuid)
+
+    def update(
+        self,
+        uuid: UUID,
+        properties: Optional[Properties] = None,
+        references: Optional[ReferenceInputs] = None,
+        vector: Optional[VECTORS] = None,
+    ) -> None:
+        """Update an object in the collection.
+
+        This is equivalent to a PATCH operation.
+
+        If the object does not exist yet, it will be created.
+
+        Arguments:
+            `uuid`
+                The UUID of the object, REQUIRED.
+            `properties`
+                The properties of the object.
+            `references`
+                Any references to other objects in Weaviate.
+            `vector`
+                The vector(s) of the object.
+                Supported types are
+                - for single vectors: `list`, 'numpy.ndarray`, `torch.Tensor`, `tf.Tensor`, `pd.Series` and `pl.Series`, by default None.
+                - for named vectors: Dict[str, *list above*], where the string is the name of the vector.
+        """
+        self._update(self._prepare_update(uuid, properties, references, vector), uuid=uuid)
+
+    def reference_add(self, from_uuid: UUID, from_property: str, to: SingleReferenceInput) -> None:
+        """Create a reference between an object in this collection and any other object in Weaviate.
+
+        Arguments:
+            `from_uuid`
+                The UUID of the object in this collection, REQUIRED.
+            `from_property`
+                The name of the property in the object in this collection, REQUIRED.
+            `to`
+                The reference to add, REQUIRED.
+
+        Raises:
+            `weaviate.WeaviateConnectionError`:
+                If the network connection to Weaviate fails.
+            `weaviate.UnexpectedStatusCodeError`:
+                If Weaviate reports a non-OK status.
+        """
+        ref = self._prepare_reference(from_uuid, from_property, to)
+        self._reference_add(from_uuid=from_uuid, from_property=from_property, ref=ref)
+
+    def reference_add_many(self, refs: List[DataReferences]) -> BatchReferenceReturn:
+        """Create multiple references on a property in batch between objects in this collection and any other object in Weaviate.
+
+        Arguments:
+            `refs`
+                The references to add including the prop name, from UUID, and to UUID.
+
+        Returns:
+            `BatchReferenceReturn`
+                A `BatchReferenceReturn` object containing the results of the batch operation.
+
+        Raises:
+            `weaviate.WeaviateConnectionError`:
+                If the network connection to Weaviate fails.
+            `weaviate.UnexpectedStatusCodeError
+                If Weaviate reports a non-OK status.
+        """
+        return self._reference_add_many(refs)
+
+    def reference_delete(
+        self, from_uuid: UUID, from_property: str, to: SingleReferenceInput
+    ) -> None:
+        """Delete a reference from an object within the collection.
+
+        Arguments:
+            `from_uuid`
+                The UUID of the object in this collection, REQUIRED.
+            `from_property`
+                The name of the property in the object in this collection from which the reference should be deleted, REQUIRED.
+            `to`
+                The reference to delete, REQUIRED.
+        """
+        ref = self._prepare_reference(from_uuid, from_property, to)
+        self._reference_delete(from_uuid=from_uuid, from_property=from_property, ref=ref)
+
+    def reference_replace(self, from_uuid: UUID, from_property: str, to: ReferenceInput) -> None:
+        """Replace a reference of an object within the collection.
+
+        Arguments:
+            `from_uuid`
+                The UUID of the object in this collection, REQUIRED.
+            `from_property`
+                The name of the property in the object in this collection from which the reference should be replaced, REQUIRED.
+            `to`
+                The reference to replace, REQUIRED.
+        """
+        ref = self._prepare_reference_replace(from_uuid, from_property, to)
+        self._reference_replace(from_uuid=from_uuid, from_property=from_property, ref=ref)
+
+    def exists(self, uuid: UUID) -> bool:
+        """Check for existence of a single object in the collection.
+
+        Arguments:
+            `uuid`
+                The UUID of the object.
+
+        Returns:
+            `bool`, True if objects exists and False if not.
+
+        Raises:
+            `weaviate.exceptions.UnexpectedStatusCodeError`:
+                If any unexpected error occurs during the operation.
+        """
+        _validate_input(_ValidateArgument(expected=[UUID], name="uuid", value=uuid))
+        return self._exists(str(uuid))
+
+
+class _DataAsync(_DataBase):
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        name: str,
+        consistency_level: Optional[ConsistencyLevel],
+        tenant: Optional[str],
+        validate_arguments: bool,
+    ) -> None:
+        super().__init__(connection, name, consistency_level, tenant, validate_arguments)
+        self._batch_rest = _BatchRESTAsync(connection, consistency_level)
+
+    async def _insert(self, weaviate_obj: Dict[str, Any]) -> uuid_package.UUID:
+        await self._connection.apost(**self._insert_request(weaviate_obj))
+        return self._inserted(weaviate_obj)
+
+    async def _insert_many(
+        self, objects: List[_BatchObject], properties: Iterable[Optional[Mapping[str, Any]]]
+    ) -> BatchObjectReturn:
+        ret = await self._batch_grpc.aobjects(
+            objects, timeout=self._connection.timeout_config.insert
+        )
+        return self._inserted_many(ret, objects, properties)
+
+    async def _exists(self, uuid: str) -> bool:
+        return (await self._connection.ahead(**self._exists_request(uuid))).status_code == 204
+
+    async def delete_by_id(self, uuid: UUID) -> bool:
+        """Delete an object from the collection based on its UUID.
+
+        Arguments:
+            `uuid`
+                The UUID of the object to delete, REQUIRED.
+        """
+        response = await self._connection.adelete(**self._delete_by_id_request(uuid))
+        return self._deleted_by_id(response)
+
     @overload
-    def delete_many(
+    async def delete_many(
         self, where: _Filters, verbose: Literal[False] = ..., *, dry_run: bool = False
     ) -> DeleteManyReturn[None]:
         ...
 
     @overload
-    def delete_many(
+    async def delete_many(
         self, where: _Filters, verbose: Literal[True], *, dry_run: bool = False
     ) -> DeleteManyReturn[List[DeleteManyObject]]:
         ...
 
     @overload
-    def delete_many(
+    async def delete_many(
         self, where: _Filters, verbose: bool = ..., *, dry_run: bool = False
     ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]:
         ...
 
-    def delete_many(
+    async def delete_many(
         self, where: _Filters, verbose: bool = False, *, dry_run: bool = False
     ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]:
         """Delete multiple objects from the collection based on a filter.
@@ -159,153 +916,44 @@ class _Data:
                 If Weaviate reports a non-OK status.
         """
         _ValidateArgument(expected=[_Filters], name="where", value=where)
-        return self._batch_delete_grpc.batch_delete(
+        ret = await self._batch_delete_grpc.abatch_delete(
             self.name, where, verbose, dry_run, self._tenant
         )
+        return self._deleted_many(ret, dry_run)
 
-    def _replace(self, weaviate_obj: Dict[str, Any], uuid: UUID) -> None:
-        path = f"/objects/{self.name}/{uuid}"
-        params, weaviate_obj = self.__apply_context_to_params_and_object({}, weaviate_obj)
-
-        weaviate_obj["id"] = str(uuid)  # must add ID to payload for PUT request
-
-        self._connection.put(
-            path=path,
-            weaviate_object=weaviate_obj,
-            params=params,
-            error_msg="Object was not replaced.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="replace object"),
-        )
-
-    def _update(self, weaviate_obj: Dict[str, Any], uuid: UUID) -> None:
-        path = f"/objects/{self.name}/{uuid}"
-        params, weaviate_obj = self.__apply_context_to_params_and_object({}, weaviate_obj)
-
-        self._connection.patch(
-            path=path,
-            weaviate_object=weaviate_obj,
-            params=params,
-            error_msg="Object was not updated.",
-            status_codes=_ExpectedStatusCodes(ok_in=[200, 204], error="update object"),
-        )
-
-    def _reference_add(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
-        params: Dict[str, str] = {}
-
-        path = f"/objects/{self.name}/{from_uuid}/references/{from_property}"
-
-        if ref.is_one_to_many:
-            raise WeaviateInvalidInputError(
-                "reference_add does not support adding multiple objects to a reference at once. Use reference_add_many or reference_replace instead."
-            )
-        for beacon in ref._to_beacons():
-            self._connection.post(
-                path=path,
-                weaviate_object=beacon,
-                params=self.__apply_context(params),
-                error_msg="Reference was not added.",
-                status_codes=_ExpectedStatusCodes(ok_in=200, error="add reference to object"),
-            )
-
-    def _reference_add_many(self, refs: List[DataReferences]) -> BatchReferenceReturn:
-        batch = [
-            _BatchReference(
-                from_=f"{BEACON}{self.name}/{ref.from_uuid}/{ref.from_property}",
-                to=beacon,
-                tenant=self._tenant,
-                from_uuid=str(ref.from_uuid),
-            )
-            for ref in refs
-            for beacon in ref._to_beacons()
-        ]
-        return self._batch_rest.references(list(batch))
-
-    def _reference_delete(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
-        params: Dict[str, str] = {}
-
-        path = f"/objects/{self.name}/{from_uuid}/references/{from_property}"
-
-        if ref.is_one_to_many:
-            raise WeaviateInvalidInputError(
-                "reference_delete does not support deleting multiple objects from a reference at once. Use reference_replace instead."
-            )
-        for beacon in ref._to_beacons():
-            self._connection.delete(
-                path=path,
-                weaviate_object=beacon,
-                params=self.__apply_context(params),
-                error_msg="Reference was not deleted.",
-                status_codes=_ExpectedStatusCodes(ok_in=204, error="delete reference from object"),
-            )
-
-    def _reference_replace(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
-        params: Dict[str, str] = {}
-
-        path = f"/objects/{self.name}/{from_uuid}/references/{from_property}"
-        self._connection.put(
-            path=path,
-            weaviate_object=ref._to_beacons(),
-            params=self.__apply_context(params),
-            error_msg="Reference was not replaced.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="replace reference on object"),
-        )
+    async def _replace(self, weaviate_obj: Dict[str, Any], uuid: UUID) -> None:
+        await self._connection.aput(**self._replace_request(weaviate_obj, uuid))
+        self._written(weaviate_obj)
 
-    def __apply_context(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        if self._tenant is not None:
-            params["tenant"] = self._tenant
-        if self._consistency_level is not None:
-            params["consistency_level"] = self._consistency_level.value
-        return params
+    async def _update(self, weaviate_obj: Dict[str, Any], uuid: UUID) -> None:
+        await self._connection.apatch(**self._update_request(weaviate_obj, uuid))
+        self._written(weaviate_obj)
 
-    def __apply_context_to_params_and_object(
-        self, params: Dict[str, Any], obj: Dict[str, Any]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-        if self._tenant is not None:
-            obj["tenant"] = self._tenant
-        if self._consistency_level is not None:
-            params["consistency_level"] = self._consistency_level.value
-        return params, obj
+    async def _reference_add(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
+        for request in self._reference_add_requests(from_uuid, from_property, ref):
+            await self._connection.apost(**request)
+        self._invalidate_query_cache()
 
-    def _serialize_props(self, props: Properties) -> Dict[str, Any]:
-        return {key: self.__serialize_primitive(val) for key, val in props.items()}
+    async def _reference_add_many(self, refs: List[DataReferences]) -> BatchReferenceReturn:
+        ret = await self._batch_rest.references(self._prepare_reference_add_many(refs))
+        self._invalidate_query_cache()
+        return ret
 
-    def _serialize_refs(self, refs: ReferenceInputs) -> Dict[str, Any]:
-        return {
-            key: (
-                val._to_beacons()
-                if isinstance(val, _Reference) or isinstance(val, ReferenceToMulti)
-                else _Reference(target_collection=None, uuids=val)._to_beacons()
-            )
-            for key, val in refs.items()
-        }
+    async def _reference_delete(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
+        for request in self._reference_delete_requests(from_uuid, from_property, ref):
+            await self._connection.adelete(**request)
+        self._invalidate_query_cache()
 
-    def __serialize_primitive(self, value: WeaviateField) -> Any:
-        if isinstance(value, str) or isinstance(value, int) or isinstance(value, float):
-            return value
-        if isinstance(value, uuid_package.UUID):
-            return str(value)
-        if isinstance(value, datetime.datetime):
-            return _datetime_to_string(value)
-        if isinstance(value, GeoCoordinate):
-            return value._to_dict()
-        if isinstance(value, PhoneNumber):
-            return value._to_dict()
-        if isinstance(value, _PhoneNumber):
-            raise WeaviateInvalidInputError(
-                "Cannot use _PhoneNumber when inserting a phone number. Use PhoneNumber instead."
-            )
-        if isinstance(value, Mapping):
-            return {key: self.__serialize_primitive(val) for key, val in value.items()}
-        if isinstance(value, Sequence):
-            return [self.__serialize_primitive(val) for val in value]
-        if value is None:
-            return value
-        raise WeaviateInvalidInputError(
-            f"Cannot serialize value of type {type(value)} to Weaviate."
+    async def _reference_replace(
+        self, from_uuid: UUID, from_property: str, ref: _Reference
+    ) -> None:
+        await self._connection.aput(
+            **self._reference_replace_request(from_uuid, from_property, ref)
         )
+        self._invalidate_query_cache()
 
 
-class _DataCollection(Generic[Properties], _Data):
+class _DataCollectionAsync(Generic[Properties], _DataAsync):
     def __init__(
         self,
         connection: ConnectionV4,
@@ -318,9 +966,9 @@ class _DataCollection(Generic[Properties], _Data):
         super().__init__(connection, name, consistency_level, tenant, validate_arguments)
         self.__type = type_
 
-    def with_data_model(self, data_model: Type[TProperties]) -> "_DataCollection[TProperties]":
+    def with_data_model(self, data_model: Type[TProperties]) -> "_DataCollectionAsync[TProperties]":
         _check_properties_generic(data_model)
-        return _DataCollection[TProperties](
+        return _DataCollectionAsync[TProperties](
             self._connection,
             self.name,
             self._consistency_level,
@@ -329,14 +977,7 @@ class _DataCollection(Generic[Properties], _Data):
             data_model,
         )
 
-    def __parse_vector(self, obj: Dict[str, Any], vector: VECTORS) -> Dict[str, Any]:
-        if isinstance(vector, dict):
-            obj["vectors"] = {key: _get_vector_v4(val) for key, val in vector.items()}
-        else:
-            obj["vector"] = _get_vector_v4(vector)
-        return obj
-
-    def insert(
+    async def insert(
         self,
         properties: Properties,
         references: Optional[ReferenceInputs] = None,
@@ -365,29 +1006,9 @@ class _DataCollection(Generic[Properties], _Data):
             `weaviate.exceptions.UnexpectedStatusCodeError`:
                 If any unexpected error occurs during the insert operation, for example the given UUID already exists.
         """
-        if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument(expected=[UUID, None], name="uuid", value=uuid),
-                    _ValidateArgument(expected=[Mapping], name="properties", value=properties),
-                    _ValidateArgument(
-                        expected=[Mapping, None], name="references", value=references
-                    ),
-                ],
-            )
-        props = self._serialize_props(properties) if properties is not None else {}
-        refs = self._serialize_refs(references) if references is not None else {}
-        weaviate_obj: Dict[str, Any] = {
-            "class": self.name,
-            "properties": {**props, **refs},
-            "id": str(uuid if uuid is not None else uuid_package.uuid4()),
-        }
-        if vector is not None:
-            weaviate_obj = self.__parse_vector(weaviate_obj, vector)
-
-        return self._insert(weaviate_obj)
+        return await self._insert(self._prepare_insert(properties, references, uuid, vector))
 
-    def insert_many(
+    async def insert_many(
         self,
         objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
     ) -> BatchObjectReturn:
@@ -407,33 +1028,47 @@ class _DataCollection(Generic[Properties], _Data):
             `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
                 If every object in the batch fails to be inserted. The exception message contains details about the failure.
         """
-        return self._batch_grpc.objects(
-            [
-                (
-                    _BatchObject(
-                        collection=self.name,
-                        vector=obj.vector,
-                        uuid=str(obj.uuid if obj.uuid is not None else uuid_package.uuid4()),
-                        properties=cast(dict, obj.properties),
-                        tenant=self._tenant,
-                        references=obj.references,
-                    )
-                    if isinstance(obj, DataObject)
-                    else _BatchObject(
-                        collection=self.name,
-                        vector=None,
-                        uuid=str(uuid_package.uuid4()),
-                        properties=cast(dict, obj),
-                        tenant=self._tenant,
-                        references=None,
-                    )
-                )
-                for obj in objects
-            ],
-            timeout=self._connection.timeout_config.insert,
-        )
+        batch_objects = self._prepare_insert_many(objects)
+        return await self._insert_many(batch_objects, (obj.properties for obj in batch_objects))
 
-    def replace(
+    async def insert_columns(
+        self,
+        properties: Optional[Mapping[str, Any]] = None,
+        *,
+        vectors: Optional[Any] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+    ) -> BatchObjectReturn:
+        """Insert the rows of column-oriented data into the collection, e.g. an `(N, D)` embedding matrix with its properties.
+
+        The i-th object is built from the i-th entry of every property column, the i-th row of every vector matrix and
+        the i-th UUID. Rows are sliced straight into the gRPC batch request without validating every object, which makes
+        this considerably faster than `insert_many` for large arrays.
+
+        Arguments:
+            `properties`
+                The properties of the objects as a mapping of property names to columns. A column can be a `list`,
+                `numpy.ndarray`, `pd.Series` or `pa.Array`.
+            `vectors`
+                The vectors of the objects as a 2-D `numpy.ndarray` or a list of vectors with one row per object. For
+                named vectors, use a mapping of vector names to matrices.
+            `uuids`
+                The UUIDs of the objects. If not provided, a UUIDv4 is generated for each object.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCBatchError`:
+                If any unexpected error occurs during the batch operation.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If the columns, vectors and uuids do not all have the same number of rows.
+            `weaviate.exceptions.WeaviateInsertInvalidPropertyError`:
+                If a property is invalid. I.e., has name `id` or `vector`, which are reserved.
+            `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
+                If every object in the batch fails to be inserted. The exception message contains details about the failure.
+        """
+        # the properties of all objects are the keys of `properties`
+        batch_objects = self._prepare_insert_columns(properties, vectors, uuids)
+        return await self._insert_many(batch_objects, [properties])
+
+    async def replace(
         self,
         uuid: UUID,
         properties: Properties,
@@ -467,28 +1102,9 @@ class _DataCollection(Generic[Properties], _Data):
             `weaviate.exceptions.WeaviateInsertInvalidPropertyError`:
                 If a property is invalid. I.e., has name `id` or `vector`, which are reserved.
         """
-        if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument(expected=[UUID], name="uuid", value=uuid),
-                    _ValidateArgument(expected=[Mapping], name="properties", value=properties),
-                    _ValidateArgument(
-                        expected=[Mapping, None], name="references", value=references
-                    ),
-                ]
-            )
-        props = self._serialize_props(properties) if properties is not None else {}
-        refs = self._serialize_refs(references) if references is not None else {}
-        weaviate_obj: Dict[str, Any] = {
-            "class": self.name,
-            "properties": {**props, **refs},
-        }
-        if vector is not None:
-            weaviate_obj = self.__parse_vector(weaviate_obj, vector)
+        await self._replace(self._prepare_replace(uuid, properties, references, vector), uuid=uuid)
 
-        self._replace(weaviate_obj, uuid=uuid)
-
-    def update(
+    async def update(
         self,
         uuid: UUID,
         properties: Optional[Properties] = None,
@@ -514,27 +1130,11 @@ class _DataCollection(Generic[Properties], _Data):
                 - for single vectors: `list`, 'numpy.ndarray`, `torch.Tensor`, `tf.Tensor`, `pd.Series` and `pl.Series`, by default None.
                 - for named vectors: Dict[str, *list above*], where the string is the name of the vector.
         """
-        if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument(expected=[UUID], name="uuid", value=uuid),
-                    _ValidateArgument(
-                        expected=[Mapping, None], name="properties", value=properties
-                    ),
-                    _ValidateArgument(
-                        expected=[Mapping, None], name="references", value=references
-                    ),
-                ],
-            )
-        props = self._serialize_props(properties) if properties is not None else {}
-        refs = self._serialize_refs(references) if references is not None else {}
-        weaviate_obj: Dict[str, Any] = {"class": self.name, "properties": {**props, **refs}}
-        if vector is not None:
-            weaviate_obj = self.__parse_vector(weaviate_obj, vector)
+        await self._update(self._prepare_update(uuid, properties, references, vector), uuid=uuid)
 
-        self._update(weaviate_obj, uuid=uuid)
-
-    def reference_add(self, from_uuid: UUID, from_property: str, to: SingleReferenceInput) -> None:
+    async def reference_add(
+        self, from_uuid: UUID, from_property: str, to: SingleReferenceInput
+    ) -> None:
         """Create a reference between an object in this collection and any other object in Weaviate.
 
         Arguments:
@@ -551,23 +1151,10 @@ class _DataCollection(Generic[Properties], _Data):
             `weaviate.UnexpectedStatusCodeError`:
                 If Weaviate reports a non-OK status.
         """
-        if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument(expected=[UUID], name="from_uuid", value=from_uuid),
-                    _ValidateArgument(expected=[str], name="from_property", value=from_property),
-                    _ValidateArgument(
-                        expected=[UUID, ReferenceToMulti], name="references", value=to
-                    ),
-                ],
-            )
-        if isinstance(to, ReferenceToMulti):
-            ref = _Reference(target_collection=to.target_collection, uuids=to.uuids)
-        else:
-            ref = _Reference(target_collection=None, uuids=to)
-        self._reference_add(from_uuid=from_uuid, from_property=from_property, ref=ref)
+        ref = self._prepare_reference(from_uuid, from_property, to)
+        await self._reference_add(from_uuid=from_uuid, from_property=from_property, ref=ref)
 
-    def reference_add_many(self, refs: List[DataReferences]) -> BatchReferenceReturn:
+    async def reference_add_many(self, refs: List[DataReferences]) -> BatchReferenceReturn:
         """Create multiple references on a property in batch between objects in this collection and any other object in Weaviate.
 
         Arguments:
@@ -584,9 +1171,9 @@ class _DataCollection(Generic[Properties], _Data):
             `weaviate.UnexpectedStatusCodeError
                 If Weaviate reports a non-OK status.
         """
-        return self._reference_add_many(refs)
+        return await self._reference_add_many(refs)
 
-    def reference_delete(
+    async def reference_delete(
         self, from_uuid: UUID, from_property: str, to: SingleReferenceInput
     ) -> None:
         """Delete a reference from an object within the collection.
@@ -599,23 +1186,12 @@ class _DataCollection(Generic[Properties], _Data):
             `to`
                 The reference to delete, REQUIRED.
         """
-        if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument(expected=[UUID], name="from_uuid", value=from_uuid),
-                    _ValidateArgument(expected=[str], name="from_property", value=from_property),
-                    _ValidateArgument(
-                        expected=[UUID, ReferenceToMulti], name="references", value=to
-                    ),
-                ]
-            )
-        if isinstance(to, ReferenceToMulti):
-            ref = _Reference(target_collection=to.target_collection, uuids=to.uuids)
-        else:
-            ref = _Reference(target_collection=None, uuids=to)
-        self._reference_delete(from_uuid=from_uuid, from_property=from_property, ref=ref)
+        ref = self._prepare_reference(from_uuid, from_property, to)
+        await self._reference_delete(from_uuid=from_uuid, from_property=from_property, ref=ref)
 
-    def reference_replace(self, from_uuid: UUID, from_property: str, to: ReferenceInput) -> None:
+    async def reference_replace(
+        self, from_uuid: UUID, from_property: str, to: ReferenceInput
+    ) -> None:
         """Replace a reference of an object within the collection.
 
         Arguments:
@@ -626,31 +1202,10 @@ class _DataCollection(Generic[Properties], _Data):
             `to`
                 The reference to replace, REQUIRED.
         """
-        if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument(expected=[UUID], name="from_uuid", value=from_uuid),
-                    _ValidateArgument(expected=[str], name="from_property", value=from_property),
-                    _ValidateArgument(
-                        expected=[
-                            UUID,
-                            ReferenceToMulti,
-                            List[str],
-                            List[uuid_package.UUID],
-                            List[UUID],
-                        ],
-                        name="references",
-                        value=to,
-                    ),
-                ]
-            )
-        if isinstance(to, ReferenceToMulti):
-            ref = _Reference(target_collection=to.target_collection, uuids=to.uuids)
-        else:
-            ref = _Reference(target_collection=None, uuids=to)
-        self._reference_replace(from_uuid=from_uuid, from_property=from_property, ref=ref)
+        ref = self._prepare_reference_replace(from_uuid, from_property, to)
+        await self._reference_replace(from_uuid=from_uuid, from_property=from_property, ref=ref)
 
-    def exists(self, uuid: UUID) -> bool:
+    async def exists(self, uuid: UUID) -> bool:
         """Check for existence of a single object in the collection.
 
         Arguments:
@@ -665,4 +1220,4 @@ class _DataCollection(Generic[Properties], _Data):
                 If any unexpected error occurs during the operation.
         """
         _validate_input(_ValidateArgument(expected=[UUID], name="uuid", value=uuid))
-        return self._exists(str(uuid))
+        return await self._exists(str(uuid))
@@ -0,0 +1,346 @@
+import base64
+import datetime
+import json
+import os
+import threading
+import uuid as uuid_package
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from pydantic import BaseModel
+
+from weaviate.collections.classes.grpc import METADATA, PROPERTIES
+from weaviate.collections.classes.internal import Object
+from weaviate.collections.iterator import ITERATOR_CACHE_SIZE, _ObjectIterator
+from weaviate.exceptions import WeaviateInvalidInputError
+
+ExportCallback = Callable[[List[Object[Any, Any]]], None]
+
+_UUID_SPACE = 1 << 128
+
+
+def _uuid_ranges(
+    shards: int,
+) -> List[Tuple[Optional[uuid_package.UUID], Optional[uuid_package.UUID]]]:
+    """Split the UUID space into `shards` contiguous ranges as `(after, upper_bound)` cursor pairs.
+
+    `after` is the cursor from which the range is iterated, i.e. the last UUID of the preceding range, and
+    `upper_bound` is the exclusive upper bound of the range. Both are `None` for the outermost ranges.
+    """
+    step = _UUID_SPACE // shards
+    return [
+        (
+            uuid_package.UUID(int=i * step - 1) if i > 0 else None,
+            uuid_package.UUID(int=(i + 1) * step) if i < shards - 1 else None,
+        )
+        for i in range(shards)
+    ]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, uuid_package.UUID):
+        return str(value)
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("utf-8")
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value)} is not JSON serializable")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default)
+
+
+def _object_to_dict(obj: Object[Any, Any]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {"uuid": str(obj.uuid), "properties": obj.properties}
+    metadata = {key: val for key, val in asdict(obj.metadata).items() if val is not None}
+    if len(metadata) > 0:
+        out["metadata"] = metadata
+    if len(obj.vector) > 0:
+        out["vector"] = obj.vector
+    return out
+
+
+class _JsonlSink:
+    def __init__(self, path: str, append: bool) -> None:
+        self.__file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def __call__(self, objects: List[Object[Any, Any]]) -> None:
+        self.__file.write("".join(_dumps(_object_to_dict(obj)) + "\n" for obj in objects))
+        self.__file.flush()
+
+    def close(self) -> None:
+        self.__file.close()
+
+
+class _ParquetSink:
+    def __init__(self, path: str) -> None:
+        try:
+            import pyarrow as pa  # type: ignore
+            import pyarrow.parquet as pq  # type: ignore
+        except ImportError as e:
+            raise WeaviateInvalidInputError(
+                "Exporting to Parquet requires `pyarrow` to be installed"
+            ) from e
+        self.__pa = pa
+        self.__pq = pq
+        self.__path = path
+        self.__writer: Optional[Any] = None
+
+    def __call__(self, objects: List[Object[Any, Any]]) -> None:
+        pa = self.__pa
+        columns: Dict[str, Any] = {
+            "uuid": pa.array([str(obj.uuid) for obj in objects], pa.string()),
+            "properties": pa.array([_dumps(obj.properties) for obj in objects], pa.string()),
+            "metadata": pa.array(
+                [
+                    _dumps({k: v for k, v in asdict(obj.metadata).items() if v is not None})
+                    for obj in objects
+                ],
+                pa.string(),
+            ),
+        }
+        for name in objects[0].vector.keys():
+            columns["vector" if name == "default" else f"vector_{name}"] = pa.array(
+                [obj.vector.get(name) for obj in objects], pa.list_(pa.float32())
+            )
+        table = pa.table(columns)
+        if self.__writer is None:
+            self.__writer = self.__pq.ParquetWriter(self.__path, table.schema)
+        self.__writer.write_table(table)
+
+    def close(self) -> None:
+        if self.__writer is not None:
+            self.__writer.close()
+
+
+@dataclass
+class _ExportCursor:
+    after: Optional[uuid_package.UUID]
+    upper_bound: Optional[uuid_package.UUID]
+    done: bool = False
+
+
+class _CollectionExport:
+    """Export all objects of a collection by iterating disjoint ranges of the UUID space concurrently."""
+
+    def __init__(
+        self,
+        fetch_objects: Callable[..., Any],
+    ) -> None:
+        self.__fetch_objects = fetch_objects
+
+    def to_callback(
+        self,
+        callback: ExportCallback,
+        *,
+        shards: int = 16,
+        concurrency: int = 4,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        checkpoint: Optional[str] = None,
+    ) -> int:
+        """Export all objects in the collection by passing them to a callback in pages of `page_size` objects.
+
+        The UUID space is split into `shards` ranges that are each iterated with their own cursor, `concurrency` of
+        them at a time. The callback is never called concurrently, but the pages of different ranges are interleaved.
+        At most `concurrency` pages are held in memory at any point in time.
+
+        Arguments:
+            `callback`
+                The function that is called with each page of objects.
+            `shards`
+                The number of UUID ranges to split the collection into.
+            `concurrency`
+                The number of ranges that are iterated concurrently.
+            `page_size`
+                The number of objects fetched per request and passed to the callback at once.
+            `include_vector`
+                Whether to include the vector of the objects.
+            `return_metadata`
+                The metadata to return with each object.
+            `return_properties`
+                The properties to return with each object.
+            `checkpoint`
+                The path of a JSON file in which the progress of each range is stored after every page. If the file
+                exists, the export resumes from the stored progress. Pages that were passed to the callback but not
+                yet checkpointed when the export was interrupted are exported again.
+
+        Returns:
+            The number of objects that were exported in this call.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If a request to the Weaviate server fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If the checkpoint was written with a different number of shards.
+        """
+        if shards < 1 or concurrency < 1 or page_size < 1:
+            raise WeaviateInvalidInputError(
+                "shards, concurrency and page_size must be positive integers"
+            )
+        cursors = self.__load_checkpoint(checkpoint, shards)
+        lock = threading.Lock()
+        stop = threading.Event()
+        exported = 0
+
+        def query(limit: int, after: Optional[uuid_package.UUID]) -> List[Object[Any, Any]]:
+            return cast(
+                List[Object[Any, Any]],
+                self.__fetch_objects(
+                    limit=limit,
+                    after=after,
+                    include_vector=include_vector,
+                    return_metadata=return_metadata,
+                    return_properties=return_properties,
+                ).objects,
+            )
+
+        def flush(cursor: _ExportCursor, page: List[Object[Any, Any]], done: bool) -> None:
+            nonlocal exported
+            with lock:
+                if len(page) > 0:
+                    callback(page)
+                    exported += len(page)
+                    cursor.after = page[-1].uuid
+                cursor.done = done
+                if checkpoint is not None:
+                    self.__save_checkpoint(checkpoint, cursors)
+
+        def export_range(cursor: _ExportCursor) -> None:
+            page: List[Object[Any, Any]] = []
+            for obj in _ObjectIterator(query, cursor.after, page_size):
+                if stop.is_set():
+                    return
+                if cursor.upper_bound is not None and obj.uuid >= cursor.upper_bound:
+                    break
+                page.append(obj)
+                if len(page) == page_size:
+                    flush(cursor, page, False)
+                    page = []
+            flush(cursor, page, True)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(export_range, cursor) for cursor in cursors if not cursor.done
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                stop.set()
+                for future in futures:
+                    future.cancel()
+                raise
+        return exported
+
+    def to_jsonl(
+        self,
+        path: str,
+        *,
+        shards: int = 16,
+        concurrency: int = 4,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        checkpoint: Optional[str] = None,
+    ) -> int:
+        """Export all objects in the collection to a JSON Lines file with one object per line.
+
+        Each line holds the `uuid` and `properties` of an object, and its `metadata` and `vector` if requested. If
+        `checkpoint` points to an existing checkpoint, the file is appended to instead of overwritten.
+
+        See `to_callback` for a description of the arguments and the return value.
+        """
+        sink = _JsonlSink(path, append=checkpoint is not None and os.path.exists(checkpoint))
+        try:
+            return self.to_callback(
+                sink,
+                shards=shards,
+                concurrency=concurrency,
+                page_size=page_size,
+                include_vector=include_vector,
+                return_metadata=return_metadata,
+                return_properties=return_properties,
+                checkpoint=checkpoint,
+            )
+        finally:
+            sink.close()
+
+    def to_parquet(
+        self,
+        path: str,
+        *,
+        shards: int = 16,
+        concurrency: int = 4,
+        page_size: int = ITERATOR_CACHE_SIZE,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        checkpoint: Optional[str] = None,
+    ) -> int:
+        """Export all objects in the collection to a Parquet file. Requires `pyarrow` to be installed.
+
+        The file has a `uuid` column, the `properties` and `metadata` of each object as JSON strings and one float32
+        list column per vector. Parquet files cannot be appended to, so when resuming from a `checkpoint` use a new
+        `path` for the remaining objects.
+
+        See `to_callback` for a description of the arguments and the return value.
+        """
+        sink = _ParquetSink(path)
+        try:
+            return self.to_callback(
+                sink,
+                shards=shards,
+                concurrency=concurrency,
+                page_size=page_size,
+                include_vector=include_vector,
+                return_metadata=return_metadata,
+                return_properties=return_properties,
+                checkpoint=checkpoint,
+            )
+        finally:
+            sink.close()
+
+    @staticmethod
+    def __load_checkpoint(checkpoint: Optional[str], shards: int) -> List[_ExportCursor]:
+        cursors = [_ExportCursor(after, upper) for after, upper in _uuid_ranges(shards)]
+        if checkpoint is None or not os.path.exists(checkpoint):
+            return cursors
+
+        with open(checkpoint, encoding="utf-8") as f:
+            state = json.load(f)
+        if len(state["cursors"]) != shards:
+            raise WeaviateInvalidInputError(
+                f"The checkpoint {checkpoint} was written for {len(state['cursors'])} shards but {shards} were requested"
+            )
+        for cursor, saved in zip(cursors, state["cursors"]):
+            cursor.after = uuid_package.UUID(saved["after"]) if saved["after"] is not None else None
+            cursor.done = saved["done"]
+        return cursors
+
+    @staticmethod
+    def __save_checkpoint(checkpoint: str, cursors: List[_ExportCursor]) -> None:
+        tmp = checkpoint + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "cursors": [
+                        {
+                            "after": str(cursor.after) if cursor.after is not None else None,
+                            "done": cursor.done,
+                        }
+                        for cursor in cursors
+                    ]
+                },
+                f,
+            )
+        os.replace(tmp, checkpoint)
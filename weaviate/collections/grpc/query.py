@@ -31,6 +31,7 @@ from weaviate.collections.classes.internal import _Generative, _GroupBy
 from weaviate.collections.filters import _FilterToGRPC
 
 from weaviate.collections.grpc.shared import _BaseGRPC
+from weaviate.collections.query_cache import _QueryCache
 
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import WeaviateQueryError, WeaviateUnsupportedFeatureError
@@ -69,6 +70,8 @@ A = TypeVar("A")
 
 
 class _QueryGRPC(_BaseGRPC):
+    """Builds the search requests of the query mixins, which send them with `call` or `acall`."""
+
     def __init__(
         self,
         connection: ConnectionV4,
@@ -77,12 +80,14 @@ class _QueryGRPC(_BaseGRPC):
         consistency_level: Optional[ConsistencyLevel],
         validate_arguments: bool,
         uses_125_api: bool,
+        cache: Optional[_QueryCache] = None,
     ):
         super().__init__(connection, consistency_level)
         self._name: str = name
         self._tenant = tenant
         self._validate_arguments = validate_arguments
         self.__uses_125_api = uses_125_api
+        self._cache = cache
 
     def __parse_near_options(
         self,
@@ -113,7 +118,7 @@ class _QueryGRPC(_BaseGRPC):
         return_references: Optional[REFERENCES] = None,
         generative: Optional[_Generative] = None,
         rerank: Optional[Rerank] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(_ValidateArgument([_Sorting, None], "sort", sort))
 
@@ -138,7 +143,7 @@ class _QueryGRPC(_BaseGRPC):
             sort_by=sort_by,
         )
 
-        return self.__call(request)
+        return request
 
     def hybrid(
         self,
@@ -158,7 +163,7 @@ class _QueryGRPC(_BaseGRPC):
         generative: Optional[_Generative] = None,
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._connection._weaviate_version.is_lower_than(1, 25, 0) and (
             isinstance(vector, _HybridNearText) or isinstance(vector, _HybridNearVector)
         ):
@@ -243,7 +248,7 @@ class _QueryGRPC(_BaseGRPC):
             hybrid_search=hybrid_search,
         )
 
-        return self.__call(request)
+        return request
 
     def bm25(
         self,
@@ -259,7 +264,7 @@ class _QueryGRPC(_BaseGRPC):
         return_references: Optional[REFERENCES] = None,
         generative: Optional[_Generative] = None,
         rerank: Optional[Rerank] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -287,7 +292,7 @@ class _QueryGRPC(_BaseGRPC):
                 else None
             ),
         )
-        return self.__call(request)
+        return request
 
     def near_vector(
         self,
@@ -305,7 +310,7 @@ class _QueryGRPC(_BaseGRPC):
         return_metadata: Optional[_MetadataQuery] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Optional[REFERENCES] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -336,7 +341,7 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
-        return self.__call(request)
+        return request
 
     def near_object(
         self,
@@ -354,7 +359,7 @@ class _QueryGRPC(_BaseGRPC):
         return_metadata: Optional[_MetadataQuery] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Optional[REFERENCES] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -384,7 +389,7 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
-        return self.__call(base_request)
+        return base_request
 
     def near_text(
         self,
@@ -404,7 +409,7 @@ class _QueryGRPC(_BaseGRPC):
         return_metadata: Optional[_MetadataQuery] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Optional[REFERENCES] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -442,7 +447,7 @@ class _QueryGRPC(_BaseGRPC):
             near_text=near_text_req,
         )
 
-        return self.__call(request)
+        return request
 
     def near_media(
         self,
@@ -461,7 +466,7 @@ class _QueryGRPC(_BaseGRPC):
         return_metadata: Optional[_MetadataQuery] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Optional[REFERENCES] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -516,7 +521,7 @@ class _QueryGRPC(_BaseGRPC):
             group_by=group_by,
             **kwargs,
         )
-        return self.__call(request)
+        return request
 
     @staticmethod
     def __parse_move(move: Optional[Move]) -> Optional[search_get_pb2.NearTextSearch.Move]:
@@ -642,7 +647,27 @@ class _QueryGRPC(_BaseGRPC):
             near_video=near_video,
         )
 
-    def __call(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+    def call(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        """Send a request built by one of the other methods and return the reply."""
+        if self._cache is None:
+            return self.__search(request)
+        key, generation, res = self._cache._get(request)
+        if res is None:
+            res = self.__search(request)
+            self._cache._put(key, generation, res)
+        return res
+
+    async def acall(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        """Send a request like `call`, but over the async gRPC channel."""
+        if self._cache is None:
+            return await self.__asearch(request)
+        key, generation, res = self._cache._get(request)
+        if res is None:
+            res = await self.__asearch(request)
+            self._cache._put(key, generation, res)
+        return res
+
+    def __search(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
         try:
             assert self._connection.grpc_stub is not None
             res: search_get_pb2.SearchReply  # According to PEP-0526
@@ -657,6 +682,19 @@ class _QueryGRPC(_BaseGRPC):
         except grpc.RpcError as e:
             raise WeaviateQueryError(e.details(), "GRPC search")  # pyright: ignore
 
+    async def __asearch(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        try:
+            assert self._connection.agrpc_stub is not None
+            res: search_get_pb2.SearchReply = await self._connection.agrpc_stub.Search(
+                request,
+                metadata=self._connection.grpc_headers(),
+                timeout=self._connection.timeout_config.query,
+            )
+            return res
+
+        except grpc.RpcError as e:
+            raise WeaviateQueryError(e.details(), "GRPC search")  # pyright: ignore
+
     def _metadata_to_grpc(self, metadata: _MetadataQuery) -> search_get_pb2.MetadataRequest:
         return search_get_pb2.MetadataRequest(
             uuid=metadata.uuid,
@@ -1,4 +1,6 @@
-from typing import Callable, Generic, Iterable, Iterator, List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Generic, Iterable, Iterator, List, Optional
 from uuid import UUID
 
 from weaviate.collections.classes.internal import Object
@@ -13,29 +15,69 @@ class _ObjectIterator(Generic[P, R], Iterable[Object[P, R]]):
         self,
         fetch_objects_query: Callable[[int, Optional[UUID]], List[Object[P, R]]],
         init_after: Optional[UUID],
+        page_size: int = ITERATOR_CACHE_SIZE,
+        prefetch: int = 0,
     ) -> None:
         self.__query = fetch_objects_query
         self.__init_after = init_after
+        self.__page_size = page_size
+        self.__prefetch = prefetch
 
-        self.__iter_object_cache: List[Object[P, R]] = []
+        self.__iter_object_cache: Deque[Object[P, R]] = deque()
         self.__iter_object_last_uuid: Optional[UUID] = init_after
 
+        # pages that are requested in the background, in cursor order
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__pages: Deque["Future[List[Object[P, R]]]"] = deque()
+
     def __iter__(self) -> Iterator[Object[P, R]]:
-        self.__iter_object_cache = []
+        self.__stop_prefetching()
+        self.__iter_object_cache = deque()
         self.__iter_object_last_uuid = self.__init_after
         return self
 
+    def __stop_prefetching(self) -> None:
+        # the pages are all futures of the executor, cancelling them is what `cancel_futures` does from Python 3.9 on.
+        # A page that is already being fetched cannot be cancelled, its result is dropped
+        for page in self.__pages:
+            page.cancel()
+        self.__pages.clear()
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
+    def __fetch_after(self, previous: "Future[List[Object[P, R]]]") -> List[Object[P, R]]:
+        # runs on the single worker thread, so `previous` has always completed at this point
+        objects = previous.result()
+        if len(objects) == 0:
+            return []
+        return self.__query(self.__page_size, objects[-1].uuid)
+
+    def __next_page(self) -> List[Object[P, R]]:
+        if self.__prefetch == 0:
+            return self.__query(self.__page_size, self.__iter_object_last_uuid)
+
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(max_workers=1)
+        if len(self.__pages) == 0:
+            self.__pages.append(
+                self.__executor.submit(self.__query, self.__page_size, self.__iter_object_last_uuid)
+            )
+        page = self.__pages.popleft()
+        while len(self.__pages) < self.__prefetch:
+            last = self.__pages[-1] if len(self.__pages) > 0 else page
+            self.__pages.append(self.__executor.submit(self.__fetch_after, last))
+        return page.result()
+
     def __next__(self) -> Object[P, R]:
         if len(self.__iter_object_cache) == 0:
-            objects = self.__query(
-                ITERATOR_CACHE_SIZE,
-                self.__iter_object_last_uuid,
-            )
-            self.__iter_object_cache = objects
+            objects = self.__next_page()
+            self.__iter_object_cache = deque(objects)
             if len(self.__iter_object_cache) == 0:
+                self.__stop_prefetching()
                 raise StopIteration
 
-        ret_object = self.__iter_object_cache.pop(0)
+        ret_object = self.__iter_object_cache.popleft()
         self.__iter_object_last_uuid = ret_object.uuid
         assert (
             self.__iter_object_last_uuid is not None
@@ -1,11 +1,27 @@
 import datetime
+import functools
 import io
 import os
 import pathlib
 import uuid as uuid_lib
-from typing import Any, Dict, Generic, List, Optional, Sequence, Type, Union, cast
+from dataclasses import dataclass
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from typing_extensions import is_typeddict
+from typing_extensions import Concatenate, ParamSpec, is_typeddict
 
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.grpc import (
@@ -18,11 +34,14 @@ from weaviate.collections.classes.grpc import (
     REFERENCES,
 )
 from weaviate.collections.classes.internal import (
+    ColumnarReturn,
     GroupByObject,
     MetadataReturn,
     GroupByMetadataReturn,
     GenerativeObject,
+    MetadataSingleObjectReturn,
     Object,
+    ObjectSingleReturn,
     _extract_properties_from_data_model,
     _extract_references_from_data_model,
     GenerativeSearchReturnType,
@@ -34,6 +53,7 @@ from weaviate.collections.classes.internal import (
     GenerativeGroup,
     QueryReturn,
     QuerySearchReturnType,
+    QuerySingleReturn,
     _QueryOptions,
     ReturnProperties,
     ReturnReferences,
@@ -50,6 +70,7 @@ from weaviate.collections.classes.types import (
 )
 from weaviate.collections.queries.byteops import _ByteOps
 from weaviate.collections.grpc.query import _QueryGRPC
+from weaviate.collections.query_cache import _QueryCache
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.proto.v1 import search_get_pb2, properties_pb2
@@ -60,7 +81,56 @@ from weaviate.util import (
 from weaviate.validator import _validate_input, _ValidateArgument
 from weaviate.warnings import _Warnings
 
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import INCLUDE_VECTOR, RETURNED_VECTOR, VECTOR_FORMAT
+
+
+# (column name, presence flag, field) of the metadata returned in columnar results
+_COLUMNAR_METADATA = (
+    ("creation_time", "creation_time_unix_present", "creation_time_unix"),
+    ("last_update_time", "last_update_time_unix_present", "last_update_time_unix"),
+    ("distance", "distance_present", "distance"),
+    ("certainty", "certainty_present", "certainty"),
+    ("score", "score_present", "score"),
+    ("explain_score", "explain_score_present", "explain_score"),
+    ("is_consistent", "is_consistent_present", "is_consistent"),
+    ("rerank_score", "rerank_score_present", "rerank_score"),
+)
+
+# decoders of the `kind` oneof of `Value` and `ListValue`, except for the nested kinds that need the query object
+_VALUE_DECODERS: Dict[str, Callable[[properties_pb2.Value], Any]] = {
+    "uuid_value": lambda value: uuid_lib.UUID(value.uuid_value),
+    "date_value": lambda value: _datetime_from_weaviate_str(value.date_value),
+    "string_value": lambda value: str(value.string_value),
+    "text_value": lambda value: str(value.text_value),
+    "int_value": lambda value: int(value.int_value),
+    "number_value": lambda value: float(value.number_value),
+    "bool_value": lambda value: bool(value.bool_value),
+    "geo_value": lambda value: GeoCoordinate(
+        latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
+    ),
+    "blob_value": lambda value: value.blob_value,
+    "phone_value": lambda value: _PhoneNumber(
+        country_code=value.phone_value.country_code,
+        default_country=value.phone_value.default_country,
+        international_formatted=value.phone_value.international_formatted,
+        national=value.phone_value.national,
+        national_formatted=value.phone_value.national_formatted,
+        number=value.phone_value.input,
+        valid=value.phone_value.valid,
+    ),
+    "null_value": lambda value: None,
+}
+
+_LIST_VALUE_DECODERS: Dict[str, Callable[[properties_pb2.ListValue], List[Any]]] = {
+    "bool_values": lambda value: list(value.bool_values.values),
+    "date_values": lambda value: [
+        _datetime_from_weaviate_str(val) for val in value.date_values.values
+    ],
+    "int_values": lambda value: _ByteOps.decode_int64s(value.int_values.values),
+    "number_values": lambda value: _ByteOps.decode_float64s(value.number_values.values),
+    "text_values": lambda value: list(value.text_values.values),
+    "uuid_values": lambda value: [uuid_lib.UUID(val) for val in value.uuid_values.values],
+}
 
 
 class _WeaviateUUIDInt(uuid_lib.UUID):
@@ -68,6 +138,63 @@ class _WeaviateUUIDInt(uuid_lib.UUID):
         object.__setattr__(self, "int", hex_)
 
 
+@dataclass
+class _LazyObjectDecoder:
+    """The decoders of the fields of the results of one reply, shared by all the lazy objects created from it."""
+
+    options: _QueryOptions
+    properties: Callable[[properties_pb2.Properties], dict]
+    metadata: Callable[[search_get_pb2.MetadataResult], MetadataReturn]
+    references: Callable[[search_get_pb2.PropertiesResult, VECTOR_FORMAT], Optional[dict]]
+    vector: Callable[[search_get_pb2.MetadataResult, VECTOR_FORMAT], Dict[str, RETURNED_VECTOR]]
+    uuid: Callable[[search_get_pb2.MetadataResult], uuid_lib.UUID]
+
+
+class _LazyObject(Object[Any, Any, Any]):
+    """An `Object` that keeps its `SearchResult` and decodes every field on first access only.
+
+    The decoded values are stored on the instance, so that every field is decoded at most once.
+    """
+
+    def __init__(self, result: search_get_pb2.SearchResult, decoder: _LazyObjectDecoder) -> None:
+        self.__result = result
+        self.__decoder = decoder
+
+    @cached_property
+    def uuid(self) -> uuid_lib.UUID:  # type: ignore[override]
+        return self.__decoder.uuid(self.__result.metadata)
+
+    @cached_property
+    def collection(self) -> str:  # type: ignore[override]
+        return self.__result.properties.target_collection
+
+    @cached_property
+    def properties(self) -> Any:
+        if not self.__decoder.options.include_properties:
+            return {}
+        return self.__decoder.properties(self.__result.properties.non_ref_props)
+
+    @cached_property
+    def metadata(self) -> MetadataReturn:  # type: ignore[override]
+        if not self.__decoder.options.include_metadata:
+            return MetadataReturn()
+        return self.__decoder.metadata(self.__result.metadata)
+
+    @cached_property
+    def references(self) -> Any:
+        if not self.__decoder.options.include_references:
+            return None
+        return self.__decoder.references(
+            self.__result.properties, self.__decoder.options.vector_format
+        )
+
+    @cached_property
+    def vector(self) -> Dict[str, RETURNED_VECTOR]:  # type: ignore[override]
+        if not self.__decoder.options.include_vector:
+            return {}
+        return self.__decoder.vector(self.__result.metadata, self.__decoder.options.vector_format)
+
+
 class _BaseQuery(Generic[Properties, References]):
     def __init__(
         self,
@@ -78,6 +205,7 @@ class _BaseQuery(Generic[Properties, References]):
         properties: Optional[Type[Properties]],
         references: Optional[Type[References]],
         validate_arguments: bool,
+        query_cache: Optional[_QueryCache] = None,
     ):
         self._connection = connection
         self._name = name
@@ -95,6 +223,7 @@ class _BaseQuery(Generic[Properties, References]):
             self.__consistency_level,
             validate_arguments=self._validate_arguments,
             uses_125_api=self.__uses_125_api,
+            cache=query_cache,
         )
 
     def __retrieve_timestamp(
@@ -149,7 +278,8 @@ class _BaseQuery(Generic[Properties, References]):
     def __extract_vector_for_object(
         self,
         add_props: "search_get_pb2.MetadataResult",
-    ) -> Dict[str, List[float]]:
+        vector_format: VECTOR_FORMAT,
+    ) -> Dict[str, RETURNED_VECTOR]:
         if (
             len(add_props.vector_bytes) == 0
             and len(add_props.vector) == 0
@@ -157,12 +287,15 @@ class _BaseQuery(Generic[Properties, References]):
         ):
             return {}
 
+        decode = (
+            _ByteOps.decode_float32s_numpy if vector_format == "numpy" else _ByteOps.decode_float32s
+        )
         if len(add_props.vector_bytes) > 0:
-            return {"default": _ByteOps.decode_float32s(add_props.vector_bytes)}
+            return {"default": decode(add_props.vector_bytes)}
 
         vecs = {}
         for vec in add_props.vectors:
-            vecs[vec.name] = _ByteOps.decode_float32s(vec.vector_bytes)
+            vecs[vec.name] = decode(vec.vector_bytes)
         return vecs
 
     def __extract_generated_for_object(
@@ -174,71 +307,35 @@ class _BaseQuery(Generic[Properties, References]):
     def __deserialize_list_value_prop_125(
         self, value: properties_pb2.ListValue
     ) -> Optional[List[Any]]:
-        if value.HasField("bool_values"):
-            return list(value.bool_values.values)
-        if value.HasField("date_values"):
-            return [_datetime_from_weaviate_str(val) for val in value.date_values.values]
-        if value.HasField("int_values"):
-            return _ByteOps.decode_int64s(value.int_values.values)
-        if value.HasField("number_values"):
-            return _ByteOps.decode_float64s(value.number_values.values)
-        if value.HasField("text_values"):
-            return list(value.text_values.values)
-        if value.HasField("uuid_values"):
-            return [uuid_lib.UUID(val) for val in value.uuid_values.values]
-        if value.HasField("object_values"):
+        kind = value.WhichOneof("kind")
+        decoder = _LIST_VALUE_DECODERS.get(kind) if kind is not None else None
+        if decoder is not None:
+            return decoder(value)
+        if kind == "object_values":
             return [
                 self.__parse_nonref_properties_result(val) for val in value.object_values.values
             ]
-        _Warnings.unknown_type_encountered(value.WhichOneof("Value"))
+        _Warnings.unknown_type_encountered(str(kind))
         return None
 
     def __deserialize_list_value_prop_123(self, value: properties_pb2.ListValue) -> List[Any]:
         return [self.__deserialize_non_ref_prop(val) for val in value.values]
 
     def __deserialize_non_ref_prop(self, value: properties_pb2.Value) -> Any:
-        if value.HasField("uuid_value"):
-            return uuid_lib.UUID(value.uuid_value)
-        if value.HasField("date_value"):
-            return _datetime_from_weaviate_str(value.date_value)
-        if value.HasField("string_value"):
-            return str(value.string_value)
-        if value.HasField("text_value"):
-            return str(value.text_value)
-        if value.HasField("int_value"):
-            return int(value.int_value)
-        if value.HasField("number_value"):
-            return float(value.number_value)
-        if value.HasField("bool_value"):
-            return bool(value.bool_value)
-        if value.HasField("list_value"):
+        kind = value.WhichOneof("kind")
+        decoder = _VALUE_DECODERS.get(kind) if kind is not None else None
+        if decoder is not None:
+            return decoder(value)
+        if kind == "list_value":
             return (
                 self.__deserialize_list_value_prop_125(value.list_value)
                 if self.__uses_125_api
                 else self.__deserialize_list_value_prop_123(value.list_value)
             )
-        if value.HasField("object_value"):
+        if kind == "object_value":
             return self.__parse_nonref_properties_result(value.object_value)
-        if value.HasField("geo_value"):
-            return GeoCoordinate(
-                latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
-            )
-        if value.HasField("blob_value"):
-            return value.blob_value
-        if value.HasField("phone_value"):
-            return _PhoneNumber(
-                country_code=value.phone_value.country_code,
-                default_country=value.phone_value.default_country,
-                international_formatted=value.phone_value.international_formatted,
-                national=value.phone_value.national,
-                national_formatted=value.phone_value.national_formatted,
-                number=value.phone_value.input,
-                valid=value.phone_value.valid,
-            )
-        if value.HasField("null_value"):
-            return None
 
-        _Warnings.unknown_type_encountered(value.WhichOneof("Value"))
+        _Warnings.unknown_type_encountered(str(kind))
         return None
 
     def __parse_nonref_properties_result(
@@ -253,6 +350,7 @@ class _BaseQuery(Generic[Properties, References]):
     def __parse_ref_properties_result(
         self,
         properties: search_get_pb2.PropertiesResult,
+        vector_format: VECTOR_FORMAT,
     ) -> Optional[dict]:
         if len(properties.ref_props) == 0:
             return {} if properties.ref_props_requested else None
@@ -261,7 +359,9 @@ class _BaseQuery(Generic[Properties, References]):
             ref_prop.prop_name: _CrossReference._from(
                 [
                     self.__result_to_query_object(
-                        prop, prop.metadata, _QueryOptions(True, True, True, True, False)
+                        prop,
+                        prop.metadata,
+                        _QueryOptions(True, True, True, True, False, vector_format),
                     )
                     for prop in ref_prop.properties
                 ]
@@ -274,7 +374,7 @@ class _BaseQuery(Generic[Properties, References]):
         props: search_get_pb2.PropertiesResult,
         meta: search_get_pb2.MetadataResult,
         options: _QueryOptions,
-    ) -> Object[Any, Any]:
+    ) -> Object[Any, Any, Any]:
         return Object(
             collection=props.target_collection,
             properties=(
@@ -288,10 +388,16 @@ class _BaseQuery(Generic[Properties, References]):
                 else MetadataReturn()
             ),
             references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
+                self.__parse_ref_properties_result(props, options.vector_format)
+                if options.include_references
+                else None
             ),
             uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
+            vector=(
+                self.__extract_vector_for_object(meta, options.vector_format)
+                if options.include_vector
+                else {}
+            ),
         )
 
     def __result_to_generative_object(
@@ -299,7 +405,7 @@ class _BaseQuery(Generic[Properties, References]):
         props: search_get_pb2.PropertiesResult,
         meta: search_get_pb2.MetadataResult,
         options: _QueryOptions,
-    ) -> GenerativeObject[Any, Any]:
+    ) -> GenerativeObject[Any, Any, Any]:
         return GenerativeObject(
             collection=props.target_collection,
             properties=(
@@ -313,10 +419,16 @@ class _BaseQuery(Generic[Properties, References]):
                 else MetadataReturn()
             ),
             references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
+                self.__parse_ref_properties_result(props, options.vector_format)
+                if options.include_references
+                else None
             ),
             uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
+            vector=(
+                self.__extract_vector_for_object(meta, options.vector_format)
+                if options.include_vector
+                else {}
+            ),
             generated=self.__extract_generated_for_object(meta),
         )
 
@@ -324,7 +436,7 @@ class _BaseQuery(Generic[Properties, References]):
         self,
         res: search_get_pb2.GroupByResult,
         options: _QueryOptions,
-    ) -> Group[Any, Any]:
+    ) -> Group[Any, Any, Any]:
         return Group(
             objects=[
                 self.__result_to_group_by_object(obj.properties, obj.metadata, options, res.name)
@@ -341,7 +453,7 @@ class _BaseQuery(Generic[Properties, References]):
         self,
         res: search_get_pb2.GroupByResult,
         options: _QueryOptions,
-    ) -> GenerativeGroup[Any, Any]:
+    ) -> GenerativeGroup[Any, Any, Any]:
         return GenerativeGroup(
             objects=[
                 self.__result_to_group_by_object(obj.properties, obj.metadata, options, res.name)
@@ -361,7 +473,7 @@ class _BaseQuery(Generic[Properties, References]):
         meta: search_get_pb2.MetadataResult,
         options: _QueryOptions,
         group_name: str,
-    ) -> GroupByObject[Any, Any]:
+    ) -> GroupByObject[Any, Any, Any]:
         return GroupByObject(
             collection=props.target_collection,
             properties=(
@@ -375,10 +487,16 @@ class _BaseQuery(Generic[Properties, References]):
                 else GroupByMetadataReturn()
             ),
             references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
+                self.__parse_ref_properties_result(props, options.vector_format)
+                if options.include_references
+                else None
             ),
             uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
+            vector=(
+                self.__extract_vector_for_object(meta, options.vector_format)
+                if options.include_vector
+                else {}
+            ),
             belongs_to_group=group_name,
         )
 
@@ -400,6 +518,16 @@ class _BaseQuery(Generic[Properties, References]):
         QueryReturn[TProperties, CrossReferences],
         QueryReturn[TProperties, TReferences],
     ]:
+        if options.return_format == "lazy":
+            decoder = _LazyObjectDecoder(
+                options=options,
+                properties=self.__parse_nonref_properties_result,
+                metadata=self.__extract_metadata_for_object,
+                references=self.__parse_ref_properties_result,
+                vector=self.__extract_vector_for_object,
+                uuid=self.__extract_id_for_object,
+            )
+            return QueryReturn(objects=[_LazyObject(obj, decoder) for obj in res.results])
         return QueryReturn(
             objects=[
                 self.__result_to_query_object(obj.properties, obj.metadata, options)
@@ -514,6 +642,57 @@ class _BaseQuery(Generic[Properties, References]):
             ),
         )
 
+    def _result_to_columnar_return(
+        self,
+        res: search_get_pb2.SearchReply,
+        options: _QueryOptions,
+    ) -> ColumnarReturn:
+        n = len(res.results)
+        uuids: List[uuid_lib.UUID] = []
+        uuid_bytes: List[bytes] = []
+        properties: Dict[str, List[Any]] = {}
+        metadata: Dict[str, List[Any]] = {}
+        vector_bytes: Dict[str, List[bytes]] = {}
+
+        for i, obj in enumerate(res.results):
+            meta = obj.metadata
+            uuids.append(self.__extract_id_for_object(meta))
+            uuid_bytes.append(meta.id_as_bytes)
+            if options.include_properties:
+                for name, value in obj.properties.non_ref_props.fields.items():
+                    column = properties.get(name)
+                    if column is None:
+                        column = properties[name] = [None] * n
+                    column[i] = self.__deserialize_non_ref_prop(value)
+            if options.include_metadata:
+                for name, present, field in _COLUMNAR_METADATA:
+                    if not getattr(meta, present):
+                        continue
+                    column = metadata.get(name)
+                    if column is None:
+                        column = metadata[name] = [None] * n
+                    value = getattr(meta, field)
+                    column[i] = (
+                        self.__retrieve_timestamp(value) if field.endswith("_unix") else value
+                    )
+            if options.include_vector:
+                if len(meta.vector_bytes) > 0:
+                    vector_bytes.setdefault("default", [b""] * n)[i] = meta.vector_bytes
+                for vec in meta.vectors:
+                    vector_bytes.setdefault(vec.name, [b""] * n)[i] = vec.vector_bytes
+
+        return ColumnarReturn(
+            collection=res.results[0].properties.target_collection if n > 0 else self._name,
+            uuids=uuids,
+            properties=properties,
+            metadata=metadata,
+            vectors={
+                name: _ByteOps.decode_float32_matrix(vectors)
+                for name, vectors in vector_bytes.items()
+            },
+            _uuid_bytes=b"".join(uuid_bytes),
+        )
+
     def _result_to_query_or_groupby_return(
         self,
         res: search_get_pb2.SearchReply,
@@ -524,13 +703,53 @@ class _BaseQuery(Generic[Properties, References]):
         references: Optional[
             ReturnReferences[TReferences]
         ],  # required until 3.12 is minimum supported version to use new generics syntax
-    ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
+    ) -> Union[
+        QuerySearchReturnType[Properties, References, TProperties, TReferences], ColumnarReturn
+    ]:
+        if options.return_format == "columnar":
+            return self._result_to_columnar_return(res, options)
         return (
             self._result_to_query_return(res, options, properties, references)
             if not options.is_group_by
             else self._result_to_groupby_return(res, options, properties, references)
         )
 
+    def _result_to_query_single_return(
+        self,
+        res: search_get_pb2.SearchReply,
+        options: _QueryOptions,
+        properties: Optional[
+            ReturnProperties[TProperties]
+        ],  # required until 3.12 is minimum supported version to use new generics syntax
+        references: Optional[
+            ReturnReferences[TReferences]
+        ],  # required until 3.12 is minimum supported version to use new generics syntax
+    ) -> Optional[QuerySingleReturn[Properties, References, TProperties, TReferences]]:
+        objects = self._result_to_query_return(res, options, properties, references)
+        if len(objects.objects) == 0:
+            return None
+
+        obj = objects.objects[0]
+        assert obj.metadata is not None
+        assert obj.metadata.creation_time is not None
+        assert obj.metadata.last_update_time is not None
+
+        return cast(
+            QuerySingleReturn[Properties, References, TProperties, TReferences],
+            ObjectSingleReturn(
+                uuid=obj.uuid,
+                vector=obj.vector,
+                properties=obj.properties,
+                metadata=MetadataSingleObjectReturn(
+                    creation_time=obj.metadata.creation_time,
+                    last_update_time=obj.metadata.last_update_time,
+                    is_consistent=obj.metadata.is_consistent,
+                ),
+                references=obj.references,
+                collection=obj.collection,
+            ),
+        )
+
     def _parse_return_properties(
         self,
         return_properties: Optional[ReturnProperties[TProperties]],
@@ -565,7 +784,10 @@ class _BaseQuery(Generic[Properties, References]):
             )  # is sourced from query-specific generic
 
     def _parse_return_metadata(
-        self, return_metadata: Optional[METADATA], include_vector: INCLUDE_VECTOR
+        self,
+        return_metadata: Optional[METADATA],
+        include_vector: INCLUDE_VECTOR,
+        vector_format: VECTOR_FORMAT,
     ) -> Optional[_MetadataQuery]:
         if self._validate_arguments:
             _validate_input(
@@ -574,6 +796,7 @@ class _BaseQuery(Generic[Properties, References]):
                         [Sequence[str], MetadataQuery, None], "return_metadata", return_metadata
                     ),
                     _ValidateArgument([bool, str, Sequence], "include_vector", include_vector),
+                    _ValidateArgument([VECTOR_FORMAT], "vector_format", vector_format),
                 ]
             )
         if return_metadata is None:
@@ -620,3 +843,56 @@ class _BaseQuery(Generic[Properties, References]):
             raise WeaviateInvalidInputError(
                 f"media must be a string, pathlib.Path, or io.BufferedReader but is {type(media)}"
             )
+
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+Q = TypeVar("Q", bound=_BaseQuery)
+_Params = ParamSpec("_Params")
+
+
+@dataclass
+class _Search(Generic[T]):
+    """The request of a query method and how to convert its reply into what the method returns."""
+
+    request: search_get_pb2.SearchRequest
+    convert: Callable[[search_get_pb2.SearchReply], T]
+
+
+def _search(
+    prepare: Callable[Concatenate[Q, _Params], _Search[T]]
+) -> Callable[Concatenate[Q, _Params], T]:
+    """Create a query method that sends the request that `prepare` builds and returns the converted reply.
+
+    The method is named like `prepare` without its leading underscore and has its docstring.
+    """
+
+    @functools.wraps(prepare)
+    def search(self: Q, *args: _Params.args, **kwargs: _Params.kwargs) -> T:
+        prepared = prepare(self, *args, **kwargs)
+        return prepared.convert(self._query.call(prepared.request))
+
+    return _named_after(search, prepare)
+
+
+def _asearch(
+    prepare: Callable[Concatenate[Q, _Params], _Search[T]]
+) -> Callable[Concatenate[Q, _Params], Coroutine[Any, Any, T]]:
+    """Create a query method like `_search` does, but as a coroutine that uses the async gRPC channel."""
+
+    @functools.wraps(prepare)
+    async def asearch(self: Q, *args: _Params.args, **kwargs: _Params.kwargs) -> T:
+        prepared = prepare(self, *args, **kwargs)
+        return prepared.convert(await self._query.acall(prepared.request))
+
+    return _named_after(asearch, prepare)
+
+
+def _named_after(method: F, prepare: Callable[..., Any]) -> F:
+    method.__name__ = prepare.__name__.lstrip("_")
+    method.__qualname__ = method.__qualname__.rsplit(".", 1)[0] + "." + method.__name__
+    return method
+
+
+class _BaseQueryAsync(Generic[Properties, References], _BaseQuery[Properties, References]):
+    """The base of the async query mixins, which create their query methods with `_asearch`."""
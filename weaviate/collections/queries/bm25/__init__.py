@@ -1,7 +1,9 @@
-from .generate import _BM25Generate
-from .query import _BM25Query
+from .generate import _BM25Generate, _BM25GenerateAsync
+from .query import _BM25Query, _BM25QueryAsync
 
 __all__ = [
     "_BM25Generate",
+    "_BM25GenerateAsync",
     "_BM25Query",
+    "_BM25QueryAsync",
 ]
@@ -13,14 +13,20 @@ from weaviate.collections.classes.internal import (
     _GroupBy,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
+from weaviate.collections.queries.base import (
+    _BaseQuery,
+    _BaseQueryAsync,
+    _Search,
+    _asearch,
+    _search,
+)
 from weaviate.exceptions import WeaviateUnsupportedFeatureError
 
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT
 
 
 class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, References]):
-    def bm25(
+    def _bm25(
         self,
         query: Optional[str],
         *,
@@ -35,10 +41,11 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         group_by: Optional[GroupBy] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> GenerativeSearchReturnType[Properties, References, TProperties, TReferences]:
+    ) -> _Search[GenerativeSearchReturnType[Properties, References, TProperties, TReferences]]:
         """Perform retrieval-augmented generation (RaG) on the results of a keyword-based BM25 search of objects in this collection.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/bm25) for a more detailed explanation.
@@ -68,6 +75,8 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
                 How the results should be reranked. NOTE: A `rerank-*` module must be enabled for this functionality to work.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format in which to return the vectors, either `"list"` (default) or `"numpy"`. With `"numpy"` the vectors are read-only float32 `numpy.ndarray` views over the returned bytes. Falls back to `"list"` if `numpy` is not installed.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -94,7 +103,17 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
             raise WeaviateUnsupportedFeatureError(
                 "BM25 group by", self._connection.server_version, "1.25.0"
             )
-        res = self._query.bm25(
+        options = _QueryOptions.from_input(
+            return_metadata=return_metadata,
+            return_properties=return_properties,
+            include_vector=include_vector,
+            collection_references=self._references,
+            query_references=return_references,
+            rerank=rerank,
+            group_by=group_by,
+            vector_format=vector_format,
+        )
+        request = self._query.bm25(
             query=query,
             properties=query_properties,
             limit=limit,
@@ -103,7 +122,9 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
             filters=filters,
             group_by=_GroupBy.from_input(group_by),
             rerank=rerank,
-            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_metadata=self._parse_return_metadata(
+                return_metadata, include_vector, vector_format
+            ),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
             generative=_Generative(
@@ -112,17 +133,19 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
                 grouped_properties=grouped_properties,
             ),
         )
-        return self._result_to_generative_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata=return_metadata,
-                return_properties=return_properties,
-                include_vector=include_vector,
-                collection_references=self._references,
-                query_references=return_references,
-                rerank=rerank,
-                group_by=group_by,
+        return _Search(
+            request,
+            lambda res: self._result_to_generative_return(
+                res, options, return_properties, return_references
             ),
-            return_properties,
-            return_references,
         )
+
+    bm25 = _search(_bm25)
+
+
+class _BM25GenerateAsync(
+    Generic[Properties, References],
+    _BM25Generate[Properties, References],
+    _BaseQueryAsync[Properties, References],
+):
+    bm25 = _asearch(_BM25Generate._bm25)
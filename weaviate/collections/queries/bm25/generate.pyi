@@ -10,8 +10,8 @@ from weaviate.collections.classes.internal import (
     CrossReferences,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.collections.queries.base import _BaseQuery, _BaseQueryAsync
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT, NUMPY_VECTOR
 
 class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, References]):
     @overload
@@ -31,6 +31,7 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -52,6 +53,29 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> GenerativeReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -73,6 +97,29 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> GenerativeReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -94,6 +141,29 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> GenerativeReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -115,6 +185,29 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> GenerativeReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -136,10 +229,55 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> GenerativeReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
     ) -> GenerativeReturn[TProperties, TReferences]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> GenerativeReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
 
     ##### GROUP BY #####
 
@@ -160,6 +298,7 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -181,6 +320,29 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> GenerativeGroupByReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -202,6 +364,29 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> GenerativeGroupByReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -223,6 +408,29 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> GenerativeGroupByReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -244,6 +452,29 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> GenerativeGroupByReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -265,7 +496,585 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> GenerativeGroupByReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
     ) -> GenerativeGroupByReturn[TProperties, TReferences]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> GenerativeGroupByReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
+
+class _BM25GenerateAsync(Generic[Properties, References], _BaseQueryAsync[Properties, References]):
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> GenerativeReturn[Properties, References]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> GenerativeReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> GenerativeReturn[Properties, CrossReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> GenerativeReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> GenerativeReturn[Properties, TReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> GenerativeReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> GenerativeReturn[TProperties, References]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> GenerativeReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> GenerativeReturn[TProperties, CrossReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> GenerativeReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> GenerativeReturn[TProperties, TReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> GenerativeReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
+
+    ##### GROUP BY #####
+
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> GenerativeGroupByReturn[Properties, References]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> GenerativeGroupByReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> GenerativeGroupByReturn[Properties, CrossReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> GenerativeGroupByReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> GenerativeGroupByReturn[Properties, TReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> GenerativeGroupByReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> GenerativeGroupByReturn[TProperties, References]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> GenerativeGroupByReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> GenerativeGroupByReturn[TProperties, CrossReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> GenerativeGroupByReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> GenerativeGroupByReturn[TProperties, TReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> GenerativeGroupByReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
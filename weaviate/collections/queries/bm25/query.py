@@ -1,10 +1,11 @@
-from typing import Generic, List, Optional
+from typing import Generic, List, Optional, Union
 
 from weaviate.collections.classes.filters import (
     _Filters,
 )
 from weaviate.collections.classes.grpc import GroupBy, Rerank, METADATA
 from weaviate.collections.classes.internal import (
+    ColumnarReturn,
     QuerySearchReturnType,
     ReturnProperties,
     ReturnReferences,
@@ -12,13 +13,19 @@ from weaviate.collections.classes.internal import (
     _GroupBy,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
+from weaviate.collections.queries.base import (
+    _BaseQuery,
+    _BaseQueryAsync,
+    _Search,
+    _asearch,
+    _search,
+)
 from weaviate.exceptions import WeaviateUnsupportedFeatureError
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT, RETURN_FORMAT
 
 
 class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, References]):
-    def bm25(
+    def _bm25(
         self,
         query: Optional[str],
         *,
@@ -30,10 +37,16 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         group_by: Optional[GroupBy] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
+    ) -> _Search[
+        Union[
+            QuerySearchReturnType[Properties, References, TProperties, TReferences], ColumnarReturn
+        ]
+    ]:
         """Search for objects in this collection using the keyword-based BM25 algorithm.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/bm25) for a more detailed explanation.
@@ -57,6 +70,10 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
                 How the results should be reranked. NOTE: A `rerank-*` module must be enabled for this functionality to work.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format in which to return the vectors, either `"list"` (default) or `"numpy"`. With `"numpy"` the vectors are read-only float32 `numpy.ndarray` views over the returned bytes. Falls back to `"list"` if `numpy` is not installed.
+            `return_format`
+                The format in which to return the results, either `"objects"` (default), `"lazy"` or `"columnar"`. With `"lazy"` the returned objects only decode their properties, metadata, references and vectors when these are first accessed. With `"columnar"` a `ColumnarReturn` is returned that stores one column per property and metadata field and one matrix per vector, it does not support `return_references`. Neither `"lazy"` nor `"columnar"` supports `group_by`.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -70,6 +87,7 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         Returns:
             A `QueryReturn` or `GroupByReturn` object that includes the searched objects.
             If `group_by` is provided then a `GroupByReturn` object is returned, otherwise a `QueryReturn` object is returned.
+            If `return_format="columnar"` is provided then a `ColumnarReturn` object is returned instead.
 
         Raises:
             `weaviate.exceptions.WeaviateQueryError`:
@@ -81,7 +99,18 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
             raise WeaviateUnsupportedFeatureError(
                 "BM25 group by", self._connection.server_version, "1.25.0"
             )
-        res = self._query.bm25(
+        options = _QueryOptions.from_input(
+            return_metadata=return_metadata,
+            return_properties=return_properties,
+            include_vector=include_vector,
+            collection_references=self._references,
+            query_references=return_references,
+            rerank=rerank,
+            group_by=group_by,
+            vector_format=vector_format,
+            return_format=return_format,
+        )
+        request = self._query.bm25(
             query=query,
             properties=query_properties,
             limit=limit,
@@ -89,22 +118,26 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
             autocut=auto_limit,
             filters=filters,
             group_by=_GroupBy.from_input(group_by),
-            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_metadata=self._parse_return_metadata(
+                return_metadata, include_vector, vector_format
+            ),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
             rerank=rerank,
         )
-        return self._result_to_query_or_groupby_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata=return_metadata,
-                return_properties=return_properties,
-                include_vector=include_vector,
-                collection_references=self._references,
-                query_references=return_references,
-                rerank=rerank,
-                group_by=group_by,
+        return _Search(
+            request,
+            lambda res: self._result_to_query_or_groupby_return(
+                res, options, return_properties, return_references
             ),
-            return_properties,
-            return_references,
         )
+
+    bm25 = _search(_bm25)
+
+
+class _BM25QueryAsync(
+    Generic[Properties, References],
+    _BM25Query[Properties, References],
+    _BaseQueryAsync[Properties, References],
+):
+    bm25 = _asearch(_BM25Query._bm25)
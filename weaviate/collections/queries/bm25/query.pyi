@@ -5,13 +5,14 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import GroupBy, Rerank, METADATA, PROPERTIES, REFERENCES
 from weaviate.collections.classes.internal import (
+    ColumnarReturn,
     GroupByReturn,
     QueryReturn,
     CrossReferences,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.collections.queries.base import _BaseQuery, _BaseQueryAsync
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT, NUMPY_VECTOR
 
 class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, References]):
     @overload
@@ -28,6 +29,8 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -46,6 +49,28 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> QueryReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -64,6 +89,28 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> QueryReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -82,6 +129,28 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> QueryReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -100,6 +169,28 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> QueryReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -118,10 +209,52 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> QueryReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
     ) -> QueryReturn[TProperties, TReferences]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> QueryReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
 
     ###### GROUP BY ######
 
@@ -139,6 +272,8 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -157,6 +292,28 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> GroupByReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -175,6 +332,28 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> GroupByReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -193,6 +372,28 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> GroupByReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -211,6 +412,28 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> GroupByReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -229,7 +452,574 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> GroupByReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
     ) -> GroupByReturn[TProperties, TReferences]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> GroupByReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: Literal["columnar"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> ColumnarReturn: ...
+
+class _BM25QueryAsync(Generic[Properties, References], _BaseQueryAsync[Properties, References]):
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> QueryReturn[Properties, References]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> QueryReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> QueryReturn[Properties, CrossReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> QueryReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> QueryReturn[Properties, TReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> QueryReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> QueryReturn[TProperties, References]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> QueryReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> QueryReturn[TProperties, CrossReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> QueryReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> QueryReturn[TProperties, TReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> QueryReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
+
+    ###### GROUP BY ######
+
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> GroupByReturn[Properties, References]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> GroupByReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> GroupByReturn[Properties, CrossReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> GroupByReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> GroupByReturn[Properties, TReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> GroupByReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> GroupByReturn[TProperties, References]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> GroupByReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> GroupByReturn[TProperties, CrossReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> GroupByReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> GroupByReturn[TProperties, TReferences]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> GroupByReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: Literal["columnar"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> ColumnarReturn: ...
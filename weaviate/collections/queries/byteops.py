@@ -1,12 +1,80 @@
 import struct
-from typing import List
+from typing import Any, List
+
+from weaviate.util import _get_vector_v4
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    _HAS_NUMPY = False
 
 
 class _ByteOps:
+    @staticmethod
+    def is_float_array(vector: Any) -> bool:
+        """Whether `vector` is a numeric `numpy.ndarray` holding a single vector that can be encoded from its buffer."""
+        return (
+            _HAS_NUMPY
+            and isinstance(vector, np.ndarray)
+            and vector.dtype.kind in "fiu"
+            and sum(dim != 1 for dim in vector.shape) <= 1
+        )
+
+    @staticmethod
+    def encode_float32s(vector: Any) -> bytes:
+        """Encode a vector into float32 bytes.
+
+        Arrays accepted by `is_float_array` are written straight from their buffer and only converted when their dtype
+        is not float32 or they are not contiguous. Any other supported vector type is converted to a list first.
+        """
+        if _ByteOps.is_float_array(vector):
+            return np.ascontiguousarray(vector, dtype=np.float32).tobytes()
+        vector_list = _get_vector_v4(vector)
+        return struct.pack("{}f".format(len(vector_list)), *vector_list)
+
+    @staticmethod
+    def float32_rows(matrix: Any) -> Any:
+        """Convert a 2-D numeric `numpy.ndarray` once into a contiguous float32 array.
+
+        Its rows are then views that `encode_float32s` writes without any further conversion. Anything else is
+        returned unchanged.
+        """
+        if _HAS_NUMPY and isinstance(matrix, np.ndarray) and matrix.ndim == 2:
+            return np.ascontiguousarray(matrix, dtype=np.float32)
+        return matrix
+
     @staticmethod
     def decode_float32s(byte_vector: bytes) -> List[float]:
         return [float(val) for val in struct.unpack(f"{len(byte_vector)//4}f", byte_vector)]
 
+    @staticmethod
+    def decode_float32s_numpy(byte_vector: bytes) -> Any:
+        """Decode the bytes into a read-only float32 `numpy.ndarray` that shares memory with `byte_vector`.
+
+        If `numpy` is not installed, this falls back to `decode_float32s` and returns a list.
+        """
+        if not _HAS_NUMPY:
+            return _ByteOps.decode_float32s(byte_vector)
+        return np.frombuffer(byte_vector, dtype=np.float32)
+
+    @staticmethod
+    def decode_float32_matrix(byte_vectors: List[bytes]) -> Any:
+        """Decode equally sized byte vectors into one 2-D float32 `numpy.ndarray` with one row per vector.
+
+        If `numpy` is not installed, or the vectors differ in length, a list with one decoded vector per row is returned.
+        """
+        if not _HAS_NUMPY:
+            return [_ByteOps.decode_float32s(byte_vector) for byte_vector in byte_vectors]
+        if len(byte_vectors) == 0:
+            return np.empty((0, 0), dtype=np.float32)
+        if len({len(byte_vector) for byte_vector in byte_vectors}) > 1:
+            return [_ByteOps.decode_float32s_numpy(byte_vector) for byte_vector in byte_vectors]
+        return np.frombuffer(b"".join(byte_vectors), dtype=np.float32).reshape(
+            len(byte_vectors), -1
+        )
+
     @staticmethod
     def decode_float64s(byte_vector: bytes) -> List[float]:
         return [float(val) for val in struct.unpack(f"{len(byte_vector)//8}d", byte_vector)]
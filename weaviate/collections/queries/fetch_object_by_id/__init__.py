@@ -1,5 +1,6 @@
-from .query import _FetchObjectByIDQuery
+from .query import _FetchObjectByIDQuery, _FetchObjectByIDQueryAsync
 
 __all__ = [
     "_FetchObjectByIDQuery",
+    "_FetchObjectByIDQueryAsync",
 ]
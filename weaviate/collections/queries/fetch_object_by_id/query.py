@@ -1,7 +1,6 @@
 from typing import (
     Generic,
     Optional,
-    cast,
 )
 
 from weaviate.collections.classes.filters import (
@@ -9,27 +8,32 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import MetadataQuery
 from weaviate.collections.classes.internal import (
-    ObjectSingleReturn,
-    MetadataSingleObjectReturn,
     QuerySingleReturn,
     ReturnProperties,
     ReturnReferences,
     _QueryOptions,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import INCLUDE_VECTOR, UUID
+from weaviate.collections.queries.base import (
+    _BaseQuery,
+    _BaseQueryAsync,
+    _Search,
+    _asearch,
+    _search,
+)
+from weaviate.types import INCLUDE_VECTOR, UUID, VECTOR_FORMAT
 
 
 class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
-    def fetch_object_by_id(
+    def _fetch_object_by_id(
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
         *,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> Optional[QuerySingleReturn[Properties, References, TProperties, TReferences]]:
+        vector_format: VECTOR_FORMAT = "list",
+    ) -> _Search[Optional[QuerySingleReturn[Properties, References, TProperties, TReferences]]]:
         """Retrieve an object from the server by its UUID.
 
         Arguments:
@@ -37,6 +41,8 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
                 The UUID of the object to retrieve, REQUIRED.
             `include_vector`
                 Whether to include the vector in the returned object.
+            `vector_format`
+                The format in which to return the vectors, either `"list"` (default) or `"numpy"`. With `"numpy"` the vectors are read-only float32 `numpy.ndarray` views over the returned bytes. Falls back to `"list"` if `numpy` is not installed.
             `return_properties`
                 The properties to return for each object.
             `return_references`
@@ -56,46 +62,34 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
         return_metadata = MetadataQuery(
             creation_time=True, last_update_time=True, is_consistent=True
         )
-        res = self._query.get(
+        options = _QueryOptions.from_input(
+            return_metadata,
+            return_properties,
+            include_vector,
+            self._references,
+            return_references,
+            vector_format=vector_format,
+        )
+        request = self._query.get(
             limit=1,
             filters=Filter.by_id().equal(uuid),
-            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_metadata=self._parse_return_metadata(
+                return_metadata, include_vector, vector_format
+            ),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        objects = self._result_to_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
-                return_properties,
-                include_vector,
-                self._references,
-                return_references,
-            ),
-            return_properties,
-            None,
+        return _Search(
+            request,
+            lambda res: self._result_to_query_single_return(res, options, return_properties, None),
         )
 
-        if len(objects.objects) == 0:
-            return None
+    fetch_object_by_id = _search(_fetch_object_by_id)
 
-        obj = objects.objects[0]
-        assert obj.metadata is not None
-        assert obj.metadata.creation_time is not None
-        assert obj.metadata.last_update_time is not None
 
-        return cast(
-            QuerySingleReturn[Properties, References, TProperties, TReferences],
-            ObjectSingleReturn(
-                uuid=obj.uuid,
-                vector=obj.vector,
-                properties=obj.properties,
-                metadata=MetadataSingleObjectReturn(
-                    creation_time=obj.metadata.creation_time,
-                    last_update_time=obj.metadata.last_update_time,
-                    is_consistent=obj.metadata.is_consistent,
-                ),
-                references=obj.references,
-                collection=obj.collection,
-            ),
-        )
+class _FetchObjectByIDQueryAsync(
+    Generic[Properties, References],
+    _FetchObjectByIDQuery[Properties, References],
+    _BaseQueryAsync[Properties, References],
+):
+    fetch_object_by_id = _asearch(_FetchObjectByIDQuery._fetch_object_by_id)
@@ -12,8 +12,8 @@ from weaviate.collections.classes.internal import (
     CrossReferences,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import INCLUDE_VECTOR, UUID
+from weaviate.collections.queries.base import _BaseQuery, _BaseQueryAsync
+from weaviate.types import INCLUDE_VECTOR, UUID, VECTOR_FORMAT, NUMPY_VECTOR
 
 class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
     @overload
@@ -24,8 +24,19 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
+        vector_format: Literal["list"] = "list",
     ) -> ObjectSingleReturn[Properties, References]: ...
     @overload
+    def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
     def fetch_object_by_id(
         self,
         uuid: UUID,
@@ -33,8 +44,19 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
+        vector_format: Literal["list"] = "list",
     ) -> ObjectSingleReturn[Properties, CrossReferences]: ...
     @overload
+    def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
     def fetch_object_by_id(
         self,
         uuid: UUID,
@@ -42,8 +64,19 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
+        vector_format: Literal["list"] = "list",
     ) -> ObjectSingleReturn[Properties, TReferences]: ...
     @overload
+    def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
     def fetch_object_by_id(
         self,
         uuid: UUID,
@@ -51,8 +84,19 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
         *,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        vector_format: Literal["list"] = "list",
     ) -> ObjectSingleReturn[TProperties, References]: ...
     @overload
+    def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
     def fetch_object_by_id(
         self,
         uuid: UUID,
@@ -60,8 +104,19 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
         *,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        vector_format: Literal["list"] = "list",
     ) -> ObjectSingleReturn[TProperties, CrossReferences]: ...
     @overload
+    def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
     def fetch_object_by_id(
         self,
         uuid: UUID,
@@ -69,4 +124,139 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
         *,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        vector_format: Literal["list"] = "list",
     ) -> ObjectSingleReturn[TProperties, TReferences]: ...
+    @overload
+    def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
+
+class _FetchObjectByIDQueryAsync(
+    Generic[Properties, References], _BaseQueryAsync[Properties, References]
+):
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+        vector_format: Literal["list"] = "list",
+    ) -> ObjectSingleReturn[Properties, References]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+        vector_format: Literal["list"] = "list",
+    ) -> ObjectSingleReturn[Properties, CrossReferences]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+        vector_format: Literal["list"] = "list",
+    ) -> ObjectSingleReturn[Properties, TReferences]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        vector_format: Literal["list"] = "list",
+    ) -> ObjectSingleReturn[TProperties, References]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        vector_format: Literal["list"] = "list",
+    ) -> ObjectSingleReturn[TProperties, CrossReferences]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        vector_format: Literal["list"] = "list",
+    ) -> ObjectSingleReturn[TProperties, TReferences]: ...
+    @overload
+    async def fetch_object_by_id(
+        self,
+        uuid: UUID,
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        vector_format: Literal["numpy"],
+    ) -> ObjectSingleReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
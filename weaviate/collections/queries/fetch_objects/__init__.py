@@ -1,7 +1,9 @@
-from .generate import _FetchObjectsGenerate
-from .query import _FetchObjectsQuery
+from .generate import _FetchObjectsGenerate, _FetchObjectsGenerateAsync
+from .query import _FetchObjectsQuery, _FetchObjectsQueryAsync
 
 __all__ = [
     "_FetchObjectsGenerate",
+    "_FetchObjectsGenerateAsync",
     "_FetchObjectsQuery",
+    "_FetchObjectsQueryAsync",
 ]
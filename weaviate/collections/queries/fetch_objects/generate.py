@@ -5,19 +5,25 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import METADATA, _Sorting
 from weaviate.collections.classes.internal import (
-    GenerativeReturnType,
+    GenerativeSearchReturnType,
     _Generative,
     ReturnProperties,
     ReturnReferences,
     _QueryOptions,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.collections.queries.base import (
+    _BaseQuery,
+    _BaseQueryAsync,
+    _Search,
+    _asearch,
+    _search,
+)
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT
 
 
 class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properties, References]):
-    def fetch_objects(
+    def _fetch_objects(
         self,
         *,
         single_prompt: Optional[str] = None,
@@ -29,10 +35,11 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
         filters: Optional[_Filters] = None,
         sort: Optional[_Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None
-    ) -> GenerativeReturnType[Properties, References, TProperties, TReferences]:
+    ) -> _Search[GenerativeSearchReturnType[Properties, References, TProperties, TReferences]]:
         """Perform retrieval-augmented generation (RaG) on the results of a simple get query of objects in this collection.
 
         Arguments:
@@ -54,6 +61,8 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
                 The sorting to apply to the retrieval.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format in which to return the vectors, either `"list"` (default) or `"numpy"`. With `"numpy"` the vectors are read-only float32 `numpy.ndarray` views over the returned bytes. Falls back to `"list"` if `numpy` is not installed.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -73,13 +82,23 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the network connection to Weaviate fails.
         """
-        res = self._query.get(
+        options = _QueryOptions.from_input(
+            return_metadata,
+            return_properties,
+            include_vector,
+            self._references,
+            return_references,
+            vector_format=vector_format,
+        )
+        request = self._query.get(
             limit=limit,
             offset=offset,
             after=after,
             filters=filters,
             sort=sort,
-            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_metadata=self._parse_return_metadata(
+                return_metadata, include_vector, vector_format
+            ),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
             generative=_Generative(
@@ -88,15 +107,19 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
                 grouped_properties=grouped_properties,
             ),
         )
-        return self._result_to_generative_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
-                return_properties,
-                include_vector,
-                self._references,
-                return_references,
+        return _Search(
+            request,
+            lambda res: self._result_to_generative_return(
+                res, options, return_properties, return_references
             ),
-            return_properties,
-            return_references,
         )
+
+    fetch_objects = _search(_fetch_objects)
+
+
+class _FetchObjectsGenerateAsync(
+    Generic[Properties, References],
+    _FetchObjectsGenerate[Properties, References],
+    _BaseQueryAsync[Properties, References],
+):
+    fetch_objects = _asearch(_FetchObjectsGenerate._fetch_objects)
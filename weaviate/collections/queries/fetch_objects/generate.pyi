@@ -14,8 +14,8 @@ from weaviate.collections.classes.internal import (
     CrossReferences,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.collections.queries.base import _BaseQuery, _BaseQueryAsync
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT, NUMPY_VECTOR
 
 class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properties, References]):
     @overload
@@ -32,6 +32,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
         sort: Optional[Union[Sort, List[Sort]]] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None
@@ -39,6 +40,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
     @overload
     def fetch_objects(
         self,
+        *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
         grouped_properties: Optional[List[str]] = None,
@@ -49,12 +51,50 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
         sort: Optional[Union[Sort, List[Sort]]] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None
+    ) -> GenerativeReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES
     ) -> GenerativeReturn[Properties, CrossReferences]: ...
     @overload
+    def fetch_objects(
+        self,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        vector_format: Literal["numpy"],
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES
+    ) -> GenerativeReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
     def fetch_objects(
         self,
         *,
@@ -68,6 +108,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
         sort: Optional[Union[Sort, List[Sort]]] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences]
@@ -86,6 +127,26 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
         sort: Optional[Union[Sort, List[Sort]]] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences]
+    ) -> GenerativeReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None
@@ -104,6 +165,26 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
         sort: Optional[Union[Sort, List[Sort]]] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None
+    ) -> GenerativeReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES
@@ -122,7 +203,278 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
         sort: Optional[Union[Sort, List[Sort]]] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES
+    ) -> GenerativeReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences]
     ) -> GenerativeReturn[TProperties, TReferences]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences]
+    ) -> GenerativeReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
+
+class _FetchObjectsGenerateAsync(
+    Generic[Properties, References], _BaseQueryAsync[Properties, References]
+):
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None
+    ) -> GenerativeReturn[Properties, References]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None
+    ) -> GenerativeReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES
+    ) -> GenerativeReturn[Properties, CrossReferences]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        vector_format: Literal["numpy"],
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES
+    ) -> GenerativeReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences]
+    ) -> GenerativeReturn[Properties, TReferences]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences]
+    ) -> GenerativeReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None
+    ) -> GenerativeReturn[TProperties, References]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None
+    ) -> GenerativeReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES
+    ) -> GenerativeReturn[TProperties, CrossReferences]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES
+    ) -> GenerativeReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences]
+    ) -> GenerativeReturn[TProperties, TReferences]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        single_prompt: Optional[str] = None,
+        grouped_task: Optional[str] = None,
+        grouped_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Union[Sort, List[Sort]]] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences]
+    ) -> GenerativeReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
@@ -1,22 +1,29 @@
-from typing import Generic, Optional
+from typing import Generic, Optional, Union
 
 from weaviate.collections.classes.filters import (
     _Filters,
 )
 from weaviate.collections.classes.grpc import METADATA, _Sorting
 from weaviate.collections.classes.internal import (
+    ColumnarReturn,
     QueryReturnType,
     ReturnProperties,
     ReturnReferences,
     _QueryOptions,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.collections.queries.base import (
+    _BaseQuery,
+    _BaseQueryAsync,
+    _Search,
+    _asearch,
+    _search,
+)
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT, RETURN_FORMAT
 
 
 class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
-    def fetch_objects(
+    def _fetch_objects(
         self,
         *,
         limit: Optional[int] = None,
@@ -25,10 +32,14 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         filters: Optional[_Filters] = None,
         sort: Optional[_Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None
-    ) -> QueryReturnType[Properties, References, TProperties, TReferences]:
+    ) -> _Search[
+        Union[QueryReturnType[Properties, References, TProperties, TReferences], ColumnarReturn]
+    ]:
         """Retrieve the objects in this collection without any search.
 
         Arguments:
@@ -44,6 +55,10 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
                 The sorting to apply to the retrieval.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format in which to return the vectors, either `"list"` (default) or `"numpy"`. With `"numpy"` the vectors are read-only float32 `numpy.ndarray` views over the returned bytes. Falls back to `"list"` if `numpy` is not installed.
+            `return_format`
+                The format in which to return the results, either `"objects"` (default), `"lazy"` or `"columnar"`. With `"lazy"` the returned objects only decode their properties, metadata, references and vectors when these are first accessed. With `"columnar"` a `ColumnarReturn` is returned that stores one column per property and metadata field and one matrix per vector, it does not support `return_references`. Neither `"lazy"` nor `"columnar"` supports `group_by`.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -58,30 +73,46 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
 
         Returns:
             A `QueryReturn` object that includes the searched objects.
+            If `return_format="columnar"` is provided then a `ColumnarReturn` object is returned instead.
 
         Raises:
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the network connection to Weaviate fails.
         """
-        res = self._query.get(
+        options = _QueryOptions.from_input(
+            return_metadata,
+            return_properties,
+            include_vector,
+            self._references,
+            return_references,
+            vector_format=vector_format,
+            return_format=return_format,
+        )
+        request = self._query.get(
             limit=limit,
             offset=offset,
             after=after,
             filters=filters,
             sort=sort,
-            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_metadata=self._parse_return_metadata(
+                return_metadata, include_vector, vector_format
+            ),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
-                return_properties,
-                include_vector,
-                self._references,
-                return_references,
+        return _Search(
+            request,
+            lambda res: self._result_to_query_or_groupby_return(
+                res, options, return_properties, return_references
             ),
-            return_properties,
-            return_references,
         )
+
+    fetch_objects = _search(_fetch_objects)
+
+
+class _FetchObjectsQueryAsync(
+    Generic[Properties, References],
+    _FetchObjectsQuery[Properties, References],
+    _BaseQueryAsync[Properties, References],
+):
+    fetch_objects = _asearch(_FetchObjectsQuery._fetch_objects)
@@ -5,6 +5,7 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES, _Sort, _Sorting
 from weaviate.collections.classes.internal import (
+    ColumnarReturn,
     QueryReturn,
     CrossReferences,
     ReturnProperties,
@@ -12,8 +13,8 @@ from weaviate.collections.classes.internal import (
     QueryReturnType,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.collections.queries.base import _BaseQuery, _BaseQueryAsync
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT, NUMPY_VECTOR
 
 class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
     @overload
@@ -27,6 +28,8 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None
@@ -42,6 +45,25 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None
+    ) -> QueryReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES
@@ -57,6 +79,25 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES
+    ) -> QueryReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences]
@@ -72,6 +113,25 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences]
+    ) -> QueryReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None
@@ -87,6 +147,25 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None
+    ) -> QueryReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES
@@ -102,6 +181,25 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES
+    ) -> QueryReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences]
@@ -117,7 +215,285 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences]
+    ) -> QueryReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None
+    ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: Literal["columnar"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None
+    ) -> ColumnarReturn: ...
+
+class _FetchObjectsQueryAsync(
+    Generic[Properties, References], _BaseQueryAsync[Properties, References]
+):
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None
+    ) -> QueryReturn[Properties, References]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None
+    ) -> QueryReturn[Properties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES
+    ) -> QueryReturn[Properties, CrossReferences]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES
+    ) -> QueryReturn[Properties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences]
+    ) -> QueryReturn[Properties, TReferences]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences]
+    ) -> QueryReturn[Properties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None
+    ) -> QueryReturn[TProperties, References]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None
+    ) -> QueryReturn[TProperties, References, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES
+    ) -> QueryReturn[TProperties, CrossReferences]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES
+    ) -> QueryReturn[TProperties, CrossReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences]
+    ) -> QueryReturn[TProperties, TReferences]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["numpy"],
+        return_format: Literal["objects", "lazy"] = "objects",
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences]
+    ) -> QueryReturn[TProperties, TReferences, NUMPY_VECTOR]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Literal["list"] = "list",
+        return_format: Literal["objects", "lazy"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: Literal["columnar"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None
+    ) -> ColumnarReturn: ...
@@ -1,7 +1,9 @@
-from .generate import _HybridGenerate
-from .query import _HybridQuery
+from .generate import _HybridGenerate, _HybridGenerateAsync
+from .query import _HybridQuery, _HybridQueryAsync
 
 __all__ = [
     "_HybridGenerate",
+    "_HybridGenerateAsync",
     "_HybridQuery",
+    "_HybridQueryAsync",
 ]
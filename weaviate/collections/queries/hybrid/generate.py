@@ -19,13 +19,19 @@ from weaviate.collections.classes.internal import (
     _GroupBy,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
+from weaviate.collections.queries.base import (
+    _BaseQuery,
+    _BaseQueryAsync,
+    _Search,
+    _asearch,
+    _search,
+)
 from weaviate.exceptions import WeaviateUnsupportedFeatureError
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import NUMBER, INCLUDE_VECTOR, VECTOR_FORMAT
 
 
 class _HybridGenerate(Generic[Properties, References], _BaseQuery[Properties, References]):
-    def hybrid(
+    def _hybrid(
         self,
         query: Optional[str],
         *,
@@ -44,10 +50,11 @@ class _HybridGenerate(Generic[Properties, References], _BaseQuery[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> GenerativeSearchReturnType[Properties, References, TProperties, TReferences]:
+    ) -> _Search[GenerativeSearchReturnType[Properties, References, TProperties, TReferences]]:
         """Perform retrieval-augmented generation (RaG) on the results of an object search in this collection using the hybrid algorithm blending keyword-based BM25 and vector-based similarity.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/hybrid) for a more detailed explanation.
@@ -85,6 +92,8 @@ class _HybridGenerate(Generic[Properties, References], _BaseQuery[Properties, Re
                 The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format in which to return the vectors, either `"list"` (default) or `"numpy"`. With `"numpy"` the vectors are read-only float32 `numpy.ndarray` views over the returned bytes. Falls back to `"list"` if `numpy` is not installed.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -111,7 +120,17 @@ class _HybridGenerate(Generic[Properties, References], _BaseQuery[Properties, Re
             raise WeaviateUnsupportedFeatureError(
                 "Hybrid group by", self._connection.server_version, "1.25.0"
             )
-        res = self._query.hybrid(
+        options = _QueryOptions.from_input(
+            return_metadata=return_metadata,
+            return_properties=return_properties,
+            include_vector=include_vector,
+            collection_references=self._references,
+            query_references=return_references,
+            rerank=rerank,
+            group_by=group_by,
+            vector_format=vector_format,
+        )
+        request = self._query.hybrid(
             query=query,
             alpha=alpha,
             vector=vector,
@@ -124,7 +143,9 @@ class _HybridGenerate(Generic[Properties, References], _BaseQuery[Properties, Re
             group_by=_GroupBy.from_input(group_by),
             rerank=rerank,
             target_vector=target_vector,
-            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_metadata=self._parse_return_metadata(
+                return_metadata, include_vector, vector_format
+            ),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
             generative=_Generative(
@@ -133,17 +154,19 @@ class _HybridGenerate(Generic[Properties, References], _BaseQuery[Properties, Re
                 grouped_properties=grouped_properties,
             ),
         )
-        return self._result_to_generative_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata=return_metadata,
-                return_properties=return_properties,
-                include_vector=include_vector,
-                collection_references=self._references,
-                query_references=return_references,
-                rerank=rerank,
-                group_by=group_by,
+        return _Search(
+            request,
+            lambda res: self._result_to_generative_return(
+                res, options, return_properties, return_references
             ),
-            return_properties,
-            return_references,
         )
+
+    hybrid = _search(_hybrid)
+
+
+class _HybridGenerateAsync(
+    Generic[Properties, References],
+    _HybridGenerate[Properties, References],
+    _BaseQueryAsync[Properties, References],
+):
+    hybrid = _asearch(_HybridGenerate._hybrid)
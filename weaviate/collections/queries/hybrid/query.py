@@ -1,4 +1,4 @@
-from typing import Generic, List, Optional
+from typing import Generic, List, Optional, Union
 
 from weaviate.collections.classes.filters import (
     _Filters,
@@ -12,6 +12,7 @@ from weaviate.collections.classes.grpc import (
     HybridVectorType,
 )
 from weaviate.collections.classes.internal import (
+    ColumnarReturn,
     QuerySearchReturnType,
     ReturnProperties,
     ReturnReferences,
@@ -19,13 +20,19 @@ from weaviate.collections.classes.internal import (
     _GroupBy,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
+from weaviate.collections.queries.base import (
+    _BaseQuery,
+    _BaseQueryAsync,
+    _Search,
+    _asearch,
+    _search,
+)
 from weaviate.exceptions import WeaviateUnsupportedFeatureError
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import NUMBER, INCLUDE_VECTOR, VECTOR_FORMAT, RETURN_FORMAT
 
 
 class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
-    def hybrid(
+    def _hybrid(
         self,
         query: Optional[str],
         *,
@@ -41,10 +48,16 @@ class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, Refer
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
+    ) -> _Search[
+        Union[
+            QuerySearchReturnType[Properties, References, TProperties, TReferences], ColumnarReturn
+        ]
+    ]:
         """Search for objects in this collection using the hybrid algorithm blending keyword-based BM25 and vector-based similarity.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/hybrid) for a more detailed explanation.
@@ -76,6 +89,10 @@ class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, Refer
                 The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format in which to return the vectors, either `"list"` (default) or `"numpy"`. With `"numpy"` the vectors are read-only float32 `numpy.ndarray` views over the returned bytes. Falls back to `"list"` if `numpy` is not installed.
+            `return_format`
+                The format in which to return the results, either `"objects"` (default), `"lazy"` or `"columnar"`. With `"lazy"` the returned objects only decode their properties, metadata, references and vectors when these are first accessed. With `"columnar"` a `ColumnarReturn` is returned that stores one column per property and metadata field and one matrix per vector, it does not support `return_references`. Neither `"lazy"` nor `"columnar"` supports `group_by`.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -91,6 +108,7 @@ class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, Refer
         Returns:
             A `QueryReturn` or `GroupByReturn` object that includes the searched objects.
             If `group_by` is provided then a `GroupByReturn` object is returned, otherwise a `QueryReturn` object is returned.
+            If `return_format="columnar"` is provided then a `ColumnarReturn` object is returned instead.
 
         Raises:
             `weaviate.exceptions.WeaviateQueryError`:
@@ -102,7 +120,18 @@ class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, Refer
             raise WeaviateUnsupportedFeatureError(
                 "Hybrid group by", self._connection.server_version, "1.25.0"
             )
-        res = self._query.hybrid(
+        options = _QueryOptions.from_input(
+            return_metadata=return_metadata,
+            return_properties=return_properties,
+            include_vector=include_vector,
+            collection_references=self._references,
+            query_references=return_references,
+            rerank=rerank,
+            group_by=group_by,
+            vector_format=vector_format,
+            return_format=return_format,
+        )
+        request = self._query.hybrid(
             query=query,
             alpha=alpha,
             vector=vector,
@@ -115,21 +144,25 @@ class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, Refer
             group_by=_GroupBy.from_input(group_by),
             rerank=rerank,
             target_vector=target_vector,
-            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_metadata=self._parse_return_metadata(
+                return_metadata, include_vector, vector_format
+            ),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_query_or_groupby_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata=return_metadata,
-                return_properties=return_properties,
-                include_vector=include_vector,
-                collection_references=self._references,
-                query_references=return_references,
-                rerank=rerank,
-                group_by=group_by,
+        return _Search(
+            request,
+            lambda res: self._result_to_query_or_groupby_return(
+                res, options, return_properties, return_references
             ),
-            return_properties,
-            return_references,
         )
+
+    hybrid = _search(_hybrid)
+
+
+class _HybridQueryAsync(
+    Generic[Properties, References],
+    _HybridQuery[Properties, References],
+    _BaseQueryAsync[Properties, References],
+):
+    hybrid = _asearch(_HybridQuery._hybrid)
@@ -1,7 +1,9 @@
-from .generate import _NearImageGenerate
-from .query import _NearImageQuery
+from .generate import _NearImageGenerate, _NearImageGenerateAsync
+from .query import _NearImageQuery, _NearImageQueryAsync
 
 __all__ = [
     "_NearImageGenerate",
+    "_NearImageGenerateAsync",
     "_NearImageQuery",
+    "_NearImageQueryAsync",
 ]
@@ -7,6 +7,7 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import METADATA, GroupBy, Rerank
 from weaviate.collections.classes.internal import (
+    ColumnarReturn,
     _GroupBy,
     ReturnProperties,
     ReturnReferences,
@@ -14,12 +15,18 @@ from weaviate.collections.classes.internal import (
     QuerySearchReturnType,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.collections.queries.base import (
+    _BaseQuery,
+    _BaseQueryAsync,
+    _Search,
+    _asearch,
+    _search,
+)
+from weaviate.types import NUMBER, INCLUDE_VECTOR, VECTOR_FORMAT, RETURN_FORMAT
 
 
 class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
-    def near_image(
+    def _near_image(
         self,
         near_image: Union[str, Path, BufferedReader],
         *,
@@ -33,10 +40,16 @@ class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
+    ) -> _Search[
+        Union[
+            QuerySearchReturnType[Properties, References, TProperties, TReferences], ColumnarReturn
+        ]
+    ]:
         """Search for objects by image in this collection using an image-capable vectorization module and vector-based similarity search.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/image) for a more detailed explanation.
@@ -67,6 +80,10 @@ class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, Re
                 The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format in which to return the vectors, either `"list"` (default) or `"numpy"`. With `"numpy"` the vectors are read-only float32 `numpy.ndarray` views over the returned bytes. Falls back to `"list"` if `numpy` is not installed.
+            `return_format`
+                The format in which to return the results, either `"objects"` (default), `"lazy"` or `"columnar"`. With `"lazy"` the returned objects only decode their properties, metadata, references and vectors when these are first accessed. With `"columnar"` a `ColumnarReturn` is returned that stores one column per property and metadata field and one matrix per vector, it does not support `return_references`. Neither `"lazy"` nor `"columnar"` supports `group_by`.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -82,12 +99,24 @@ class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, Re
         Returns:
             A `QueryReturn` or `GroupByReturn` object that includes the searched objects.
             If `group_by` is provided then a `GroupByReturn` object is returned, otherwise a `QueryReturn` object is returned.
+            If `return_format="columnar"` is provided then a `ColumnarReturn` object is returned instead.
 
         Raises:
             `weaviate.exceptions.WeaviateQueryError`:
                 If the request to the Weaviate server fails.
         """
-        res = self._query.near_media(
+        options = _QueryOptions.from_input(
+            return_metadata,
+            return_properties,
+            include_vector,
+            self._references,
+            return_references,
+            rerank,
+            group_by,
+            vector_format=vector_format,
+            return_format=return_format,
+        )
+        request = self._query.near_media(
             media=self._parse_media(near_image),
             type_="image",
             certainty=certainty,
@@ -99,21 +128,25 @@ class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, Re
             group_by=_GroupBy.from_input(group_by),
             rerank=rerank,
             target_vector=target_vector,
-            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_metadata=self._parse_return_metadata(
+                return_metadata, include_vector, vector_format
+            ),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_query_or_groupby_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
-                return_properties,
-                include_vector,
-                self._references,
-                return_references,
-                rerank,
-                group_by,
+        return _Search(
+            request,
+            lambda res: self._result_to_query_or_groupby_return(
+                res, options, return_properties, return_references
             ),
-            return_properties,
-            return_references,
         )
+
+    near_image = _search(_near_image)
+
+
+class _NearImageQueryAsync(
+    Generic[Properties, References],
+    _NearImageQuery[Properties, References],
+    _BaseQueryAsync[Properties, References],
+):
+    near_image = _asearch(_NearImageQuery._near_image)
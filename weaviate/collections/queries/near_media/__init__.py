@@ -1,7 +1,9 @@
-from .generate import _NearMediaGenerate
-from .query import _NearMediaQuery
+from .generate import _NearMediaGenerate, _NearMediaGenerateAsync
+from .query import _NearMediaQuery, _NearMediaQueryAsync
 
 __all__ = [
     "_NearMediaGenerate",
+    "_NearMediaGenerateAsync",
     "_NearMediaQuery",
+    "_NearMediaQueryAsync",
 ]
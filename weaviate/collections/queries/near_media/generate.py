@@ -15,12 +15,18 @@ from weaviate.collections.classes.internal import (
     _QueryOptions,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
-from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.collections.queries.base import (
+    _BaseQuery,
+    _BaseQueryAsync,
+    _Search,
+    _asearch,
+    _search,
+)
+from weaviate.types import NUMBER, INCLUDE_VECTOR, VECTOR_FORMAT
 
 
 class _NearMediaGenerate(Generic[Properties, References], _BaseQuery[Properties, References]):
-    def near_media(
+    def _near_media(
         self,
         media: Union[str, Path, BufferedReader],
         media_type: NearMediaType,
@@ -38,10 +44,11 @@ class _NearMediaGenerate(Generic[Properties, References], _BaseQuery[Properties,
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: VECTOR_FORMAT = "list",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> GenerativeSearchReturnType[Properties, References, TProperties, TReferences]:
+    ) -> _Search[GenerativeSearchReturnType[Properties, References, TProperties, TReferences]]:
         """Perform retrieval-augmented generation (RaG) on the results of a by-audio object search in this collection using an audio-capable vectorization module and vector-based similarity search.
 
         See the [docs](https://weaviate.io/developers/weaviate/modules/retriever-vectorizer-modules/multi2vec-bind) for a more detailed explanation.
@@ -74,6 +81,8 @@ class _NearMediaGenerate(Generic[Properties, References], _BaseQuery[Properties,
                 The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format in which to return the vectors, either `"list"` (default) or `"numpy"`. With `"numpy"` the vectors are read-only float32 `numpy.ndarray` views over the returned bytes. Falls back to `"list"` if `numpy` is not installed.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -94,7 +103,17 @@ class _NearMediaGenerate(Generic[Properties, References], _BaseQuery[Properties,
             `weaviate.exceptions.WeaviateQueryError`:
                 If the request to the Weaviate server fails.
         """
-        res = self._query.near_media(
+        options = _QueryOptions.from_input(
+            return_metadata,
+            return_properties,
+            include_vector,
+            self._references,
+            return_references,
+            rerank,
+            group_by,
+            vector_format=vector_format,
+        )
+        request = self._query.near_media(
             media=self._parse_media(media),
             type_=media_type.value,
             certainty=certainty,
@@ -111,21 +130,25 @@ class _NearMediaGenerate(Generic[Properties, References], _BaseQuery[Properties,
             limit=limit,
             offset=offset,
             autocut=auto_limit,
-            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_metadata=self._parse_return_metadata(
+                return_metadata, include_vector, vector_format
+            ),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_generative_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
-                return_properties,
-                include_vector,
-                self._references,
-                return_references,
-                rerank,
-                group_by,
+        return _Search(
+            request,
+            lambda res: self._result_to_generative_return(
+                res, options, return_properties, return_references
             ),
-            return_properties,
-            return_references,
         )
+
+    near_media = _search(_near_media)
+
+
+class _NearMediaGenerateAsync(
+    Generic[Properties, References],
+    _NearMediaGenerate[Properties, References],
+    _BaseQueryAsync[Properties, References],
+):
+    near_media = _asearch(_NearMediaGenerate._near_media)
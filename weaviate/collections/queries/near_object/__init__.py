@@ -1,7 +1,9 @@
-from .generate import _NearObjectGenerate
-from .query import _NearObjectQuery
+from .generate import _NearObjectGenerate, _NearObjectGenerateAsync
+from .query import _NearObjectQuery, _NearObjectQueryAsync
 
 __all__ = [
     "_NearObjectGenerate",
+    "_NearObjectGenerateAsync",
     "_NearObjectQuery",
+    "_NearObjectQueryAsync",
 ]
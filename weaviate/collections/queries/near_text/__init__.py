@@ -1,7 +1,9 @@
-from .generate import _NearTextGenerate
-from .query import _NearTextQuery
+from .generate import _NearTextGenerate, _NearTextGenerateAsync
+from .query import _NearTextQuery, _NearTextQueryAsync
 
 __all__ = [
     "_NearTextGenerate",
+    "_NearTextGenerateAsync",
     "_NearTextQuery",
+    "_NearTextQueryAsync",
 ]
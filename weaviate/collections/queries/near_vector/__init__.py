@@ -1,7 +1,9 @@
-from .generate import _NearVectorGenerate
-from .query import _NearVectorQuery
+from .generate import _NearVectorGenerate, _NearVectorGenerateAsync
+from .query import _NearVectorQuery, _NearVectorQueryAsync
 
 __all__ = [
     "_NearVectorGenerate",
+    "_NearVectorGenerateAsync",
     "_NearVectorQuery",
+    "_NearVectorQueryAsync",
 ]
@@ -1,31 +1,75 @@
-from typing import Generic
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Generic, List, Optional, Sequence, Type, cast
 
+from weaviate.collections.classes.grpc import _BatchQuery
+from weaviate.collections.classes.internal import BatchQueryReturnType
+from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.types import TProperties, References
 
-from weaviate.collections.queries.bm25 import _BM25Generate, _BM25Query
-from weaviate.collections.queries.fetch_object_by_id import _FetchObjectByIDQuery
-from weaviate.collections.queries.fetch_objects import _FetchObjectsGenerate, _FetchObjectsQuery
-from weaviate.collections.queries.hybrid import _HybridGenerate, _HybridQuery
+from weaviate.collections.queries.bm25 import (
+    _BM25Generate,
+    _BM25GenerateAsync,
+    _BM25Query,
+    _BM25QueryAsync,
+)
+from weaviate.collections.queries.fetch_object_by_id import (
+    _FetchObjectByIDQuery,
+    _FetchObjectByIDQueryAsync,
+)
+from weaviate.collections.queries.fetch_objects import (
+    _FetchObjectsGenerate,
+    _FetchObjectsGenerateAsync,
+    _FetchObjectsQuery,
+    _FetchObjectsQueryAsync,
+)
+from weaviate.collections.queries.hybrid import (
+    _HybridGenerate,
+    _HybridGenerateAsync,
+    _HybridQuery,
+    _HybridQueryAsync,
+)
 from weaviate.collections.queries.near_image import (
     _NearImageGenerate,
+    _NearImageGenerateAsync,
     _NearImageQuery,
+    _NearImageQueryAsync,
 )
 from weaviate.collections.queries.near_media import (
     _NearMediaGenerate,
+    _NearMediaGenerateAsync,
     _NearMediaQuery,
+    _NearMediaQueryAsync,
 )
 from weaviate.collections.queries.near_object import (
     _NearObjectGenerate,
+    _NearObjectGenerateAsync,
     _NearObjectQuery,
+    _NearObjectQueryAsync,
 )
 from weaviate.collections.queries.near_text import (
     _NearTextGenerate,
+    _NearTextGenerateAsync,
     _NearTextQuery,
+    _NearTextQueryAsync,
 )
 from weaviate.collections.queries.near_vector import (
     _NearVectorGenerate,
+    _NearVectorGenerateAsync,
     _NearVectorQuery,
+    _NearVectorQueryAsync,
 )
+from weaviate.collections.query_cache import _QueryCache
+from weaviate.connect import ConnectionV4
+from weaviate.exceptions import WeaviateInvalidInputError
+
+BATCH_QUERY_CONCURRENCY = 16
+
+
+def _validate_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise WeaviateInvalidInputError("concurrency must be a positive integer")
 
 
 class _QueryCollection(
@@ -40,7 +84,77 @@ class _QueryCollection(
     _NearTextQuery[TProperties, References],
     _NearVectorQuery[TProperties, References],
 ):
-    pass
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        name: str,
+        consistency_level: Optional[ConsistencyLevel],
+        tenant: Optional[str],
+        properties: Optional[Type[TProperties]],
+        references: Optional[Type[References]],
+        validate_arguments: bool,
+        query_cache: Optional[_QueryCache] = None,
+    ):
+        super().__init__(
+            connection,
+            name,
+            consistency_level,
+            tenant,
+            properties,
+            references,
+            validate_arguments,
+            query_cache,
+        )
+        # the executors of `batch`, one per concurrency, are created on first use and reused by later calls
+        self.__executors: Dict[int, ThreadPoolExecutor] = {}
+        self.__executors_lock = threading.Lock()
+
+    def __executor(self, concurrency: int) -> ThreadPoolExecutor:
+        with self.__executors_lock:
+            executor = self.__executors.get(concurrency)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=concurrency, thread_name_prefix="weaviate-query-batch"
+                )
+                self.__executors[concurrency] = executor
+            return executor
+
+    def batch(
+        self, queries: Sequence[_BatchQuery], *, concurrency: int = BATCH_QUERY_CONCURRENCY
+    ) -> List[BatchQueryReturnType]:
+        """Run many searches concurrently over the gRPC channel of the client and return their results in order.
+
+        Define the searches with `wvc.query.BatchQuery`, e.g. `BatchQuery.near_vector(vector, limit=10)`. The threads
+        that run the searches are kept by the collection and reused by later calls.
+
+        Arguments:
+            `queries`
+                The searches to run.
+            `concurrency`
+                The maximum number of searches that are in flight at the same time.
+
+        Returns:
+            A list with the return value of each search at the position of the search in `queries`. If a search
+            fails, the exception that it raised is returned in its place instead, so that one failing search does not
+            affect the others.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `concurrency` is not a positive integer.
+        """
+        _validate_concurrency(concurrency)
+
+        def run(query: _BatchQuery) -> BatchQueryReturnType:
+            try:
+                return cast(
+                    BatchQueryReturnType, getattr(self, query.method)(*query.args, **query.kwargs)
+                )
+            except Exception as e:
+                return e
+
+        if concurrency == 1 or len(queries) <= 1:
+            return [run(query) for query in queries]
+        return list(self.__executor(concurrency).map(run, queries))
 
 
 class _GenerateCollection(
@@ -55,3 +169,52 @@ class _GenerateCollection(
     _NearVectorGenerate[TProperties, References],
 ):
     pass
+
+
+class _QueryCollectionAsync(
+    Generic[TProperties, References],
+    _BM25QueryAsync[TProperties, References],
+    _FetchObjectByIDQueryAsync[TProperties, References],
+    _FetchObjectsQueryAsync[TProperties, References],
+    _HybridQueryAsync[TProperties, References],
+    _NearImageQueryAsync[TProperties, References],
+    _NearMediaQueryAsync[TProperties, References],
+    _NearObjectQueryAsync[TProperties, References],
+    _NearTextQueryAsync[TProperties, References],
+    _NearVectorQueryAsync[TProperties, References],
+):
+    async def batch(
+        self, queries: Sequence[_BatchQuery], *, concurrency: int = BATCH_QUERY_CONCURRENCY
+    ) -> List[BatchQueryReturnType]:
+        """Run many searches concurrently over the gRPC channel of the client and return their results in order.
+
+        See `_QueryCollection.batch` for a description of the arguments and the return value.
+        """
+        _validate_concurrency(concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(query: _BatchQuery) -> BatchQueryReturnType:
+            async with semaphore:
+                try:
+                    return cast(
+                        BatchQueryReturnType,
+                        await getattr(self, query.method)(*query.args, **query.kwargs),
+                    )
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(*(run(query) for query in queries)))
+
+
+class _GenerateCollectionAsync(
+    Generic[TProperties, References],
+    _BM25GenerateAsync[TProperties, References],
+    _FetchObjectsGenerateAsync[TProperties, References],
+    _HybridGenerateAsync[TProperties, References],
+    _NearImageGenerateAsync[TProperties, References],
+    _NearMediaGenerateAsync[TProperties, References],
+    _NearObjectGenerateAsync[TProperties, References],
+    _NearTextGenerateAsync[TProperties, References],
+    _NearVectorGenerateAsync[TProperties, References],
+):
+    pass
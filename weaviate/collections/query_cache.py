@@ -0,0 +1,131 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, NamedTuple, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from weaviate.connect import ConnectionV4
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import search_get_pb2
+
+QUERY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+QUERY_CACHE_TTL = 60.0
+
+# number of writes made through the data namespaces of a client, per collection. Cached replies are only valid for the
+# generation they were requested in, so a write invalidates all cached replies of its collection at once.
+_write_generations: "WeakKeyDictionary[ConnectionV4, Dict[str, int]]" = WeakKeyDictionary()
+_write_generations_lock = threading.Lock()
+
+
+def _write_generation(connection: ConnectionV4, name: str) -> int:
+    with _write_generations_lock:
+        return _write_generations.get(connection, {}).get(name, 0)
+
+
+def _invalidate_query_caches(connection: ConnectionV4, name: str) -> None:
+    with _write_generations_lock:
+        generations = _write_generations.setdefault(connection, {})
+        generations[name] = generations.get(name, 0) + 1
+
+
+@dataclass
+class QueryCacheStats:
+    """Metrics of a client-side query cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class _CacheEntry(NamedTuple):
+    reply: search_get_pb2.SearchReply
+    size: int
+    expires_at: float
+    generation: int
+
+
+class _QueryCache:
+    """A client-side cache of search replies, see `Collection.with_query_cache`.
+
+    Replies are keyed on the serialized search request, which includes the collection, the tenant and the consistency
+    level. The least recently used replies are evicted when the cache exceeds `max_bytes`, and replies older than
+    `ttl` seconds or requested before the last write through the data namespace of the collection are never returned.
+    """
+
+    def __init__(self, connection: ConnectionV4, name: str, max_bytes: int, ttl: float) -> None:
+        if max_bytes < 1:
+            raise WeaviateInvalidInputError("max_bytes must be a positive integer")
+        if ttl <= 0:
+            raise WeaviateInvalidInputError("ttl must be a positive number of seconds")
+        self.__connection = connection
+        self.__name = name
+        self.__max_bytes = max_bytes
+        self.__ttl = ttl
+
+        self.__lock = threading.Lock()
+        self.__entries: "OrderedDict[bytes, _CacheEntry]" = OrderedDict()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def _get(
+        self, request: search_get_pb2.SearchRequest
+    ) -> Tuple[bytes, int, Optional[search_get_pb2.SearchReply]]:
+        """Look up the reply to a request.
+
+        Returns the cache key and the write generation to pass to `_put` after a miss together with the reply.
+        """
+        key = request.SerializeToString(deterministic=True)
+        generation = _write_generation(self.__connection, self.__name)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and (
+                entry.generation != generation or entry.expires_at < time.monotonic()
+            ):
+                self.__remove(key)
+                entry = None
+            if entry is None:
+                self.__misses += 1
+                return key, generation, None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return key, generation, entry.reply
+
+    def _put(self, key: bytes, generation: int, reply: search_get_pb2.SearchReply) -> None:
+        size = len(key) + reply.ByteSize()
+        if size > self.__max_bytes:
+            return
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = _CacheEntry(
+                reply, size, time.monotonic() + self.__ttl, generation
+            )
+            self.__size += size
+            while self.__size > self.__max_bytes:
+                self.__remove(next(iter(self.__entries)))
+                self.__evictions += 1
+
+    def __remove(self, key: bytes) -> None:
+        self.__size -= self.__entries.pop(key).size
+
+    def clear(self) -> None:
+        """Remove all cached replies."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def stats(self) -> QueryCacheStats:
+        """Return the hits, misses and evictions since the cache was created and its current size."""
+        with self.__lock:
+            return QueryCacheStats(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                entries=len(self.__entries),
+                size_bytes=self.__size,
+            )
@@ -6,9 +6,24 @@ from pydantic import BaseModel, Field
 
 @dataclass
 class ConnectionConfig:
+    """Connection settings of the client.
+
+    If `schema_cache` is set, a client of the v4 API keeps the collection configurations that it fetched from Weaviate,
+    e.g. for `collection.config.get` and `client.collections.exists`, and answers later lookups locally. The cache is
+    dropped whenever the schema is changed through the client and, if given, cached configurations are refetched after
+    `schema_cache_ttl` seconds.
+
+    With auto-schema, writing objects adds the properties that a collection does not have yet. The configuration of a
+    collection is therefore also refetched after objects with properties that it does not list were written through
+    `collection.data` or a batch of this client. Without a TTL, changes made by other clients, including the
+    properties that auto-schema adds for their inserts, are not picked up.
+    """
+
     session_pool_connections: int = 20
     session_pool_maxsize: int = 100
     session_pool_max_retries: int = 3
+    schema_cache: bool = False
+    schema_cache_ttl: Optional[float] = None
 
     def __post_init__(self) -> None:
         if not isinstance(self.session_pool_connections, int):
@@ -23,6 +38,17 @@ class ConnectionConfig:
             raise TypeError(
                 f"session_pool_max_retries must be {int}, received {type(self.session_pool_max_retries)}"
             )
+        if not isinstance(self.schema_cache, bool):
+            raise TypeError(f"schema_cache must be {bool}, received {type(self.schema_cache)}")
+        if self.schema_cache_ttl is not None:
+            if not isinstance(self.schema_cache_ttl, (int, float)):
+                raise TypeError(
+                    f"schema_cache_ttl must be {float}, received {type(self.schema_cache_ttl)}"
+                )
+            if self.schema_cache_ttl <= 0:
+                raise ValueError(
+                    f"schema_cache_ttl must be positive, received {self.schema_cache_ttl}"
+                )
 
 
 # used in v3 only
@@ -0,0 +1,96 @@
+import threading
+import time
+from copy import deepcopy
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+
+_Schema = Optional[Dict[str, Any]]
+
+
+class _SchemaCacheEntry(NamedTuple):
+    schema: _Schema
+    expires_at: float
+    # the lowercased names of the properties of the collection
+    properties: FrozenSet[str]
+
+
+class _SchemaCache:
+    """A client-wide cache of the collection configurations returned by `/schema/{name}`, see `ConnectionConfig`.
+
+    Every schema change made through the client increments the version of the cache and drops all its entries.
+    Configurations that were fetched while a change was made are not stored, so that a reply which raced the change
+    cannot outlive it. A configuration of `None` records that the collection does not exist.
+    """
+
+    def __init__(self, enabled: bool, ttl: Optional[float]) -> None:
+        self.__enabled = enabled
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__entries: Dict[str, _SchemaCacheEntry] = {}
+        self.__version = 0
+
+    def __lookup(self, name: str) -> Tuple[int, Optional[_SchemaCacheEntry]]:
+        with self.__lock:
+            entry = self.__entries.get(name)
+            if entry is not None and entry.expires_at < time.monotonic():
+                del self.__entries[name]
+                entry = None
+            return self.__version, entry
+
+    def __store(self, version: int, name: str, schema: _Schema) -> None:
+        expires_at = float("inf") if self.__ttl is None else time.monotonic() + self.__ttl
+        properties = frozenset(
+            prop["name"].lower() for prop in (schema or {}).get("properties") or []
+        )
+        with self.__lock:
+            if version == self.__version:
+                self.__entries[name] = _SchemaCacheEntry(deepcopy(schema), expires_at, properties)
+
+    def fetch(self, name: str, load: Callable[[], _Schema]) -> _Schema:
+        """Return the configuration of a collection, calling `load` to fetch it from Weaviate on a miss.
+
+        The returned configuration is a copy that can be modified freely.
+        """
+        if not self.__enabled:
+            return load()
+        version, entry = self.__lookup(name)
+        if entry is not None:
+            return deepcopy(entry.schema)
+        schema = load()
+        self.__store(version, name, schema)
+        return schema
+
+    async def afetch(self, name: str, load: Callable[[], Awaitable[_Schema]]) -> _Schema:
+        """Return the configuration of a collection, awaiting `load` to fetch it from Weaviate on a miss."""
+        if not self.__enabled:
+            return await load()
+        version, entry = self.__lookup(name)
+        if entry is not None:
+            return deepcopy(entry.schema)
+        schema = await load()
+        self.__store(version, name, schema)
+        return schema
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    def written(self, name: str, properties: Iterable[str]) -> None:
+        """Drop the cached configuration of a collection if objects with properties it does not have were written to it.
+
+        With auto-schema, Weaviate adds these properties to the collection. Configurations of other collections and
+        fetches that are in flight are not affected.
+        """
+        if not self.__enabled:
+            return
+        with self.__lock:
+            entry = self.__entries.get(name)
+            if entry is None or entry.schema is None:
+                return
+            if any(prop.lower() not in entry.properties for prop in properties):
+                del self.__entries[name]
+
+    def invalidate(self) -> None:
+        """Drop all cached configurations after a schema change."""
+        with self.__lock:
+            self.__version += 1
+            self.__entries.clear()
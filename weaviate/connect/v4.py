@@ -42,6 +42,7 @@ from weaviate.connect.base import (
     _get_proxies,
 )
 from weaviate.connect.integrations import _IntegrationConfig
+from weaviate.connect.schema_cache import _SchemaCache
 from weaviate.embedded import EmbeddedV4
 from weaviate.exceptions import (
     AuthenticationFailedError,
@@ -109,6 +110,9 @@ class _Connection(_ConnectionBase):
         self._grpc_channel_async: Optional[AsyncChannel] = None
         self.timeout_config = timeout_config
         self.__connection_config = connection_config
+        self._schema_cache = _SchemaCache(
+            connection_config.schema_cache, connection_config.schema_cache_ttl
+        )
         self.__trust_env = trust_env
         self._weaviate_version = _ServerVersion.from_string("")
         self.__connected = False
@@ -455,6 +459,36 @@ class _Connection(_ConnectionBase):
         except ConnectError as conn_err:
             raise WeaviateConnectionError(error_msg) from conn_err
 
+    async def __asend(
+        self,
+        method: Literal["DELETE", "GET", "HEAD", "PATCH", "POST", "PUT"],
+        url: str,
+        error_msg: str,
+        status_codes: Optional[_ExpectedStatusCodes],
+        weaviate_object: Optional[JSONPayload] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        if not self.is_connected() or self._aclient is None:
+            raise WeaviateClosedClientError()
+        if self.embedded_db is not None:
+            self.embedded_db.ensure_running()
+        try:
+            req = self._aclient.build_request(
+                method,
+                url,
+                json=weaviate_object,
+                params=params,
+                headers=self.__get_latest_headers(),
+            )
+            res = await self._aclient.send(req)
+            if status_codes is not None and res.status_code not in status_codes.ok:
+                raise UnexpectedStatusCodeError(error_msg, response=res)
+            return cast(Response, res)
+        except RuntimeError as e:
+            raise WeaviateClosedClientError() from e
+        except ConnectError as conn_err:
+            raise WeaviateConnectionError(error_msg) from conn_err
+
     def delete(
         self,
         path: str,
@@ -472,6 +506,23 @@ class _Connection(_ConnectionBase):
             status_codes=status_codes,
         )
 
+    async def adelete(
+        self,
+        path: str,
+        weaviate_object: Optional[JSONPayload] = None,
+        params: Optional[Dict[str, Any]] = None,
+        error_msg: str = "",
+        status_codes: Optional[_ExpectedStatusCodes] = None,
+    ) -> Response:
+        return await self.__asend(
+            "DELETE",
+            url=self.url + self._api_version_path + path,
+            weaviate_object=weaviate_object,
+            params=params,
+            error_msg=error_msg,
+            status_codes=status_codes,
+        )
+
     def patch(
         self,
         path: str,
@@ -489,6 +540,23 @@ class _Connection(_ConnectionBase):
             status_codes=status_codes,
         )
 
+    async def apatch(
+        self,
+        path: str,
+        weaviate_object: JSONPayload,
+        params: Optional[Dict[str, Any]] = None,
+        error_msg: str = "",
+        status_codes: Optional[_ExpectedStatusCodes] = None,
+    ) -> Response:
+        return await self.__asend(
+            "PATCH",
+            url=self.url + self._api_version_path + path,
+            weaviate_object=weaviate_object,
+            params=params,
+            error_msg=error_msg,
+            status_codes=status_codes,
+        )
+
     def post(
         self,
         path: str,
@@ -511,20 +579,16 @@ class _Connection(_ConnectionBase):
         path: str,
         weaviate_object: JSONPayload,
         params: Optional[Dict[str, Any]] = None,
+        error_msg: str = "",
+        status_codes: Optional[_ExpectedStatusCodes] = None,
     ) -> Response:
-        if not self.is_connected():
-            raise WeaviateClosedClientError()
-        assert self._aclient is not None
-
-        if self.embedded_db is not None:
-            self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return await self._aclient.post(
-            url=request_url,
-            json=weaviate_object,
+        return await self.__asend(
+            "POST",
+            url=self.url + self._api_version_path + path,
+            weaviate_object=weaviate_object,
             params=params,
-            headers=self.__get_latest_headers(),
+            error_msg=error_msg,
+            status_codes=status_codes,
         )
 
     def put(
@@ -544,6 +608,23 @@ class _Connection(_ConnectionBase):
             status_codes=status_codes,
         )
 
+    async def aput(
+        self,
+        path: str,
+        weaviate_object: JSONPayload,
+        params: Optional[Dict[str, Any]] = None,
+        error_msg: str = "",
+        status_codes: Optional[_ExpectedStatusCodes] = None,
+    ) -> Response:
+        return await self.__asend(
+            "PUT",
+            url=self.url + self._api_version_path + path,
+            weaviate_object=weaviate_object,
+            params=params,
+            error_msg=error_msg,
+            status_codes=status_codes,
+        )
+
     def get(
         self,
         path: str,
@@ -562,6 +643,21 @@ class _Connection(_ConnectionBase):
             "GET", url=request_url, params=params, error_msg=error_msg, status_codes=status_codes
         )
 
+    async def aget(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        error_msg: str = "",
+        status_codes: Optional[_ExpectedStatusCodes] = None,
+    ) -> Response:
+        return await self.__asend(
+            "GET",
+            url=self.url + self._api_version_path + path,
+            params=params,
+            error_msg=error_msg,
+            status_codes=status_codes,
+        )
+
     def head(
         self,
         path: str,
@@ -577,6 +673,21 @@ class _Connection(_ConnectionBase):
             status_codes=status_codes,
         )
 
+    async def ahead(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        error_msg: str = "",
+        status_codes: Optional[_ExpectedStatusCodes] = None,
+    ) -> Response:
+        return await self.__asend(
+            "HEAD",
+            url=self.url + self._api_version_path + path,
+            params=params,
+            error_msg=error_msg,
+            status_codes=status_codes,
+        )
+
     @property
     def server_version(self) -> str:
         """
@@ -8,6 +8,8 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import Sorting
 from weaviate.collections.classes.internal import (
+    BatchQueryReturnType,
+    ColumnarReturn,
     GenerativeNearMediaReturnType,
     GenerativeReturnType,
     MetadataReturn,
@@ -30,6 +32,8 @@ from weaviate.collections.classes.types import (
 )
 
 __all__ = [
+    "BatchQueryReturnType",
+    "ColumnarReturn",
     "FilterByCreationTime",
     "FilterById",
     "FilterByProperty",
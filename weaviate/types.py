@@ -1,6 +1,11 @@
 import datetime
 import uuid as uuid_package
-from typing import Dict, Union, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Dict, Literal, Union, List, Sequence, Tuple
+from typing_extensions import TypeAlias
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
 DATE = datetime.datetime
 UUID = Union[str, uuid_package.UUID]
@@ -9,6 +14,12 @@ NUMBER = Union[int, float]
 GEO_COORDINATES = Tuple[float, float]
 VECTORS = Union[Dict[str, List[float]], List[float]]
 INCLUDE_VECTOR = Union[bool, str, List[str]]
+VECTOR_FORMAT = Literal["list", "numpy"]
+# a vector returned by a query with `vector_format="numpy"`
+NUMPY_VECTOR: TypeAlias = "npt.NDArray[np.float32]"
+# a vector returned by a query in either `VECTOR_FORMAT`
+RETURNED_VECTOR = Union[List[float], NUMPY_VECTOR]
+RETURN_FORMAT = Literal["objects", "lazy", "columnar"]
 
 BEACON = "weaviate://localhost/"
 
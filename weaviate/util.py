@@ -3,6 +3,7 @@ Helper functions!
 """
 
 import base64
+import binascii
 import datetime
 import io
 import json
@@ -10,7 +11,7 @@ import os
 import re
 from enum import Enum, EnumMeta
 from pathlib import Path
-from typing import Union, Sequence, Any, Optional, List, Dict, Generator, Tuple, cast
+from typing import Union, Sequence, Any, Optional, List, Dict, Tuple, cast
 
 import requests
 import httpx
@@ -33,7 +34,9 @@ MAXIMUM_MINOR_VERSION_DELTA = 3  # The maximum delta between minor versions of W
 MINIMUM_NO_WARNING_VERSION = (
     "v1.16.0"  # The minimum version of Weaviate that will not trigger an upgrade warning.
 )
-BYTES_PER_CHUNK = 65535  # The number of bytes to read per chunk when encoding files ~ 64kb
+BYTES_PER_CHUNK = (
+    65535  # The number of bytes to read per chunk when encoding files ~ 64kb, a multiple of 3
+)
 
 
 # MetaEnum and BaseEnum are required to support `in` statements:
@@ -80,16 +83,15 @@ def image_encoder_b64(image_or_image_path: Union[str, io.BufferedReader]) -> str
         if not os.path.isfile(image_or_image_path):
             raise ValueError("No file found at location " + image_or_image_path)
         with open(image_or_image_path, "br") as file:
-            content = file.read()
+            return _file_encoder_b64(file)
 
     elif isinstance(image_or_image_path, io.BufferedReader):
-        content = image_or_image_path.read()
+        return _file_encoder_b64(image_or_image_path)
     else:
         raise TypeError(
             '"image_or_image_path" should be a image path or a binary read file'
             " (io.BufferedReader)"
         )
-    return base64.b64encode(content).decode("utf-8")
 
 
 def file_encoder_b64(file_or_file_path: Union[str, Path, io.BufferedReader]) -> str:
@@ -117,15 +119,7 @@ def file_encoder_b64(file_or_file_path: Union[str, Path, io.BufferedReader]) ->
         If the argument is of a wrong data type.
     """
 
-    def _chunks(buffer: io.BufferedReader, chunk_size: int) -> Generator[bytes, Any, Any]:
-        while True:
-            data = buffer.read(chunk_size)
-            if not data:
-                break
-            yield data
-
     should_close_file = False
-    use_buffering = True
     file = None
 
     try:
@@ -134,13 +128,11 @@ def file_encoder_b64(file_or_file_path: Union[str, Path, io.BufferedReader]) ->
                 raise ValueError("No file found at location " + file_or_file_path)
             file = open(file_or_file_path, "br")
             should_close_file = True
-            use_buffering = os.path.getsize(file_or_file_path) > BYTES_PER_CHUNK
         elif isinstance(file_or_file_path, Path):
             if not file_or_file_path.is_file():
                 raise ValueError("No file found at location " + str(file_or_file_path))
             file = file_or_file_path.open("br")
             should_close_file = True
-            use_buffering = file_or_file_path.stat().st_size > BYTES_PER_CHUNK
         elif isinstance(file_or_file_path, io.BufferedReader):
             file = file_or_file_path
         else:
@@ -149,17 +141,33 @@ def file_encoder_b64(file_or_file_path: Union[str, Path, io.BufferedReader]) ->
                 " (io.BufferedReader)"
             )
 
-        if use_buffering:
-            encoded: str = ""
-            for chunk in _chunks(file, BYTES_PER_CHUNK):
-                encoded += base64.b64encode(chunk).decode("utf-8")
-        else:
-            encoded = base64.b64encode(file.read()).decode("utf-8")
-
+        return _file_encoder_b64(file)
     finally:
         if should_close_file and file is not None:
             file.close()
 
+
+def _file_encoder_b64(file: io.BufferedReader) -> str:
+    """Encode the rest of a file chunk by chunk through a single reused read buffer.
+
+    Only the encoded string grows with the size of the file, CPython extends it in place. Chunks are encoded in
+    multiples of 3 bytes so that no padding ends up in the middle of the string, even if a read returns less data than
+    requested, e.g. from a pipe.
+    """
+    encoded = ""
+    buffer = bytearray(BYTES_PER_CHUNK)
+    with memoryview(buffer) as view:
+        pending = 0
+        while True:
+            read = file.readinto(view[pending:])
+            if not read:
+                break
+            end = pending + read
+            complete = end - end % 3
+            encoded += binascii.b2a_base64(view[:complete], newline=False).decode("ascii")
+            pending = end - complete
+            view[:pending] = view[complete:end]
+        encoded += binascii.b2a_base64(view[:pending], newline=False).decode("ascii")
     return encoded
 
 
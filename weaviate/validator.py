@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List, Sequence, Union, get_args, get_origin
+from typing import Any, List, Literal, Sequence, Union, get_args, get_origin
 
 from weaviate.exceptions import WeaviateInvalidInputError
 
@@ -30,6 +30,8 @@ def __is_valid(expected: Any, value: Any) -> bool:
     if expected is None:
         return value is None
     expected_origin = get_origin(expected)
+    if expected_origin is Literal:
+        return value in get_args(expected)
     if expected_origin is Union:
         args = get_args(expected)
         return any(isinstance(value, arg) for arg in args)
@@ -264,6 +264,14 @@ class _Warnings:
             stacklevel=1,
         )
 
+    @staticmethod
+    def batch_routing_refresh_failed(err: str) -> None:
+        warnings.warn(
+            message=f"""Bat006: The placement of the shards could not be refreshed for shard routing, objects are sent in arrival order until it succeeds: error {err}""",
+            category=UserWarning,
+            stacklevel=1,
+        )
+
     @staticmethod
     def unknown_type_encountered(field: str) -> None:
         warnings.warn(